@@ -76,7 +76,7 @@ class MemoryConfig:
     """Configuration for memory and storage settings."""
 
     def __init__(self):
-        # Memory store type (in-memory for development, postgres for production)
+        # Memory store type (in_memory for development, sqlite for persistent storage)
         self.store_type = get_env_var("MEMORY_STORE_TYPE", "in_memory")
 
         # Database configuration for persistent storage
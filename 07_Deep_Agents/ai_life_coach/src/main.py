@@ -39,6 +39,7 @@ from src.tools.habit_tools import create_habit_tools
 from src.tools.resource_tools import create_resource_tools
 from src.tools.emergency_tools import create_emergency_tools
 from src.tools.user_tools import create_user_tools
+from src.middleware import CrisisScreeningMiddleware
 from src.agents import get_all_specialists
 from src.agents.coordinator import get_coordinator_prompt
 
@@ -72,7 +73,7 @@ def create_life_coach():
     # Create memory tools
     from src.memory import create_memory_store
 
-    memory_store = create_memory_store()
+    memory_store = create_memory_store(config.memory.store_type, config.memory.db_uri)
     (
         get_user_profile,
         save_user_preference,
@@ -600,6 +601,8 @@ def create_life_coach():
             wellness_specialist,
         ],
         system_prompt=get_coordinator_prompt(),
+        # Screen every user message for crisis indicators before the model runs
+        middleware=[CrisisScreeningMiddleware()],
     )
 
     return life_coach
@@ -10,18 +10,71 @@ Memory Architecture:
 - Shared namespace: coaching patterns (anonymized across users)
 """
 
+import heapq
+import itertools
+import json
+import math
+import re
+import threading
+import time
+import weakref
+import zlib
+from bisect import bisect_left, insort
+from collections import namedtuple
+from contextlib import contextmanager
+from dataclasses import dataclass, field, fields
 from datetime import datetime
-from typing import Any, Dict, List, Optional, Tuple
+from typing import (
+    Any,
+    Callable,
+    ClassVar,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Sequence,
+    Tuple,
+)
 from uuid import uuid4
 
 # Import LangGraph Store components
 try:
     from langgraph.store.memory import InMemoryStore
-    from langgraph.store.base import BaseStore
+    from langgraph.store.base import (
+        BaseStore,
+        GetOp,
+        ListNamespacesOp,
+        MatchCondition,
+        PutOp,
+        SearchOp,
+    )
 except ImportError:
     # For development/testing without full LangGraph installation
     InMemoryStore = None  # type: ignore
     BaseStore = Any  # type: ignore
+    GetOp = ListNamespacesOp = MatchCondition = PutOp = SearchOp = None  # type: ignore
+
+# Optional fast JSON codecs (orjson preferred, then msgspec, then stdlib json)
+try:
+    import orjson
+except ImportError:
+    orjson = None  # type: ignore
+
+try:
+    import msgspec
+except ImportError:
+    msgspec = None  # type: ignore
+
+
+# Upper bound for namespace listings (store.search() returns only 10 items by default)
+MAX_SEARCH_RESULTS = 10_000
+
+# Maximum operations sent to the store in one batch() call
+BATCH_SIZE = 1_000
+
+# Journal entries appended by a journaled MemoryManager before it compacts
+JOURNAL_COMPACT_EVERY = 200
 
 
 # ==============================================================================
@@ -39,6 +92,11 @@ def get_goals_namespace(user_id: str) -> Tuple[str, str]:
     return (user_id, "goals")
 
 
+def get_goal_index_namespace(user_id: str) -> Tuple[str, str]:
+    """Get the goal secondary-index namespace for a user."""
+    return (user_id, "goal_index")
+
+
 def get_progress_namespace(user_id: str) -> Tuple[str, str]:
     """Get the progress namespace for a user."""
     return (user_id, "progress")
@@ -54,299 +112,574 @@ def get_coaching_patterns_namespace() -> Tuple[str, str]:
     return ("coaching", "patterns")
 
 
+def get_pattern_vectors_namespace() -> Tuple[str, str]:
+    """Get the namespace holding coaching pattern embeddings."""
+    return ("coaching", "pattern_vectors")
+
+
+def get_journal_namespace(namespace: Tuple[str, ...]) -> Tuple[str, ...]:
+    """Get the journal namespace holding pending mutations for a namespace."""
+    return ("journal", *namespace)
+
+
 # ==============================================================================
-# Data Models
+# Serialization Helpers
 # ==============================================================================
 
 
-class UserProfile:
-    """User profile data including demographics, values, and life situation."""
+def dumps_json(data: Any) -> bytes:
+    """Encode data as JSON bytes using the fastest available codec."""
+    if orjson is not None:
+        return orjson.dumps(data, option=orjson.OPT_NON_STR_KEYS)
+    if msgspec is not None:
+        return msgspec.json.encode(data)
+    return json.dumps(data, separators=(",", ":")).encode()
 
-    def __init__(
-        self,
-        user_id: str,
-        name: Optional[str] = None,
-        age: Optional[int] = None,
-        occupation: Optional[str] = None,
-        relationship_status: Optional[str] = None,
-        values: Optional[List[str]] = None,
-        life_situation: Optional[Dict[str, Any]] = None,
-        created_at: Optional[str] = None,
-        updated_at: Optional[str] = None,
-    ):
-        self.user_id = user_id
-        self.name = name or ""
-        self.age = age
-        self.occupation = occupation or ""
-        self.relationship_status = relationship_status or ""
-        self.values = values or []
-        self.life_situation = life_situation or {}
-        self.created_at = created_at or datetime.now().isoformat()
-        self.updated_at = updated_at or datetime.now().isoformat()
+
+def loads_json(data: Any) -> Any:
+    """Decode JSON bytes or text using the fastest available codec."""
+    if orjson is not None:
+        return orjson.loads(data)
+    if msgspec is not None:
+        return msgspec.json.decode(data)
+    return json.loads(data)
+
+
+def parse_timestamp(value: Optional[str]) -> Optional[datetime]:
+    """
+    Parse an ISO timestamp.
+
+    Args:
+        value: ISO 8601 date or datetime string
+
+    Returns:
+        Parsed datetime, or None if value is empty or invalid
+    """
+    if not value:
+        return None
+    try:
+        return datetime.fromisoformat(value)
+    except (TypeError, ValueError):
+        return None
+
+
+@dataclass(slots=True, eq=False)
+class _Record:
+    """
+    Shared behaviour for the slotted memory records.
+
+    Timestamps stay ISO strings (the storage format); parsed values are cached
+    per record and re-parsed only if the string changes.
+    """
+
+    _parsed: Optional[Dict[str, Tuple[str, Optional[datetime]]]] = field(
+        default=None, init=False, repr=False
+    )
+    _FIELDS: ClassVar[frozenset] = frozenset()
 
     def to_dict(self) -> Dict[str, Any]:
-        """Convert profile to dictionary for storage."""
-        return {
-            "user_id": self.user_id,
-            "name": self.name,
-            "age": self.age,
-            "occupation": self.occupation,
-            "relationship_status": self.relationship_status,
-            "values": self.values,
-            "life_situation": self.life_situation,
-            "created_at": self.created_at,
-            "updated_at": self.updated_at,
-        }
+        """Convert record to dictionary for storage (its init fields, in order)."""
+        return {f.name: getattr(self, f.name) for f in fields(self) if f.init}
 
     @classmethod
-    def from_dict(cls, data: Dict[str, Any]) -> "UserProfile":
-        """Create profile from dictionary."""
-        return cls(
-            user_id=data.get("user_id", ""),
-            name=data.get("name"),
-            age=data.get("age"),
-            occupation=data.get("occupation"),
-            relationship_status=data.get("relationship_status"),
-            values=data.get("values", []),
-            life_situation=data.get("life_situation", {}),
-            created_at=data.get("created_at"),
-            updated_at=data.get("updated_at"),
-        )
+    def from_dict(cls, data: Dict[str, Any]):
+        """Create a record from a stored dictionary, ignoring unknown keys."""
+        try:
+            return cls(**data)
+        except TypeError:
+            return cls(**{k: v for k, v in data.items() if k in cls._FIELDS})
+
+    def to_json(self) -> bytes:
+        """Serialize to JSON bytes."""
+        return dumps_json(self.to_dict())
+
+    @classmethod
+    def from_json(cls, data: Any):
+        """Create a record from JSON bytes or text."""
+        return cls.from_dict(loads_json(data))
+
+    def _timestamp(self, name: str) -> Optional[datetime]:
+        """Parsed value of a timestamp field, cached on the record."""
+        raw = getattr(self, name)
+        if self._parsed is None:
+            self._parsed = {}
+        cached = self._parsed.get(name)
+        if cached is None or cached[0] != raw:
+            cached = self._parsed[name] = (raw, parse_timestamp(raw))
+        return cached[1]
+
+
+def _record(cls):
+    """Make a slotted dataclass record (identity equality, hashable)."""
+    cls = dataclass(slots=True, eq=False)(cls)
+    cls._FIELDS = frozenset(f.name for f in fields(cls) if f.init)
+    return cls
 
 
-class Goal:
+# ==============================================================================
+# Data Models
+# ==============================================================================
+
+
+@_record
+class UserProfile(_Record):
+    """User profile data including demographics, values, and life situation."""
+
+    user_id: str = ""
+    name: Optional[str] = None
+    age: Optional[int] = None
+    occupation: Optional[str] = None
+    relationship_status: Optional[str] = None
+    values: Optional[List[str]] = None
+    life_situation: Optional[Dict[str, Any]] = None
+    created_at: Optional[str] = None
+    updated_at: Optional[str] = None
+
+    def __post_init__(self):
+        self.name = self.name or ""
+        self.occupation = self.occupation or ""
+        self.relationship_status = self.relationship_status or ""
+        self.values = self.values or []
+        self.life_situation = self.life_situation or {}
+        if not (self.created_at and self.updated_at):
+            now = datetime.now().isoformat()
+            self.created_at = self.created_at or now
+            self.updated_at = self.updated_at or now
+
+    @property
+    def created_at_dt(self) -> Optional[datetime]:
+        """Parsed created_at."""
+        return self._timestamp("created_at")
+
+    @property
+    def updated_at_dt(self) -> Optional[datetime]:
+        """Parsed updated_at."""
+        return self._timestamp("updated_at")
+
+
+@_record
+class Goal(_Record):
     """User goal with metadata for tracking and dependencies."""
 
+    goal_id: Optional[str] = None
+    title: str = ""
+    description: str = ""
+    domain: str = "general"  # career, relationship, finance, wellness
+    priority: int = 3  # 1-5 (5 = highest)
+    status: str = "pending"  # pending, in_progress, completed, cancelled
+    timeframe: str = "medium"  # short, medium, long
+    deadline: Optional[str] = None
+    dependencies: Optional[List[str]] = None  # IDs of prerequisite goals
+    created_at: Optional[str] = None
+
+    def __post_init__(self):
+        self.goal_id = self.goal_id or str(uuid4())
+        self.dependencies = self.dependencies or []
+        self.created_at = self.created_at or datetime.now().isoformat()
+
+    @property
+    def created_at_dt(self) -> Optional[datetime]:
+        """Parsed created_at."""
+        return self._timestamp("created_at")
+
+    @property
+    def deadline_dt(self) -> Optional[datetime]:
+        """Parsed deadline."""
+        return self._timestamp("deadline")
+
+
+class GoalIndex:
+    """
+    Secondary indexes over a user's goals (domain, status, deadline).
+
+    Stored as one document next to the goals and updated on every save, so
+    filtered queries only load the goals that match.
+    """
+
     def __init__(
         self,
-        goal_id: Optional[str] = None,
-        title: str = "",
-        description: str = "",
-        domain: str = "general",  # career, relationship, finance, wellness
-        priority: int = 3,  # 1-5 (5 = highest)
-        status: str = "pending",  # pending, in_progress, completed, cancelled
-        timeframe: str = "medium",  # short, medium, long
-        deadline: Optional[str] = None,
-        dependencies: Optional[List[str]] = None,  # IDs of prerequisite goals
-        created_at: Optional[str] = None,
+        entries: Optional[Dict[str, Dict[str, Any]]] = None,
+        by_domain: Optional[Dict[str, List[str]]] = None,
+        by_status: Optional[Dict[str, List[str]]] = None,
+        by_deadline: Optional[List[List[str]]] = None,
+        next_seq: int = 0,
     ):
-        self.goal_id = goal_id or str(uuid4())
-        self.title = title
-        self.description = description
-        self.domain = domain
-        self.priority = priority
-        self.status = status
-        self.timeframe = timeframe
-        self.deadline = deadline
-        self.dependencies = dependencies or []
-        self.created_at = created_at or datetime.now().isoformat()
+        self.entries = entries or {}  # goal_id -> indexed fields + save sequence
+        self.by_domain = by_domain or {}
+        self.by_status = by_status or {}
+        self.by_deadline = by_deadline or []  # sorted [deadline, goal_id] pairs
+        self.next_seq = next_seq
+
+    def add(self, goal: "Goal") -> None:
+        """Index a goal, replacing any previous entry for it."""
+        previous = self.entries.get(goal.goal_id)
+        if previous is not None:
+            self.remove(goal.goal_id)
+            seq = previous["seq"]
+        else:
+            seq = self.next_seq
+            self.next_seq += 1
+
+        self.entries[goal.goal_id] = {
+            "domain": goal.domain,
+            "status": goal.status,
+            "deadline": goal.deadline,
+            "seq": seq,
+        }
+        self.by_domain.setdefault(goal.domain, []).append(goal.goal_id)
+        self.by_status.setdefault(goal.status, []).append(goal.goal_id)
+        if goal.deadline:
+            insort(self.by_deadline, [goal.deadline, goal.goal_id])
+
+    def remove(self, goal_id: str) -> None:
+        """Drop a goal from every index."""
+        entry = self.entries.pop(goal_id, None)
+        if entry is None:
+            return
+        for buckets, value in (
+            (self.by_domain, entry["domain"]),
+            (self.by_status, entry["status"]),
+        ):
+            bucket = buckets.get(value, [])
+            if goal_id in bucket:
+                bucket.remove(goal_id)
+            if not bucket:
+                buckets.pop(value, None)
+        if entry["deadline"]:
+            pos = bisect_left(self.by_deadline, [entry["deadline"], goal_id])
+            if pos < len(self.by_deadline) and self.by_deadline[pos][1] == goal_id:
+                del self.by_deadline[pos]
+
+    def query(
+        self,
+        domain: Optional[str] = None,
+        status: Optional[str] = None,
+        due_before: Optional[str] = None,
+    ) -> List[str]:
+        """
+        Find goal IDs matching all given criteria.
+
+        Args:
+            domain: Required domain
+            status: Required status
+            due_before: Only goals whose deadline is earlier than this ISO date
+
+        Returns:
+            Matching goal IDs in the order the goals were first saved
+        """
+        candidates: List[List[str]] = []
+        if domain is not None:
+            candidates.append(self.by_domain.get(domain, []))
+        if status is not None:
+            candidates.append(self.by_status.get(status, []))
+        if due_before is not None:
+            end = bisect_left(self.by_deadline, [due_before])
+            candidates.append([goal_id for _, goal_id in self.by_deadline[:end]])
+        if not candidates:
+            candidates.append(list(self.entries))
+
+        # Walk the smallest posting list and probe the others
+        candidates.sort(key=len)
+        others = [set(ids) for ids in candidates[1:]]
+        matches = [gid for gid in candidates[0] if all(gid in ids for ids in others)]
+        return sorted(matches, key=lambda gid: self.entries[gid]["seq"])
 
     def to_dict(self) -> Dict[str, Any]:
-        """Convert goal to dictionary for storage."""
+        """Convert index to dictionary for storage."""
         return {
-            "goal_id": self.goal_id,
-            "title": self.title,
-            "description": self.description,
-            "domain": self.domain,
-            "priority": self.priority,
-            "status": self.status,
-            "timeframe": self.timeframe,
-            "deadline": self.deadline,
-            "dependencies": self.dependencies,
-            "created_at": self.created_at,
+            "entries": self.entries,
+            "by_domain": self.by_domain,
+            "by_status": self.by_status,
+            "by_deadline": self.by_deadline,
+            "next_seq": self.next_seq,
         }
 
     @classmethod
-    def from_dict(cls, data: Dict[str, Any]) -> "Goal":
-        """Create goal from dictionary."""
+    def from_dict(cls, data: Dict[str, Any]) -> "GoalIndex":
+        """Create index from dictionary."""
         return cls(
-            goal_id=data.get("goal_id"),
-            title=data.get("title", ""),
-            description=data.get("description", ""),
-            domain=data.get("domain", "general"),
-            priority=data.get("priority", 3),
-            status=data.get("status", "pending"),
-            timeframe=data.get("timeframe", "medium"),
-            deadline=data.get("deadline"),
-            dependencies=data.get("dependencies", []),
-            created_at=data.get("created_at"),
+            entries=data.get("entries", {}),
+            by_domain=data.get("by_domain", {}),
+            by_status=data.get("by_status", {}),
+            by_deadline=[list(pair) for pair in data.get("by_deadline", [])],
+            next_seq=data.get("next_seq", 0),
         )
 
 
-class Milestone:
+@_record
+class Milestone(_Record):
     """Achievement or milestone in user's journey."""
 
-    def __init__(
-        self,
-        title: str = "",
-        description: str = "",
-        domain: str = "general",
-        achieved_at: Optional[str] = None,
-        significance: str = "normal",  # minor, normal, major
-        milestone_id: Optional[str] = None,
-    ):
-        self.milestone_id = milestone_id or str(uuid4())
-        self.title = title
-        self.description = description
-        self.domain = domain
-        self.achieved_at = achieved_at or datetime.now().isoformat()
-        self.significance = significance
+    title: str = ""
+    description: str = ""
+    domain: str = "general"
+    achieved_at: Optional[str] = None
+    significance: str = "normal"  # minor, normal, major
+    milestone_id: Optional[str] = None
 
-    def to_dict(self) -> Dict[str, Any]:
-        """Convert milestone to dictionary for storage."""
-        return {
-            "milestone_id": self.milestone_id,
-            "title": self.title,
-            "description": self.description,
-            "domain": self.domain,
-            "achieved_at": self.achieved_at,
-            "significance": self.significance,
-        }
+    def __post_init__(self):
+        self.milestone_id = self.milestone_id or str(uuid4())
+        self.achieved_at = self.achieved_at or datetime.now().isoformat()
 
-    @classmethod
-    def from_dict(cls, data: Dict[str, Any]) -> "Milestone":
-        """Create milestone from dictionary."""
-        return cls(
-            title=data.get("title", ""),
-            description=data.get("description", ""),
-            domain=data.get("domain", "general"),
-            achieved_at=data.get("achieved_at"),
-            significance=data.get("significance", "normal"),
-            milestone_id=data.get("milestone_id"),  # Preserve original ID
-        )
+    @property
+    def achieved_at_dt(self) -> Optional[datetime]:
+        """Parsed achieved_at."""
+        return self._timestamp("achieved_at")
 
 
-class Setback:
+@_record
+class Setback(_Record):
     """Setback or challenge user has overcome."""
 
-    def __init__(
-        self,
-        description: str = "",
-        domain: str = "general",
-        occurred_at: Optional[str] = None,
-        resolved: bool = False,
-        resolution_notes: str = "",
-        setback_id: Optional[str] = None,
-    ):
-        self.setback_id = setback_id or str(uuid4())
-        self.description = description
-        self.domain = domain
-        self.occurred_at = occurred_at or datetime.now().isoformat()
-        self.resolved = resolved
-        self.resolution_notes = resolution_notes
+    description: str = ""
+    domain: str = "general"
+    occurred_at: Optional[str] = None
+    resolved: bool = False
+    resolution_notes: str = ""
+    setback_id: Optional[str] = None
 
-    def to_dict(self) -> Dict[str, Any]:
-        """Convert setback to dictionary for storage."""
-        return {
-            "setback_id": self.setback_id,
-            "description": self.description,
-            "domain": self.domain,
-            "occurred_at": self.occurred_at,
-            "resolved": self.resolved,
-            "resolution_notes": self.resolution_notes,
-        }
+    def __post_init__(self):
+        self.setback_id = self.setback_id or str(uuid4())
+        self.occurred_at = self.occurred_at or datetime.now().isoformat()
 
-    @classmethod
-    def from_dict(cls, data: Dict[str, Any]) -> "Setback":
-        """Create setback from dictionary."""
-        return cls(
-            description=data.get("description", ""),
-            domain=data.get("domain", "general"),
-            occurred_at=data.get("occurred_at"),
-            resolved=data.get("resolved", False),
-            resolution_notes=data.get("resolution_notes", ""),
-            setback_id=data.get("setback_id"),  # Preserve original ID
-        )
+    @property
+    def occurred_at_dt(self) -> Optional[datetime]:
+        """Parsed occurred_at."""
+        return self._timestamp("occurred_at")
 
 
-class UserPreferences:
+@_record
+class UserPreferences(_Record):
     """User preferences for communication and coaching style."""
 
-    def __init__(
-        self,
-        user_id: str = "",
-        communication_style: str = "balanced",  # concise, balanced, detailed
-        coaching_approach: str = "supportive",  # direct, supportive, collaborative
-        preferred_checkin_frequency: str = "weekly",  # daily, weekly, bi_weekly
-        preferred_response_length: str = "medium",  # short, medium, long
-        custom_preferences: Optional[Dict[str, Any]] = None,
-    ):
-        self.user_id = user_id
-        self.communication_style = communication_style
-        self.coaching_approach = coaching_approach
-        self.preferred_checkin_frequency = preferred_checkin_frequency
-        self.preferred_response_length = preferred_response_length
-        self.custom_preferences = custom_preferences or {}
-
-    def to_dict(self) -> Dict[str, Any]:
-        """Convert preferences to dictionary for storage."""
-        return {
-            "user_id": self.user_id,
-            "communication_style": self.communication_style,
-            "coaching_approach": self.coaching_approach,
-            "preferred_checkin_frequency": self.preferred_checkin_frequency,
-            "preferred_response_length": self.preferred_response_length,
-            "custom_preferences": self.custom_preferences,
-        }
+    user_id: str = ""
+    communication_style: str = "balanced"  # concise, balanced, detailed
+    coaching_approach: str = "supportive"  # direct, supportive, collaborative
+    preferred_checkin_frequency: str = "weekly"  # daily, weekly, bi_weekly
+    preferred_response_length: str = "medium"  # short, medium, long
+    custom_preferences: Optional[Dict[str, Any]] = None
 
-    @classmethod
-    def from_dict(cls, data: Dict[str, Any]) -> "UserPreferences":
-        """Create preferences from dictionary."""
-        return cls(
-            user_id=data.get("user_id", ""),
-            communication_style=data.get("communication_style", "balanced"),
-            coaching_approach=data.get("coaching_approach", "supportive"),
-            preferred_checkin_frequency=data.get("preferred_checkin_frequency", "weekly"),
-            preferred_response_length=data.get("preferred_response_length", "medium"),
-            custom_preferences=data.get("custom_preferences", {}),
-        )
+    def __post_init__(self):
+        self.custom_preferences = self.custom_preferences or {}
 
 
-class CoachingPattern:
+@_record
+class CoachingPattern(_Record):
     """Anonymized coaching pattern learned across users."""
 
-    def __init__(
-        self,
-        pattern_id: Optional[str] = None,
-        title: str = "",
-        description: str = "",
-        category: str = "general",  # strategy, insight, challenge
-        effectiveness_score: Optional[float] = None,  # 0-1 based on outcomes
-        usage_count: int = 0,
-        related_domains: Optional[List[str]] = None,
-    ):
-        self.pattern_id = pattern_id or str(uuid4())
-        self.title = title
-        self.description = description
-        self.category = category
-        self.effectiveness_score = effectiveness_score
-        self.usage_count = usage_count
-        self.related_domains = related_domains or []
+    pattern_id: Optional[str] = None
+    title: str = ""
+    description: str = ""
+    category: str = "general"  # strategy, insight, challenge
+    effectiveness_score: Optional[float] = None  # 0-1 based on outcomes
+    usage_count: int = 0
+    related_domains: Optional[List[str]] = None
 
-    def to_dict(self) -> Dict[str, Any]:
-        """Convert pattern to dictionary for storage."""
-        return {
-            "pattern_id": self.pattern_id,
-            "title": self.title,
-            "description": self.description,
-            "category": self.category,
-            "effectiveness_score": self.effectiveness_score,
-            "usage_count": self.usage_count,
-            "related_domains": self.related_domains,
-        }
+    def __post_init__(self):
+        self.pattern_id = self.pattern_id or str(uuid4())
+        self.related_domains = self.related_domains or []
 
-    @classmethod
-    def from_dict(cls, data: Dict[str, Any]) -> "CoachingPattern":
-        """Create pattern from dictionary."""
-        return cls(
-            pattern_id=data.get("pattern_id"),
-            title=data.get("title", ""),
-            description=data.get("description", ""),
-            category=data.get("category", "general"),
-            effectiveness_score=data.get("effectiveness_score"),
-            usage_count=data.get("usage_count", 0),
-            related_domains=data.get("related_domains", []),
-        )
+
+# ==============================================================================
+# Pattern Vector Index
+# ==============================================================================
+
+EmbeddingFunction = Callable[[str], Sequence[float]]
+
+_TOKEN_RE = re.compile(r"[a-z0-9']+")
+_STOPWORDS = frozenset(
+    "a an and are as at be but by for from has have how i in is it its my of on or "
+    "so that the their them they this to was we what when with you your".split()
+)
+
+
+def hashed_embedding(text: str, dims: int = 512) -> List[float]:
+    """
+    Local, offline text embedding using feature hashing.
+
+    Unigrams and bigrams are hashed into a fixed number of signed buckets and
+    the vector is L2-normalized. Deterministic across processes, so vectors
+    can be persisted.
+
+    Args:
+        text: Text to embed
+        dims: Vector dimensionality
+
+    Returns:
+        Embedding vector of length dims
+    """
+    tokens = [t for t in _TOKEN_RE.findall(text.lower()) if t not in _STOPWORDS]
+    features = tokens + [f"{a} {b}" for a, b in zip(tokens, tokens[1:])]
+    vector = [0.0] * dims
+    for feature in features:
+        h = zlib.crc32(feature.encode())
+        vector[h % dims] += 1.0 if h & 0x80000000 else -1.0
+    norm = math.sqrt(sum(v * v for v in vector))
+    return [v / norm for v in vector] if norm else vector
+
+
+def _pattern_text(pattern: CoachingPattern) -> str:
+    """Text that represents a pattern for embedding."""
+    return " ".join(
+        [pattern.title, pattern.description, pattern.category, *(pattern.related_domains or [])]
+    )
+
+
+def _to_sparse(vector: Sequence[float]) -> Dict[int, float]:
+    """L2-normalize a vector and keep its non-zero components."""
+    norm = math.sqrt(sum(v * v for v in vector))
+    if not norm:
+        return {}
+    return {i: v / norm for i, v in enumerate(vector) if v}
+
+
+class PatternVectorIndex:
+    """
+    In-memory vector index over coaching patterns.
+
+    Vectors are kept sparse in an inverted index (dimension -> postings), so
+    a query only touches patterns sharing a dimension with it. Scores are
+    cosine similarity scaled by a usage prior:
+    ``similarity * (1 + usage_weight * log1p(usage_count))``.
+    """
+
+    def __init__(self, embed_fn: Optional[EmbeddingFunction] = None, usage_weight: float = 0.1):
+        """
+        Initialize the index.
+
+        Args:
+            embed_fn: Text embedding function (defaults to hashed_embedding)
+            usage_weight: Strength of the usage-count ranking prior
+        """
+        self.embed_fn = embed_fn or hashed_embedding
+        self.usage_weight = usage_weight
+        self._patterns: Dict[str, CoachingPattern] = {}
+        self._vectors: Dict[str, Dict[int, float]] = {}
+        self._postings: Dict[int, Dict[str, float]] = {}
+        self._priors: Dict[str, float] = {}
+        self._lock = threading.RLock()
+
+    @property
+    def embedder_name(self) -> str:
+        """Name stored with persisted vectors to detect embedder changes."""
+        return getattr(self.embed_fn, "__name__", type(self.embed_fn).__name__)
+
+    def __len__(self) -> int:
+        return len(self._patterns)
+
+    def __contains__(self, pattern_id: str) -> bool:
+        return pattern_id in self._patterns
+
+    def embed(self, text: str) -> Dict[int, float]:
+        """Embed text as a normalized sparse vector."""
+        return _to_sparse(self.embed_fn(text))
+
+    def add(self, pattern: CoachingPattern, vector: Optional[Dict[int, float]] = None) -> None:
+        """
+        Add or replace a pattern.
+
+        Args:
+            pattern: Pattern to index
+            vector: Precomputed sparse vector (embedded from the pattern if None)
+        """
+        if vector is None:
+            vector = self.embed(_pattern_text(pattern))
+        with self._lock:
+            self.remove(pattern.pattern_id)
+            self._patterns[pattern.pattern_id] = pattern
+            self._vectors[pattern.pattern_id] = vector
+            usage = max(pattern.usage_count or 0, 0)
+            self._priors[pattern.pattern_id] = 1.0 + self.usage_weight * math.log1p(usage)
+            for dim, value in vector.items():
+                self._postings.setdefault(dim, {})[pattern.pattern_id] = value
+
+    def remove(self, pattern_id: str) -> None:
+        """Remove a pattern if present."""
+        with self._lock:
+            self._patterns.pop(pattern_id, None)
+            self._priors.pop(pattern_id, None)
+            for dim in self._vectors.pop(pattern_id, {}):
+                postings = self._postings.get(dim)
+                if postings is not None:
+                    postings.pop(pattern_id, None)
+                    if not postings:
+                        del self._postings[dim]
+
+    def get(self, pattern_id: str) -> Optional[CoachingPattern]:
+        """Get an indexed pattern."""
+        return self._patterns.get(pattern_id)
+
+    def search(
+        self, query: str, k: int = 5, domain: Optional[str] = None
+    ) -> List[Tuple[CoachingPattern, float]]:
+        """
+        Find the patterns most relevant to a query.
+
+        Args:
+            query: Free-text description of the user's situation
+            k: Number of patterns to return
+            domain: Only patterns related to this domain
+
+        Returns:
+            (pattern, score) pairs, best first
+        """
+        query_vector = self.embed(query)
+        scores: Dict[str, float] = {}
+        with self._lock:
+            for dim, q in query_vector.items():
+                for pattern_id, value in self._postings.get(dim, {}).items():
+                    scores[pattern_id] = scores.get(pattern_id, 0.0) + q * value
+
+            priors = self._priors
+            ranked = [
+                (similarity * priors[pattern_id], pattern_id)
+                for pattern_id, similarity in scores.items()
+                if similarity > 0
+            ]
+            if domain is not None:
+                ranked = [
+                    entry
+                    for entry in ranked
+                    if domain in (self._patterns[entry[1]].related_domains or [])
+                ]
+
+            best = heapq.nlargest(k, ranked)
+            return [(self._patterns[pattern_id], score) for score, pattern_id in best]
+
+
+# ==============================================================================
+# Store Transactions
+# ==============================================================================
+
+# Per-store locks shared by every MemoryManager on a store in this process
+_store_locks: "weakref.WeakKeyDictionary[Any, threading.RLock]" = weakref.WeakKeyDictionary()
+_store_locks_guard = threading.Lock()
+
+
+@contextmanager
+def store_transaction(store: Any) -> Iterator[None]:
+    """
+    Serialize a read-modify-write sequence on a store.
+
+    Uses the store's own transaction() when it has one (SQLiteStore: other
+    threads and processes wait on the database write lock). Other stores get
+    a lock shared by all managers on that store object in this process.
+
+    Args:
+        store: The LangGraph store being updated
+    """
+    transaction = getattr(store, "transaction", None)
+    if transaction is not None:
+        with transaction():
+            yield
+        return
+
+    with _store_locks_guard:
+        lock = _store_locks.get(store)
+        if lock is None:
+            lock = _store_locks[store] = threading.RLock()
+    with lock:
+        yield
 
 
 # ==============================================================================
@@ -362,12 +695,25 @@ class MemoryManager:
     Handles error cases like missing users/data gracefully.
     """
 
-    def __init__(self, store: Any):
+    def __init__(
+        self,
+        store: Any,
+        embed_fn: Optional[EmbeddingFunction] = None,
+        journaled: bool = False,
+        compact_every: int = JOURNAL_COMPACT_EVERY,
+    ):
         """
         Initialize the memory manager with a LangGraph Store.
 
         Args:
             store: An instance of InMemoryStore or PostgresStore
+            embed_fn: Text embedding function for coaching pattern retrieval
+                (defaults to the offline hashed_embedding)
+            journaled: Append small mutations (pattern usage increments,
+                preference updates, progress entries) to a journal instead of
+                rewriting whole records. Every manager sharing a store should
+                use the same mode.
+            compact_every: Journal appends between automatic compactions
 
         Raises:
             ValueError: If store is not provided
@@ -377,6 +723,13 @@ class MemoryManager:
                 "Store cannot be None. Initialize with InMemoryStore or PostgresStore."
             )
         self.store = store
+        self._embed_fn = embed_fn
+        self._pattern_index: Optional[PatternVectorIndex] = None
+        self._pattern_index_lock = threading.Lock()
+        self.journaled = journaled
+        self.compact_every = compact_every
+        self._journal_appends = 0
+        self._journal_lock = threading.Lock()
 
     # ==================== Profile Operations ====================
 
@@ -427,7 +780,11 @@ class MemoryManager:
 
     def save_goal(self, user_id: str, goal: Goal) -> None:
         """
-        Save or update a single goal.
+        Save or update a single goal and its index entries.
+
+        The index update runs in a store transaction, so concurrent saves by
+        other managers (or processes, on SQLiteStore) cannot drop each
+        other's entries.
 
         Args:
             user_id: User's unique identifier
@@ -439,8 +796,15 @@ class MemoryManager:
         if not user_id:
             raise ValueError("user_id cannot be empty")
 
-        namespace = get_goals_namespace(user_id)
-        self.store.put(namespace, goal.goal_id, goal.to_dict())
+        with store_transaction(self.store):
+            index = self._load_goal_index(user_id)
+            index.add(goal)
+            self.put_many(
+                [
+                    (get_goals_namespace(user_id), goal.goal_id, goal.to_dict()),
+                    (get_goal_index_namespace(user_id), "goal_index", index.to_dict()),
+                ]
+            )
 
     def get_goal(self, user_id: str, goal_id: str) -> Optional[Goal]:
         """
@@ -462,24 +826,46 @@ class MemoryManager:
             pass
         return None
 
-    def get_goals(self, user_id: str) -> List[Goal]:
+    def get_goals(
+        self,
+        user_id: str,
+        domain: Optional[str] = None,
+        status: Optional[str] = None,
+        due_before: Optional[str] = None,
+        limit: Optional[int] = None,
+        offset: int = 0,
+    ) -> List[Goal]:
         """
-        Retrieve all goals for a user.
+        Retrieve goals for a user, optionally filtered and paged.
+
+        Filters are answered from the goal index, so only matching goals are
+        loaded from the store.
 
         Args:
             user_id: User's unique identifier
+            domain: Only goals in this domain
+            status: Only goals with this status
+            due_before: Only goals with a deadline earlier than this ISO date
+            limit: Maximum number of goals to return
+            offset: Number of matching goals to skip (in save order)
 
         Returns:
             List of Goal objects (empty list if no goals found)
         """
-        namespace = get_goals_namespace(user_id)
-        goals: List[Goal] = []
         try:
-            items = list(self.store.search(namespace))
-            goals = [Goal.from_dict(item.value) for item in items if item.value]
+            if domain is None and status is None and due_before is None and limit is None:
+                items = self.store.search(
+                    get_goals_namespace(user_id), limit=MAX_SEARCH_RESULTS, offset=offset
+                )
+                return _goals_from_items(items)
+
+            goal_ids = self._load_goal_index(user_id).query(domain, status, due_before)
+            end = offset + limit if limit is not None else None
+            namespace = get_goals_namespace(user_id)
+            values = self.get_many([(namespace, goal_id) for goal_id in goal_ids[offset:end]])
+            return [Goal.from_dict(value) for value in values if value]
         except Exception:
-            pass
-        return goals
+            return []
 
     def get_goals_by_domain(self, user_id: str, domain: str) -> List[Goal]:
         """
@@ -492,8 +878,26 @@ class MemoryManager:
         Returns:
             List of Goal objects filtered by domain
         """
-        goals = self.get_goals(user_id)
-        return [goal for goal in goals if goal.domain == domain]
+        return self.get_goals(user_id, domain=domain)
+
+    def count_goals(
+        self, user_id: str, domain: Optional[str] = None, status: Optional[str] = None
+    ) -> int:
+        """
+        Count goals matching the given filters without loading them.
+
+        Args:
+            user_id: User's unique identifier
+            domain: Only goals in this domain
+            status: Only goals with this status
+
+        Returns:
+            Number of matching goals
+        """
+        try:
+            return len(self._load_goal_index(user_id).query(domain, status))
+        except Exception:
+            return 0
 
     def delete_goal(self, user_id: str, goal_id: str) -> bool:
         """
@@ -506,13 +910,48 @@ class MemoryManager:
         Returns:
             True if deleted, False otherwise
         """
-        namespace = get_goals_namespace(user_id)
         try:
-            self.store.delete(namespace, goal_id)
+            with store_transaction(self.store):
+                index = self._load_goal_index(user_id)
+                index.remove(goal_id)
+                self._batch(
+                    [
+                        PutOp(get_goals_namespace(user_id), goal_id, None),
+                        PutOp(get_goal_index_namespace(user_id), "goal_index", index.to_dict()),
+                    ]
+                )
             return True
         except Exception:
             return False
 
+    def rebuild_goal_index(self, user_id: str) -> GoalIndex:
+        """
+        Rebuild a user's goal index from the stored goals.
+
+        Used for goals saved before indexing existed or written to the store
+        directly.
+
+        Args:
+            user_id: User's unique identifier
+
+        Returns:
+            The rebuilt GoalIndex
+        """
+        with store_transaction(self.store):
+            index = GoalIndex()
+            items = self.store.search(get_goals_namespace(user_id), limit=MAX_SEARCH_RESULTS)
+            for goal in sorted(_goals_from_items(items), key=lambda g: g.created_at or ""):
+                index.add(goal)
+            self.store.put(get_goal_index_namespace(user_id), "goal_index", index.to_dict())
+            return index
+
+    def _load_goal_index(self, user_id: str) -> GoalIndex:
+        """Load a user's goal index, building it on first use."""
+        item = self.store.get(get_goal_index_namespace(user_id), "goal_index")
+        if item and item.value:
+            return GoalIndex.from_dict(item.value)
+        return self.rebuild_goal_index(user_id)
+
     # ==================== Progress Operations ====================
 
     def add_milestone(self, user_id: str, milestone: Milestone) -> None:
@@ -531,7 +970,11 @@ class MemoryManager:
 
         namespace = get_progress_namespace(user_id)
         # Use milestone ID as key
-        self.store.put(namespace, f"milestone_{milestone.milestone_id}", milestone.to_dict())
+        key = f"milestone_{milestone.milestone_id}"
+        if self.journaled:
+            self._append_journal(namespace, key, {"op": "put", "value": milestone.to_dict()})
+        else:
+            self.store.put(namespace, key, milestone.to_dict())
 
     def add_setback(self, user_id: str, setback: Setback) -> None:
         """
@@ -548,7 +991,11 @@ class MemoryManager:
             raise ValueError("user_id cannot be empty")
 
         namespace = get_progress_namespace(user_id)
-        self.store.put(namespace, f"setback_{setback.setback_id}", setback.to_dict())
+        key = f"setback_{setback.setback_id}"
+        if self.journaled:
+            self._append_journal(namespace, key, {"op": "put", "value": setback.to_dict()})
+        else:
+            self.store.put(namespace, key, setback.to_dict())
 
     def get_milestones(self, user_id: str) -> List[Milestone]:
         """
@@ -560,16 +1007,10 @@ class MemoryManager:
         Returns:
             List of Milestone objects (empty list if none found)
         """
-        namespace = get_progress_namespace(user_id)
-        milestones: List[Milestone] = []
         try:
-            items = list(self.store.search(namespace))
-            for item in items:
-                if item.value and isinstance(item.key, str) and item.key.startswith("milestone_"):
-                    milestones.append(Milestone.from_dict(item.value))
+            return _milestones_from_items(self._search_namespace(get_progress_namespace(user_id)))
         except Exception:
-            pass
-        return sorted(milestones, key=lambda m: m.achieved_at or "")
+            return []
 
     def get_setbacks(self, user_id: str) -> List[Setback]:
         """
@@ -581,16 +1022,10 @@ class MemoryManager:
         Returns:
             List of Setback objects (empty list if none found)
         """
-        namespace = get_progress_namespace(user_id)
-        setbacks: List[Setback] = []
         try:
-            items = list(self.store.search(namespace))
-            for item in items:
-                if item.value and isinstance(item.key, str) and item.key.startswith("setback_"):
-                    setbacks.append(Setback.from_dict(item.value))
+            return _setbacks_from_items(self._search_namespace(get_progress_namespace(user_id)))
         except Exception:
-            pass
-        return sorted(setbacks, key=lambda s: s.occurred_at or "")
+            return []
 
     # ==================== Preferences Operations ====================
 
@@ -608,7 +1043,7 @@ class MemoryManager:
             raise ValueError("user_id cannot be empty")
 
         namespace = get_preferences_namespace(preferences.user_id)
-        self.store.put(namespace, "preferences_data", preferences.to_dict())
+        self._put_records([(namespace, "preferences_data", preferences.to_dict())])
 
     def get_preferences(self, user_id: str) -> Optional[UserPreferences]:
         """
@@ -622,19 +1057,17 @@ class MemoryManager:
         """
         namespace = get_preferences_namespace(user_id)
         try:
-            item = self.store.get(namespace, "preferences_data")
-            if item and item.value:
-                prefs_dict = item.value
-                prefs_dict["user_id"] = user_id  # Ensure user_id is set
-                return UserPreferences.from_dict(prefs_dict)
+            return _preferences_from_item(user_id, self._get_item(namespace, "preferences_data"))
         except Exception:
-            pass
-        return None
+            return None
 
     def update_preference_key(self, user_id: str, key: str, value: Any) -> None:
         """
         Update a single preference field.
 
+        In journaled mode the update is appended to the journal without
+        reading the stored preferences.
+
         Args:
             user_id: User's unique identifier
             key: Preference field name (e.g., "communication_style")
@@ -646,6 +1079,15 @@ class MemoryManager:
         if not user_id:
             raise ValueError("user_id cannot be empty")
 
+        if self.journaled:
+            path = [key] if key in UserPreferences._FIELDS else ["custom_preferences", key]
+            self._append_journal(
+                get_preferences_namespace(user_id),
+                "preferences_data",
+                {"op": "set", "path": path, "value": value},
+            )
+            return
+
         preferences = self.get_preferences(user_id) or UserPreferences(user_id=user_id)
 
         # Update if key exists in preferences
@@ -664,14 +1106,35 @@ class MemoryManager:
         """
         Save or update a coaching pattern (shared across users).
 
+        The pattern is embedded once and its vector stored next to it; the
+        vector is only recomputed when the pattern's text changes.
+
         Args:
             pattern: CoachingPattern object to save
 
         Note:
             Patterns are stored in shared namespace and should be anonymized.
         """
-        namespace = get_coaching_patterns_namespace()
-        self.store.put(namespace, pattern.pattern_id, pattern.to_dict())
+        index = self._pattern_index
+        embedder = index or PatternVectorIndex(self._embed_fn)
+        text = _pattern_text(pattern)
+        writes = [(get_coaching_patterns_namespace(), pattern.pattern_id, pattern.to_dict())]
+
+        indexed = index.get(pattern.pattern_id) if index else None
+        if indexed is not None and _pattern_text(indexed) == text:
+            vector = index._vectors[pattern.pattern_id]
+        else:
+            vector = embedder.embed(text)
+            writes.append(
+                (
+                    get_pattern_vectors_namespace(),
+                    pattern.pattern_id,
+                    _vector_record(vector, text, embedder.embedder_name),
+                )
+            )
+        self._put_records(writes)
+        if index is not None:
+            index.add(pattern, vector)
 
     def get_pattern(self, pattern_id: str) -> Optional[CoachingPattern]:
         """
@@ -685,7 +1148,7 @@ class MemoryManager:
         """
         namespace = get_coaching_patterns_namespace()
         try:
-            item = self.store.get(namespace, pattern_id)
+            item = self._get_item(namespace, pattern_id)
             if item and item.value:
                 return CoachingPattern.from_dict(item.value)
         except Exception:
@@ -702,7 +1165,7 @@ class MemoryManager:
         namespace = get_coaching_patterns_namespace()
         patterns: List[CoachingPattern] = []
         try:
-            items = list(self.store.search(namespace))
+            items = self._search_namespace(namespace)
             patterns = [CoachingPattern.from_dict(item.value) for item in items if item.value]
         except Exception:
             pass
@@ -725,13 +1188,349 @@ class MemoryManager:
         """
         Increment the usage count for a pattern.
 
+        The count is used as a ranking prior by find_relevant_patterns. In
+        journaled mode the increment is appended to the journal without
+        reading the pattern.
+
         Args:
             pattern_id: Pattern's unique identifier
         """
+        if self.journaled:
+            namespace = get_coaching_patterns_namespace()
+            self._append_journal(
+                namespace, pattern_id, {"op": "incr", "path": ["usage_count"], "delta": 1}
+            )
+            index = self._pattern_index
+            indexed = index.get(pattern_id) if index else None
+            if indexed is not None:
+                indexed.usage_count = (indexed.usage_count or 0) + 1
+                index.add(indexed, index._vectors[pattern_id])
+            return
+
         pattern = self.get_pattern(pattern_id)
         if pattern:
             pattern.usage_count += 1
-            self.save_pattern(pattern)
+            self.store.put(get_coaching_patterns_namespace(), pattern_id, pattern.to_dict())
+            index = self._pattern_index
+            if index is not None and pattern_id in index:
+                index.add(pattern, index._vectors[pattern_id])
+
+    def find_relevant_patterns(
+        self, query: str, k: int = 5, domain: Optional[str] = None
+    ) -> List[Tuple[CoachingPattern, float]]:
+        """
+        Retrieve the coaching patterns most relevant to a situation.
+
+        Uses an in-memory vector index built from the stored pattern vectors
+        on first use; frequently used patterns rank higher.
+
+        Args:
+            query: Free-text description of the user's situation
+            k: Number of patterns to return
+            domain: Only patterns related to this domain
+
+        Returns:
+            (CoachingPattern, score) pairs, best first
+        """
+        if not query or k <= 0:
+            return []
+        try:
+            return self._get_pattern_index().search(query, k=k, domain=domain)
+        except Exception:
+            return []
+
+    def _get_pattern_index(self) -> PatternVectorIndex:
+        """Build the pattern vector index from the store on first use."""
+        if self._pattern_index is not None:
+            return self._pattern_index
+
+        with self._pattern_index_lock:
+            if self._pattern_index is not None:
+                return self._pattern_index
+
+            index = PatternVectorIndex(self._embed_fn)
+            pattern_items, vector_items = self._search_many(
+                [get_coaching_patterns_namespace(), get_pattern_vectors_namespace()]
+            )
+            if self.journaled:
+                pattern_items = self._search_namespace(get_coaching_patterns_namespace())
+            vectors = {item.key: item.value for item in vector_items if item.value}
+
+            stale = []
+            for item in pattern_items:
+                if not item.value:
+                    continue
+                pattern = CoachingPattern.from_dict(item.value)
+                text = _pattern_text(pattern)
+                record = vectors.get(pattern.pattern_id)
+                if (
+                    record
+                    and record.get("text") == text
+                    and record.get("embedder") == index.embedder_name
+                ):
+                    index.add(pattern, {int(i): v for i, v in record["vector"]})
+                else:
+                    vector = index.embed(text)
+                    index.add(pattern, vector)
+                    stale.append(
+                        (
+                            get_pattern_vectors_namespace(),
+                            pattern.pattern_id,
+                            _vector_record(vector, text, index.embedder_name),
+                        )
+                    )
+            if stale:
+                self.put_many(stale)
+
+            self._pattern_index = index
+            return index
+
+    # ==================== Journal Operations ====================
+
+    def _append_journal(self, namespace: Tuple[str, ...], key: str, entry: Dict[str, Any]) -> None:
+        """Append a mutation of (namespace, key) to the journal (a single put)."""
+        value = {"key": key, **entry, "logged_at": datetime.now().isoformat()}
+        self.store.put(get_journal_namespace(namespace), _journal_sequence(), value)
+
+        with self._journal_lock:
+            self._journal_appends += 1
+            due = self._journal_appends >= self.compact_every
+        if due:
+            self.compact_journal()
+
+    def _put_records(self, writes: List[Tuple[Tuple[str, ...], str, Dict[str, Any]]]) -> None:
+        """
+        Write whole records, superseding their pending journal entries.
+
+        In journaled mode the records' journal entries are deleted in the same
+        store batch as the writes; left in place, reads would apply them again
+        on top of the new values.
+        """
+        if not self.journaled:
+            self.put_many(writes)
+            return
+
+        with store_transaction(self.store):
+            journals = [(get_journal_namespace(namespace), key) for namespace, key, _ in writes]
+            entry_lists = self._batch(
+                [
+                    SearchOp(journal, filter={"key": key}, limit=MAX_SEARCH_RESULTS)
+                    for journal, key in journals
+                ]
+            )
+            ops = [PutOp(namespace, key, value) for namespace, key, value in writes]
+            for (journal, _), entries in zip(journals, entry_lists):
+                ops.extend(PutOp(journal, entry.key, None) for entry in entries)
+            self.store.batch(ops)
+
+    def _get_item(self, namespace: Tuple[str, ...], key: str) -> Any:
+        """Get an item with pending journal entries applied."""
+        if not self.journaled:
+            return self.store.get(namespace, key)
+        item, entries = self._batch(
+            [
+                GetOp(namespace, key),
+                SearchOp(
+                    get_journal_namespace(namespace),
+                    filter={"key": key},
+                    limit=MAX_SEARCH_RESULTS,
+                ),
+            ]
+        )
+        merged = _merge_journal(namespace, [item] if item else [], entries)
+        return merged[0] if merged else None
+
+    def _search_namespace(self, namespace: Tuple[str, ...]) -> List[Any]:
+        """List a namespace with pending journal entries applied."""
+        if not self.journaled:
+            return self.store.search(namespace, limit=MAX_SEARCH_RESULTS)
+        items, entries = self._search_many([namespace, get_journal_namespace(namespace)])
+        return _merge_journal(namespace, items, entries)
+
+    def compact_journal(self) -> int:
+        """
+        Fold pending journal entries into their records.
+
+        The journal and records are read, and the updated records written with
+        the folded entries deleted, inside one store_transaction(): on
+        SQLiteStore a single database transaction, so a crash either keeps the
+        entries or the compacted snapshot, never both, and no other manager or
+        process can fold the same entries in between. Entries appended while
+        compacting are left for the next run. Pending entries are also
+        applied on read, so no replay is needed after a restart.
+
+        Returns:
+            Number of journal entries folded
+        """
+        with store_transaction(self.store):
+            return self._compact_journal()
+
+    def _compact_journal(self) -> int:
+        """Compact the journal; callers hold store_transaction()."""
+        with self._journal_lock:
+            self._journal_appends = 0
+
+        (journal_namespaces,) = self._batch(
+            [
+                ListNamespacesOp(
+                    match_conditions=(MatchCondition("prefix", ("journal",)),),
+                    limit=MAX_SEARCH_RESULTS,
+                )
+            ]
+        )
+        if not journal_namespaces:
+            return 0
+
+        entry_lists = self._search_many(list(journal_namespaces))
+        targets = []
+        for journal_namespace, entries in zip(journal_namespaces, entry_lists):
+            namespace = tuple(journal_namespace[1:])
+            for key in {entry.value.get("key") for entry in entries if entry.value}:
+                targets.append((namespace, key))
+        current: Dict[Tuple[str, ...], List[Any]] = {}
+        for item in self._batch([GetOp(namespace, key) for namespace, key in targets]):
+            if item:
+                current.setdefault(tuple(item.namespace), []).append(item)
+
+        ops = []
+        folded = 0
+        for journal_namespace, entries in zip(journal_namespaces, entry_lists):
+            namespace = tuple(journal_namespace[1:])
+            existing = current.get(namespace, [])
+            for item in _merge_journal(namespace, existing, entries):
+                ops.append(PutOp(namespace, item.key, item.value))
+            ops.extend(PutOp(tuple(journal_namespace), entry.key, None) for entry in entries)
+            folded += len(entries)
+
+        # Not chunked: snapshots and entry deletions must land together
+        self.store.batch(ops)
+        return folded
+
+    # ==================== Batch Operations ====================
+
+    def _batch(self, ops: List[Any]) -> List[Any]:
+        """Run store operations in as few batch() round trips as possible."""
+        results: List[Any] = []
+        for start in range(0, len(ops), BATCH_SIZE):
+            results.extend(self.store.batch(ops[start : start + BATCH_SIZE]))
+        return results
+
+    async def _abatch(self, ops: List[Any]) -> List[Any]:
+        """Async version of _batch using store.abatch()."""
+        results: List[Any] = []
+        for start in range(0, len(ops), BATCH_SIZE):
+            results.extend(await self.store.abatch(ops[start : start + BATCH_SIZE]))
+        return results
+
+    def get_many(
+        self, keys: Iterable[Tuple[Tuple[str, ...], str]]
+    ) -> List[Optional[Dict[str, Any]]]:
+        """
+        Retrieve many values across namespaces in one store round trip.
+
+        Args:
+            keys: (namespace, key) pairs
+
+        Returns:
+            Stored values in request order (None where not found)
+        """
+        results = self._batch([GetOp(namespace, key) for namespace, key in keys])
+        return [item.value if item else None for item in results]
+
+    def put_many(self, items: Iterable[Tuple[Tuple[str, ...], str, Dict[str, Any]]]) -> None:
+        """
+        Store many values across namespaces in one store round trip.
+
+        Args:
+            items: (namespace, key, value) triples
+        """
+        self._batch([PutOp(namespace, key, value) for namespace, key, value in items])
+
+    def delete_many(self, keys: Iterable[Tuple[Tuple[str, ...], str]]) -> None:
+        """
+        Delete many keys across namespaces in one store round trip.
+
+        Args:
+            keys: (namespace, key) pairs
+        """
+        self._batch([PutOp(namespace, key, None) for namespace, key in keys])
+
+    async def aget_many(
+        self, keys: Iterable[Tuple[Tuple[str, ...], str]]
+    ) -> List[Optional[Dict[str, Any]]]:
+        """Async version of get_many."""
+        results = await self._abatch([GetOp(namespace, key) for namespace, key in keys])
+        return [item.value if item else None for item in results]
+
+    async def aput_many(self, items: Iterable[Tuple[Tuple[str, ...], str, Dict[str, Any]]]) -> None:
+        """Async version of put_many."""
+        await self._abatch([PutOp(namespace, key, value) for namespace, key, value in items])
+
+    async def adelete_many(self, keys: Iterable[Tuple[Tuple[str, ...], str]]) -> None:
+        """Async version of delete_many."""
+        await self._abatch([PutOp(namespace, key, None) for namespace, key in keys])
+
+    def _search_many(self, namespaces: List[Tuple[str, ...]]) -> List[List[Any]]:
+        """List every item in each namespace using batched searches."""
+        return self._batch(
+            [SearchOp(namespace, limit=MAX_SEARCH_RESULTS) for namespace in namespaces]
+        )
+
+    def get_profiles_for_users(self, user_ids: List[str]) -> Dict[str, Optional[UserProfile]]:
+        """
+        Retrieve profiles for many users in one store round trip.
+
+        Args:
+            user_ids: User identifiers
+
+        Returns:
+            Dictionary mapping user_id to UserProfile (None if not found)
+        """
+        values = self.get_many([(get_profile_namespace(uid), "profile_data") for uid in user_ids])
+        return {
+            uid: UserProfile.from_dict(value) if value else None
+            for uid, value in zip(user_ids, values)
+        }
+
+    def get_goals_for_users(self, user_ids: List[str]) -> Dict[str, List[Goal]]:
+        """
+        Retrieve all goals for many users in one store round trip.
+
+        Args:
+            user_ids: User identifiers
+
+        Returns:
+            Dictionary mapping user_id to list of Goal objects
+        """
+        results = self._search_many([get_goals_namespace(uid) for uid in user_ids])
+        return {uid: _goals_from_items(items) for uid, items in zip(user_ids, results)}
+
+    def get_milestones_for_users(self, user_ids: List[str]) -> Dict[str, List[Milestone]]:
+        """
+        Retrieve all milestones for many users in one store round trip.
+
+        Args:
+            user_ids: User identifiers
+
+        Returns:
+            Dictionary mapping user_id to list of Milestone objects
+        """
+        namespaces = [get_progress_namespace(uid) for uid in user_ids]
+        if not self.journaled:
+            results = self._search_many(namespaces)
+            return {uid: _milestones_from_items(items) for uid, items in zip(user_ids, results)}
+
+        # Records and their pending journal entries in the same batch
+        results = self._search_many(
+            namespaces + [get_journal_namespace(namespace) for namespace in namespaces]
+        )
+        count = len(namespaces)
+        return {
+            uid: _milestones_from_items(_merge_journal(namespace, items, entries))
+            for uid, namespace, items, entries in zip(
+                user_ids, namespaces, results[:count], results[count:]
+            )
+        }
 
     # ==================== Utility Operations ====================
 
@@ -739,24 +1538,66 @@ class MemoryManager:
         """
         Get a comprehensive summary of all data for a user.
 
+        All namespaces are read in a single batched store call.
+
         Args:
             user_id: User's unique identifier
 
         Returns:
             Dictionary containing summary of all user data
         """
+        prefs_namespace = get_preferences_namespace(user_id)
+        progress_namespace = get_progress_namespace(user_id)
+        ops = [
+            GetOp(get_profile_namespace(user_id), "profile_data"),
+            GetOp(prefs_namespace, "preferences_data"),
+            SearchOp(get_goals_namespace(user_id), limit=MAX_SEARCH_RESULTS),
+            SearchOp(progress_namespace, limit=MAX_SEARCH_RESULTS),
+        ]
+        if self.journaled:
+            ops.append(SearchOp(get_journal_namespace(prefs_namespace), limit=MAX_SEARCH_RESULTS))
+            ops.append(
+                SearchOp(get_journal_namespace(progress_namespace), limit=MAX_SEARCH_RESULTS)
+            )
+        try:
+            results = self._batch(ops)
+        except Exception:
+            # Store without batch support: fall back to individual lookups
+            return {
+                "profile": self.get_profile(user_id),
+                "goals": self.get_goals(user_id),
+                "milestones": self.get_milestones(user_id),
+                "setbacks": self.get_setbacks(user_id),
+                "preferences": self.get_preferences(user_id),
+            }
+
+        profile_item, prefs_item, goal_items, progress_items = results[:4]
+        if self.journaled:
+            prefs_items = _merge_journal(
+                prefs_namespace, [prefs_item] if prefs_item else [], results[4]
+            )
+            prefs_item = prefs_items[0] if prefs_items else None
+            progress_items = _merge_journal(progress_namespace, progress_items, results[5])
+
         return {
-            "profile": self.get_profile(user_id),
-            "goals": self.get_goals(user_id),
-            "milestones": self.get_milestones(user_id),
-            "setbacks": self.get_setbacks(user_id),
-            "preferences": self.get_preferences(user_id),
+            "profile": (
+                UserProfile.from_dict(profile_item.value)
+                if profile_item and profile_item.value
+                else None
+            ),
+            "goals": _goals_from_items(goal_items),
+            "milestones": _milestones_from_items(progress_items),
+            "setbacks": _setbacks_from_items(progress_items),
+            "preferences": _preferences_from_item(user_id, prefs_item),
         }
 
     def delete_user_data(self, user_id: str) -> bool:
         """
         Delete all data for a user (GDPR compliance).
 
+        Lists the user's namespaces in one batched call and deletes every
+        item in a second one.
+
         Args:
             user_id: User's unique identifier
 
@@ -764,38 +1605,149 @@ class MemoryManager:
             True if deletion successful, False otherwise
         """
         try:
-            # Delete from each user-specific namespace
             namespaces = [
                 get_profile_namespace(user_id),
                 get_goals_namespace(user_id),
+                get_goal_index_namespace(user_id),
                 get_progress_namespace(user_id),
                 get_preferences_namespace(user_id),
             ]
-
-            for namespace in namespaces:
-                try:
-                    items = list(self.store.search(namespace))
-                    for item in items:
-                        self.store.delete(namespace, item.key)
-                except Exception:
-                    continue
-
+            namespaces += [get_journal_namespace(namespace) for namespace in namespaces[-2:]]
+            results = self._search_many(namespaces)
+            self.delete_many(
+                [(tuple(item.namespace), item.key) for items in results for item in items]
+            )
             return True
         except Exception:
             return False
 
 
+# ==============================================================================
+# Journal Helpers
+# ==============================================================================
+
+# Namespace/key/value view of a record with journal entries applied
+JournaledItem = namedtuple("JournaledItem", ["namespace", "key", "value"])
+
+_journal_counter = itertools.count()
+_journal_writer = uuid4().hex[:8]
+
+
+def _journal_sequence() -> str:
+    """Journal entry key that sorts in append order (time, then per-process counter)."""
+    return f"{time.time_ns():020d}-{next(_journal_counter):08d}-{_journal_writer}"
+
+
+def _apply_journal_entry(value: Optional[Dict[str, Any]], entry: Dict[str, Any]) -> Any:
+    """Apply one journal entry to a stored value without mutating it."""
+    op = entry.get("op")
+    if op == "put":
+        return dict(entry["value"])
+    if op == "incr":
+        if value is None:
+            return None  # Counter on a missing record: nothing to increment
+        value = dict(value)
+        field_name = entry["path"][-1]
+        value[field_name] = (value.get(field_name) or 0) + entry.get("delta", 1)
+        return value
+    if op == "set":
+        value = dict(value or {})
+        target = value
+        *parents, leaf = entry["path"]
+        for name in parents:
+            target[name] = dict(target.get(name) or {})
+            target = target[name]
+        target[leaf] = entry["value"]
+        return value
+    return value
+
+
+def _merge_journal(
+    namespace: Tuple[str, ...], items: Iterable[Any], entries: Iterable[Any]
+) -> List[Any]:
+    """Apply journal entries (in append order) to the items of a namespace."""
+    pending: Dict[str, List[Dict[str, Any]]] = {}
+    for entry in sorted((e for e in entries if e and e.value), key=lambda e: e.key):
+        pending.setdefault(entry.value.get("key"), []).append(entry.value)
+    if not pending:
+        return list(items)
+
+    merged = []
+    for item in items:
+        if item.key not in pending:
+            merged.append(item)
+            continue
+        value = item.value
+        for entry in pending.pop(item.key):
+            value = _apply_journal_entry(value, entry)
+        merged.append(JournaledItem(namespace, item.key, value))
+
+    for key, key_entries in pending.items():
+        value = None
+        for entry in key_entries:
+            value = _apply_journal_entry(value, entry)
+        if value is not None:
+            merged.append(JournaledItem(namespace, key, value))
+    return merged
+
+
+# ==============================================================================
+# Item Parsing Helpers
+# ==============================================================================
+
+
+def _goals_from_items(items: Iterable[Any]) -> List[Goal]:
+    """Build goals from goals-namespace store items."""
+    return [Goal.from_dict(item.value) for item in items if item.value]
+
+
+def _milestones_from_items(items: Iterable[Any]) -> List[Milestone]:
+    """Build milestones (sorted by achievement date) from progress-namespace items."""
+    milestones = [
+        Milestone.from_dict(item.value)
+        for item in items
+        if item.value and isinstance(item.key, str) and item.key.startswith("milestone_")
+    ]
+    return sorted(milestones, key=lambda m: m.achieved_at or "")
+
+
+def _setbacks_from_items(items: Iterable[Any]) -> List[Setback]:
+    """Build setbacks (sorted by occurrence date) from progress-namespace items."""
+    setbacks = [
+        Setback.from_dict(item.value)
+        for item in items
+        if item.value and isinstance(item.key, str) and item.key.startswith("setback_")
+    ]
+    return sorted(setbacks, key=lambda s: s.occurred_at or "")
+
+
+def _vector_record(vector: Dict[int, float], text: str, embedder: str) -> Dict[str, Any]:
+    """Build the stored form of a pattern vector."""
+    return {"vector": [[i, v] for i, v in vector.items()], "text": text, "embedder": embedder}
+
+
+def _preferences_from_item(user_id: str, item: Any) -> Optional[UserPreferences]:
+    """Build preferences from a preferences-namespace item."""
+    if not item or not item.value:
+        return None
+    prefs_dict = dict(item.value)
+    prefs_dict["user_id"] = user_id  # Ensure user_id is set
+    return UserPreferences.from_dict(prefs_dict)
+
+
 # ==============================================================================
 # Factory Functions
 # ==============================================================================
 
 
-def create_memory_store(store_type: str = "in_memory") -> Any:
+def create_memory_store(store_type: str = "in_memory", path: Optional[str] = None) -> Any:
     """
     Create a memory store instance.
 
     Args:
-        store_type: Type of store to create ("in_memory" or "postgres")
+        store_type: Type of store to create ("in_memory", "sqlite" or "postgres")
+        path: Database file or "sqlite:///" URI for the sqlite store
+            (defaults to ai_life_coach.db)
 
     Returns:
         Initialized BaseStore instance
@@ -809,12 +1761,21 @@ def create_memory_store(store_type: str = "in_memory") -> Any:
 
     if store_type == "in_memory":
         return InMemoryStore()
+    elif store_type == "sqlite":
+        try:
+            from .sqlite_store import DEFAULT_SQLITE_PATH, SQLiteStore
+        except ImportError:
+            from sqlite_store import DEFAULT_SQLITE_PATH, SQLiteStore
+
+        return SQLiteStore(path or DEFAULT_SQLITE_PATH)
     elif store_type == "postgres":
         raise NotImplementedError(
-            "PostgresStore not yet implemented. Use store_type='in_memory' for development."
+            "PostgresStore not yet implemented. Use store_type='sqlite' for persistent storage."
         )
     else:
-        raise ValueError(f"Invalid store_type: {store_type}. Use 'in_memory' or 'postgres'.")
+        raise ValueError(
+            f"Invalid store_type: {store_type}. Use 'in_memory', 'sqlite' or 'postgres'."
+        )
 
 
 def create_memory_manager(store: Optional[Any] = None) -> MemoryManager:
@@ -0,0 +1,284 @@
+"""
+Agent middleware for AI Life Coach.
+
+CrisisScreeningMiddleware screens every incoming user message for crisis
+indicators before the coordinator model runs. The analyze_crisis_risk tool
+only runs when the model decides to call it, which costs a full model turn;
+this middleware runs the compiled crisis keyword matcher synchronously
+(well under a millisecond for a typical message).
+
+A keyword hit alone is not enough to skip the coordinator: many crisis
+keywords also turn up in everyday messages ("suicide prevention", "digital
+detox", "jump off point"). The run ends straight away with crisis resources
+only when a high or critical result either contains an explicit crisis
+statement ("kill myself", "cutting myself") or is corroborated by several
+keyword matches. Every other result is stored on the agent state under
+"crisis_screening" and the coordinator runs as usual, with the screening
+result added to its system prompt so it can follow the crisis protocol and
+call the emergency tools itself.
+"""
+
+import time
+from typing import Any, Awaitable, Callable, Dict, List, NotRequired, Optional
+
+from langchain.agents.middleware import (
+    AgentMiddleware,
+    AgentState,
+    ModelRequest,
+    ModelResponse,
+    hook_config,
+)
+from langchain_core.messages import AIMessage, SystemMessage
+from langgraph.runtime import Runtime
+
+from src.tools.emergency_tools import (
+    CRISIS_RESOURCES,
+    CrisisDetectionResult,
+    CrisisLevel,
+    build_crisis_response,
+    detect_crisis_keywords,
+    get_appropriate_resources,
+)
+
+# Crisis levels that may bypass the coordinator
+SHORT_CIRCUIT_LEVELS = (CrisisLevel.HIGH, CrisisLevel.CRITICAL)
+
+# Keywords that are explicit first-person crisis statements; one is enough
+# to bypass the coordinator. Other keywords ("suicide", "jump off",
+# "get beaten", "overdose") are common in harmless messages.
+EXPLICIT_CRISIS_PHRASES = frozenset(
+    {
+        "kill myself",
+        "end my life",
+        "take my life",
+        "want to die",
+        "better off dead",
+        "no reason to live",
+        "end it all",
+        "can't go on",
+        "hang myself",
+        "hanging myself",
+        "suicidal thoughts",
+        "cutting myself",
+        "hurt myself",
+        "burning myself",
+        "starving myself",
+        "overdosed",
+        "being abused",
+        "molested",
+        "raped",
+        "assaulted by partner",
+        "strangled",
+        "partner hit me",
+    }
+)
+
+# Keyword matches (per crisis type) that together corroborate a high or
+# critical result
+MIN_CORROBORATING_SIGNALS = 2
+
+# Resources already covered by build_crisis_response wording
+_GENERAL_RESOURCES = {
+    CRISIS_RESOURCES[resource_id]["name"]
+    for resource_id in ("988_lifeline", "crisis_text_line", "emergency_services")
+}
+
+
+def _message_text(message: Any) -> str:
+    """Return the plain text of a message (string or content-block list)."""
+    content = getattr(message, "content", None)
+    if content is None and isinstance(message, dict):
+        content = message.get("content")
+    if isinstance(content, str):
+        return content
+    if isinstance(content, list):
+        parts = []
+        for block in content:
+            if isinstance(block, str):
+                parts.append(block)
+            elif isinstance(block, dict) and block.get("type") == "text":
+                parts.append(block.get("text", ""))
+        return " ".join(parts)
+    return ""
+
+
+def format_screening_note(screening: Dict[str, Any]) -> str:
+    """
+    Build the system prompt note for a screening result left to the model.
+
+    Args:
+        screening: CrisisDetectionResult.to_dict() of the latest user message
+
+    Returns:
+        Note asking the coordinator to apply its crisis protocol
+    """
+    crisis_types = ", ".join(screening.get("crisis_types") or []) or "unknown"
+    keywords = ", ".join(f'"{k}"' for k in dict.fromkeys(screening.get("matched_keywords") or []))
+    return (
+        "Crisis screening of the user's latest message: "
+        f"level {screening.get('crisis_level')}, types {crisis_types}, "
+        f"matched {keywords}. Keywords may be used in a harmless sense. If the "
+        "message may describe a real crisis, follow the crisis protocol: check on "
+        "the user's safety and use analyze_crisis_risk before coaching."
+    )
+
+
+def _with_screening_note(request: ModelRequest) -> ModelRequest:
+    """Add the latest screening result (if any) to the request's system prompt."""
+    screening = (request.state or {}).get("crisis_screening")
+    if not screening:
+        return request
+    note = format_screening_note(screening)
+    prompt = request.system_prompt
+    return request.override(
+        system_message=SystemMessage(content=f"{prompt}\n\n{note}" if prompt else note)
+    )
+
+
+def _is_user_message(message: Any) -> bool:
+    if isinstance(message, dict):
+        return message.get("role") in ("user", "human")
+    return getattr(message, "type", None) == "human"
+
+
+def format_screening_response(result: CrisisDetectionResult) -> str:
+    """
+    Build the reply sent when screening short-circuits the coordinator.
+
+    Args:
+        result: Crisis detection result for the user's message
+
+    Returns:
+        Crisis response text, with type-specific resources (e.g. the domestic
+        violence hotline) added after the general ones
+    """
+    crisis_types = [ct.value for ct in result.crisis_types]
+    response = build_crisis_response(result.crisis_level.value, crisis_types)
+
+    specific = [
+        resource
+        for resource in get_appropriate_resources(result.crisis_types)
+        if resource["name"] not in _GENERAL_RESOURCES
+    ]
+    if not specific:
+        return response
+
+    lines = ["", "Other support that may help with what you've described:", ""]
+    for resource in specific:
+        lines.append(f"📞 {resource['name']}: {resource['number']}")
+        lines.append(f"   {resource['description']} ({resource['available']})")
+    return response + "\n" + "\n".join(lines)
+
+
+class CrisisScreeningState(AgentState):
+    """Agent state with the screening result of the latest user message."""
+
+    crisis_screening: NotRequired[Optional[Dict[str, Any]]]
+
+
+class CrisisScreeningMiddleware(AgentMiddleware):
+    """
+    Screen each new user message for crisis indicators before the model runs.
+
+    Only the latest message is screened, and only when it comes from the
+    user, so the hook is a no-op on the model calls that follow tool calls.
+    A result that does not short-circuit is added to the system prompt of
+    every model call until the next user message. The detection result of
+    the last screened message is kept on last_result and its duration (in
+    milliseconds) on last_latency_ms.
+
+    Example:
+        >>> agent = create_deep_agent(..., middleware=[CrisisScreeningMiddleware()])
+    """
+
+    state_schema = CrisisScreeningState
+
+    def __init__(
+        self,
+        levels: Optional[List[CrisisLevel]] = None,
+        min_signals: int = MIN_CORROBORATING_SIGNALS,
+    ):
+        """
+        Args:
+            levels: Crisis levels that may short-circuit to crisis resources
+                (defaults to SHORT_CIRCUIT_LEVELS: high and critical)
+            min_signals: Keyword matches needed to short-circuit without an
+                explicit crisis statement (a keyword listed under several
+                crisis types counts once per type)
+        """
+        super().__init__()
+        self.levels = tuple(levels) if levels is not None else SHORT_CIRCUIT_LEVELS
+        self.min_signals = min_signals
+        self.last_result: Optional[CrisisDetectionResult] = None
+        self.last_latency_ms = 0.0
+
+    def should_short_circuit(self, result: CrisisDetectionResult) -> bool:
+        """
+        Decide whether a result is strong enough to skip the coordinator.
+
+        Args:
+            result: Crisis detection result for the user's message
+
+        Returns:
+            True for a result at one of the short-circuit levels that contains
+            an explicit crisis statement or at least min_signals keyword matches
+        """
+        if result.crisis_level not in self.levels:
+            return False
+        if any(keyword in EXPLICIT_CRISIS_PHRASES for keyword in result.matched_keywords):
+            return True
+        return len(result.matched_keywords) >= self.min_signals
+
+    def screen(self, text: str) -> Optional[Dict[str, Any]]:
+        """
+        Screen one user message.
+
+        Args:
+            text: Message text
+
+        Returns:
+            State update that answers with crisis resources and jumps to the
+            end of the run, or one that records the screening result (None
+            when nothing was detected) and lets the model handle the message
+        """
+        started = time.perf_counter()
+        result = detect_crisis_keywords(text)
+        self.last_latency_ms = (time.perf_counter() - started) * 1000
+        self.last_result = result
+
+        screening = result.to_dict() if result.is_crisis else None
+        if not self.should_short_circuit(result):
+            return {"crisis_screening": screening}
+
+        reply = AIMessage(
+            content=format_screening_response(result),
+            response_metadata={"crisis_screening": screening},
+        )
+        return {"messages": [reply], "crisis_screening": screening, "jump_to": "end"}
+
+    @hook_config(can_jump_to=["end"])
+    def before_model(
+        self, state: CrisisScreeningState, runtime: Runtime
+    ) -> Optional[Dict[str, Any]]:
+        messages = state.get("messages") or []
+        if not messages or not _is_user_message(messages[-1]):
+            return None
+        return self.screen(_message_text(messages[-1]))
+
+    @hook_config(can_jump_to=["end"])
+    async def abefore_model(
+        self, state: CrisisScreeningState, runtime: Runtime
+    ) -> Optional[Dict[str, Any]]:
+        return self.before_model(state, runtime)
+
+    def wrap_model_call(
+        self, request: ModelRequest, handler: Callable[[ModelRequest], ModelResponse]
+    ) -> ModelResponse:
+        return handler(_with_screening_note(request))
+
+    async def awrap_model_call(
+        self,
+        request: ModelRequest,
+        handler: Callable[[ModelRequest], Awaitable[ModelResponse]],
+    ) -> ModelResponse:
+        return await handler(_with_screening_note(request))
@@ -8,6 +8,9 @@ This module provides comprehensive performance optimization utilities:
 - **parallel**: Parallel execution for subagents and tools
 - **memory_optimizer**: Optimized memory access patterns
 - **tool_optimizer**: Tool invocation optimization
+- **tracing**: Nested span export in OpenTelemetry (OTLP/JSON) format
+- **hotspots**: Offline scripted-session profiling (flame graphs, per-tool costs)
+- **benchmarks**: Micro-benchmarks for core data structures
 
 Quick Start:
     >>> from src.performance import get_profiler, get_cache_manager
@@ -28,6 +31,7 @@ Quick Start:
 
 from .profiler import (
     PerformanceProfiler,
+    StreamingHistogram,
     ToolPerformanceTracker,
     MemoryAccessOptimizer,
     get_profiler,
@@ -57,9 +61,16 @@ from .cache import (
 from .parallel import (
     ParallelExecutor,
     AsyncToolExecutor,
+    AsyncTaskExecutor,
+    run_coroutine_sync,
     ParallelResult,
+    LatencyTracker,
+    get_latency_tracker,
+    get_parallel_executor,
+    shutdown_parallel_executors,
     parallel_map,
     parallel_specialists,
+    fan_out_specialists,
     BatchProcessor,
     optimize_specialist_delegation,
 )
@@ -68,6 +79,7 @@ from .memory_optimizer import (
     OptimizedMemoryManager,
     LazyLoader,
     PrefetchManager,
+    AdaptiveCacheTuner,
     create_optimized_memory_manager,
 )
 
@@ -80,9 +92,32 @@ from .tool_optimizer import (
     get_tool_optimizer,
 )
 
+from .tracing import (
+    Span,
+    Tracer,
+    InMemorySpanExporter,
+    OTLPJsonFileExporter,
+    get_tracer,
+    reset_tracer,
+    trace_span,
+    spans_to_otlp,
+)
+
+from .hotspots import (
+    ScriptedChatModel,
+    StackSampler,
+    ToolHotspot,
+    HotspotReport,
+    build_tool_registry,
+    run_hotspot_profile,
+)
+
+from .benchmarks import benchmark_memory_models, benchmark_keyword_matching, benchmark_goal_graph
+
 __all__ = [
     # Profiler
     "PerformanceProfiler",
+    "StreamingHistogram",
     "ToolPerformanceTracker",
     "MemoryAccessOptimizer",
     "get_profiler",
@@ -108,15 +143,23 @@ __all__ = [
     # Parallel
     "ParallelExecutor",
     "AsyncToolExecutor",
+    "AsyncTaskExecutor",
+    "run_coroutine_sync",
     "ParallelResult",
+    "LatencyTracker",
+    "get_latency_tracker",
+    "get_parallel_executor",
+    "shutdown_parallel_executors",
     "parallel_map",
     "parallel_specialists",
+    "fan_out_specialists",
     "BatchProcessor",
     "optimize_specialist_delegation",
     # Memory Optimizer
     "OptimizedMemoryManager",
     "LazyLoader",
     "PrefetchManager",
+    "AdaptiveCacheTuner",
     "create_optimized_memory_manager",
     # Tool Optimizer
     "ToolInvocationOptimizer",
@@ -125,4 +168,24 @@ __all__ = [
     "optimized_tool",
     "optimize_tool_call",
     "get_tool_optimizer",
+    # Tracing
+    "Span",
+    "Tracer",
+    "InMemorySpanExporter",
+    "OTLPJsonFileExporter",
+    "get_tracer",
+    "reset_tracer",
+    "trace_span",
+    "spans_to_otlp",
+    # Hotspots
+    "ScriptedChatModel",
+    "StackSampler",
+    "ToolHotspot",
+    "HotspotReport",
+    "build_tool_registry",
+    "run_hotspot_profile",
+    # Benchmarks
+    "benchmark_memory_models",
+    "benchmark_keyword_matching",
+    "benchmark_goal_graph",
 ]
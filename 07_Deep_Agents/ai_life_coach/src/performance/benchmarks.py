@@ -0,0 +1,413 @@
+"""
+Micro-benchmarks for AI Life Coach data structures.
+
+Each benchmark returns a plain dictionary of measurements so it can be used
+from tests, and prints a short table when run from the command line.
+
+Usage:
+    cd src && python -m performance.benchmarks models --count 100000
+    cd src && python -m performance.benchmarks keywords --count 200
+    cd src && python -m performance.benchmarks graph --count 5000
+"""
+
+import argparse
+import gc
+import json
+import random
+import re
+import sys
+import time
+import tracemalloc
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+# Add parent directory to path so memory and tools resolve
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+
+def _timed(func: Callable[[], Any]) -> Tuple[Any, float]:
+    """Run func once (garbage collector paused) and return (result, seconds)."""
+    gc.collect()
+    gc.disable()
+    try:
+        start = time.perf_counter()
+        result = func()
+        return result, time.perf_counter() - start
+    finally:
+        gc.enable()
+
+
+def _allocated(func: Callable[[], Any]) -> Tuple[Any, int]:
+    """Run func under tracemalloc and return (result, bytes still allocated)."""
+    gc.collect()
+    tracemalloc.start()
+    try:
+        result = func()
+        current, _ = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return result, current
+
+
+# ==============================================================================
+# Memory Records
+# ==============================================================================
+
+
+class _PlainGoal:
+    """Goal as a plain __dict__ class; baseline for the slotted record."""
+
+    def __init__(self, **data: Any):
+        self.goal_id = data.get("goal_id")
+        self.title = data.get("title", "")
+        self.description = data.get("description", "")
+        self.domain = data.get("domain", "general")
+        self.priority = data.get("priority", 3)
+        self.status = data.get("status", "pending")
+        self.timeframe = data.get("timeframe", "medium")
+        self.deadline = data.get("deadline")
+        self.dependencies = data.get("dependencies", [])
+        self.created_at = data.get("created_at")
+
+
+def _goal_dicts(count: int) -> List[Dict[str, Any]]:
+    """Stored-form goals with realistic field values."""
+    domains = ["career", "finance", "wellness", "relationship"]
+    return [
+        {
+            "goal_id": f"goal-{i:08d}",
+            "title": f"Goal number {i}",
+            "description": "Build a sustainable habit and track weekly progress",
+            "domain": domains[i % 4],
+            "priority": i % 5 + 1,
+            "status": "in_progress" if i % 3 else "pending",
+            "timeframe": "medium",
+            "deadline": f"2026-{i % 12 + 1:02d}-{i % 28 + 1:02d}",
+            "dependencies": [f"goal-{i - 1:08d}"] if i else [],
+            "created_at": f"2025-{i % 12 + 1:02d}-{i % 28 + 1:02d}T08:{i % 60:02d}:00",
+        }
+        for i in range(count)
+    ]
+
+
+def benchmark_memory_models(count: int = 100_000) -> Dict[str, Any]:
+    """
+    Measure allocation and (de)serialization cost of Goal records.
+
+    Args:
+        count: Number of goals
+
+    Returns:
+        Dictionary of timings (seconds) and allocation sizes (bytes)
+    """
+    from memory import Goal, dumps_json, loads_json, msgspec, orjson
+
+    data = _goal_dicts(count)
+    results: Dict[str, Any] = {"count": count}
+
+    plain, results["plain_bytes"] = _allocated(lambda: [_PlainGoal(**d) for d in data])
+    del plain
+    goals, results["slotted_bytes"] = _allocated(lambda: [Goal.from_dict(d) for d in data])
+
+    _, results["plain_from_dict_s"] = _timed(lambda: [_PlainGoal(**d) for d in data])
+    _, results["from_dict_s"] = _timed(lambda: [Goal.from_dict(d) for d in data])
+    dicts, results["to_dict_s"] = _timed(lambda: [g.to_dict() for g in goals])
+
+    encoded, results["json_encode_s"] = _timed(lambda: json.dumps(dicts))
+    _, results["json_decode_s"] = _timed(lambda: json.loads(encoded))
+    fast, results["fast_encode_s"] = _timed(lambda: dumps_json(dicts))
+    _, results["fast_decode_s"] = _timed(lambda: loads_json(fast))
+    results["fast_codec"] = "orjson" if orjson else "msgspec" if msgspec else "json"
+
+    _, results["datetime_first_s"] = _timed(lambda: [g.created_at_dt for g in goals])
+    _, results["datetime_cached_s"] = _timed(lambda: [g.created_at_dt for g in goals])
+    return results
+
+
+def format_model_benchmark(results: Dict[str, Any]) -> str:
+    """Format benchmark_memory_models() results as a table."""
+    mb = 1024 * 1024
+    rows = [
+        ("Allocated, plain class", f"{results['plain_bytes'] / mb:.1f} MB"),
+        ("Allocated, slotted record", f"{results['slotted_bytes'] / mb:.1f} MB"),
+        ("from_dict, plain class", f"{results['plain_from_dict_s'] * 1000:.1f} ms"),
+        ("from_dict, slotted record", f"{results['from_dict_s'] * 1000:.1f} ms"),
+        ("to_dict", f"{results['to_dict_s'] * 1000:.1f} ms"),
+        ("JSON encode (json)", f"{results['json_encode_s'] * 1000:.1f} ms"),
+        ("JSON decode (json)", f"{results['json_decode_s'] * 1000:.1f} ms"),
+        (f"JSON encode ({results['fast_codec']})", f"{results['fast_encode_s'] * 1000:.1f} ms"),
+        (f"JSON decode ({results['fast_codec']})", f"{results['fast_decode_s'] * 1000:.1f} ms"),
+        ("created_at_dt, first access", f"{results['datetime_first_s'] * 1000:.1f} ms"),
+        ("created_at_dt, cached", f"{results['datetime_cached_s'] * 1000:.1f} ms"),
+    ]
+    lines = [f"Memory records: {results['count']:,} goals", "-" * 50]
+    lines.extend(f"{label:<36}{value:>14}" for label, value in rows)
+    return "\n".join(lines)
+
+
+# ==============================================================================
+# Keyword Matching
+# ==============================================================================
+
+# Everyday journal vocabulary mixed with the occasional keyword
+_JOURNAL_FILLER = (
+    "today i went to work and the meeting about the project ran long "
+    "after lunch we took a walk with the team then i cooked dinner "
+    "my sister called and we talked about the weekend plans for the family"
+).split()
+_JOURNAL_KEYWORDS = (
+    "happy tired stressed progress struggled learned grateful overwhelmed "
+    "hard difficult calm proud better give up frustrated"
+).split()
+
+
+def _journal_entries(count: int, words: int, seed: int = 42) -> List[str]:
+    """Deterministic long journal entries (~6 characters per word)."""
+    rng = random.Random(seed)
+    entries = []
+    for _ in range(count):
+        tokens = [
+            rng.choice(_JOURNAL_KEYWORDS) if rng.random() < 0.05 else rng.choice(_JOURNAL_FILLER)
+            for _ in range(words)
+        ]
+        entries.append(" ".join(tokens).capitalize() + ".")
+    return entries
+
+
+def _scan_per_keyword(text: str, keywords: List[str], whole_words: bool) -> int:
+    """Baseline: one substring search (plus a regex count) per keyword."""
+    text_lower = text.lower()
+    found = 0
+    for keyword in keywords:
+        if keyword in text_lower:
+            if whole_words:
+                found += len(re.findall(r"\b" + re.escape(keyword) + r"\b", text_lower))
+            else:
+                found += 1
+    return found
+
+
+def benchmark_keyword_matching(count: int = 200, words: int = 2000) -> Dict[str, Any]:
+    """
+    Compare per-keyword scanning with the compiled keyword matchers.
+
+    Measures the sentiment (mood), reflection and crisis keyword sets on long
+    journal entries, then how both approaches scale with the number of
+    keywords using synthetic keyword sets.
+
+    Args:
+        count: Number of journal entries
+        words: Words per entry
+
+    Returns:
+        Dictionary of timings (seconds) and match counts
+    """
+    from tools.emergency_tools import CRISIS_KEYWORDS, CRISIS_MATCHER
+    from tools.keyword_matcher import KeywordMatcher
+    from tools.mood_tools import SENTIMENT_KEYWORDS, SENTIMENT_MATCHER
+    from tools.reflection_tools import REFLECTION_MATCHER, REFLECTION_SENTIMENT_KEYWORDS
+
+    entries = _journal_entries(count, words)
+    results: Dict[str, Any] = {
+        "count": count,
+        "words": words,
+        "chars": sum(len(e) for e in entries) // max(count, 1),
+    }
+
+    keyword_sets = {
+        "sentiment": ([k for ks in SENTIMENT_KEYWORDS.values() for k in ks], True),
+        "reflection": ([k for ks in REFLECTION_SENTIMENT_KEYWORDS.values() for k in ks], False),
+        "crisis": (
+            [k for levels in CRISIS_KEYWORDS.values() for ks in levels.values() for k in ks],
+            False,
+        ),
+    }
+    matchers = {
+        "sentiment": SENTIMENT_MATCHER,
+        "reflection": REFLECTION_MATCHER,
+        "crisis": CRISIS_MATCHER,
+    }
+    for name, (keywords, whole_words) in keyword_sets.items():
+        matcher = matchers[name]
+        results[f"{name}_keywords"] = len(keywords)
+        found, results[f"{name}_naive_s"] = _timed(
+            lambda: [_scan_per_keyword(e, keywords, whole_words) for e in entries]
+        )
+        matches, results[f"{name}_matcher_s"] = _timed(
+            lambda: [matcher.find_all(e) for e in entries]
+        )
+        results[f"{name}_naive_matches"] = sum(found)
+        results[f"{name}_matcher_matches"] = sum(len(m) for m in matches)
+
+    # Scaling with the number of keywords (synthetic, mostly absent keywords)
+    rng = random.Random(7)
+    sample = entries[: max(1, count // 10)]
+    results["scaling"] = []
+    for size in (100, 1000):
+        keywords = [
+            "".join(rng.choice("abcdefghijklmnopqrstuvwxyz") for _ in range(rng.randint(4, 9)))
+            for _ in range(size)
+        ]
+        matcher = KeywordMatcher.from_keywords({"synthetic": keywords}, boundary="word")
+        _, naive_s = _timed(lambda: [_scan_per_keyword(e, keywords, True) for e in sample])
+        _, matcher_s = _timed(lambda: [matcher.find_all(e) for e in sample])
+        results["scaling"].append(
+            {"keywords": size, "entries": len(sample), "naive_s": naive_s, "matcher_s": matcher_s}
+        )
+    return results
+
+
+def format_keyword_benchmark(results: Dict[str, Any]) -> str:
+    """Format benchmark_keyword_matching() results as a table."""
+    lines = [
+        f"Keyword matching: {results['count']:,} entries x {results['words']:,} words "
+        f"(~{results['chars']:,} chars)",
+        "-" * 66,
+        f"{'Keyword set':<24}{'Keywords':>9}{'Per keyword':>14}{'Matcher':>11}{'Matches':>8}",
+    ]
+    for name in ("sentiment", "reflection", "crisis"):
+        lines.append(
+            f"{name:<24}{results[f'{name}_keywords']:>9}"
+            f"{results[f'{name}_naive_s'] * 1000:>11.1f} ms"
+            f"{results[f'{name}_matcher_s'] * 1000:>8.1f} ms"
+            f"{results[f'{name}_matcher_matches']:>8}"
+        )
+    for row in results["scaling"]:
+        label = f"synthetic ({row['entries']} entries)"
+        lines.append(
+            f"{label:<24}{row['keywords']:>9}{row['naive_s'] * 1000:>11.1f} ms"
+            f"{row['matcher_s'] * 1000:>8.1f} ms{'':>8}"
+        )
+    return "\n".join(lines)
+
+
+# ==============================================================================
+# Goal Dependency Graph
+# ==============================================================================
+
+_EDGE_TYPES = ("enables", "requires", "supports", "conflicts")
+
+
+def _goal_graph(graph_cls: type, goals: int, edges: int, seed: int = 11) -> Any:
+    """Random goal graph; edges only point forward, so it stays acyclic."""
+    from tools.goal_dependency_tools import DependencyEdge, GoalNode
+
+    rng = random.Random(seed)
+    graph = graph_cls()
+    for i in range(goals):
+        graph.add_goal(
+            GoalNode(f"goal_{i}", "career", f"Goal {i}", estimated_effort=rng.randint(1, 20))
+        )
+    for _ in range(edges):
+        source = rng.randrange(goals - 1)
+        target = rng.randrange(source + 1, goals)
+        graph.add_dependency(
+            DependencyEdge(
+                f"goal_{source}", f"goal_{target}", rng.choice(_EDGE_TYPES), rng.random()
+            )
+        )
+    return graph
+
+
+def benchmark_goal_graph(count: int = 5000, edges_per_goal: int = 10) -> Dict[str, Any]:
+    """
+    Compare indexed and scanning edge lookups in GoalDependencyGraph.
+
+    detect_cycles() and simulate_impact() call get_dependents() once per goal
+    they visit. Scanning the edge list on every call makes a traversal
+    O(V x E), too slow to run in full at this size, so the scanning cost is
+    estimated as (calls made by the traversal) x (mean cost of one scanning
+    lookup, sampled over 50 goals).
+
+    Args:
+        count: Number of goals
+        edges_per_goal: Edges per goal (5,000 goals -> 50,000 edges)
+
+    Returns:
+        Dictionary of timings (seconds) and traversal sizes
+    """
+    from tools.goal_dependency_tools import GoalDependencyGraph
+
+    class CountingGraph(GoalDependencyGraph):
+        """Indexed graph that counts edge lookups."""
+
+        calls = 0
+
+        def get_dependents(self, goal_id, relationship_type=None):
+            CountingGraph.calls += 1
+            return super().get_dependents(goal_id, relationship_type)
+
+    def scan_dependents(graph, goal_id):
+        """Baseline: the full edge-list scan get_dependents() used to do."""
+        return [e for e in graph.edges if e.from_goal_id == goal_id]
+
+    edges = count * edges_per_goal
+    graph, build_s = _timed(lambda: _goal_graph(CountingGraph, count, edges))
+    results: Dict[str, Any] = {"goals": count, "edges": len(graph.edges), "build_s": build_s}
+
+    sample = [f"goal_{i}" for i in random.Random(3).sample(range(count), min(50, count))]
+    _, scan_s = _timed(lambda: [scan_dependents(graph, goal_id) for goal_id in sample])
+    results["scan_lookup_s"] = scan_s / len(sample)
+
+    traversals = {
+        "detect_cycles": lambda: graph.detect_cycles(),
+        "impact_success": lambda: graph.simulate_impact("goal_0", "success"),
+        "impact_failure": lambda: graph.simulate_impact("goal_0", "failure"),
+    }
+    for name, run in traversals.items():
+        CountingGraph.calls = 0
+        output, results[f"{name}_indexed_s"] = _timed(run)
+        results[f"{name}_lookups"] = CountingGraph.calls
+        results[f"{name}_scan_s"] = CountingGraph.calls * results["scan_lookup_s"]
+        results[f"{name}_result"] = (
+            len(output) if isinstance(output, list) else sum(len(v) for v in output.values())
+        )
+    return results
+
+
+def format_goal_graph_benchmark(results: Dict[str, Any]) -> str:
+    """Format benchmark_goal_graph() results as a table."""
+    lines = [
+        f"Goal dependency graph: {results['goals']:,} goals, {results['edges']:,} edges "
+        f"(built in {results['build_s'] * 1000:.0f} ms)",
+        "-" * 66,
+        f"{'Traversal':<18}{'Lookups':>9}{'Scanning (est.)':>18}{'Indexed':>11}{'Result':>10}",
+    ]
+    for name in ("detect_cycles", "impact_success", "impact_failure"):
+        lines.append(
+            f"{name:<18}{results[f'{name}_lookups']:>9,}"
+            f"{results[f'{name}_scan_s']:>16.1f} s"
+            f"{results[f'{name}_indexed_s'] * 1000:>8.1f} ms"
+            f"{results[f'{name}_result']:>10,}"
+        )
+    lines.append(f"Scanning lookup: {results['scan_lookup_s'] * 1000:.2f} ms per call (sampled)")
+    return "\n".join(lines)
+
+
+# ==============================================================================
+# Command Line
+# ==============================================================================
+
+BENCHMARKS: Dict[str, Tuple[Callable[..., Dict[str, Any]], Callable[[Dict[str, Any]], str]]] = {
+    "models": (benchmark_memory_models, format_model_benchmark),
+    "keywords": (benchmark_keyword_matching, format_keyword_benchmark),
+    "graph": (benchmark_goal_graph, format_goal_graph_benchmark),
+}
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """Command-line entry point."""
+    parser = argparse.ArgumentParser(description="Run AI Life Coach micro-benchmarks.")
+    parser.add_argument("benchmark", choices=sorted(BENCHMARKS), help="Benchmark to run")
+    parser.add_argument(
+        "--count", type=int, help="Number of records (defaults to the benchmark's own)"
+    )
+    args = parser.parse_args(argv)
+
+    run, fmt = BENCHMARKS[args.benchmark]
+    print(fmt(run() if args.count is None else run(args.count)))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -26,6 +26,7 @@ class CacheEntry:
     timestamp: float = field(default_factory=time.time)
     access_count: int = 0
     last_access: float = field(default_factory=time.time)
+    ttl: Optional[float] = None  # Per-entry TTL; None follows the cache default
 
 
 class TimedCache:
@@ -48,10 +49,12 @@ class TimedCache:
         self._cache: Dict[str, CacheEntry] = {}
         self._hits = 0
         self._misses = 0
+        self._evictions = 0
 
     def _is_expired(self, entry: CacheEntry) -> bool:
         """Check if a cache entry has expired."""
-        return time.time() - entry.timestamp > self.default_ttl
+        ttl = entry.ttl if entry.ttl is not None else self.default_ttl
+        return time.time() - entry.timestamp > ttl
 
     def _evict_expired(self):
         """Remove expired entries from the cache."""
@@ -68,6 +71,7 @@ class TimedCache:
             to_remove = max(1, len(sorted_items) // 10)
             for key, _ in sorted_items[:to_remove]:
                 del self._cache[key]
+            self._evictions += to_remove
 
     def get(self, key: str) -> Optional[Any]:
         """
@@ -111,10 +115,25 @@ class TimedCache:
         self._evict_lru()
 
         entry = CacheEntry(
-            value=value, timestamp=time.time(), access_count=0, last_access=time.time()
+            value=value, timestamp=time.time(), access_count=0, last_access=time.time(), ttl=ttl
         )
         self._cache[key] = entry
 
+    def resize(self, max_size: int):
+        """
+        Change the maximum size, evicting least recently used entries if needed.
+
+        Args:
+            max_size: New maximum number of entries
+        """
+        self.max_size = max_size
+        if len(self._cache) > max_size:
+            sorted_items = sorted(self._cache.items(), key=lambda x: x[1].last_access)
+            to_remove = len(self._cache) - max_size
+            for key, _ in sorted_items[:to_remove]:
+                del self._cache[key]
+            self._evictions += to_remove
+
     def delete(self, key: str) -> bool:
         """
         Delete a key from the cache.
@@ -135,6 +154,7 @@ class TimedCache:
         self._cache.clear()
         self._hits = 0
         self._misses = 0
+        self._evictions = 0
 
     def get_stats(self) -> Dict[str, Any]:
         """
@@ -149,8 +169,10 @@ class TimedCache:
         return {
             "size": len(self._cache),
             "max_size": self.max_size,
+            "default_ttl": self.default_ttl,
             "hits": self._hits,
             "misses": self._misses,
+            "evictions": self._evictions,
             "hit_rate": hit_rate,
             "hit_rate_percent": hit_rate * 100,
         }
@@ -184,6 +206,9 @@ class MemoryCacheManager:
         # Calculated results cache - for expensive calculations
         self.calculation_cache = TimedCache(default_ttl=60.0, max_size=5000)  # 1 min TTL
 
+        # Session data cache - check-ins, mood history, habits preloaded per session
+        self.session_cache = TimedCache(default_ttl=900.0, max_size=1000)  # 15 min TTL
+
     def get_profile(self, user_id: str) -> Optional[Any]:
         """Get cached user profile."""
         return self.profile_cache.get(f"profile:{user_id}")
@@ -224,10 +249,39 @@ class MemoryCacheManager:
         """Cache calculation result."""
         self.calculation_cache.set(f"calc:{calc_key}", result)
 
+    def get_user_data(self, data_type: str, user_id: str) -> Optional[Any]:
+        """Get cached per-user session data (e.g. "checkins", "moods", "habits")."""
+        return self.session_cache.get(f"{data_type}:{user_id}")
+
+    def set_user_data(self, data_type: str, user_id: str, data: Any):
+        """Cache per-user session data."""
+        self.session_cache.set(f"{data_type}:{user_id}", data)
+
+    def invalidate_user_data(self, user_id: str, data_type: Optional[str] = None):
+        """Invalidate one (or every) type of cached session data for a user."""
+        if data_type is not None:
+            self.session_cache.delete(f"{data_type}:{user_id}")
+            return
+        suffix = f":{user_id}"
+        for key in self.session_cache.get_keys():
+            if key.endswith(suffix):
+                self.session_cache.delete(key)
+
+    def get_caches(self) -> Dict[str, TimedCache]:
+        """Get the managed caches by name."""
+        return {
+            "profile": self.profile_cache,
+            "goals": self.goals_cache,
+            "tool": self.tool_cache,
+            "calculation": self.calculation_cache,
+            "session": self.session_cache,
+        }
+
     def invalidate_user(self, user_id: str):
         """Invalidate all cached data for a user."""
         self.invalidate_profile(user_id)
         self.invalidate_goals(user_id)
+        self.invalidate_user_data(user_id)
 
     def clear_all(self):
         """Clear all caches."""
@@ -235,6 +289,7 @@ class MemoryCacheManager:
         self.goals_cache.clear()
         self.tool_cache.clear()
         self.calculation_cache.clear()
+        self.session_cache.clear()
 
     def get_all_stats(self) -> Dict[str, Dict[str, Any]]:
         """Get statistics for all caches."""
@@ -243,6 +298,7 @@ class MemoryCacheManager:
             "goals_cache": self.goals_cache.get_stats(),
             "tool_cache": self.tool_cache.get_stats(),
             "calculation_cache": self.calculation_cache.get_stats(),
+            "session_cache": self.session_cache.get_stats(),
         }
 
     def print_stats(self):
@@ -255,6 +311,7 @@ class MemoryCacheManager:
         for cache_name, cache_stats in stats.items():
             print(f"\n{cache_name}:")
             print(f"  Size: {cache_stats['size']}/{cache_stats['max_size']}")
+            print(f"  TTL: {cache_stats['default_ttl']:.0f}s")
             print(f"  Hits: {cache_stats['hits']}")
             print(f"  Misses: {cache_stats['misses']}")
             print(f"  Hit Rate: {cache_stats['hit_rate_percent']:.1f}%")
@@ -0,0 +1,580 @@
+"""
+Hotspot profiling for AI Life Coach tools.
+
+This module replays a scripted coaching session offline - a scripted chat model
+emits the tool calls an agent would make - and profiles the tool layer while it
+runs. It produces:
+
+- Collapsed stacks (``a;b;c <count>``) from a stack sampler, ready for
+  flamegraph.pl, speedscope or inferno
+- A ranked table of tools by cumulative time and memory allocated (tracemalloc)
+
+Usage:
+    cd src && python -m performance.hotspots --iterations 3 --output-dir perf_reports
+"""
+
+import argparse
+import importlib
+import os
+import sys
+import tempfile
+import threading
+import time
+import tracemalloc
+from collections import defaultdict
+from dataclasses import dataclass, field
+from pathlib import Path
+from types import SimpleNamespace
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple
+
+# Add parent directory to path so tool modules resolve their imports
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+SCENARIO_USER_ID = "hotspot_user"
+
+# (module, factory, dependency) for every tool module; dependency is the
+# argument the factory expects: "backend", "store" or None
+TOOL_FACTORIES: List[Tuple[str, str, Optional[str]]] = [
+    ("memory_tools", "create_memory_tools", "store"),
+    ("user_tools", "create_user_tools", "store"),
+    ("planning_tools", "create_planning_tools", None),
+    ("context_tools", "create_context_tools", "backend"),
+    ("assessment_tools", "create_assessment_tools", "backend"),
+    ("career_tools", "create_career_tools", "backend"),
+    ("relationship_tools", "create_relationship_tools", "backend"),
+    ("finance_tools", "create_finance_tools", "backend"),
+    ("wellness_tools", "create_wellness_tools", "backend"),
+    ("habit_tools", "create_habit_tools", "backend"),
+    ("mood_tools", "create_mood_tools", "backend"),
+    ("checkin_tools", "create_checkin_tools", "backend"),
+    ("reflection_tools", "create_reflection_tools", "backend"),
+    ("dashboard_tools", "create_dashboard_tools", "backend"),
+    ("goal_dependency_tools", "create_goal_dependency_tools", "backend"),
+    ("cross_domain_tools", "create_cross_domain_tools", "backend"),
+    ("emergency_tools", "create_emergency_tools", "backend"),
+    ("adaptive_tools", "create_adaptive_tools", "backend"),
+    ("communication_tools", "create_communication_tools", "backend"),
+    ("integration_tools", "create_integration_tools", "backend"),
+    ("phase_planning_tools", "create_phase_planning_tools", "backend"),
+    ("resource_tools", "create_resource_tools", "backend"),
+    ("viz_tools", "create_viz_tools", "backend"),
+]
+
+
+def _default_scenario(user_id: str = SCENARIO_USER_ID) -> List[Dict[str, Any]]:
+    """
+    Build the default scripted session.
+
+    Each turn has a user message, the tool calls the model makes in response
+    and the model's final reply.
+    """
+    goals = [
+        {"id": "career_1", "domain": "career", "title": "Get promoted", "priority": 1},
+        {"id": "finance_1", "domain": "finance", "title": "Build emergency fund", "priority": 2},
+        {"id": "wellness_1", "domain": "wellness", "title": "Exercise 3x per week", "priority": 2},
+        {"id": "relationship_1", "domain": "relationships", "title": "Weekly date night"},
+    ]
+    dependencies = [
+        {"from_goal_id": "wellness_1", "to_goal_id": "career_1", "relationship_type": "enables"},
+        {"from_goal_id": "career_1", "to_goal_id": "finance_1", "relationship_type": "enables"},
+    ]
+    checkin = {
+        "career_goals_completed": 60,
+        "relationship_goals_completed": 75,
+        "finance_goals_completed": 50,
+        "wellness_goals_completed": 80,
+        "average_mood": 7,
+        "average_energy": 6,
+        "stress_level": 5,
+        "sleep_quality": 7,
+        "primary_obstacles": "Long hours at work",
+        "obstacle_severity": 4,
+        "key_achievements": "Finished the quarterly review",
+    }
+    return [
+        {
+            "user": "Hi, I want to build better habits and feel less stressed.",
+            "tool_calls": [
+                ("save_user_preference", {"user_id": user_id, "key": "style", "value": "direct"}),
+                ("get_user_profile", {"user_id": user_id}),
+                ("create_habit", {"user_id": user_id, "name": "Morning walk", "domain": "health"}),
+                (
+                    "create_habit",
+                    {"user_id": user_id, "name": "Read 20 pages", "domain": "personal_growth"},
+                ),
+                ("create_habit", {"user_id": user_id, "name": "Budget", "domain": "finance"}),
+                ("list_habits", {"user_id": user_id}),
+            ],
+            "response": "Great start - I've set up three habits for you.",
+        },
+        {
+            "user": "I'm feeling tired but hopeful about work this week.",
+            "tool_calls": [
+                ("analyze_text_sentiment", {"text": "I'm feeling tired but hopeful about work"}),
+                ("analyze_crisis_risk", {"user_message": "I'm tired but hopeful about work"}),
+                (
+                    "log_mood_entry",
+                    {
+                        "user_id": user_id,
+                        "mood_dimensions": {
+                            "happiness": 6,
+                            "stress": 5,
+                            "energy": 4,
+                            "motivation": 7,
+                        },
+                    },
+                ),
+                ("get_mood_history", {"user_id": user_id, "days": 30}),
+                ("detect_mood_triggers", {"user_id": user_id}),
+            ],
+            "response": "Thanks for sharing - your motivation is holding up well.",
+        },
+        {
+            "user": "Here's my weekly check-in.",
+            "tool_calls": [
+                ("conduct_weekly_checkin", {"user_id": user_id, "responses": checkin}),
+                ("calculate_progress_score", {"user_id": user_id}),
+                ("analyze_weekly_trends", {"user_id": user_id, "weeks": 4}),
+                ("generate_adaptation_recommendations", {"user_id": user_id}),
+            ],
+            "response": "Solid week. Let's adjust your finance goals slightly.",
+        },
+        {
+            "user": "How do my goals fit together?",
+            "tool_calls": [
+                (
+                    "build_goal_dependency_graph",
+                    {"user_id": user_id, "goals": goals, "dependencies": dependencies},
+                ),
+                ("find_critical_path", {"user_id": user_id}),
+                (
+                    "simulate_goal_impact",
+                    {"user_id": user_id, "goal_id": "wellness_1", "outcome": "success"},
+                ),
+                ("detect_goal_conflicts", {"user_id": user_id}),
+            ],
+            "response": "Exercise unlocks your career goal, which unlocks your savings.",
+        },
+        {
+            "user": "Show me where I stand and help me reflect.",
+            "tool_calls": [
+                ("get_habit_streaks", {"user_id": user_id}),
+                ("calculate_habit_strength_score", {"user_id": user_id}),
+                ("render_progress_dashboard", {"user_id": user_id}),
+                ("generate_weekly_reflection_prompts", {"user_id": user_id}),
+                (
+                    "save_reflection_response",
+                    {
+                        "user_id": user_id,
+                        "prompt_category": "wins",
+                        "prompt_text": "What went well this week?",
+                        "response_text": "I walked every morning and felt more focused.",
+                    },
+                ),
+                ("extract_insights_from_reflections", {"user_id": user_id}),
+            ],
+            "response": "Here's your dashboard and a few prompts to reflect on.",
+        },
+    ]
+
+
+class ScriptedChatModel:
+    """
+    Offline chat model that replays a fixed script.
+
+    For each turn it first answers with the turn's tool calls and, once the
+    tool results are in, with the turn's final reply - the same message
+    sequence a tool-calling LLM produces, without any network access.
+    """
+
+    def __init__(self, scenario: List[Dict[str, Any]]):
+        self._messages: Iterator[Dict[str, Any]] = self._script(scenario)
+
+    @staticmethod
+    def _script(scenario: List[Dict[str, Any]]) -> Iterator[Dict[str, Any]]:
+        call_id = 0
+        for turn in scenario:
+            tool_calls = []
+            for name, args in turn.get("tool_calls", []):
+                call_id += 1
+                tool_calls.append({"name": name, "args": args, "id": f"call_{call_id}"})
+            if tool_calls:
+                yield {"role": "assistant", "content": "", "tool_calls": tool_calls}
+            yield {"role": "assistant", "content": turn.get("response", ""), "tool_calls": []}
+
+    def invoke(self, messages: List[Dict[str, Any]]) -> Dict[str, Any]:
+        """Return the next scripted assistant message."""
+        try:
+            return next(self._messages)
+        except StopIteration:
+            return {"role": "assistant", "content": "", "tool_calls": []}
+
+
+@dataclass
+class ToolHotspot:
+    """Aggregated cost of one tool across the scenario."""
+
+    name: str
+    calls: int = 0
+    errors: int = 0
+    total_time: float = 0.0
+    peak_alloc_bytes: int = 0  # Largest peak allocation during a single call
+    total_alloc_bytes: int = 0  # Sum of per-call peak allocations
+
+    @property
+    def avg_time(self) -> float:
+        """Average time per call in seconds."""
+        return self.total_time / self.calls if self.calls else 0.0
+
+
+@dataclass
+class HotspotReport:
+    """Result of a hotspot profiling run."""
+
+    tool_stats: Dict[str, ToolHotspot]
+    stack_counts: Dict[str, int]
+    wall_time: float
+    sample_interval: float
+    skipped_modules: Dict[str, str] = field(default_factory=dict)
+    missing_tools: List[str] = field(default_factory=list)
+
+    def ranked_tools(self, by: str = "total_time") -> List[ToolHotspot]:
+        """
+        Rank tools by a ToolHotspot attribute (descending).
+
+        Args:
+            by: "total_time", "avg_time", "total_alloc_bytes", "peak_alloc_bytes" or "calls"
+
+        Returns:
+            List of ToolHotspot, most expensive first
+        """
+        return sorted(self.tool_stats.values(), key=lambda s: getattr(s, by), reverse=True)
+
+    def collapsed_stacks(self) -> str:
+        """Render samples in collapsed-stack format for flame graph tools."""
+        return "".join(f"{stack} {count}\n" for stack, count in sorted(self.stack_counts.items()))
+
+    def format_table(self, limit: int = 30) -> str:
+        """Render the ranked tool table."""
+        lines = []
+        lines.append("=" * 90)
+        lines.append("TOOL HOTSPOTS (ranked by cumulative time)")
+        lines.append("=" * 90)
+        lines.append(
+            f"Wall time: {self.wall_time:.3f}s, "
+            f"{sum(self.stack_counts.values())} stack samples "
+            f"@ {self.sample_interval * 1000:.1f}ms"
+        )
+        lines.append("")
+        lines.append(
+            f"{'Tool':<40} {'Calls':>6} {'Errors':>6} {'Total (ms)':>11} "
+            f"{'Avg (ms)':>9} {'Alloc (KiB)':>12}"
+        )
+        lines.append("-" * 90)
+        for stat in self.ranked_tools()[:limit]:
+            lines.append(
+                f"{stat.name:<40} {stat.calls:>6} {stat.errors:>6} "
+                f"{stat.total_time * 1000:>11.2f} {stat.avg_time * 1000:>9.2f} "
+                f"{stat.total_alloc_bytes / 1024:>12.1f}"
+            )
+        if self.missing_tools:
+            lines.append("")
+            lines.append(f"Scripted tools not available: {', '.join(sorted(self.missing_tools))}")
+        if self.skipped_modules:
+            lines.append("")
+            lines.append("Skipped tool modules:")
+            for module, reason in sorted(self.skipped_modules.items()):
+                lines.append(f"  {module}: {reason}")
+        lines.append("=" * 90)
+        return "\n".join(lines)
+
+    def save(self, output_dir: str) -> Dict[str, str]:
+        """
+        Write ``hotspots.collapsed`` and ``hotspots.txt`` to a directory.
+
+        Args:
+            output_dir: Directory to write into (created if missing)
+
+        Returns:
+            Dictionary of {"collapsed": path, "table": path}
+        """
+        os.makedirs(output_dir, exist_ok=True)
+        paths = {
+            "collapsed": os.path.join(output_dir, "hotspots.collapsed"),
+            "table": os.path.join(output_dir, "hotspots.txt"),
+        }
+        with open(paths["collapsed"], "w") as f:
+            f.write(self.collapsed_stacks())
+        with open(paths["table"], "w") as f:
+            f.write(self.format_table(limit=len(self.tool_stats)) + "\n")
+        return paths
+
+
+class StackSampler:
+    """
+    Periodically samples one thread's Python stack.
+
+    Samples are folded into ``root;...;leaf`` strings with counts, which is the
+    collapsed-stack input format for flame graphs.
+    """
+
+    def __init__(self, interval: float = 0.001, thread_id: Optional[int] = None):
+        """
+        Initialize sampler.
+
+        Args:
+            interval: Seconds between samples
+            thread_id: Thread to sample (defaults to the thread calling start())
+        """
+        self.interval = interval
+        self.thread_id = thread_id
+        self.counts: Dict[str, int] = defaultdict(int)
+        self._labels: Dict[Any, str] = {}
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def start(self):
+        """Start sampling in a background thread."""
+        if self.thread_id is None:
+            self.thread_id = threading.get_ident()
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._run, name="stack-sampler", daemon=True)
+        self._thread.start()
+
+    def stop(self):
+        """Stop sampling."""
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+
+    def _label(self, code) -> str:
+        """Frame label as "module:qualname", cached per code object."""
+        label = self._labels.get(code)
+        if label is None:
+            module = Path(code.co_filename).stem
+            label = f"{module}:{getattr(code, 'co_qualname', code.co_name)}"
+            self._labels[code] = label
+        return label
+
+    def _run(self):
+        while not self._stop.wait(self.interval):
+            frame = sys._current_frames().get(self.thread_id)
+            stack = []
+            while frame is not None:
+                stack.append(self._label(frame.f_code))
+                frame = frame.f_back
+            if stack:
+                self.counts[";".join(reversed(stack))] += 1
+
+
+def _offline_backend(workspace: str) -> Any:
+    """
+    Path-only backend rooted at a scratch workspace.
+
+    The file-backed tools locate their files through ``root_dir`` (or
+    ``workspace`` for older dashboard code) and fall back to ./workspace
+    without it, so this exposes both rather than a deepagents
+    FilesystemBackend, which keeps its root private.
+    """
+    return SimpleNamespace(root_dir=workspace, workspace=Path(workspace))
+
+
+def build_tool_registry(workspace: str) -> Tuple[Dict[str, Any], Dict[str, str]]:
+    """
+    Create every tool module against an offline workspace.
+
+    Args:
+        workspace: Scratch directory for file-backed tools
+
+    Returns:
+        Tuple of ({tool_name: tool}, {module: reason} for modules that failed)
+    """
+    backend = _offline_backend(workspace)
+    store = None
+    registry: Dict[str, Any] = {}
+    skipped: Dict[str, str] = {}
+
+    for module_name, factory_name, dependency in TOOL_FACTORIES:
+        try:
+            module = importlib.import_module(f"tools.{module_name}")
+            factory = getattr(module, factory_name)
+            if dependency == "store":
+                if store is None:
+                    from memory import create_memory_store
+
+                    store = create_memory_store()
+                tools = factory(store)
+            elif dependency == "backend":
+                tools = factory(backend=backend)
+            else:
+                tools = factory()
+        except Exception as e:
+            skipped[module_name] = f"{type(e).__name__}: {e}"
+            continue
+
+        for tool in tools:
+            name = getattr(tool, "name", None) or getattr(tool, "__name__", str(tool))
+            # First module wins on duplicate names (e.g. build_goal_dependency_graph)
+            registry.setdefault(name, tool)
+
+    return registry, skipped
+
+
+def _invoke_tool(tool: Any, args: Dict[str, Any]) -> Any:
+    """Call a LangChain tool or a plain function with keyword arguments."""
+    if hasattr(tool, "invoke"):
+        return tool.invoke(args)
+    return tool(**args)
+
+
+def run_hotspot_profile(
+    scenario: Optional[List[Dict[str, Any]]] = None,
+    tools: Optional[Dict[str, Callable]] = None,
+    iterations: int = 1,
+    sample_interval: float = 0.001,
+    trace_allocations: bool = True,
+    workspace: Optional[str] = None,
+) -> HotspotReport:
+    """
+    Replay a scripted coaching session and profile the tool calls.
+
+    Args:
+        scenario: Turns of {"user", "tool_calls": [(name, args)], "response"};
+            defaults to a session touching habits, mood, check-ins, goals,
+            reflections and the dashboard
+        tools: Tool registry {name: tool}; defaults to all tool modules
+            built against a scratch workspace
+        iterations: Number of times to replay the scenario (data accumulates)
+        sample_interval: Seconds between stack samples
+        trace_allocations: Measure per-call allocations with tracemalloc
+        workspace: Workspace directory for the default registry (temporary if None)
+
+    Returns:
+        HotspotReport with ranked tool costs and collapsed stacks
+
+    Example:
+        >>> report = run_hotspot_profile(iterations=3)
+        >>> print(report.format_table(limit=10))
+    """
+    scenario = scenario if scenario is not None else _default_scenario()
+    skipped: Dict[str, str] = {}
+    temp_dir = None
+    if tools is None:
+        if workspace is None:
+            temp_dir = tempfile.TemporaryDirectory(prefix="life_coach_hotspots_")
+            workspace = temp_dir.name
+        tools, skipped = build_tool_registry(workspace)
+
+    stats: Dict[str, ToolHotspot] = {}
+    missing = set()
+    sampler = StackSampler(interval=sample_interval)
+    started_tracemalloc = trace_allocations and not tracemalloc.is_tracing()
+    if started_tracemalloc:
+        tracemalloc.start()
+
+    start = time.perf_counter()
+    sampler.start()
+    try:
+        for _ in range(iterations):
+            model = ScriptedChatModel(scenario)
+            for turn in scenario:
+                messages: List[Dict[str, Any]] = [{"role": "user", "content": turn.get("user", "")}]
+                reply = model.invoke(messages)
+                while reply["tool_calls"]:
+                    messages.append(reply)
+                    for call in reply["tool_calls"]:
+                        output = _profile_tool_call(
+                            tools, call["name"], call["args"], stats, missing, trace_allocations
+                        )
+                        messages.append(
+                            {"role": "tool", "content": str(output), "tool_call_id": call["id"]}
+                        )
+                    reply = model.invoke(messages)
+    finally:
+        sampler.stop()
+        wall_time = time.perf_counter() - start
+        if started_tracemalloc:
+            tracemalloc.stop()
+        if temp_dir is not None:
+            temp_dir.cleanup()
+
+    return HotspotReport(
+        tool_stats=stats,
+        stack_counts=dict(sampler.counts),
+        wall_time=wall_time,
+        sample_interval=sample_interval,
+        skipped_modules=skipped,
+        missing_tools=sorted(missing),
+    )
+
+
+def _profile_tool_call(
+    tools: Dict[str, Any],
+    name: str,
+    args: Dict[str, Any],
+    stats: Dict[str, ToolHotspot],
+    missing: set,
+    trace_allocations: bool,
+) -> Any:
+    """Dispatch one tool call, recording its time and allocations."""
+    tool = tools.get(name)
+    if tool is None:
+        missing.add(name)
+        return f"Error: unknown tool {name}"
+
+    stat = stats.get(name)
+    if stat is None:
+        stat = stats[name] = ToolHotspot(name=name)
+
+    if trace_allocations:
+        tracemalloc.reset_peak()
+        baseline = tracemalloc.get_traced_memory()[0]
+
+    start = time.perf_counter()
+    try:
+        output = _invoke_tool(tool, args)
+    except Exception as e:
+        stat.errors += 1
+        output = f"Error: {e}"
+    stat.total_time += time.perf_counter() - start
+    stat.calls += 1
+
+    if trace_allocations:
+        allocated = max(0, tracemalloc.get_traced_memory()[1] - baseline)
+        stat.total_alloc_bytes += allocated
+        stat.peak_alloc_bytes = max(stat.peak_alloc_bytes, allocated)
+
+    return output
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """Command-line entry point."""
+    parser = argparse.ArgumentParser(
+        description="Profile AI Life Coach tools with a scripted offline session."
+    )
+    parser.add_argument("--iterations", type=int, default=3, help="Scenario replays")
+    parser.add_argument("--interval", type=float, default=0.001, help="Sample interval (s)")
+    parser.add_argument("--output-dir", default="perf_reports", help="Where to write reports")
+    parser.add_argument("--limit", type=int, default=30, help="Rows in the printed table")
+    parser.add_argument(
+        "--no-allocations", action="store_true", help="Skip tracemalloc (lower overhead)"
+    )
+    args = parser.parse_args(argv)
+
+    report = run_hotspot_profile(
+        iterations=args.iterations,
+        sample_interval=args.interval,
+        trace_allocations=not args.no_allocations,
+    )
+    paths = report.save(args.output_dir)
+
+    print(report.format_table(limit=args.limit))
+    print(f"\nCollapsed stacks: {paths['collapsed']}")
+    print(f"  flamegraph.pl {paths['collapsed']} > hotspots.svg")
+    print(f"Ranked table:     {paths['table']}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -5,7 +5,7 @@ This module provides the bridge between the performance optimization
 utilities and the main AI Life Coach system.
 """
 
-from typing import Any, Dict, List, Optional
+from typing import Any, Callable, Dict, List, Optional
 import functools
 
 # Import performance utilities
@@ -13,28 +13,43 @@ from .profiler import get_profiler, profile, timed
 from .cache import get_cache_manager, cached_profile, cached_goals
 from .memory_optimizer import (
     OptimizedMemoryManager,
+    PrefetchManager,
     create_optimized_memory_manager,
     LazyLoader,
 )
 from .parallel import parallel_specialists, optimize_specialist_delegation
 from .tool_optimizer import get_tool_optimizer, optimized_tool
+from .tracing import OTLPJsonFileExporter, get_tracer, reset_tracer
 
 
-def optimize_life_coach_system(store: Any) -> Dict[str, Any]:
+def optimize_life_coach_system(
+    store: Any, workspace_dir: Optional[str] = None, backend: Any = None
+) -> Dict[str, Any]:
     """
     Optimize the AI Life Coach system with all performance improvements.
 
     Args:
         store: LangGraph Store instance
+        workspace_dir: Workspace root of the file-backed tools (enables
+            prefetching of check-ins, mood history and habits)
+        backend: Backend shared with the tools (defaults to the configured
+            backend); also enables prefetching when workspace_dir is omitted
 
     Returns:
         Dictionary with optimized components:
         - memory_manager: OptimizedMemoryManager instance
+        - prefetch_manager: PrefetchManager; call start_session(user_id) on
+          session start or user switch and end_session() when it ends
         - cache_manager: Cache manager for direct access
         - profiler: Profiler for monitoring
     """
     # Create optimized memory manager
-    memory_manager = create_optimized_memory_manager(store)
+    config = get_performance_config()
+    memory_manager = create_optimized_memory_manager(
+        store, adaptive_caching=config.enable_caching and config.enable_adaptive_caching
+    )
+
+    prefetch_manager = PrefetchManager(memory_manager, workspace_dir=workspace_dir, backend=backend)
 
     # Get cache manager
     cache_manager = get_cache_manager()
@@ -44,6 +59,7 @@ def optimize_life_coach_system(store: Any) -> Dict[str, Any]:
 
     return {
         "memory_manager": memory_manager,
+        "prefetch_manager": prefetch_manager,
         "cache_manager": cache_manager,
         "profiler": profiler,
     }
@@ -86,15 +102,27 @@ def create_optimized_specialist_delegation(
     """
 
     def delegate(context: Dict[str, Any]) -> Dict[str, Any]:
-        if use_parallel and len(specialist_funcs) >= parallel_threshold:
-            return parallel_specialists(
-                specialist_funcs, context, max_workers=min(len(specialist_funcs), 4), timeout=30.0
-            )
-        else:
+        parallel = use_parallel and len(specialist_funcs) >= parallel_threshold
+        turn_attributes = {
+            "specialists.count": len(specialist_funcs),
+            "delegation.mode": "parallel" if parallel else "sequential",
+        }
+        if "user_id" in context:
+            turn_attributes["user.id"] = str(context["user_id"])
+
+        with profile("coordinator.turn", turn_attributes):
+            if parallel:
+                return parallel_specialists(
+                    specialist_funcs,
+                    context,
+                    max_workers=min(len(specialist_funcs), 4),
+                    timeout=30.0,
+                )
+
             # Sequential execution
             results = {}
             for name, func in specialist_funcs.items():
-                with profile(f"specialist.{name}"):
+                with profile(f"specialist.{name}", {"specialist.name": name}):
                     try:
                         results[name] = func(**context)
                     except Exception as e:
@@ -116,20 +144,28 @@ class PerformanceConfig:
         enable_caching: bool = True,
         enable_parallel: bool = True,
         enable_profiling: bool = True,
+        enable_adaptive_caching: bool = False,
+        profiling_use_histograms: bool = False,
+        profiling_sample_rate: float = 1.0,
         profile_cache_ttl: float = 600.0,
         goals_cache_ttl: float = 300.0,
         tool_cache_ttl: float = 180.0,
         max_parallel_workers: int = 4,
         parallel_threshold: int = 2,
+        trace_export_path: Optional[str] = None,
     ):
         self.enable_caching = enable_caching
         self.enable_parallel = enable_parallel
         self.enable_profiling = enable_profiling
+        self.enable_adaptive_caching = enable_adaptive_caching
+        self.profiling_use_histograms = profiling_use_histograms
+        self.profiling_sample_rate = profiling_sample_rate
         self.profile_cache_ttl = profile_cache_ttl
         self.goals_cache_ttl = goals_cache_ttl
         self.tool_cache_ttl = tool_cache_ttl
         self.max_parallel_workers = max_parallel_workers
         self.parallel_threshold = parallel_threshold
+        self.trace_export_path = trace_export_path  # OTLP/JSON lines file for spans
 
     @classmethod
     def development(cls) -> "PerformanceConfig":
@@ -151,7 +187,10 @@ class PerformanceConfig:
         return cls(
             enable_caching=True,
             enable_parallel=True,
-            enable_profiling=False,  # Disable in production for performance
+            enable_profiling=True,  # Always-on: sampled, constant-memory histograms
+            enable_adaptive_caching=True,  # TTLs/sizes follow the observed workload
+            profiling_use_histograms=True,
+            profiling_sample_rate=0.1,
             profile_cache_ttl=600.0,
             goals_cache_ttl=300.0,
             tool_cache_ttl=180.0,
@@ -179,10 +218,24 @@ _perf_config: Optional[PerformanceConfig] = None
 
 
 def set_performance_config(config: PerformanceConfig):
-    """Set the global performance configuration."""
+    """Set the global performance configuration and apply its profiler settings."""
     global _perf_config
     _perf_config = config
 
+    profiler = get_profiler()
+    profiler.configure(
+        use_histograms=config.profiling_use_histograms,
+        sample_rate=config.profiling_sample_rate,
+    )
+    if config.enable_profiling:
+        profiler.enable()
+    else:
+        profiler.disable()
+
+    reset_tracer()
+    if config.trace_export_path:
+        get_tracer().add_exporter(OTLPJsonFileExporter(config.trace_export_path))
+
 
 def get_performance_config() -> PerformanceConfig:
     """Get the global performance configuration."""
@@ -204,9 +257,15 @@ def print_performance_summary():
 
     print("\nConfiguration:")
     print(f"  Caching: {'Enabled' if config.enable_caching else 'Disabled'}")
+    print(f"  Adaptive Caching: {'Enabled' if config.enable_adaptive_caching else 'Disabled'}")
     print(f"  Parallel Execution: {'Enabled' if config.enable_parallel else 'Disabled'}")
     print(f"  Profiling: {'Enabled' if config.enable_profiling else 'Disabled'}")
+    if config.enable_profiling:
+        mode = "histogram" if config.profiling_use_histograms else "exact"
+        print(f"  Profiling Mode: {mode} (sample rate {config.profiling_sample_rate:.0%})")
     print(f"  Max Parallel Workers: {config.max_parallel_workers}")
+    if config.trace_export_path:
+        print(f"  Span Export: {config.trace_export_path}")
 
     print("\nCache Statistics:")
     stats = cache.get_all_stats()
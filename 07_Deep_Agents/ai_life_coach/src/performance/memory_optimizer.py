@@ -5,8 +5,11 @@ This module provides optimized memory operations with caching and
 batch processing to reduce latency.
 """
 
+import importlib
+import threading
 import time
-from typing import Any, Dict, List, Optional, Tuple, Callable
+from concurrent.futures import CancelledError, Future
+from typing import Any, Dict, List, Optional, Set, Tuple, Callable
 from functools import wraps
 
 import sys
@@ -25,8 +28,9 @@ except ImportError:
     Milestone = object
     Setback = object
 
-from .cache import get_cache_manager, cached_profile, cached_goals
-from .profiler import get_profiler
+from .cache import MemoryCacheManager, get_cache_manager, cached_profile, cached_goals
+from .parallel import get_parallel_executor
+from .profiler import MemoryAccessOptimizer, get_profiler, profile
 
 
 class OptimizedMemoryManager:
@@ -49,6 +53,42 @@ class OptimizedMemoryManager:
         self._manager = base_manager
         self._cache = get_cache_manager()
         self._profiler = get_profiler()
+        self._access_optimizer: Optional[MemoryAccessOptimizer] = None
+        self._tuner: Optional["AdaptiveCacheTuner"] = None
+
+    def enable_adaptive_caching(
+        self,
+        prefetch_manager: Optional["PrefetchManager"] = None,
+        interval: float = 60.0,
+        bounds: Optional[Dict[str, Dict[str, float]]] = None,
+    ) -> "AdaptiveCacheTuner":
+        """
+        Track profile/goal accesses and periodically retune the caches.
+
+        Args:
+            prefetch_manager: Optional prefetch manager to queue hot keys into
+            interval: Minimum seconds between tuning rounds
+            bounds: Per-cache TTL/size bounds (see AdaptiveCacheTuner)
+
+        Returns:
+            The AdaptiveCacheTuner (inspect ``history`` or ``format_report()``)
+        """
+        self._access_optimizer = MemoryAccessOptimizer(self._profiler)
+        self._tuner = AdaptiveCacheTuner(
+            cache_manager=self._cache,
+            access_optimizer=self._access_optimizer,
+            prefetch_manager=prefetch_manager,
+            interval=interval,
+            bounds=bounds,
+        )
+        return self._tuner
+
+    def _track(self, namespace: str, key: str, start: float, hit: bool):
+        """Record an access for adaptive caching (no-op unless enabled)."""
+        if self._access_optimizer is None:
+            return
+        self._access_optimizer.track_access(namespace, key, time.perf_counter() - start, hit)
+        self._tuner.maybe_tune()
 
     # ==================== Optimized Profile Operations ====================
 
@@ -63,9 +103,11 @@ class OptimizedMemoryManager:
             UserProfile or None if not found
         """
         with self._profiler.profile_section("memory.get_profile"):
+            start = time.perf_counter()
             # Try cache first
             cached = self._cache.get_profile(user_id)
             if cached is not None:
+                self._track("profile", user_id, start, hit=True)
                 return cached
 
             # Load from underlying manager
@@ -73,6 +115,7 @@ class OptimizedMemoryManager:
             if profile:
                 self._cache.set_profile(user_id, profile)
 
+            self._track("profile", user_id, start, hit=False)
             return profile
 
     def save_profile(self, profile: UserProfile) -> None:
@@ -90,20 +133,30 @@ class OptimizedMemoryManager:
 
     # ==================== Optimized Goal Operations ====================
 
-    def get_goals(self, user_id: str) -> List[Goal]:
+    def get_goals(self, user_id: str, **filters: Any) -> List[Goal]:
         """
         Get all goals for user with caching.
 
+        Filtered or paged queries (domain, status, due_before, limit, offset)
+        go straight to the goal index of the underlying manager.
+
         Args:
             user_id: User's unique identifier
+            **filters: Optional MemoryManager.get_goals filters
 
         Returns:
             List of Goal objects
         """
+        if filters:
+            with self._profiler.profile_section("memory.get_goals_indexed"):
+                return self._manager.get_goals(user_id, **filters)
+
         with self._profiler.profile_section("memory.get_goals"):
+            start = time.perf_counter()
             # Try cache first
             cached = self._cache.get_goals(user_id)
             if cached is not None:
+                self._track("goals", user_id, start, hit=True)
                 return cached
 
             # Load from underlying manager
@@ -111,6 +164,7 @@ class OptimizedMemoryManager:
             if goals:
                 self._cache.set_goals(user_id, goals)
 
+            self._track("goals", user_id, start, hit=False)
             return goals
 
     def get_goal(self, user_id: str, goal_id: str) -> Optional[Goal]:
@@ -176,27 +230,24 @@ class OptimizedMemoryManager:
             Dictionary with all user data
         """
         with self._profiler.profile_section("memory.get_user_summary"):
-            # Load from cache or underlying manager
-            profile = self.get_profile(user_id)
-            goals = self.get_goals(user_id)
-
-            # These are typically accessed less frequently, skip cache
-            milestones = self._manager.get_milestones(user_id)
-            setbacks = self._manager.get_setbacks(user_id)
-            preferences = self._manager.get_preferences(user_id)
-
-            return {
-                "profile": profile,
-                "goals": goals,
-                "milestones": milestones,
-                "setbacks": setbacks,
-                "preferences": preferences,
-            }
+            profile = self._cache.get_profile(user_id)
+            goals = self._cache.get_goals(user_id)
+
+            # One batched store read for everything; refresh the caches from it
+            summary = self._manager.get_user_summary(user_id)
+            if profile is None and summary["profile"]:
+                self._cache.set_profile(user_id, summary["profile"])
+            if goals is None and summary["goals"]:
+                self._cache.set_goals(user_id, summary["goals"])
+            return summary
 
     def get_multiple_profiles(self, user_ids: List[str]) -> Dict[str, Optional[UserProfile]]:
         """
         Get multiple profiles efficiently.
 
+        Cached profiles are served from cache; all misses are loaded with a
+        single batched store read.
+
         Args:
             user_ids: List of user IDs
 
@@ -204,11 +255,47 @@ class OptimizedMemoryManager:
             Dictionary mapping user_id to profile
         """
         with self._profiler.profile_section("memory.get_multiple_profiles"):
-            results = {}
+            results: Dict[str, Optional[UserProfile]] = {}
+            missing = []
             for user_id in user_ids:
-                results[user_id] = self.get_profile(user_id)
+                results[user_id] = self._cache.get_profile(user_id)
+                if results[user_id] is None:
+                    missing.append(user_id)
+
+            if missing:
+                for user_id, profile in self._manager.get_profiles_for_users(missing).items():
+                    results[user_id] = profile
+                    if profile:
+                        self._cache.set_profile(user_id, profile)
             return results
 
+    def get_goals_for_users(self, user_ids: List[str]) -> Dict[str, List[Goal]]:
+        """
+        Get goals for multiple users, batching all cache misses into one store read.
+
+        Args:
+            user_ids: List of user IDs
+
+        Returns:
+            Dictionary mapping user_id to list of goals
+        """
+        with self._profiler.profile_section("memory.get_goals_for_users"):
+            results: Dict[str, List[Goal]] = {}
+            missing = []
+            for user_id in user_ids:
+                cached = self._cache.get_goals(user_id)
+                if cached is None:
+                    missing.append(user_id)
+                else:
+                    results[user_id] = cached
+
+            if missing:
+                for user_id, goals in self._manager.get_goals_for_users(missing).items():
+                    results[user_id] = goals
+                    if goals:
+                        self._cache.set_goals(user_id, goals)
+            return {user_id: results[user_id] for user_id in user_ids}
+
     # ==================== Cache Management ====================
 
     def invalidate_user(self, user_id: str) -> None:
@@ -230,18 +317,24 @@ class OptimizedMemoryManager:
         return getattr(self._manager, name)
 
 
-def create_optimized_memory_manager(store: Any) -> OptimizedMemoryManager:
+def create_optimized_memory_manager(
+    store: Any, adaptive_caching: bool = False
+) -> OptimizedMemoryManager:
     """
     Create an optimized memory manager.
 
     Args:
         store: LangGraph Store instance
+        adaptive_caching: Retune cache TTLs/sizes from observed accesses
 
     Returns:
         OptimizedMemoryManager instance
     """
     base_manager = MemoryManager(store)
-    return OptimizedMemoryManager(base_manager)
+    manager = OptimizedMemoryManager(base_manager)
+    if adaptive_caching:
+        manager.enable_adaptive_caching()
+    return manager
 
 
 class LazyLoader:
@@ -292,30 +385,142 @@ class LazyLoader:
         return bool(self.data)
 
 
+def _import_tools_module(name: str) -> Any:
+    """Import a tools module from the same package root as this one (src. or top level)."""
+    root = (__package__ or "").rpartition(".")[0]
+    return importlib.import_module(f"{root}.tools.{name}" if root else f"tools.{name}")
+
+
+def _default_backend() -> Any:
+    """The configured workspace backend, or None before the environment is initialized."""
+    try:
+        return importlib.import_module("config").get_backend()
+    except (ImportError, RuntimeError):
+        return None
+
+
 class PrefetchManager:
     """
     Manages prefetching of data to reduce latency.
 
-    Prefetches likely-to-be-needed data in the background.
+    On session start (or user switch) a background worker preloads what a
+    coaching session reads first - profile, goals, recent check-ins, mood
+    history and habits - so the first tool calls hit warm caches. Profile and
+    goals go through the optimized memory manager's caches; workspace data is
+    loaded through the tools' own loaders (load_checkin_history,
+    load_mood_series, load_habit_logs), which keep it cached for the tools, and the result is
+    also kept in the cache manager's session cache (see ``get_prefetched``).
     """
 
-    def __init__(self, memory_manager: OptimizedMemoryManager):
+    DEFAULT_ORDER = ["profile", "goals", "checkins", "moods", "habits"]
+
+    def __init__(
+        self,
+        memory_manager: OptimizedMemoryManager,
+        workspace_dir: Optional[str] = None,
+        backend: Any = None,
+        recent_checkins: int = 8,
+        recent_moods: int = 30,
+        max_workers: int = 2,
+    ):
         """
         Initialize prefetch manager.
 
         Args:
             memory_manager: Optimized memory manager instance
+            workspace_dir: Workspace root used by the file-backed tools; enables
+                prefetching of check-ins, mood entries and habits (defaults to
+                the backend's root when a backend is given)
+            backend: Backend the tools read through; defaults to the configured
+                backend so prefetched data lands in the caches the tools use
+            recent_checkins: Number of most recent weekly check-ins to preload
+            recent_moods: Number of most recent mood entries to preload
+            max_workers: Worker threads for background prefetching
         """
         self._manager = memory_manager
+        self._cache = get_cache_manager()
         self._prefetch_queue: List[Tuple[str, str]] = []  # (type, id)
+        self._lock = threading.Lock()
+        self._max_workers = max_workers
+
+        self._loaders: Dict[str, Callable[[str], Any]] = {}
+        self._session_types: set = set()  # Types stored in the session cache
+        self.register_loader("profile", lambda user_id: self._manager.get_profile(user_id), False)
+        self.register_loader("goals", lambda user_id: self._manager.get_goals(user_id), False)
+        if workspace_dir is not None or backend is not None:
+            if backend is None:
+                backend = _default_backend()
+            if workspace_dir is not None:
+                workspace = Path(workspace_dir)
+            else:
+                # Same fallback the tools use, so both resolve the same files
+                workspace = Path(getattr(backend, "root_dir", "workspace"))
+            checkin_tools = _import_tools_module("checkin_tools")
+            habit_tools = _import_tools_module("habit_tools")
+            mood_tools = _import_tools_module("mood_tools")
+            self.register_loader(
+                "checkins",
+                lambda user_id: checkin_tools.load_checkin_history(
+                    user_id, backend, workspace
+                ).recent(recent_checkins),
+            )
+            self.register_loader(
+                "moods",
+                lambda user_id: mood_tools.load_mood_series(user_id, backend, workspace).tail(
+                    recent_moods
+                ),
+            )
+            self.register_loader(
+                "habits",
+                lambda user_id: habit_tools.load_habit_logs(user_id, backend, workspace),
+            )
+
+        self._usage: Dict[str, int] = {}  # Prefetched-data reads, per type
+        self._session_user: Optional[str] = None
+        self._session_future: Optional[Future] = None
+        self._cancel_event: Optional[threading.Event] = None
+
+    def register_loader(
+        self, data_type: str, loader: Callable[[str], Any], cache_result: bool = True
+    ):
+        """
+        Register (or replace) a loader for a type of per-user data.
+
+        Args:
+            data_type: Name of the data (e.g. "checkins")
+            loader: Function of user_id returning the data
+            cache_result: Store the result in the session cache; use False for
+                loaders that populate their own cache (profile, goals)
+        """
+        self._loaders[data_type] = loader
+        if cache_result:
+            self._session_types.add(data_type)
+        else:
+            self._session_types.discard(data_type)
 
     def queue_profile_prefetch(self, user_id: str):
         """Queue a profile to be prefetched."""
-        self._prefetch_queue.append(("profile", user_id))
+        with self._lock:
+            self._prefetch_queue.append(("profile", user_id))
 
     def queue_goals_prefetch(self, user_id: str):
         """Queue goals to be prefetched."""
-        self._prefetch_queue.append(("goals", user_id))
+        with self._lock:
+            self._prefetch_queue.append(("goals", user_id))
+
+    def _load(self, data_type: str, user_id: str) -> bool:
+        """Run one loader, storing session data; returns False on failure."""
+        loader = self._loaders.get(data_type)
+        if loader is None:
+            return False
+        try:
+            data = loader(user_id)
+        except Exception:
+            # Ignore prefetch errors
+            return False
+        if data_type in self._session_types:
+            self._cache.set_user_data(data_type, user_id, data)
+        return True
 
     def execute_prefetch(self, max_items: int = 10):
         """
@@ -325,19 +530,380 @@ class PrefetchManager:
             max_items: Maximum number of items to prefetch
         """
         with profile("prefetch.execute"):
-            items_to_prefetch = self._prefetch_queue[:max_items]
-            self._prefetch_queue = self._prefetch_queue[max_items:]
+            with self._lock:
+                items_to_prefetch = self._prefetch_queue[:max_items]
+                self._prefetch_queue = self._prefetch_queue[max_items:]
 
             for data_type, data_id in items_to_prefetch:
-                try:
-                    if data_type == "profile":
-                        self._manager.get_profile(data_id)
-                    elif data_type == "goals":
-                        self._manager.get_goals(data_id)
-                except Exception:
-                    # Ignore prefetch errors
-                    pass
+                self._load(data_type, data_id)
+
+    def predict(self, user_id: str) -> List[str]:
+        """
+        Predict which data a session will need, most likely first.
+
+        Types whose prefetched data has been read most often come first;
+        ties keep DEFAULT_ORDER.
+
+        Args:
+            user_id: User starting a session
+
+        Returns:
+            Ordered list of data types to preload
+        """
+        default_rank = {data_type: i for i, data_type in enumerate(self.DEFAULT_ORDER)}
+        return sorted(
+            self._loaders,
+            key=lambda t: (-self._usage.get(t, 0), default_rank.get(t, len(default_rank))),
+        )
+
+    def start_session(self, user_id: str) -> Future:
+        """
+        Start preloading a user's data in the background.
+
+        Any prefetch running for a different user is cancelled first. Calling
+        this again for the active user returns the running prefetch.
+
+        Args:
+            user_id: User whose session is starting
+
+        Returns:
+            Future resolving to a summary {"user_id", "loaded", "failed", "cancelled", "elapsed"}
+        """
+        with self._lock:
+            running = self._session_future is not None and not self._session_future.done()
+            if self._session_user == user_id and running:
+                return self._session_future
+            self._cancel_session_locked()
+
+            cancel_event = threading.Event()
+            executor = get_parallel_executor(max_workers=self._max_workers).executor
+            self._session_user = user_id
+            self._cancel_event = cancel_event
+            self._session_future = executor.submit(self._run_session, user_id, cancel_event)
+            return self._session_future
+
+    def switch_user(self, user_id: str) -> Future:
+        """Cancel the current prefetch and start one for another user."""
+        return self.start_session(user_id)
+
+    def end_session(self, wait: bool = False):
+        """
+        Cancel background prefetching for the current session.
+
+        Args:
+            wait: Block until an in-flight loader has returned
+        """
+        with self._lock:
+            future = self._session_future
+            self._cancel_session_locked()
+            self._session_user = None
+        if wait and future is not None:
+            try:
+                future.result()
+            except CancelledError:
+                pass
+
+    def _cancel_session_locked(self):
+        """Signal the running session to stop (caller holds the lock)."""
+        if self._cancel_event is not None:
+            self._cancel_event.set()
+        if self._session_future is not None:
+            self._session_future.cancel()  # Succeeds only if not started yet
+
+    def _run_session(self, user_id: str, cancel_event: threading.Event) -> Dict[str, Any]:
+        """Background worker: preload predicted data, then drain the queue."""
+        start = time.perf_counter()
+        loaded: List[str] = []
+        failed: List[str] = []
+
+        with profile("prefetch.session", {"user.id": user_id}):
+            for data_type in self.predict(user_id):
+                if cancel_event.is_set():
+                    break
+                (loaded if self._load(data_type, user_id) else failed).append(data_type)
+
+            # Use remaining time for explicitly queued items (e.g. from the tuner)
+            while not cancel_event.is_set():
+                with self._lock:
+                    if not self._prefetch_queue:
+                        break
+                    data_type, data_id = self._prefetch_queue.pop(0)
+                self._load(data_type, data_id)
+
+        return {
+            "user_id": user_id,
+            "loaded": loaded,
+            "failed": failed,
+            "cancelled": cancel_event.is_set(),
+            "elapsed": time.perf_counter() - start,
+        }
+
+    def get_prefetched(self, data_type: str, user_id: str) -> Optional[Any]:
+        """
+        Get preloaded session data (check-ins, moods, habits, custom loaders).
+
+        Args:
+            data_type: Type of data
+            user_id: User's unique identifier
+
+        Returns:
+            The prefetched data, or None if it has not been (or is no longer) cached
+        """
+        data = self._cache.get_user_data(data_type, user_id)
+        if data is not None:
+            self._usage[data_type] = self._usage.get(data_type, 0) + 1
+        return data
 
     def clear_queue(self):
         """Clear the prefetch queue."""
-        self._prefetch_queue.clear()
+        with self._lock:
+            self._prefetch_queue.clear()
+
+
+class AdaptiveCacheTuner:
+    """
+    Feeds observed memory access patterns back into cache configuration.
+
+    Each tuning round looks at the accesses recorded since the previous round
+    (re-access intervals also span rounds, since the access optimizer keeps
+    each key's last access) and adjusts, within bounds:
+    - TTLs: raised when keys are re-accessed after they would have expired and
+      misses are expensive; lowered when keys are re-used well within the TTL
+      (fresher data at no hit-rate cost) or, once a round has already been
+      observed, not re-used at all
+    - Sizes: grown when the cache evicts while the re-used working set does not
+      fit; shrunk when the cache stays mostly empty
+    - Prefetching: the hottest uncached keys are queued on the PrefetchManager
+
+    Caches without access observations (tool, calculation, session) are left
+    alone.
+
+    Every change is recorded in ``history`` with the old value, new value and reason.
+    """
+
+    DEFAULT_BOUNDS = {"min_ttl": 10.0, "max_ttl": 3600.0, "min_size": 100, "max_size": 20000}
+
+    # Optimizer namespace -> MemoryCacheManager cache name
+    NAMESPACE_CACHES = {"profile": "profile", "goals": "goals"}
+
+    def __init__(
+        self,
+        cache_manager: Optional[MemoryCacheManager] = None,
+        access_optimizer: Optional[MemoryAccessOptimizer] = None,
+        prefetch_manager: Optional["PrefetchManager"] = None,
+        interval: float = 60.0,
+        bounds: Optional[Dict[str, Dict[str, float]]] = None,
+        min_samples: int = 20,
+        max_step: float = 2.0,
+        min_miss_cost: float = 0.0001,
+        prefetch_limit: int = 10,
+    ):
+        """
+        Initialize the tuner.
+
+        Args:
+            cache_manager: Caches to tune (global cache manager if None)
+            access_optimizer: Source of access patterns
+            prefetch_manager: Optional prefetch manager to queue hot keys into
+            interval: Minimum seconds between automatic tuning rounds
+            bounds: Per-cache overrides of DEFAULT_BOUNDS, e.g. {"profile": {"max_ttl": 900}}
+            min_samples: Accesses needed in a namespace before its TTL is changed
+            max_step: Largest factor a setting may change by in one round
+            min_miss_cost: Misses cheaper than this (seconds) never justify a longer TTL
+            prefetch_limit: Maximum keys queued for prefetch per round
+        """
+        self.cache_manager = cache_manager or get_cache_manager()
+        self.access_optimizer = access_optimizer or MemoryAccessOptimizer()
+        self.prefetch_manager = prefetch_manager
+        self.interval = interval
+        self.bounds = bounds or {}
+        self.min_samples = min_samples
+        self.max_step = max_step
+        self.min_miss_cost = min_miss_cost
+        self.prefetch_limit = prefetch_limit
+        self.history: List[Dict[str, Any]] = []
+        self._last_tune = time.time()
+        self._last_stats: Dict[str, Dict[str, Any]] = {}
+        self._observed: Set[str] = set()  # Caches with accesses in an earlier round
+        self._lock = threading.Lock()
+
+    def _bounds_for(self, cache_name: str) -> Dict[str, float]:
+        """Get bounds for a cache, applying overrides."""
+        bounds = dict(self.DEFAULT_BOUNDS)
+        bounds.update(self.bounds.get(cache_name, {}))
+        return bounds
+
+    def _step(self, old: float, target: float, low: float, high: float) -> float:
+        """Move towards target by at most max_step, clamped to [low, high]."""
+        target = min(max(target, old / self.max_step), old * self.max_step)
+        return min(max(target, low), high)
+
+    def maybe_tune(self) -> List[Dict[str, Any]]:
+        """Run a tuning round if the interval has elapsed (cheap otherwise)."""
+        if time.time() - self._last_tune < self.interval:
+            return []
+        return self.tune()
+
+    def tune(self) -> List[Dict[str, Any]]:
+        """
+        Run one tuning round now.
+
+        Returns:
+            List of changes: {"cache", "setting", "old", "new", "reason", "timestamp"}
+        """
+        if not self._lock.acquire(blocking=False):
+            return []  # Another thread is tuning
+        try:
+            self._last_tune = time.time()
+            namespace_stats = self.access_optimizer.get_namespace_stats()
+            changes: List[Dict[str, Any]] = []
+
+            for cache_name, cache in self.cache_manager.get_caches().items():
+                stats = cache.get_stats()
+                previous = self._last_stats.get(cache_name, {"evictions": 0})
+                self._last_stats[cache_name] = stats
+                bounds = self._bounds_for(cache_name)
+
+                usage = next(
+                    (
+                        namespace_stats[ns]
+                        for ns, name in self.NAMESPACE_CACHES.items()
+                        if name == cache_name and ns in namespace_stats
+                    ),
+                    None,
+                )
+                if usage is None:
+                    continue  # No observations to tune from
+                if usage["accesses"] >= self.min_samples:
+                    change = self._tune_ttl(cache_name, cache, usage, bounds)
+                    if change:
+                        changes.append(change)
+
+                evictions = stats["evictions"] - previous["evictions"]
+                change = self._tune_size(
+                    cache_name, cache, stats, evictions, usage["reused_keys"], bounds
+                )
+                if change:
+                    changes.append(change)
+                self._observed.add(cache_name)
+
+            changes.extend(self._queue_prefetches())
+            self.access_optimizer.reset()
+            self.history.extend(changes)
+            return changes
+        finally:
+            self._lock.release()
+
+    def _tune_ttl(
+        self, cache_name: str, cache: Any, usage: Dict[str, Any], bounds: Dict[str, float]
+    ) -> Optional[Dict[str, Any]]:
+        """Adjust a cache's default TTL from re-access intervals and miss cost."""
+        old = cache.default_ttl
+        interval = usage["median_reaccess_interval"]
+
+        if interval is None:
+            if cache_name not in self._observed:
+                return None  # First round: no key has had a chance to return yet
+            new = self._step(old, old / self.max_step, bounds["min_ttl"], bounds["max_ttl"])
+            reason = f"none of {usage['keys']} keys re-accessed"
+        elif interval > old and usage["avg_miss_time"] >= self.min_miss_cost:
+            new = self._step(old, interval * 1.5, bounds["min_ttl"], bounds["max_ttl"])
+            reason = (
+                f"keys re-accessed every {interval:.0f}s, after expiry; "
+                f"misses cost {usage['avg_miss_time'] * 1000:.2f}ms"
+            )
+        elif interval * 4 < old:
+            new = self._step(old, interval * 4, bounds["min_ttl"], bounds["max_ttl"])
+            reason = f"keys re-accessed every {interval:.0f}s; shorter TTL keeps data fresher"
+        else:
+            return None
+
+        if abs(new - old) < old * 0.1:
+            return None
+        cache.default_ttl = new
+        return self._change(cache_name, "ttl", old, new, reason)
+
+    def _tune_size(
+        self,
+        cache_name: str,
+        cache: Any,
+        stats: Dict[str, Any],
+        evictions: int,
+        working_set: int,
+        bounds: Dict[str, float],
+    ) -> Optional[Dict[str, Any]]:
+        """Adjust a cache's max size from evictions and occupancy."""
+        old = cache.max_size
+        if evictions > 0:
+            target = max(working_set * 1.25, old * 1.5)
+            new = int(self._step(old, target, bounds["min_size"], bounds["max_size"]))
+            reason = f"{evictions} evictions since last round"
+        elif stats["size"] < old * 0.25:
+            target = max(stats["size"] * 2, working_set * 1.25)
+            new = int(self._step(old, target, bounds["min_size"], bounds["max_size"]))
+            reason = f"only {stats['size']}/{old} entries used"
+        else:
+            return None
+
+        if new == old:
+            return None
+        cache.resize(new)
+        return self._change(cache_name, "max_size", old, new, reason)
+
+    def _queue_prefetches(self) -> List[Dict[str, Any]]:
+        """Queue the hottest uncached profile/goal keys for prefetching."""
+        if self.prefetch_manager is None:
+            return []
+
+        # Check presence via keys so the hit/miss statistics are not disturbed
+        cached = set(self.cache_manager.profile_cache.get_keys())
+        cached.update(self.cache_manager.goals_cache.get_keys())
+
+        queued: Dict[str, List[str]] = {}
+        for rec in self.access_optimizer.get_caching_recommendations():
+            if sum(len(ids) for ids in queued.values()) >= self.prefetch_limit:
+                break
+            namespace, _, user_id = rec["key"].partition(":")
+            if rec["key"] in cached:
+                continue
+            if namespace == "profile":
+                self.prefetch_manager.queue_profile_prefetch(user_id)
+            elif namespace == "goals":
+                self.prefetch_manager.queue_goals_prefetch(user_id)
+            else:
+                continue
+            queued.setdefault(namespace, []).append(user_id)
+
+        return [
+            self._change(namespace, "prefetch", None, user_ids, "frequently accessed, not cached")
+            for namespace, user_ids in queued.items()
+        ]
+
+    @staticmethod
+    def _change(cache_name: str, setting: str, old: Any, new: Any, reason: str) -> Dict[str, Any]:
+        return {
+            "cache": cache_name,
+            "setting": setting,
+            "old": old,
+            "new": new,
+            "reason": reason,
+            "timestamp": time.time(),
+        }
+
+    def format_report(self) -> str:
+        """Render the history of changes as text."""
+        lines = ["=" * 80, "ADAPTIVE CACHE TUNING", "=" * 80]
+        if not self.history:
+            lines.append("No changes made.")
+        for change in self.history:
+            if change["setting"] == "prefetch":
+                value = f"queued {len(change['new'])} keys"
+            elif change["setting"] == "ttl":
+                value = f"{change['old']:.0f}s -> {change['new']:.0f}s"
+            else:
+                value = f"{change['old']} -> {change['new']}"
+            lines.append(
+                f"{change['cache']:<12} {change['setting']:<9} {value:<22} {change['reason']}"
+            )
+        lines.append("=" * 80)
+        return "\n".join(lines)
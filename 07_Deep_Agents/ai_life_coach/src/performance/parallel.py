@@ -5,20 +5,28 @@ This module provides utilities for parallel subagent execution
 to improve overall system performance.
 
 Features:
-- Parallel tool execution
+- Parallel tool execution on long-lived, shared worker pools
 - Concurrent subagent delegation
 - Async wrapper utilities
 - Batch processing helpers
 """
 
 import asyncio
+import atexit
 import concurrent.futures
+import contextvars
 import functools
+import inspect
+import threading
 import time
-from typing import Any, Callable, Dict, List, Optional, Tuple, Union
+import weakref
+from collections import deque
+from typing import Any, Callable, Deque, Dict, List, Optional, Tuple, Union
 from dataclasses import dataclass
 from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor
 
+from .tracing import get_tracer
+
 
 @dataclass
 class ParallelResult:
@@ -27,7 +35,11 @@ class ParallelResult:
     name: str
     result: Any
     error: Optional[Exception] = None
-    execution_time: float = 0.0
+    execution_time: float = 0.0  # queue_time + run_time
+    queue_time: float = 0.0  # Time spent waiting for a free worker
+    run_time: float = 0.0  # Time spent executing the function
+    timed_out: bool = False  # Did not finish within the latency budget
+    hedged: bool = False  # Result came from a hedged (duplicate) attempt
 
     @property
     def success(self) -> bool:
@@ -35,11 +47,108 @@ class ParallelResult:
         return self.error is None
 
 
+class LatencyTracker:
+    """
+    Tracks recent run times per task name for tail-latency decisions.
+
+    Keeps a bounded window of samples per name and answers percentile
+    queries, used to decide when a slow specialist deserves a hedged retry.
+    """
+
+    def __init__(self, window_size: int = 100, min_samples: int = 5):
+        """
+        Initialize the tracker.
+
+        Args:
+            window_size: Number of recent samples kept per name
+            min_samples: Samples required before percentiles are reported
+        """
+        self.window_size = window_size
+        self.min_samples = min_samples
+        self._samples: Dict[str, Deque[float]] = {}
+        self._lock = threading.Lock()
+
+    def record(self, name: str, seconds: float):
+        """Record a completed run time for a task name."""
+        with self._lock:
+            samples = self._samples.get(name)
+            if samples is None:
+                samples = self._samples[name] = deque(maxlen=self.window_size)
+            samples.append(seconds)
+
+    def percentile(self, name: str, pct: float = 95.0) -> Optional[float]:
+        """
+        Get a latency percentile for a task name.
+
+        Args:
+            name: Task name
+            pct: Percentile in the range 0-100
+
+        Returns:
+            Latency in seconds, or None if there are too few samples
+        """
+        with self._lock:
+            samples = self._samples.get(name)
+            if not samples or len(samples) < self.min_samples:
+                return None
+            ordered = sorted(samples)
+        index = min(len(ordered) - 1, int(round(pct / 100.0 * (len(ordered) - 1))))
+        return ordered[index]
+
+    def reset(self):
+        """Forget all samples."""
+        with self._lock:
+            self._samples.clear()
+
+
+# Global latency tracker used for hedging decisions
+_latency_tracker: Optional[LatencyTracker] = None
+
+
+def get_latency_tracker() -> LatencyTracker:
+    """Get or create the global latency tracker."""
+    global _latency_tracker
+    if _latency_tracker is None:
+        _latency_tracker = LatencyTracker()
+    return _latency_tracker
+
+
+# Marks pool worker threads so nested calls do not wait on their own pool
+_worker_state = threading.local()
+
+
+def _mark_worker(executor_id: int):
+    """Thread pool initializer recording which executor owns the thread."""
+    _worker_state.executor_id = executor_id
+
+
+def _run_timed(func: Callable, args: Tuple, kwargs: Dict) -> Tuple[bool, Any, float, float]:
+    """
+    Run a task inside a worker and capture its timing.
+
+    Module-level so it can be pickled for process pools. perf_counter uses a
+    system-wide monotonic clock, so timestamps are comparable across processes.
+
+    Returns:
+        Tuple of (succeeded, result_or_exception, start_time, end_time)
+    """
+    start_time = time.perf_counter()
+    try:
+        result = func(*args, **kwargs)
+        return True, result, start_time, time.perf_counter()
+    except Exception as e:
+        return False, e, start_time, time.perf_counter()
+
+
 class ParallelExecutor:
     """
     Execute functions in parallel for improved performance.
 
-    Supports both thread-based and process-based parallelism.
+    Supports both thread-based and process-based parallelism. The worker pool
+    is created lazily on first use and reused across calls until
+    ``shutdown()`` is called, so per-call cost is task submission only.
+    Hedged retries (see ``execute_with_budget``) run on a separate pool of the
+    same size, so they never queue behind the stragglers they are hedging.
     """
 
     def __init__(self, max_workers: int = 4, use_processes: bool = False):
@@ -53,6 +162,80 @@ class ParallelExecutor:
         self.max_workers = max_workers
         self.use_processes = use_processes
         self._executor_class = ProcessPoolExecutor if use_processes else ThreadPoolExecutor
+        self._pool: Optional[concurrent.futures.Executor] = None
+        self._hedge_pool: Optional[concurrent.futures.Executor] = None
+        self._pool_lock = threading.Lock()
+        self._hedges_running = 0
+        self._stragglers = 0  # Timed-out attempts still occupying a worker
+        self._count_lock = threading.Lock()
+
+    def _create_pool(self, thread_name_prefix: str) -> concurrent.futures.Executor:
+        if self.use_processes:
+            return ProcessPoolExecutor(max_workers=self.max_workers)
+        return ThreadPoolExecutor(
+            max_workers=self.max_workers,
+            thread_name_prefix=thread_name_prefix,
+            initializer=_mark_worker,
+            initargs=(id(self),),
+        )
+
+    @property
+    def executor(self) -> concurrent.futures.Executor:
+        """Get the underlying pool, creating (or replacing a broken) one on demand."""
+        with self._pool_lock:
+            if self._pool is None or getattr(self._pool, "_broken", False):
+                self._pool = self._create_pool("parallel")
+            return self._pool
+
+    @property
+    def hedge_executor(self) -> concurrent.futures.Executor:
+        """Get the pool reserved for hedged retries, creating it on demand."""
+        with self._pool_lock:
+            if self._hedge_pool is None or getattr(self._hedge_pool, "_broken", False):
+                self._hedge_pool = self._create_pool("parallel-hedge")
+            return self._hedge_pool
+
+    @property
+    def straggler_count(self) -> int:
+        """Number of attempts abandoned by an expired budget that are still running."""
+        with self._count_lock:
+            return self._stragglers
+
+    def shutdown(self, wait: bool = True, cancel_futures: bool = False):
+        """
+        Shut down the worker pool.
+
+        The executor stays usable; a new pool is created on the next call.
+
+        Args:
+            wait: Block until running tasks finish
+            cancel_futures: Cancel tasks that have not started yet
+        """
+        with self._pool_lock:
+            pools = [self._pool, self._hedge_pool]
+            self._pool = self._hedge_pool = None
+        for pool in pools:
+            if pool is not None:
+                pool.shutdown(wait=wait, cancel_futures=cancel_futures)
+
+    def __enter__(self) -> "ParallelExecutor":
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.shutdown()
+
+    def _in_own_worker(self) -> bool:
+        """Check whether the caller is running on one of this executor's threads."""
+        return not self.use_processes and getattr(_worker_state, "executor_id", None) == id(
+            self
+        )
+
+    def _submit(self, pool, func: Callable, args: Tuple, kwargs: Dict) -> concurrent.futures.Future:
+        """Submit a timed call, carrying the caller's context (active span) into threads."""
+        if self.use_processes:
+            return pool.submit(_run_timed, func, args, kwargs)
+        ctx = contextvars.copy_context()
+        return pool.submit(ctx.run, _run_timed, func, args, kwargs)
 
     def execute_parallel(
         self, tasks: List[Tuple[Callable, Tuple, Dict]], timeout: Optional[float] = None
@@ -65,7 +248,11 @@ class ParallelExecutor:
             timeout: Optional timeout in seconds
 
         Returns:
-            List of ParallelResult objects
+            List of ParallelResult objects, in the same order as ``tasks``
+
+        Raises:
+            concurrent.futures.TimeoutError: If tasks are still running after
+                ``timeout`` seconds (unstarted tasks are cancelled)
 
         Example:
             >>> executor = ParallelExecutor(max_workers=4)
@@ -75,38 +262,225 @@ class ParallelExecutor:
             ... ]
             >>> results = executor.execute_parallel(tasks)
         """
-        results = []
-
-        with self._executor_class(max_workers=self.max_workers) as executor:
-            # Submit all tasks
-            future_to_task = {}
-            for name, (func, args, kwargs) in enumerate(tasks):
-                start_time = time.perf_counter()
-                future = executor.submit(func, *args, **kwargs)
-                future_to_task[future] = (
-                    name,
-                    func.__name__ if hasattr(func, "__name__") else str(func),
-                    start_time,
+        if not tasks:
+            return []
+
+        func_names = [getattr(func, "__name__", str(func)) for func, _, _ in tasks]
+
+        if self._in_own_worker():
+            # Nested call from one of our workers: run inline rather than
+            # queueing behind ourselves on a saturated pool
+            outcomes = [
+                (time.perf_counter(), _run_timed(func, args, kwargs))
+                for func, args, kwargs in tasks
+            ]
+        else:
+            pool = self.executor
+            submitted = []
+            for func, args, kwargs in tasks:
+                submit_time = time.perf_counter()
+                submitted.append((submit_time, self._submit(pool, func, args, kwargs)))
+
+            done, not_done = concurrent.futures.wait(
+                [future for _, future in submitted], timeout=timeout
+            )
+            if not_done:
+                for future in not_done:
+                    future.cancel()
+                raise concurrent.futures.TimeoutError(
+                    f"{len(not_done)} of {len(tasks)} tasks did not finish in {timeout}s"
                 )
 
-            # Collect results
-            for future in concurrent.futures.as_completed(future_to_task, timeout=timeout):
-                name, func_name, start_time = future_to_task[future]
-                execution_time = time.perf_counter() - start_time
-
+            outcomes = []
+            for submit_time, future in submitted:
                 try:
-                    result = future.result(timeout=0)
-                    results.append(
-                        ParallelResult(name=func_name, result=result, execution_time=execution_time)
-                    )
+                    outcomes.append((submit_time, future.result()))
                 except Exception as e:
-                    results.append(
-                        ParallelResult(
-                            name=func_name, result=None, error=e, execution_time=execution_time
-                        )
-                    )
+                    # Pool-level failure (e.g. unpicklable task, broken pool)
+                    now = time.perf_counter()
+                    outcomes.append((submit_time, (False, e, now, now)))
 
-        return results
+        return [
+            self._build_result(func_name, submit_time, outcome)
+            for func_name, (submit_time, outcome) in zip(func_names, outcomes)
+        ]
+
+    def execute_with_budget(
+        self,
+        named_tasks: Dict[str, Tuple[Callable, Tuple, Dict]],
+        budget: float,
+        hedge: bool = True,
+        hedge_percentile: float = 95.0,
+        latency_tracker: Optional[LatencyTracker] = None,
+    ) -> Dict[str, ParallelResult]:
+        """
+        Execute named tasks in parallel within a latency budget.
+
+        Unlike ``execute_parallel`` this never raises on expiry: tasks that
+        finish within ``budget`` seconds return their results, the rest are
+        returned with ``timed_out=True`` and a TimeoutError. Stragglers that
+        have not started are cancelled; running threads cannot be interrupted,
+        so their late results are discarded.
+
+        With ``hedge`` enabled, a task still running past its historical
+        ``hedge_percentile`` latency gets one duplicate attempt; whichever
+        attempt finishes first wins. Hedges run on ``hedge_executor`` and are
+        skipped when all of its workers are busy. Attempts abandoned on expiry
+        are counted in ``straggler_count`` until they finish, and their run
+        times still feed ``latency_tracker``.
+
+        Args:
+            named_tasks: Dictionary of {name: (function, args, kwargs)}
+            budget: Latency budget in seconds for the whole fan-out
+            hedge: Whether to issue hedged retries for slow tasks
+            hedge_percentile: Latency percentile that triggers a hedge
+            latency_tracker: Tracker for per-name latencies (global by default)
+
+        Returns:
+            Dictionary of {name: ParallelResult}, in ``named_tasks`` order
+
+        Example:
+            >>> results = executor.execute_with_budget(
+            ...     {'career': (career_func, (), context)}, budget=8.0
+            ... )
+            >>> if results['career'].timed_out:
+            ...     ...
+        """
+        if not named_tasks:
+            return {}
+
+        tracker = latency_tracker or get_latency_tracker()
+        start = time.perf_counter()
+        deadline = start + budget
+        results: Dict[str, ParallelResult] = {}
+
+        if self._in_own_worker():
+            # Nested fan-out: run inline, skipping whatever no longer fits
+            for name, (func, args, kwargs) in named_tasks.items():
+                if time.perf_counter() >= deadline:
+                    break
+                submit_time = time.perf_counter()
+                results[name] = self._build_result(
+                    name, submit_time, _run_timed(func, args, kwargs)
+                )
+                if results[name].success:
+                    tracker.record(name, results[name].run_time)
+        else:
+            pool = self.executor
+            attempts: Dict[concurrent.futures.Future, Tuple[str, float, bool]] = {}
+
+            def submit(name: str, is_hedge: bool):
+                func, args, kwargs = named_tasks[name]
+                if is_hedge:
+                    with self._count_lock:
+                        if self._hedges_running >= self.max_workers:
+                            return  # No free hedge worker: let the first attempt run
+                        self._hedges_running += 1
+                    future = self._submit(self.hedge_executor, func, args, kwargs)
+                    future.add_done_callback(self._release_hedge)
+                else:
+                    future = self._submit(pool, func, args, kwargs)
+                attempts[future] = (name, time.perf_counter(), is_hedge)
+
+            hedge_at: Dict[str, float] = {}
+            for name in named_tasks:
+                submit(name, False)
+                threshold = tracker.percentile(name, hedge_percentile) if hedge else None
+                if threshold is not None and start + threshold < deadline:
+                    hedge_at[name] = start + threshold
+
+            while len(results) < len(named_tasks):
+                now = time.perf_counter()
+                if now >= deadline:
+                    break
+
+                for name in [n for n, at in hedge_at.items() if at <= now]:
+                    del hedge_at[name]
+                    submit(name, True)
+
+                wake_at = min([deadline] + list(hedge_at.values()))
+                done, _ = concurrent.futures.wait(
+                    list(attempts),
+                    timeout=max(0.0, wake_at - now),
+                    return_when=concurrent.futures.FIRST_COMPLETED,
+                )
+
+                for future in done:
+                    name, submit_time, is_hedge = attempts.pop(future)
+                    if name in results:
+                        continue  # Lost the race against the other attempt
+                    try:
+                        outcome = future.result()
+                    except Exception as e:
+                        now = time.perf_counter()
+                        outcome = (False, e, now, now)
+                    results[name] = self._build_result(name, submit_time, outcome)
+                    results[name].hedged = is_hedge
+                    hedge_at.pop(name, None)
+                    if results[name].success:
+                        tracker.record(name, results[name].run_time)
+
+                    # Cancel the sibling attempt if it has not started yet
+                    for other, (other_name, _, _) in list(attempts.items()):
+                        if other_name == name and other.cancel():
+                            del attempts[other]
+
+            for future, (name, _, _) in attempts.items():
+                if not future.cancel():
+                    self._track_straggler(future, name, tracker)
+
+        elapsed = time.perf_counter() - start
+        ordered: Dict[str, ParallelResult] = {}
+        for name in named_tasks:
+            ordered[name] = results.get(name) or ParallelResult(
+                name=name,
+                result=None,
+                error=concurrent.futures.TimeoutError(
+                    f"'{name}' did not finish within the {budget}s budget"
+                ),
+                execution_time=elapsed,
+                timed_out=True,
+            )
+        return ordered
+
+    def _release_hedge(self, future: concurrent.futures.Future):
+        with self._count_lock:
+            self._hedges_running -= 1
+
+    def _track_straggler(
+        self, future: concurrent.futures.Future, name: str, tracker: LatencyTracker
+    ):
+        """Count an abandoned attempt until it finishes, then record its run time."""
+        with self._count_lock:
+            self._stragglers += 1
+
+        def finished(done: concurrent.futures.Future):
+            with self._count_lock:
+                self._stragglers -= 1
+            if done.cancelled() or done.exception() is not None:
+                return
+            ok, _, start_time, end_time = done.result()
+            if ok:
+                tracker.record(name, end_time - start_time)
+
+        future.add_done_callback(finished)
+
+    @staticmethod
+    def _build_result(
+        name: str, submit_time: float, outcome: Tuple[bool, Any, float, float]
+    ) -> ParallelResult:
+        """Convert a _run_timed outcome into a ParallelResult."""
+        ok, value, start_time, end_time = outcome
+        queue_time = max(0.0, start_time - submit_time)
+        run_time = end_time - start_time
+        return ParallelResult(
+            name=name,
+            result=value if ok else None,
+            error=None if ok else value,
+            execution_time=queue_time + run_time,
+            queue_time=queue_time,
+            run_time=run_time,
+        )
 
     def execute_map(
         self, func: Callable, items: List[Any], timeout: Optional[float] = None
@@ -162,33 +536,255 @@ class ParallelExecutor:
         return {name: result for name, result in zip(specialist_funcs.keys(), results)}
 
 
+# Long-lived executors shared by the convenience functions below
+_shared_executors: Dict[Tuple[int, bool], ParallelExecutor] = {}
+_shared_executors_lock = threading.Lock()
+
+
+def get_parallel_executor(max_workers: int = 4, use_processes: bool = False) -> ParallelExecutor:
+    """
+    Get a shared ParallelExecutor for the given pool configuration.
+
+    Executors are created once per (max_workers, use_processes) pair and reused,
+    so repeated coordinator turns do not pay pool start-up costs.
+
+    Args:
+        max_workers: Maximum number of parallel workers
+        use_processes: Use process pool instead of thread pool
+
+    Returns:
+        Shared ParallelExecutor instance
+    """
+    key = (max_workers, use_processes)
+    with _shared_executors_lock:
+        executor = _shared_executors.get(key)
+        if executor is None:
+            executor = ParallelExecutor(max_workers=max_workers, use_processes=use_processes)
+            _shared_executors[key] = executor
+        return executor
+
+
+def shutdown_parallel_executors(wait: bool = True):
+    """
+    Shut down all shared executors.
+
+    Registered with atexit; call explicitly for a graceful shutdown earlier
+    (e.g. when the coach application stops).
+
+    Args:
+        wait: Block until running tasks finish
+    """
+    with _shared_executors_lock:
+        executors = list(_shared_executors.values())
+        _shared_executors.clear()
+    for executor in executors:
+        executor.shutdown(wait=wait)
+    _stop_background_loop()
+
+
+atexit.register(shutdown_parallel_executors)
+
+
+# Event loop thread used to run coroutines from sync code that is itself
+# executing inside a running loop (e.g. a sync tool under LangGraph ainvoke)
+_background_loop: Optional[asyncio.AbstractEventLoop] = None
+_background_thread: Optional[threading.Thread] = None
+_background_lock = threading.Lock()
+
+
+def _get_background_loop() -> asyncio.AbstractEventLoop:
+    """Get or start the shared background event loop."""
+    global _background_loop, _background_thread
+    with _background_lock:
+        if _background_loop is None or _background_loop.is_closed():
+            loop = asyncio.new_event_loop()
+            thread = threading.Thread(
+                target=loop.run_forever, name="async-executor-loop", daemon=True
+            )
+            thread.start()
+            _background_loop, _background_thread = loop, thread
+        return _background_loop
+
+
+def _stop_background_loop():
+    """Stop the shared background event loop, if running."""
+    global _background_loop, _background_thread
+    with _background_lock:
+        loop, thread = _background_loop, _background_thread
+        _background_loop, _background_thread = None, None
+    if loop is not None and not loop.is_closed():
+        loop.call_soon_threadsafe(loop.stop)
+        if thread is not None:
+            thread.join(timeout=5)
+        loop.close()
+
+
+def run_coroutine_sync(coro: Any) -> Any:
+    """
+    Run a coroutine to completion from synchronous code.
+
+    Uses ``asyncio.run`` when no loop is running in this thread; otherwise the
+    coroutine is handed to a shared background loop so the caller's loop is
+    never re-entered.
+
+    Args:
+        coro: Coroutine to run
+
+    Returns:
+        The coroutine's result
+    """
+    try:
+        asyncio.get_running_loop()
+    except RuntimeError:
+        return asyncio.run(coro)
+    return asyncio.run_coroutine_threadsafe(coro, _get_background_loop()).result()
+
+
+class AsyncTaskExecutor:
+    """
+    Asyncio-native executor with bounded concurrency.
+
+    Coroutine functions are awaited directly and blocking functions are
+    offloaded with ``asyncio.to_thread``, all limited by a per-loop semaphore.
+    ``run_many`` uses a TaskGroup so cancelling the caller (or hitting the
+    timeout) cancels every outstanding task.
+
+    Works from async code (``await executor.run_many(...)``, e.g. under
+    LangGraph ``ainvoke``) and from sync code (``executor.run_many_sync(...)``,
+    e.g. under ``invoke``), including sync code already running inside a loop.
+    """
+
+    def __init__(self, max_concurrency: int = 4):
+        """
+        Initialize the executor.
+
+        Args:
+            max_concurrency: Maximum number of tasks running at once per event loop
+        """
+        self.max_concurrency = max_concurrency
+        # One semaphore per event loop; asyncio primitives are loop-bound
+        self._semaphores: weakref.WeakKeyDictionary = weakref.WeakKeyDictionary()
+
+    def _get_semaphore(self) -> asyncio.Semaphore:
+        """Get the concurrency limiter for the running loop."""
+        loop = asyncio.get_running_loop()
+        semaphore = self._semaphores.get(loop)
+        if semaphore is None:
+            semaphore = self._semaphores[loop] = asyncio.Semaphore(self.max_concurrency)
+        return semaphore
+
+    @staticmethod
+    async def _call(func: Callable, args: Tuple, kwargs: Dict) -> Any:
+        """Await a coroutine function or offload a blocking one to a thread."""
+        if inspect.iscoroutinefunction(func):
+            return await func(*args, **kwargs)
+        result = await asyncio.to_thread(func, *args, **kwargs)
+        if inspect.isawaitable(result):
+            result = await result
+        return result
+
+    async def run(self, func: Callable, *args, **kwargs) -> Any:
+        """
+        Run a single function under the concurrency limit.
+
+        Args:
+            func: Function or coroutine function to run
+            *args: Positional arguments
+            **kwargs: Keyword arguments
+
+        Returns:
+            Function result (exceptions propagate)
+        """
+        async with self._get_semaphore():
+            return await self._call(func, args, kwargs)
+
+    async def _run_timed(
+        self, index: int, func: Callable, args: Tuple, kwargs: Dict, results: List
+    ):
+        """Run one task, storing a ParallelResult with queue and run timings."""
+        name = getattr(func, "__name__", f"task_{index}")
+        submit_time = time.perf_counter()
+        async with self._get_semaphore():
+            start_time = time.perf_counter()
+            try:
+                value = await self._call(func, args, kwargs)
+                error = None
+            except Exception as e:
+                value, error = None, e
+        end_time = time.perf_counter()
+        results[index] = ParallelResult(
+            name=name,
+            result=value,
+            error=error,
+            execution_time=end_time - submit_time,
+            queue_time=start_time - submit_time,
+            run_time=end_time - start_time,
+        )
+
+    async def run_many(
+        self, tasks: List[Tuple[Callable, Tuple, Dict]], timeout: Optional[float] = None
+    ) -> List[ParallelResult]:
+        """
+        Run multiple tasks concurrently.
+
+        Errors are isolated per task. On timeout every unfinished task is
+        cancelled and reported with ``timed_out=True``.
+
+        Args:
+            tasks: List of (function, args, kwargs) tuples
+            timeout: Optional overall timeout in seconds
+
+        Returns:
+            List of ParallelResult objects, in the same order as ``tasks``
+        """
+        results: List[Optional[ParallelResult]] = [None] * len(tasks)
+        start = time.perf_counter()
+
+        try:
+            async with asyncio.timeout(timeout):
+                async with asyncio.TaskGroup() as group:
+                    for index, (func, args, kwargs) in enumerate(tasks):
+                        group.create_task(self._run_timed(index, func, args, kwargs, results))
+        except TimeoutError:
+            pass
+
+        elapsed = time.perf_counter() - start
+        for index, (func, _, _) in enumerate(tasks):
+            if results[index] is None:
+                results[index] = ParallelResult(
+                    name=getattr(func, "__name__", f"task_{index}"),
+                    result=None,
+                    error=TimeoutError(f"Task did not finish within {timeout}s"),
+                    execution_time=elapsed,
+                    timed_out=True,
+                )
+        return results
+
+    def run_sync(self, func: Callable, *args, **kwargs) -> Any:
+        """Synchronous interface to ``run``."""
+        return run_coroutine_sync(self.run(func, *args, **kwargs))
+
+    def run_many_sync(
+        self, tasks: List[Tuple[Callable, Tuple, Dict]], timeout: Optional[float] = None
+    ) -> List[ParallelResult]:
+        """Synchronous interface to ``run_many``."""
+        return run_coroutine_sync(self.run_many(tasks, timeout))
+
+
 class AsyncToolExecutor:
     """
     Async-based tool execution for non-blocking operations.
 
     Useful for I/O-bound operations like network calls or file operations.
+    Thin wrapper over AsyncTaskExecutor kept for existing callers.
     """
 
-    def __init__(self):
-        self._loop: Optional[asyncio.AbstractEventLoop] = None
-
-    def _get_loop(self) -> asyncio.AbstractEventLoop:
-        """Get or create event loop."""
-        if self._loop is None or self._loop.is_closed():
-            try:
-                self._loop = asyncio.get_event_loop()
-            except RuntimeError:
-                self._loop = asyncio.new_event_loop()
-                asyncio.set_event_loop(self._loop)
-        return self._loop
+    def __init__(self, max_concurrency: int = 4):
+        self._executor = AsyncTaskExecutor(max_concurrency=max_concurrency)
 
     async def _execute_async(self, func: Callable, *args, **kwargs) -> Any:
         """Execute a function asynchronously."""
-        loop = self._get_loop()
-
-        # Run in thread pool to avoid blocking
-        with ThreadPoolExecutor(max_workers=1) as executor:
-            return await loop.run_in_executor(executor, functools.partial(func, *args, **kwargs))
+        return await self._executor.run(func, *args, **kwargs)
 
     def execute(self, func: Callable, *args, **kwargs) -> Any:
         """
@@ -202,8 +798,7 @@ class AsyncToolExecutor:
         Returns:
             Function result
         """
-        loop = self._get_loop()
-        return loop.run_until_complete(self._execute_async(func, *args, **kwargs))
+        return self._executor.run_sync(func, *args, **kwargs)
 
     async def execute_multiple(
         self, tasks: List[Tuple[Callable, Tuple, Dict]]
@@ -217,27 +812,7 @@ class AsyncToolExecutor:
         Returns:
             List of ParallelResult objects
         """
-
-        async def run_task(name: str, func: Callable, args: Tuple, kwargs: Dict) -> ParallelResult:
-            start_time = time.perf_counter()
-            try:
-                result = await self._execute_async(func, *args, **kwargs)
-                return ParallelResult(
-                    name=name, result=result, execution_time=time.perf_counter() - start_time
-                )
-            except Exception as e:
-                return ParallelResult(
-                    name=name, result=None, error=e, execution_time=time.perf_counter() - start_time
-                )
-
-        # Create tasks
-        async_tasks = []
-        for i, (func, args, kwargs) in enumerate(tasks):
-            name = func.__name__ if hasattr(func, "__name__") else f"task_{i}"
-            async_tasks.append(run_task(name, func, args, kwargs))
-
-        # Execute concurrently
-        return await asyncio.gather(*async_tasks)
+        return await self._executor.run_many(tasks)
 
     def run_multiple(self, tasks: List[Tuple[Callable, Tuple, Dict]]) -> List[ParallelResult]:
         """
@@ -249,8 +824,7 @@ class AsyncToolExecutor:
         Returns:
             List of ParallelResult objects
         """
-        loop = self._get_loop()
-        return loop.run_until_complete(self.execute_multiple(tasks))
+        return self._executor.run_many_sync(tasks)
 
 
 def parallel_map(
@@ -266,16 +840,65 @@ def parallel_map(
         timeout: Optional timeout
 
     Returns:
-        List of results (may include exceptions)
+        List of results in input order (may include exceptions)
 
     Example:
         >>> results = parallel_map(process_user, user_ids, max_workers=8)
     """
-    executor = ParallelExecutor(max_workers=max_workers)
+    executor = get_parallel_executor(max_workers=max_workers)
     results = executor.execute_map(func, items, timeout)
     return [r.result if r.success else r.error for r in results]
 
 
+def _traced_specialist(name: str, func: Callable) -> Callable:
+    """Wrap a specialist so each attempt is recorded as a ``specialist.<name>`` span."""
+
+    @functools.wraps(func)
+    def wrapper(*args, **kwargs):
+        attributes = {"component": "specialist", "specialist.name": name}
+        with get_tracer().span(f"specialist.{name}", attributes):
+            return func(*args, **kwargs)
+
+    return wrapper
+
+
+def fan_out_specialists(
+    specialist_funcs: Dict[str, Callable],
+    context: Dict[str, Any],
+    budget: float = 30.0,
+    max_workers: int = 4,
+    hedge: bool = True,
+) -> Dict[str, ParallelResult]:
+    """
+    Fan out to specialists within a per-turn latency budget.
+
+    Specialists that finish in time return their results; the rest come back
+    with ``timed_out=True`` so the coordinator can answer with what it has.
+    Specialists that run past their historical p95 get one hedged retry.
+
+    Args:
+        specialist_funcs: Dictionary of {name: function}
+        context: Shared context passed to every specialist as keyword arguments
+        budget: Latency budget in seconds for the whole fan-out
+        max_workers: Number of parallel workers
+        hedge: Whether to issue hedged retries for slow specialists
+
+    Returns:
+        Dictionary of {name: ParallelResult}
+
+    Example:
+        >>> results = fan_out_specialists(specialists, context, budget=8.0)
+        >>> finished = {n: r.result for n, r in results.items() if r.success}
+    """
+    executor = get_parallel_executor(max_workers=max_workers)
+    if get_tracer().enabled:
+        specialist_funcs = {
+            name: _traced_specialist(name, func) for name, func in specialist_funcs.items()
+        }
+    named_tasks = {name: (func, (), context) for name, func in specialist_funcs.items()}
+    return executor.execute_with_budget(named_tasks, budget, hedge=hedge)
+
+
 def parallel_specialists(
     specialist_funcs: Dict[str, Callable],
     context: Dict[str, Any],
@@ -289,10 +912,11 @@ def parallel_specialists(
         specialist_funcs: Dictionary of {name: function}
         context: Shared context to pass to all specialists
         max_workers: Number of parallel workers
-        timeout: Timeout in seconds
+        timeout: Latency budget in seconds; specialists still running after
+            it are returned as TimeoutError instead of failing the whole call
 
     Returns:
-        Dictionary of {name: result}
+        Dictionary of {name: result} (errors and timeouts as exceptions)
 
     Example:
         >>> specialists = {
@@ -302,8 +926,9 @@ def parallel_specialists(
         >>> results = parallel_specialists(specialists, {'user_id': '123'})
         >>> career_result = results['career']
     """
-    executor = ParallelExecutor(max_workers=max_workers)
-    results = executor.execute_specialist_tasks(specialist_funcs, context, timeout)
+    results = fan_out_specialists(
+        specialist_funcs, context, budget=timeout, max_workers=max_workers
+    )
 
     # Extract just the results
     return {
@@ -341,7 +966,7 @@ class BatchProcessor:
             List of results
         """
         results = []
-        executor = ParallelExecutor(max_workers=self.max_workers)
+        executor = get_parallel_executor(max_workers=self.max_workers)
 
         # Process in batches
         for i in range(0, len(items), self.batch_size):
@@ -389,6 +1014,7 @@ def optimize_specialist_delegation(
     specialists: Dict[str, Callable],
     user_context: Dict[str, Any],
     parallel_threshold: int = 2,
+    latency_budget: float = 30.0,
 ) -> Dict[str, Any]:
     """
     Intelligently decide between parallel and sequential specialist execution.
@@ -398,9 +1024,10 @@ def optimize_specialist_delegation(
         specialists: Dictionary of available specialists
         user_context: User context data
         parallel_threshold: Minimum number of specialists to trigger parallel execution
+        latency_budget: Per-turn latency budget in seconds for parallel execution
 
     Returns:
-        Dictionary of specialist results
+        Dictionary of specialist results (timed-out specialists as TimeoutError)
     """
     # If only one specialist or few specialists, execute sequentially
     if len(specialists) < parallel_threshold:
@@ -414,5 +1041,5 @@ def optimize_specialist_delegation(
 
     # Multiple specialists - execute in parallel for better performance
     return parallel_specialists(
-        specialists, user_context, max_workers=min(len(specialists), 4), timeout=30.0
+        specialists, user_context, max_workers=min(len(specialists), 4), timeout=latency_budget
     )
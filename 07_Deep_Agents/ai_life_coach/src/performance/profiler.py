@@ -9,10 +9,14 @@ Features:
 - Tool call performance tracking
 - Memory access pattern analysis
 - Performance report generation
+- Low-overhead sampling mode backed by streaming histograms
+- Nested span export (see tracing.py) for profiled sections
 """
 
 import cProfile
+import math
 import pstats
+import random
 import time
 import functools
 from contextlib import contextmanager
@@ -21,6 +25,92 @@ from typing import Any, Callable, Dict, List, Optional, Tuple
 from collections import defaultdict
 import io
 
+from .tracing import get_tracer
+
+
+class StreamingHistogram:
+    """
+    Fixed-size latency histogram with HDR-style log-linear buckets.
+
+    Values are recorded in microseconds into buckets whose width grows with
+    magnitude, keeping relative error below ``1 / 2**sub_bucket_bits``.
+    Memory is fixed at construction, ``record`` is O(1), and percentile
+    queries walk a constant number of buckets regardless of sample count.
+    """
+
+    def __init__(self, sub_bucket_bits: int = 5, max_value_seconds: float = 3600.0):
+        """
+        Initialize the histogram.
+
+        Args:
+            sub_bucket_bits: Precision bits per power of two (5 = ~3% error)
+            max_value_seconds: Largest value tracked precisely; larger values
+                are clamped into the top bucket
+        """
+        self._sub_bits = sub_bucket_bits
+        self._sub_count = 1 << sub_bucket_bits
+        self._max_us = max(self._sub_count * 2, int(max_value_seconds * 1_000_000))
+        self._counts = [0] * (self._index_for(self._max_us) + 1)
+        self.count = 0
+        self.total = 0.0
+        self.min = math.inf
+        self.max = 0.0
+
+    def _index_for(self, value_us: int) -> int:
+        """Map a microsecond value to its bucket index."""
+        if value_us < self._sub_count * 2:
+            return value_us
+        shift = value_us.bit_length() - (self._sub_bits + 1)
+        return self._sub_count * shift + (value_us >> shift)
+
+    def _value_for(self, index: int) -> float:
+        """Representative (midpoint) value in seconds for a bucket index."""
+        if index < self._sub_count * 2:
+            return index / 1_000_000
+        shift = index // self._sub_count - 1
+        mantissa = index - self._sub_count * shift
+        low = mantissa << shift
+        return (low + ((1 << shift) - 1) / 2) / 1_000_000
+
+    def record(self, seconds: float):
+        """Record a single value in seconds."""
+        value_us = min(self._max_us, max(0, int(seconds * 1_000_000)))
+        self._counts[self._index_for(value_us)] += 1
+        self.count += 1
+        self.total += seconds
+        if seconds < self.min:
+            self.min = seconds
+        if seconds > self.max:
+            self.max = seconds
+
+    def percentile(self, pct: float) -> float:
+        """
+        Get an approximate percentile.
+
+        Args:
+            pct: Percentile in the range 0-100
+
+        Returns:
+            Value in seconds (0.0 if nothing was recorded)
+        """
+        if self.count == 0:
+            return 0.0
+        rank = max(1, math.ceil(pct / 100.0 * self.count))
+        seen = 0
+        for index, bucket_count in enumerate(self._counts):
+            seen += bucket_count
+            if seen >= rank:
+                return min(self.max, max(self.min, self._value_for(index)))
+        return self.max
+
+    def reset(self):
+        """Clear all recorded values."""
+        self._counts = [0] * len(self._counts)
+        self.count = 0
+        self.total = 0.0
+        self.min = math.inf
+        self.max = 0.0
+
 
 class PerformanceProfiler:
     """
@@ -31,13 +121,29 @@ class PerformanceProfiler:
     - Tool calls
     - Memory access
     - Subagent coordination
+
+    By default every timing is kept for exact statistics. With
+    ``use_histograms=True`` timings go into fixed-size streaming histograms
+    instead, so memory stays constant no matter how long profiling runs.
+    ``sample_rate`` times only a fraction of calls; call counts remain exact
+    and totals are scaled up from the sampled timings.
     """
 
-    def __init__(self):
+    def __init__(self, use_histograms: bool = False, sample_rate: float = 1.0):
+        """
+        Initialize the profiler.
+
+        Args:
+            use_histograms: Record into streaming histograms instead of lists
+            sample_rate: Fraction of calls to time (0.0-1.0)
+        """
         self.metrics: Dict[str, List[float]] = defaultdict(list)
+        self.histograms: Dict[str, StreamingHistogram] = defaultdict(StreamingHistogram)
         self.call_counts: Dict[str, int] = defaultdict(int)
         self.start_times: Dict[str, float] = {}
         self.enabled = True
+        self.use_histograms = use_histograms
+        self.sample_rate = max(0.0, min(1.0, sample_rate))
 
     def enable(self):
         """Enable profiling."""
@@ -47,35 +153,103 @@ class PerformanceProfiler:
         """Disable profiling."""
         self.enabled = False
 
+    def configure(self, use_histograms: Optional[bool] = None, sample_rate: Optional[float] = None):
+        """
+        Switch recording backend and/or sampling rate in place.
+
+        Collected metrics are cleared when the backend changes.
+
+        Args:
+            use_histograms: Record into streaming histograms instead of lists
+            sample_rate: Fraction of calls to time (0.0-1.0)
+        """
+        if use_histograms is not None and use_histograms != self.use_histograms:
+            self.reset()
+            self.use_histograms = use_histograms
+        if sample_rate is not None:
+            self.sample_rate = max(0.0, min(1.0, sample_rate))
+
     @contextmanager
-    def profile_section(self, section_name: str):
+    def profile_section(self, section_name: str, attributes: Optional[Dict[str, Any]] = None):
         """
         Context manager to profile a section of code.
 
+        When span tracing is enabled the section is also recorded as a span,
+        nested under whichever section is currently active.
+
         Args:
             section_name: Name of the section being profiled
+            attributes: Optional span attributes (ignored when tracing is off)
 
         Example:
             >>> with profiler.profile_section("memory_access"):
             ...     result = memory_manager.get_profile(user_id)
         """
+        tracer = get_tracer()
+        if not tracer.enabled:
+            with self._timed_section(section_name):
+                yield
+            return
+
+        span_attributes = {"component": section_name.split(".", 1)[0]}
+        if attributes:
+            span_attributes.update(attributes)
+        with tracer.span(section_name, span_attributes):
+            with self._timed_section(section_name):
+                yield
+
+    @contextmanager
+    def _timed_section(self, section_name: str):
+        """Time a section into the metrics backend, honouring sampling."""
         if not self.enabled:
             yield
             return
 
+        if self.sample_rate < 1.0 and random.random() >= self.sample_rate:
+            # Not sampled: count the call without timing it
+            self.call_counts[section_name] += 1
+            yield
+            return
+
         start_time = time.perf_counter()
         try:
             yield
         finally:
-            elapsed = time.perf_counter() - start_time
+            self._record(section_name, time.perf_counter() - start_time)
+
+    def _record(self, section_name: str, elapsed: float):
+        """Store one timing in the active backend."""
+        if self.use_histograms:
+            self.histograms[section_name].record(elapsed)
+        else:
             self.metrics[section_name].append(elapsed)
-            self.call_counts[section_name] += 1
+        self.call_counts[section_name] += 1
 
     def record_timing(self, section_name: str, elapsed: float):
         """Record a timing directly."""
         if self.enabled:
-            self.metrics[section_name].append(elapsed)
-            self.call_counts[section_name] += 1
+            self._record(section_name, elapsed)
+
+    def get_percentile(self, section_name: str, pct: float) -> Optional[float]:
+        """
+        Get a latency percentile for a section.
+
+        Args:
+            section_name: Name of the profiled section
+            pct: Percentile in the range 0-100
+
+        Returns:
+            Latency in seconds, or None if the section has no timings
+        """
+        if self.use_histograms:
+            histogram = self.histograms.get(section_name)
+            return histogram.percentile(pct) if histogram and histogram.count else None
+        times = self.metrics.get(section_name)
+        if not times:
+            return None
+        ordered = sorted(times)
+        rank = max(1, math.ceil(pct / 100.0 * len(ordered)))
+        return ordered[rank - 1]
 
     def get_summary(self) -> Dict[str, Dict[str, float]]:
         """
@@ -84,23 +258,60 @@ class PerformanceProfiler:
         Returns:
             Dictionary with statistics for each tracked section:
             - count: Number of calls
-            - total_time: Total time spent
+            - total_time: Total time spent (estimated when sampling)
             - avg_time: Average time per call
             - min_time: Minimum time
             - max_time: Maximum time
+            - p50_time, p95_time, p99_time: Latency percentiles
         """
         summary = {}
-        for section, times in self.metrics.items():
-            if times:
-                summary[section] = {
-                    "count": len(times),
-                    "total_time": sum(times),
-                    "avg_time": sum(times) / len(times),
-                    "min_time": min(times),
-                    "max_time": max(times),
-                }
+        if self.use_histograms:
+            for section, histogram in self.histograms.items():
+                if histogram.count:
+                    summary[section] = self._section_stats(
+                        section,
+                        histogram.count,
+                        histogram.total,
+                        histogram.min,
+                        histogram.max,
+                        histogram.percentile,
+                    )
+        else:
+            for section, times in self.metrics.items():
+                if times:
+                    ordered = sorted(times)
+
+                    def percentile(pct: float, ordered=ordered) -> float:
+                        return ordered[max(1, math.ceil(pct / 100.0 * len(ordered))) - 1]
+
+                    summary[section] = self._section_stats(
+                        section, len(times), sum(times), ordered[0], ordered[-1], percentile
+                    )
         return summary
 
+    def _section_stats(
+        self,
+        section: str,
+        timed_count: int,
+        timed_total: float,
+        min_time: float,
+        max_time: float,
+        percentile: Callable[[float], float],
+    ) -> Dict[str, float]:
+        """Build summary statistics, scaling totals up when sampling."""
+        avg_time = timed_total / timed_count
+        count = max(self.call_counts.get(section, 0), timed_count)
+        return {
+            "count": count,
+            "total_time": avg_time * count,
+            "avg_time": avg_time,
+            "min_time": min_time,
+            "max_time": max_time,
+            "p50_time": percentile(50),
+            "p95_time": percentile(95),
+            "p99_time": percentile(99),
+        }
+
     def get_top_slowest(self, n: int = 10) -> List[Tuple[str, float]]:
         """
         Get the top N slowest sections by average time.
@@ -122,6 +333,7 @@ class PerformanceProfiler:
     def reset(self):
         """Reset all metrics."""
         self.metrics.clear()
+        self.histograms.clear()
         self.call_counts.clear()
         self.start_times.clear()
 
@@ -133,10 +345,10 @@ class PerformanceProfiler:
             Multi-line string with performance statistics
         """
         lines = [
-            "=" * 70,
+            "=" * 80,
             "AI LIFE COACH - PERFORMANCE PROFILE REPORT",
             f"Generated: {datetime.now().isoformat()}",
-            "=" * 70,
+            "=" * 80,
             "",
         ]
 
@@ -156,9 +368,10 @@ class PerformanceProfiler:
                 f"Total Execution Time: {total_time:.4f}s",
                 "",
                 "Performance by Section:",
-                "-" * 70,
-                f"{'Section':<40} {'Calls':>8} {'Avg (ms)':>10} {'Total (ms)':>12}",
-                "-" * 70,
+                "-" * 80,
+                f"{'Section':<36} {'Calls':>8} {'Avg (ms)':>10} "
+                f"{'P95 (ms)':>10} {'Total (ms)':>12}",
+                "-" * 80,
             ]
         )
 
@@ -167,24 +380,26 @@ class PerformanceProfiler:
 
         for section_name, stats in sorted_sections:
             avg_ms = stats["avg_time"] * 1000
+            p95_ms = stats["p95_time"] * 1000
             total_ms = stats["total_time"] * 1000
             lines.append(
-                f"{section_name:<40} {stats['count']:>8} {avg_ms:>10.2f} {total_ms:>12.2f}"
+                f"{section_name:<36} {stats['count']:>8} {avg_ms:>10.2f} {p95_ms:>10.2f} "
+                f"{total_ms:>12.2f}"
             )
 
         lines.extend(
             [
-                "-" * 70,
+                "-" * 80,
                 "",
                 "Top Bottlenecks (by average time per call):",
-                "-" * 70,
+                "-" * 80,
             ]
         )
 
         for section_name, avg_time in self.get_top_slowest(5):
             lines.append(f"  {section_name}: {avg_time * 1000:.2f}ms avg")
 
-        lines.append("=" * 70)
+        lines.append("=" * 80)
 
         return "\n".join(lines)
 
@@ -201,23 +416,33 @@ def get_profiler() -> PerformanceProfiler:
     return _profiler
 
 
-def reset_profiler():
-    """Reset the global profiler."""
+def reset_profiler(use_histograms: bool = False, sample_rate: float = 1.0):
+    """
+    Reset the global profiler.
+
+    Args:
+        use_histograms: Record into streaming histograms (constant memory)
+        sample_rate: Fraction of calls to time (0.0-1.0)
+    """
     global _profiler
-    _profiler = PerformanceProfiler()
+    _profiler = PerformanceProfiler(use_histograms=use_histograms, sample_rate=sample_rate)
 
 
 @contextmanager
-def profile(section_name: str):
+def profile(section_name: str, attributes: Optional[Dict[str, Any]] = None):
     """
     Convenience context manager using global profiler.
 
+    Args:
+        section_name: Name of the section being profiled
+        attributes: Optional span attributes when tracing is enabled
+
     Example:
         >>> with profile("database_query"):
         ...     results = db.query()
     """
     profiler = get_profiler()
-    with profiler.profile_section(section_name):
+    with profiler.profile_section(section_name, attributes):
         yield
 
 
@@ -242,7 +467,7 @@ def timed(func: Callable) -> Callable:
         profiler = get_profiler()
         section_name = f"{func.__module__}.{func.__name__}"
 
-        with profiler.profile_section(section_name):
+        with profiler.profile_section(section_name, {"code.function": func.__qualname__}):
             return func(*args, **kwargs)
 
     return wrapper
@@ -305,7 +530,7 @@ class ToolPerformanceTracker:
         @functools.wraps(tool_func)
         def wrapper(*args, **kwargs):
             section_name = f"tool.{name}"
-            with self.profiler.profile_section(section_name):
+            with self.profiler.profile_section(section_name, {"tool.name": name}):
                 return tool_func(*args, **kwargs)
 
         # Preserve tool metadata
@@ -328,23 +553,49 @@ class MemoryAccessOptimizer:
     Tracks frequently accessed data and suggests caching strategies.
     """
 
+    # Seconds a key's last access is remembered after reset()
+    HISTORY_WINDOW = 86400.0
+
     def __init__(self, profiler: Optional[PerformanceProfiler] = None):
         self.profiler = profiler or get_profiler()
         self.access_patterns: Dict[str, Dict[str, Any]] = defaultdict(
             lambda: {
                 "count": 0,
+                "first_access": None,
                 "last_access": None,
+                "previous_access": None,  # Last access before the current window
                 "total_time": 0.0,
+                "misses": 0,
+                "miss_time": 0.0,
             }
         )
+        # access_key -> last access time, kept across reset() windows
+        self._last_seen: Dict[str, float] = {}
 
-    def track_access(self, namespace: str, key: str, access_time: float):
-        """Track a memory access."""
+    def track_access(
+        self, namespace: str, key: str, access_time: float, hit: Optional[bool] = None
+    ):
+        """
+        Track a memory access.
+
+        Args:
+            namespace: Data type (e.g. "profile", "goals")
+            key: Key within the namespace (e.g. user ID)
+            access_time: Time the access took in seconds
+            hit: Whether the access was served from cache (None if unknown)
+        """
         access_key = f"{namespace}:{key}"
         pattern = self.access_patterns[access_key]
+        now = time.time()
         pattern["count"] += 1
-        pattern["last_access"] = time.time()
+        if pattern["first_access"] is None:
+            pattern["first_access"] = now
+            pattern["previous_access"] = self._last_seen.get(access_key)
+        pattern["last_access"] = now
         pattern["total_time"] += access_time
+        if hit is False:
+            pattern["misses"] += 1
+            pattern["miss_time"] += access_time
 
     def get_frequently_accessed(self, min_accesses: int = 3) -> List[Tuple[str, int]]:
         """
@@ -390,6 +641,70 @@ class MemoryAccessOptimizer:
 
         return sorted(recommendations, key=lambda x: x["priority_score"], reverse=True)
 
+    def get_namespace_stats(self) -> Dict[str, Dict[str, Any]]:
+        """
+        Aggregate access patterns per namespace.
+
+        A key's first access in the window counts as a re-access when the
+        key was also accessed in an earlier window (see reset()), so keys
+        read less often than once per window still report their interval.
+
+        Returns:
+            Dictionary of {namespace: stats} with key counts, accesses, misses,
+            average miss cost and the median interval between re-accesses
+        """
+        grouped: Dict[str, Dict[str, Any]] = {}
+        for access_key, data in self.access_patterns.items():
+            namespace = access_key.split(":", 1)[0]
+            stats = grouped.setdefault(
+                namespace,
+                {"keys": 0, "accesses": 0, "misses": 0, "miss_time": 0.0, "intervals": []},
+            )
+            stats["keys"] += 1
+            stats["accesses"] += data["count"]
+            stats["misses"] += data["misses"]
+            stats["miss_time"] += data["miss_time"]
+            previous = data.get("previous_access")
+            reaccesses = data["count"] if previous is not None else data["count"] - 1
+            if reaccesses >= 1:
+                span = data["last_access"] - (
+                    previous if previous is not None else data["first_access"]
+                )
+                stats["intervals"].append(span / reaccesses)
+
+        result = {}
+        for namespace, stats in grouped.items():
+            intervals = sorted(stats.pop("intervals"))
+            stats["reused_keys"] = len(intervals)
+            stats["median_reaccess_interval"] = (
+                intervals[len(intervals) // 2] if intervals else None
+            )
+            stats["avg_miss_time"] = (
+                stats["miss_time"] / stats["misses"] if stats["misses"] else 0.0
+            )
+            result[namespace] = stats
+        return result
+
+    def reset(self, namespace: Optional[str] = None):
+        """
+        Start a new window of tracked accesses.
+
+        Each forgotten key's last access time is kept (for HISTORY_WINDOW
+        seconds), so its next access is measured against it.
+
+        Args:
+            namespace: Only reset this namespace (all if None)
+        """
+        prefix = f"{namespace}:" if namespace is not None else ""
+        for access_key in [k for k in self.access_patterns if k.startswith(prefix)]:
+            last_access = self.access_patterns.pop(access_key)["last_access"]
+            if last_access is not None:
+                self._last_seen[access_key] = last_access
+
+        cutoff = time.time() - self.HISTORY_WINDOW
+        for access_key in [k for k, seen in self._last_seen.items() if seen < cutoff]:
+            del self._last_seen[access_key]
+
 
 def print_performance_report():
     """Print the current performance report."""
@@ -5,13 +5,19 @@ This module provides tool wrappers that reduce redundant invocations
 and improve overall tool execution performance.
 """
 
+import asyncio
+import contextvars
 import functools
 import hashlib
+import inspect
 import json
-from typing import Any, Callable, Dict, List, Optional, Tuple, Set
+import threading
+from concurrent.futures import Executor, Future
+from typing import Any, Callable, Dict, List, Optional, Tuple, Set, Union
 from collections import defaultdict
 
 from .cache import get_cache_manager, hash_args
+from .parallel import ParallelExecutor, get_parallel_executor
 from .profiler import profile
 
 
@@ -25,8 +31,11 @@ class ToolInvocationOptimizer:
 
     def __init__(self):
         self._cache = get_cache_manager()
-        self._pending_calls: Dict[str, Any] = {}  # Deduplication
+        self._pending_calls: Dict[str, Future] = {}  # In-flight calls (threads)
+        self._pending_async_calls: Dict[Tuple[int, str], asyncio.Future] = {}
+        self._pending_lock = threading.Lock()
         self._call_stats: Dict[str, int] = defaultdict(int)
+        self._coalesced_stats: Dict[str, int] = defaultdict(int)
 
     def _get_call_key(self, tool_name: str, args: Tuple, kwargs: Dict) -> str:
         """Generate unique key for a tool call."""
@@ -35,10 +44,11 @@ class ToolInvocationOptimizer:
 
     def invoke_with_dedup(self, tool_func: Callable, *args, **kwargs) -> Any:
         """
-        Invoke a tool with call deduplication.
+        Invoke a tool with call deduplication (single-flight).
 
-        If the same call is already in progress, waits for its result
-        instead of making a duplicate call.
+        If the same call is already in progress on another thread, waits for
+        its result instead of making a duplicate call. Exceptions raised by
+        the in-flight call are re-raised in every waiting caller.
 
         Args:
             tool_func: Tool function to invoke
@@ -51,18 +61,84 @@ class ToolInvocationOptimizer:
         tool_name = getattr(tool_func, "__name__", "unknown")
         call_key = self._get_call_key(tool_name, args, kwargs)
 
-        # Check if this exact call is already pending
-        if call_key in self._pending_calls:
-            # Wait for existing call to complete
-            return self._pending_calls[call_key]
+        with self._pending_lock:
+            future = self._pending_calls.get(call_key)
+            is_leader = future is None
+            if is_leader:
+                future = Future()
+                self._pending_calls[call_key] = future
+                self._call_stats[tool_name] += 1
+            else:
+                self._coalesced_stats[tool_name] += 1
 
-        # Make the call
-        self._call_stats[tool_name] += 1
+        if not is_leader:
+            # Wait for the in-flight call to complete
+            return future.result()
 
-        with profile(f"tool.{tool_name}"):
-            result = tool_func(*args, **kwargs)
+        try:
+            with profile(f"tool.{tool_name}"):
+                result = tool_func(*args, **kwargs)
+        except BaseException as e:
+            future.set_exception(e)
+            raise
+        else:
+            future.set_result(result)
+            return result
+        finally:
+            with self._pending_lock:
+                self._pending_calls.pop(call_key, None)
+
+    async def ainvoke_with_dedup(self, tool_func: Callable, *args, **kwargs) -> Any:
+        """
+        Async variant of invoke_with_dedup for use inside an event loop.
 
-        return result
+        Coroutine functions are awaited directly; plain functions are run
+        in a worker thread so they do not block the loop. Calls are
+        coalesced per event loop.
+
+        Args:
+            tool_func: Tool function or coroutine function to invoke
+            *args: Positional arguments
+            **kwargs: Keyword arguments
+
+        Returns:
+            Tool result
+        """
+        tool_name = getattr(tool_func, "__name__", "unknown")
+        loop = asyncio.get_running_loop()
+        pending_key = (id(loop), self._get_call_key(tool_name, args, kwargs))
+
+        future = self._pending_async_calls.get(pending_key)
+        if future is not None:
+            with self._pending_lock:
+                self._coalesced_stats[tool_name] += 1
+            # Shield so a cancelled waiter does not cancel the shared call
+            return await asyncio.shield(future)
+
+        future = loop.create_future()
+        self._pending_async_calls[pending_key] = future
+        with self._pending_lock:
+            self._call_stats[tool_name] += 1
+
+        try:
+            with profile(f"tool.{tool_name}"):
+                if inspect.iscoroutinefunction(tool_func):
+                    result = await tool_func(*args, **kwargs)
+                else:
+                    result = await asyncio.to_thread(tool_func, *args, **kwargs)
+        except asyncio.CancelledError:
+            future.cancel()
+            raise
+        except BaseException as e:
+            future.set_exception(e)
+            # Mark retrieved so an unawaited shared future does not warn
+            future.exception()
+            raise
+        else:
+            future.set_result(result)
+            return result
+        finally:
+            self._pending_async_calls.pop(pending_key, None)
 
     def invoke_with_cache(
         self, tool_func: Callable, *args, cache_ttl: float = 180.0, **kwargs
@@ -102,24 +178,82 @@ class ToolInvocationOptimizer:
         """Get tool invocation statistics."""
         return dict(self._call_stats)
 
+    def get_dedup_stats(self) -> Dict[str, Any]:
+        """
+        Get call deduplication statistics.
+
+        Returns:
+            Dictionary with:
+            - executed: Number of calls that actually ran
+            - coalesced: Number of calls that shared an in-flight result
+            - by_tool: Per-tool {"executed", "coalesced"} counts
+        """
+        with self._pending_lock:
+            tools = set(self._call_stats) | set(self._coalesced_stats)
+            by_tool = {
+                name: {
+                    "executed": self._call_stats.get(name, 0),
+                    "coalesced": self._coalesced_stats.get(name, 0),
+                }
+                for name in tools
+            }
+        return {
+            "executed": sum(stats["executed"] for stats in by_tool.values()),
+            "coalesced": sum(stats["coalesced"] for stats in by_tool.values()),
+            "by_tool": by_tool,
+        }
+
 
 class BatchToolInvoker:
     """
     Batches multiple tool calls for more efficient execution.
 
     Collects tool calls and executes them together when the batch is flushed.
+    Calls to the same tool are grouped; tools that expose a vectorized
+    ``batch_fn`` (see ``register_batch_fn``) are invoked once per group, and
+    all other calls run concurrently through a shared ``ParallelExecutor``
+    (inline when flushed from one of its own workers).
     """
 
-    def __init__(self, max_batch_size: int = 10):
+    def __init__(
+        self,
+        max_batch_size: int = 10,
+        max_workers: int = 4,
+        executor: Optional[Union[ParallelExecutor, Executor]] = None,
+    ):
         """
         Initialize batch invoker.
 
         Args:
             max_batch_size: Maximum number of calls per batch
+            max_workers: Size of the shared pool used when no executor is given
+            executor: Optional executor to run calls on; a plain Executor gets
+                the caller's context copied into each call
         """
         self.max_batch_size = max_batch_size
+        self.max_workers = max_workers
+        self._executor = executor
         self._pending: List[Tuple[Callable, Tuple, Dict]] = []
         self._results: List[Any] = []
+        self._batch_fns: Dict[Callable, Callable] = {}
+
+    def register_batch_fn(self, tool_func: Callable, batch_fn: Callable):
+        """
+        Register a vectorized implementation for a tool.
+
+        ``batch_fn`` receives a list of ``(args, kwargs)`` pairs and must return
+        a list of results in the same order. An item may be an Exception to
+        report a failure for that call only.
+
+        Args:
+            tool_func: Tool function the batch implementation replaces
+            batch_fn: Vectorized implementation
+        """
+        self._batch_fns[tool_func] = batch_fn
+
+    def _get_batch_fn(self, tool_func: Callable) -> Optional[Callable]:
+        """Find the vectorized implementation for a tool, if any."""
+        return self._batch_fns.get(tool_func) or getattr(tool_func, "batch_fn", None)
 
     def add(self, tool_func: Callable, *args, **kwargs):
         """
@@ -136,28 +270,96 @@ class BatchToolInvoker:
         if len(self._pending) >= self.max_batch_size:
             self.flush()
 
+    @staticmethod
+    def _call_one(tool_func: Callable, args: Tuple, kwargs: Dict) -> Any:
+        """Run a single call, returning the exception instead of raising."""
+        try:
+            return tool_func(*args, **kwargs)
+        except Exception as e:
+            return e
+
+    def _call_group(
+        self, tool_func: Callable, batch_fn: Callable, calls: List[Tuple[Tuple, Dict]]
+    ) -> List[Any]:
+        """Run a group through its batch_fn, falling back to per-call execution."""
+        tool_name = getattr(tool_func, "__name__", "unknown")
+        try:
+            with profile(f"tool.{tool_name}.batch"):
+                results = list(batch_fn(calls))
+            if len(results) != len(calls):
+                raise ValueError(
+                    f"batch_fn for '{tool_name}' returned {len(results)} results "
+                    f"for {len(calls)} calls"
+                )
+            return results
+        except Exception:
+            # Isolate failures: retry each call on its own
+            return [self._call_one(tool_func, args, kwargs) for args, kwargs in calls]
+
+    def _run_tasks(self, tasks: List[Tuple[Callable, Tuple, Dict]]) -> List[Tuple[bool, Any]]:
+        """Run tasks concurrently, returning (succeeded, result_or_exception) per task."""
+        if self._executor is None or isinstance(self._executor, ParallelExecutor):
+            executor = self._executor or get_parallel_executor(self.max_workers)
+            return [
+                (result.success, result.result if result.success else result.error)
+                for result in executor.execute_parallel(tasks)
+            ]
+
+        futures: List[Future] = [
+            self._executor.submit(contextvars.copy_context().run, func, *args, **kwargs)
+            for func, args, kwargs in tasks
+        ]
+        outcomes: List[Tuple[bool, Any]] = []
+        for future in futures:
+            try:
+                outcomes.append((True, future.result()))
+            except Exception as e:
+                outcomes.append((False, e))
+        return outcomes
+
     def flush(self) -> List[Any]:
         """
         Execute all pending tool calls.
 
         Returns:
-            List of results
+            List of results in submission order. A failed call yields its
+            exception in place of a result.
         """
         if not self._pending:
             return []
 
-        results = []
-
-        # Execute calls sequentially (could be parallelized if independent)
-        for tool_func, args, kwargs in self._pending:
-            try:
-                result = tool_func(*args, **kwargs)
-                results.append(result)
-            except Exception as e:
-                results.append(e)
+        pending = self._pending
+        self._pending = []
+        results: List[Any] = [None] * len(pending)
+
+        # Group compatible calls (same tool) preserving submission positions
+        groups: Dict[Callable, List[int]] = {}
+        for index, (tool_func, _, _) in enumerate(pending):
+            groups.setdefault(tool_func, []).append(index)
+
+        tasks: List[Tuple[Callable, Tuple, Dict]] = []
+        slots: List[Tuple[List[int], bool]] = []  # (result positions, is_group)
+        for tool_func, indices in groups.items():
+            batch_fn = self._get_batch_fn(tool_func)
+            if batch_fn is not None:
+                calls = [(pending[i][1], pending[i][2]) for i in indices]
+                tasks.append((self._call_group, (tool_func, batch_fn, calls), {}))
+                slots.append((indices, True))
+            else:
+                for i in indices:
+                    _, args, kwargs = pending[i]
+                    tasks.append((self._call_one, (tool_func, args, kwargs), {}))
+                    slots.append(([i], False))
+
+        for (indices, is_group), (ok, value) in zip(slots, self._run_tasks(tasks)):
+            if not ok:
+                values = [value] * len(indices)
+            else:
+                values = value if is_group else [value]
+            for i, item in zip(indices, values):
+                results[i] = item
 
         self._results.extend(results)
-        self._pending.clear()
 
         return results
 
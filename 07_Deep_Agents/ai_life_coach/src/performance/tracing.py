@@ -0,0 +1,326 @@
+"""
+Span tracing for AI Life Coach.
+
+This module records nested spans (coordinator turn -> specialist -> tool ->
+memory access) with parent/child IDs and attributes, using the OpenTelemetry
+data model so traces can be inspected with standard tooling.
+
+Features:
+- Context-propagated parent/child spans (threads via copied contexts, asyncio natively)
+- In-memory exporter for tests
+- OTLP-JSON file exporter (one ExportTraceServiceRequest per line)
+- Zero cost when no exporter is configured
+"""
+
+import contextvars
+import json
+import random
+import threading
+import time
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from typing import Any, Dict, Iterator, List, Optional
+
+SERVICE_NAME = "ai-life-coach"
+INSTRUMENTATION_SCOPE = "ai_life_coach.performance"
+
+# OTLP status codes
+STATUS_UNSET = 0
+STATUS_OK = 1
+STATUS_ERROR = 2
+
+
+@dataclass
+class Span:
+    """A single timed operation within a trace."""
+
+    name: str
+    trace_id: str
+    span_id: str
+    parent_span_id: Optional[str] = None
+    start_time_ns: int = 0
+    end_time_ns: int = 0
+    attributes: Dict[str, Any] = field(default_factory=dict)
+    status_code: int = STATUS_UNSET
+    status_message: str = ""
+
+    @property
+    def duration(self) -> float:
+        """Span duration in seconds."""
+        return (self.end_time_ns - self.start_time_ns) / 1e9
+
+    def set_attribute(self, key: str, value: Any):
+        """Set a span attribute."""
+        self.attributes[key] = value
+
+    def to_otlp(self) -> Dict[str, Any]:
+        """Convert to the OTLP/JSON span representation."""
+        data = {
+            "traceId": self.trace_id,
+            "spanId": self.span_id,
+            "name": self.name,
+            "kind": 1,  # SPAN_KIND_INTERNAL
+            "startTimeUnixNano": str(self.start_time_ns),
+            "endTimeUnixNano": str(self.end_time_ns),
+            "attributes": [_otlp_attribute(k, v) for k, v in self.attributes.items()],
+            "status": {"code": self.status_code},
+        }
+        if self.parent_span_id:
+            data["parentSpanId"] = self.parent_span_id
+        if self.status_message:
+            data["status"]["message"] = self.status_message
+        return data
+
+
+def _otlp_value(value: Any) -> Dict[str, Any]:
+    """Encode an attribute value as an OTLP AnyValue."""
+    if isinstance(value, bool):
+        return {"boolValue": value}
+    if isinstance(value, int):
+        return {"intValue": str(value)}
+    if isinstance(value, float):
+        return {"doubleValue": value}
+    if isinstance(value, (list, tuple)):
+        return {"arrayValue": {"values": [_otlp_value(v) for v in value]}}
+    return {"stringValue": str(value)}
+
+
+def _otlp_attribute(key: str, value: Any) -> Dict[str, Any]:
+    """Encode a key/value pair as an OTLP KeyValue."""
+    return {"key": key, "value": _otlp_value(value)}
+
+
+def spans_to_otlp(spans: List[Span]) -> Dict[str, Any]:
+    """
+    Build an OTLP ExportTraceServiceRequest body for a list of spans.
+
+    Args:
+        spans: Finished spans
+
+    Returns:
+        Dictionary in OTLP/JSON layout
+    """
+    return {
+        "resourceSpans": [
+            {
+                "resource": {"attributes": [_otlp_attribute("service.name", SERVICE_NAME)]},
+                "scopeSpans": [
+                    {
+                        "scope": {"name": INSTRUMENTATION_SCOPE},
+                        "spans": [span.to_otlp() for span in spans],
+                    }
+                ],
+            }
+        ]
+    }
+
+
+class InMemorySpanExporter:
+    """Collects finished spans in memory (for tests and ad-hoc inspection)."""
+
+    def __init__(self):
+        self._spans: List[Span] = []
+        self._lock = threading.Lock()
+
+    def export(self, spans: List[Span]):
+        """Store finished spans."""
+        with self._lock:
+            self._spans.extend(spans)
+
+    def get_finished_spans(self) -> List[Span]:
+        """Get all exported spans in export order."""
+        with self._lock:
+            return list(self._spans)
+
+    def clear(self):
+        """Forget exported spans."""
+        with self._lock:
+            self._spans.clear()
+
+    def shutdown(self):
+        """No resources to release."""
+
+
+class OTLPJsonFileExporter:
+    """
+    Appends spans to a file in OTLP/JSON lines format.
+
+    Each exported batch (normally one complete trace) is written as a single
+    ExportTraceServiceRequest object per line, the layout used by the
+    OpenTelemetry Collector file exporter.
+    """
+
+    def __init__(self, filepath: str):
+        """
+        Initialize the exporter.
+
+        Args:
+            filepath: Path of the file to append to
+        """
+        self.filepath = filepath
+        self._lock = threading.Lock()
+
+    def export(self, spans: List[Span]):
+        """Append a batch of spans as one OTLP/JSON line."""
+        if not spans:
+            return
+        line = json.dumps(spans_to_otlp(spans), separators=(",", ":"))
+        with self._lock:
+            with open(self.filepath, "a", encoding="utf-8") as f:
+                f.write(line + "\n")
+
+    def shutdown(self):
+        """No buffered data to flush."""
+
+
+# Current span for the running thread / asyncio task
+_current_span: contextvars.ContextVar[Optional[Span]] = contextvars.ContextVar(
+    "ai_life_coach_current_span", default=None
+)
+
+
+class Tracer:
+    """
+    Creates spans and hands finished traces to exporters.
+
+    Spans of a trace are buffered until its root span ends and then exported
+    together; spans finishing after their root are exported on their own.
+    Tracing is disabled (and ``span`` is a no-op) until an exporter is added.
+    """
+
+    def __init__(self):
+        self._exporters: List[Any] = []
+        self._pending: Dict[str, List[Span]] = {}
+        self._lock = threading.Lock()
+
+    @property
+    def enabled(self) -> bool:
+        """True when at least one exporter is configured."""
+        return bool(self._exporters)
+
+    def add_exporter(self, exporter: Any):
+        """Add an exporter with an ``export(spans)`` method."""
+        self._exporters.append(exporter)
+
+    def remove_exporter(self, exporter: Any):
+        """Remove a previously added exporter."""
+        if exporter in self._exporters:
+            self._exporters.remove(exporter)
+
+    def shutdown(self):
+        """Flush incomplete traces and shut down all exporters."""
+        with self._lock:
+            pending = [span for spans in self._pending.values() for span in spans]
+            self._pending.clear()
+        if pending:
+            self._export(pending)
+        for exporter in self._exporters:
+            exporter.shutdown()
+        self._exporters.clear()
+
+    @staticmethod
+    def current_span() -> Optional[Span]:
+        """Get the span active in the current context."""
+        return _current_span.get()
+
+    @contextmanager
+    def span(self, name: str, attributes: Optional[Dict[str, Any]] = None) -> Iterator[Span]:
+        """
+        Context manager that records a span as a child of the current one.
+
+        Args:
+            name: Span name (e.g. "tool.log_habit_completion")
+            attributes: Optional initial attributes
+
+        Example:
+            >>> with tracer.span("coordinator.turn", {"user.id": user_id}) as span:
+            ...     span.set_attribute("specialists", 3)
+        """
+        if not self._exporters:
+            yield None
+            return
+
+        parent = _current_span.get()
+        span = Span(
+            name=name,
+            trace_id=parent.trace_id if parent else f"{random.getrandbits(128):032x}",
+            span_id=f"{random.getrandbits(64):016x}",
+            parent_span_id=parent.span_id if parent else None,
+            start_time_ns=time.time_ns(),
+            attributes=dict(attributes or {}),
+        )
+        if parent is None:
+            with self._lock:
+                self._pending[span.trace_id] = []
+
+        token = _current_span.set(span)
+        try:
+            yield span
+        except BaseException as e:
+            span.status_code = STATUS_ERROR
+            span.status_message = str(e)
+            span.attributes["exception.type"] = type(e).__name__
+            raise
+        else:
+            if span.status_code == STATUS_UNSET:
+                span.status_code = STATUS_OK
+        finally:
+            span.end_time_ns = time.time_ns()
+            _current_span.reset(token)
+            self._finish(span)
+
+    def _finish(self, span: Span):
+        """Buffer a finished span, exporting its trace when the root ends."""
+        with self._lock:
+            pending = self._pending.get(span.trace_id)
+            if span.parent_span_id is None:
+                batch = self._pending.pop(span.trace_id, [])
+                batch.append(span)
+            elif pending is not None:
+                pending.append(span)
+                return
+            else:
+                # Root already exported (e.g. a straggler specialist)
+                batch = [span]
+        self._export(batch)
+
+    def _export(self, spans: List[Span]):
+        """Send spans to every exporter, isolating exporter failures."""
+        for exporter in list(self._exporters):
+            try:
+                exporter.export(spans)
+            except Exception as e:
+                print(f"WARNING: span export failed: {e}")
+
+
+# Global tracer instance
+_tracer: Optional[Tracer] = None
+
+
+def get_tracer() -> Tracer:
+    """Get or create the global tracer."""
+    global _tracer
+    if _tracer is None:
+        _tracer = Tracer()
+    return _tracer
+
+
+def reset_tracer():
+    """Shut down and replace the global tracer."""
+    global _tracer
+    if _tracer is not None:
+        _tracer.shutdown()
+    _tracer = Tracer()
+
+
+@contextmanager
+def trace_span(name: str, attributes: Optional[Dict[str, Any]] = None) -> Iterator[Span]:
+    """
+    Convenience context manager using the global tracer.
+
+    Example:
+        >>> with trace_span("coordinator.turn", {"user.id": "user_123"}):
+        ...     run_turn()
+    """
+    with get_tracer().span(name, attributes) as span:
+        yield span
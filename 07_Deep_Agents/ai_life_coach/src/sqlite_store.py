@@ -0,0 +1,446 @@
+"""
+SQLite-backed LangGraph store for AI Life Coach.
+
+Provides a durable BaseStore implementation so profiles, goals and coaching
+patterns survive restarts and can be shared by several worker processes.
+
+Features:
+- WAL journal mode (concurrent readers alongside a single writer)
+- Primary-key index on (namespace, key) for point lookups
+- Namespace prefix search as an index range scan
+- Values stored as JSON; search filters are evaluated with json_extract()
+- Multi-batch transactions for read-modify-write sequences
+- Migration from an in-memory store or a JSON dump of one
+"""
+
+import asyncio
+import json
+import sqlite3
+import threading
+from contextlib import contextmanager, nullcontext
+from datetime import datetime, timezone
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple
+
+from langgraph.store.base import (
+    BaseStore,
+    GetOp,
+    Item,
+    ListNamespacesOp,
+    MatchCondition,
+    Op,
+    PutOp,
+    Result,
+    SearchItem,
+    SearchOp,
+)
+
+# Optional fast JSON codec for stored values
+try:
+    import orjson
+
+    def _dumps(value: Any) -> str:
+        return orjson.dumps(value, option=orjson.OPT_NON_STR_KEYS).decode()
+
+    _loads = orjson.loads
+except ImportError:
+    _dumps = json.dumps
+    _loads = json.loads
+
+# Default database file (matches MemoryConfig.db_uri)
+DEFAULT_SQLITE_PATH = "ai_life_coach.db"
+
+# Namespace labels are joined with "." (LangGraph forbids "." inside labels), so
+# every namespace under prefix P sorts in the range [P + ".", P + "/").
+_SEPARATOR = "."
+_SEPARATOR_NEXT = chr(ord(_SEPARATOR) + 1)
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS store (
+    namespace TEXT NOT NULL,
+    key TEXT NOT NULL,
+    value TEXT NOT NULL,
+    created_at TEXT NOT NULL,
+    updated_at TEXT NOT NULL,
+    PRIMARY KEY (namespace, key)
+)
+"""
+
+_SQL_OPERATORS = {"$eq": "IS", "$ne": "IS NOT", "$gt": ">", "$gte": ">=", "$lt": "<", "$lte": "<="}
+
+
+def _encode_namespace(namespace: Tuple[str, ...]) -> str:
+    """Encode a namespace tuple as a sortable string."""
+    return _SEPARATOR.join(namespace)
+
+
+def _decode_namespace(namespace: str) -> Tuple[str, ...]:
+    """Decode a namespace string back into a tuple."""
+    return tuple(namespace.split(_SEPARATOR)) if namespace else ()
+
+
+def _json_path(field: str) -> str:
+    """Build a json_extract() path for a top-level value field."""
+    return '$."' + field.replace('"', '\\"') + '"'
+
+
+def _filter_to_sql(filter: Dict[str, Any]) -> Optional[Tuple[str, List[Any]]]:
+    """
+    Translate a search filter into a SQL condition.
+
+    Args:
+        filter: LangGraph filter (field -> value or {"$op": value})
+
+    Returns:
+        (sql, params), or None if the filter compares nested objects or lists
+        and must be evaluated in Python instead
+    """
+    clauses: List[str] = []
+    params: List[Any] = []
+    for field, expected in filter.items():
+        conditions = expected if isinstance(expected, dict) else {"$eq": expected}
+        if not all(op in _SQL_OPERATORS for op in conditions):
+            return None
+        for op, operand in conditions.items():
+            if isinstance(operand, (dict, list, tuple)):
+                return None
+            if op in ("$eq", "$ne"):
+                clauses.append(f"json_extract(value, ?) {_SQL_OPERATORS[op]} ?")
+                params.extend([_json_path(field), operand])
+            else:
+                clauses.append(f"CAST(json_extract(value, ?) AS REAL) {_SQL_OPERATORS[op]} ?")
+                params.extend([_json_path(field), float(operand)])
+    return " AND ".join(clauses) or "1", params
+
+
+def _matches_filter(value: Any, expected: Any) -> bool:
+    """Python evaluation of a filter value, with the same semantics as InMemoryStore."""
+    if isinstance(expected, dict):
+        if any(k.startswith("$") for k in expected):
+            for op, operand in expected.items():
+                if op == "$eq" and value != operand:
+                    return False
+                if op == "$ne" and value == operand:
+                    return False
+                if op in ("$gt", "$gte", "$lt", "$lte"):
+                    if value is None:
+                        return False
+                    a, b = float(value), float(operand)
+                    if not {"$gt": a > b, "$gte": a >= b, "$lt": a < b, "$lte": a <= b}[op]:
+                        return False
+            return True
+        return isinstance(value, dict) and all(
+            _matches_filter(value.get(k), v) for k, v in expected.items()
+        )
+    if isinstance(expected, (list, tuple)):
+        return (
+            isinstance(value, (list, tuple))
+            and len(value) == len(expected)
+            and all(_matches_filter(v, e) for v, e in zip(value, expected))
+        )
+    return value == expected
+
+
+def _namespace_matches(condition: MatchCondition, namespace: Tuple[str, ...]) -> bool:
+    """Whether a namespace satisfies a list_namespaces() match condition."""
+    path = tuple(condition.path)
+    if len(namespace) < len(path):
+        return False
+    if condition.match_type == "prefix":
+        pairs = zip(namespace, path)
+    elif condition.match_type == "suffix":
+        pairs = zip(reversed(namespace), reversed(path))
+    else:
+        raise ValueError(f"Unsupported match type: {condition.match_type}")
+    return all(p == "*" or n == p for n, p in pairs)
+
+
+class SQLiteStore(BaseStore):
+    """
+    LangGraph store persisted in a SQLite database.
+
+    A single connection is shared by all threads and serialized with a lock.
+    Within a batch, reads see the state before the batch and writes are
+    applied afterwards in one transaction (last write per key wins), the same
+    semantics as InMemoryStore.
+
+    Example:
+        >>> store = SQLiteStore("ai_life_coach.db")
+        >>> store.put(("user_123", "goals"), "goal_1", {"title": "Run a 5k"})
+        >>> store.search(("user_123", "goals"))
+    """
+
+    def __init__(self, path: str = DEFAULT_SQLITE_PATH, timeout: float = 30.0):
+        """
+        Open (and if needed create) a SQLite store.
+
+        Args:
+            path: Database file path, "sqlite:///<path>" URI, or ":memory:"
+            timeout: Seconds to wait for another process's write lock
+        """
+        if path.startswith("sqlite:///"):
+            path = path[len("sqlite:///") :]
+        self.path = path
+        self._lock = threading.RLock()
+        self._in_transaction = False
+        self._conn = sqlite3.connect(path, timeout=timeout, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        with self._conn:
+            self._conn.execute(_SCHEMA)
+
+    def close(self) -> None:
+        """Close the database connection."""
+        with self._lock:
+            self._conn.close()
+
+    @contextmanager
+    def transaction(self) -> Iterator["SQLiteStore"]:
+        """
+        Run several batches as one transaction.
+
+        Takes the database write lock up front (BEGIN IMMEDIATE), so other
+        threads and processes wait until the block ends and a read-modify-
+        write done inside it cannot interleave with theirs. Batches inside
+        the block see each other's writes; everything is committed on exit
+        and rolled back if the block raises. Nested blocks join the outer one.
+
+        Example:
+            >>> with store.transaction():
+            ...     item = store.get(namespace, "counter")
+            ...     store.put(namespace, "counter", {"n": item.value["n"] + 1})
+        """
+        with self._lock:
+            if self._in_transaction:
+                yield self
+                return
+            self._conn.execute("BEGIN IMMEDIATE")
+            self._in_transaction = True
+            try:
+                yield self
+            except BaseException:
+                self._conn.rollback()
+                raise
+            else:
+                self._conn.commit()
+            finally:
+                self._in_transaction = False
+
+    # ==================== BaseStore Interface ====================
+
+    def batch(self, ops: Iterable[Op]) -> List[Result]:
+        """
+        Execute a batch of store operations.
+
+        Args:
+            ops: GetOp, SearchOp, ListNamespacesOp and PutOp instances
+
+        Returns:
+            One result per operation (None for puts)
+        """
+        results: List[Result] = []
+        puts: Dict[Tuple[Tuple[str, ...], str], PutOp] = {}
+        with self._lock:
+            for op in ops:
+                if isinstance(op, GetOp):
+                    results.append(self._get(op))
+                elif isinstance(op, SearchOp):
+                    results.append(self._search(op))
+                elif isinstance(op, ListNamespacesOp):
+                    results.append(self._list_namespaces(op))
+                elif isinstance(op, PutOp):
+                    puts[(op.namespace, op.key)] = op
+                    results.append(None)
+                else:
+                    raise ValueError(f"Unknown operation type: {type(op)}")
+            if puts:
+                self._apply_puts(puts.values())
+        return results
+
+    async def abatch(self, ops: Iterable[Op]) -> List[Result]:
+        """Async version of batch, run in a worker thread."""
+        return await asyncio.to_thread(self.batch, list(ops))
+
+    # ==================== Operation Handlers ====================
+
+    def _get(self, op: GetOp) -> Optional[Item]:
+        """Look up a single item by primary key."""
+        row = self._conn.execute(
+            "SELECT value, created_at, updated_at FROM store WHERE namespace = ? AND key = ?",
+            (_encode_namespace(op.namespace), op.key),
+        ).fetchone()
+        if row is None:
+            return None
+        return Item(
+            value=_loads(row[0]),
+            key=op.key,
+            namespace=op.namespace,
+            created_at=row[1],
+            updated_at=row[2],
+        )
+
+    def _search(self, op: SearchOp) -> List[SearchItem]:
+        """List items under a namespace prefix, optionally filtered."""
+        sql = "SELECT namespace, key, value, created_at, updated_at FROM store"
+        params: List[Any] = []
+        clauses: List[str] = []
+
+        if op.namespace_prefix:
+            prefix = _encode_namespace(op.namespace_prefix)
+            clauses.append("(namespace = ? OR (namespace >= ? AND namespace < ?))")
+            params.extend([prefix, prefix + _SEPARATOR, prefix + _SEPARATOR_NEXT])
+
+        translated = _filter_to_sql(op.filter) if op.filter else ("1", [])
+        if translated is not None:
+            clauses.append(translated[0])
+            params.extend(translated[1])
+
+        if clauses:
+            sql += " WHERE " + " AND ".join(clauses)
+        sql += " ORDER BY namespace, rowid"
+        if translated is not None:
+            sql += " LIMIT ? OFFSET ?"
+            params.extend([op.limit, op.offset])
+
+        rows = self._conn.execute(sql, params).fetchall()
+        items = [
+            SearchItem(
+                namespace=_decode_namespace(row[0]),
+                key=row[1],
+                value=_loads(row[2]),
+                created_at=row[3],
+                updated_at=row[4],
+            )
+            for row in rows
+        ]
+        if translated is None:
+            items = [
+                item
+                for item in items
+                if all(_matches_filter(item.value.get(k), v) for k, v in op.filter.items())
+            ][op.offset : op.offset + op.limit]
+        return items
+
+    def _list_namespaces(self, op: ListNamespacesOp) -> List[Tuple[str, ...]]:
+        """List distinct namespaces matching the operation's conditions."""
+        rows = self._conn.execute("SELECT DISTINCT namespace FROM store").fetchall()
+        namespaces = [_decode_namespace(row[0]) for row in rows]
+        if op.match_conditions:
+            namespaces = [
+                ns
+                for ns in namespaces
+                if all(_namespace_matches(cond, ns) for cond in op.match_conditions)
+            ]
+        if op.max_depth is not None:
+            namespaces = list({ns[: op.max_depth] for ns in namespaces})
+        return sorted(namespaces)[op.offset : op.offset + op.limit]
+
+    def _apply_puts(self, puts: Iterable[PutOp]) -> None:
+        """Apply upserts and deletes in a single transaction."""
+        now = datetime.now(timezone.utc).isoformat()
+        upserts = []
+        deletes = []
+        for op in puts:
+            namespace = _encode_namespace(op.namespace)
+            if op.value is None:
+                deletes.append((namespace, op.key))
+            else:
+                upserts.append((namespace, op.key, _dumps(dict(op.value)), now, now))
+        # Inside transaction() the enclosing block commits
+        with nullcontext() if self._in_transaction else self._conn:
+            if deletes:
+                self._conn.executemany("DELETE FROM store WHERE namespace = ? AND key = ?", deletes)
+            if upserts:
+                self._conn.executemany(
+                    "INSERT INTO store (namespace, key, value, created_at, updated_at) "
+                    "VALUES (?, ?, ?, ?, ?) "
+                    "ON CONFLICT (namespace, key) DO UPDATE SET "
+                    "value = excluded.value, updated_at = excluded.updated_at",
+                    upserts,
+                )
+
+    # ==================== Migration ====================
+
+    def import_dump(self, records: Iterable[Dict[str, Any]]) -> int:
+        """
+        Load records produced by dump_store(), keeping their timestamps.
+
+        Existing items with the same namespace and key are overwritten.
+
+        Args:
+            records: Dictionaries with namespace, key, value, created_at, updated_at
+
+        Returns:
+            Number of records imported
+        """
+        now = datetime.now(timezone.utc).isoformat()
+        rows = [
+            (
+                _encode_namespace(tuple(record["namespace"])),
+                record["key"],
+                _dumps(record["value"]),
+                record.get("created_at") or now,
+                record.get("updated_at") or now,
+            )
+            for record in records
+        ]
+        with self._lock, nullcontext() if self._in_transaction else self._conn:
+            self._conn.executemany(
+                "INSERT OR REPLACE INTO store (namespace, key, value, created_at, updated_at) "
+                "VALUES (?, ?, ?, ?, ?)",
+                rows,
+            )
+        return len(rows)
+
+    def migrate_from(self, source: BaseStore) -> int:
+        """
+        Copy every item from another store (e.g. an InMemoryStore).
+
+        Args:
+            source: Store to copy from
+
+        Returns:
+            Number of items copied
+        """
+        return self.import_dump(dump_store(source))
+
+
+def dump_store(store: BaseStore, page_size: int = 1000) -> List[Dict[str, Any]]:
+    """
+    Export every item in a store as JSON-serializable records.
+
+    Args:
+        store: Store to export
+        page_size: Namespaces / items fetched per request
+
+    Returns:
+        List of dictionaries with namespace, key, value, created_at, updated_at
+    """
+    namespaces: List[Tuple[str, ...]] = []
+    while True:
+        page = store.list_namespaces(limit=page_size, offset=len(namespaces))
+        namespaces.extend(page)
+        if len(page) < page_size:
+            break
+
+    records = []
+    for namespace in namespaces:
+        offset = 0
+        while True:
+            items = store.search(namespace, limit=page_size, offset=offset)
+            for item in items:
+                # Prefix search also returns child namespaces; they are dumped on their own
+                if tuple(item.namespace) != namespace:
+                    continue
+                records.append(
+                    {
+                        "namespace": list(item.namespace),
+                        "key": item.key,
+                        "value": item.value,
+                        "created_at": item.created_at.isoformat(),
+                        "updated_at": item.updated_at.isoformat(),
+                    }
+                )
+            if len(items) < page_size:
+                break
+            offset += page_size
+    return records
@@ -17,6 +17,8 @@ Key Features:
 3. Trend Analysis - Week-over-week comparisons across all metrics
 4. Adaptation Engine - Pattern-based recommendations for goal adjustment
 5. Weekly Reports - JSON + Markdown generation with actionable insights
+6. Check-In History - Indexed, cached check-in store shared with the mood and
+   dashboard tools
 
 Tools:
 - conduct_weekly_checkin: Complete guided check-in questionnaire
@@ -26,10 +28,13 @@ Tools:
 - generate_weekly_report: Create detailed weekly progress report (JSON + Markdown)
 """
 
+from bisect import bisect_left, insort
 from datetime import datetime, date
 from pathlib import Path
 from typing import Any, Dict, List, Optional, Tuple
 import json
+import os
+import re
 
 # Import LangChain components
 try:
@@ -480,6 +485,310 @@ def generate_adaptations(
     return adaptations
 
 
+# ==============================================================================
+# Check-In History Repository
+# ==============================================================================
+
+# Weeks (counted back from the latest check-in) whose decoded records stay cached
+RECENT_CHECKIN_WINDOW = 12
+
+# Score keys stored with every check-in
+SCORE_DOMAINS = ("overall", "career", "relationship", "finance", "wellness")
+
+_CHECKIN_FILE_RE = re.compile(r"^week_(\d+)_checkin\.json$")
+
+
+def get_checkin_path(user_id: str, week_number: int) -> str:
+    """Workspace-relative path of a user's check-in for one week."""
+    return f"checkins/{user_id}/week_{week_number}_checkin.json"
+
+
+def _file_signature(path: Path) -> Optional[Tuple[int, int]]:
+    try:
+        stat = path.stat()
+    except OSError:
+        return None
+    return (stat.st_mtime_ns, stat.st_size)
+
+
+def _record_scores(record: Dict[str, Any]) -> Dict[str, float]:
+    """Per-domain scores of a check-in, computed from responses when not stored."""
+    stored = record.get("scores") or {}
+    responses = record.get("responses") or {}
+    scores = {}
+    for domain in SCORE_DOMAINS:
+        if domain in stored:
+            scores[domain] = stored[domain]
+        elif domain == "overall":
+            scores[domain] = calculate_overall_score(responses)
+        else:
+            scores[domain] = calculate_domain_score(responses, domain)
+    return scores
+
+
+class CheckinHistory:
+    """
+    Index of a user's weekly check-ins.
+
+    The week index comes from a single scan of the user's check-in directory
+    and is rebuilt only when the directory changes. Records of the most recent
+    weeks (RECENT_CHECKIN_WINDOW) are decoded once and cached together with
+    their per-domain scores; each cached record is revalidated against its
+    file's (mtime_ns, size) so a check-in rewritten in place is picked up.
+
+    Use load_checkin_history() to get the shared instance for a user.
+    """
+
+    def __init__(
+        self,
+        user_id: str,
+        backend: Any,
+        workspace_path: Path,
+        window: int = RECENT_CHECKIN_WINDOW,
+    ):
+        self.user_id = user_id
+        self.backend = backend
+        self.directory = Path(workspace_path) / "checkins" / user_id
+        self.window = window
+        self._dir_signature: Optional[Tuple[int, int]] = None
+        self._weeks: List[int] = []
+        # week -> (file signature, decoded record, per-domain scores)
+        self._records: Dict[int, Tuple[Any, Dict[str, Any], Dict[str, float]]] = {}
+
+    def __len__(self) -> int:
+        return len(self._weeks)
+
+    def __contains__(self, week_number: int) -> bool:
+        return week_number in self._records or self._index_position(week_number) is not None
+
+    @property
+    def weeks(self) -> List[int]:
+        """Indexed week numbers in ascending order."""
+        return list(self._weeks)
+
+    @property
+    def latest_week(self) -> Optional[int]:
+        return self._weeks[-1] if self._weeks else None
+
+    @property
+    def version(self) -> Tuple[Any, ...]:
+        """
+        Data version of the index and the recent window.
+
+        Changes when a check-in is added or removed, or when one of the recent
+        weeks is rewritten. Call refresh() first (load_checkin_history does).
+        """
+        window = self._weeks[-self.window :] if self.window > 0 else []
+        return (self._dir_signature,) + tuple(
+            _file_signature(self.directory / f"week_{week}_checkin.json") for week in window
+        )
+
+    def next_week(self) -> int:
+        """Week number for the next check-in."""
+        return (self.latest_week or 0) + 1
+
+    def refresh(self) -> "CheckinHistory":
+        """Rescan the check-in directory if it changed since the last scan."""
+        signature = _file_signature(self.directory)
+        if signature is not None and signature == self._dir_signature:
+            return self
+
+        weeks = []
+        if signature is not None:
+            with os.scandir(self.directory) as entries:
+                for entry in entries:
+                    match = _CHECKIN_FILE_RE.match(entry.name)
+                    if match:
+                        weeks.append(int(match.group(1)))
+        weeks.sort()
+
+        self._dir_signature = signature
+        self._weeks = weeks
+        self._evict()
+        return self
+
+    def _evict(self) -> None:
+        """Drop cached records that are no longer indexed or left the window."""
+        indexed = set(self._weeks)
+        for week in [w for w in self._records if w not in indexed or not self._in_window(w)]:
+            del self._records[week]
+
+    def _index_position(self, week_number: int) -> Optional[int]:
+        position = bisect_left(self._weeks, week_number)
+        if position < len(self._weeks) and self._weeks[position] == week_number:
+            return position
+        return None
+
+    def _in_window(self, week_number: int) -> bool:
+        latest = self.latest_week
+        return latest is not None and week_number > latest - self.window
+
+    def _read(self, week_number: int) -> Optional[Dict[str, Any]]:
+        path = get_checkin_path(self.user_id, week_number)
+        try:
+            if hasattr(self.backend, "read_file"):
+                content = self.backend.read_file(path)
+            else:
+                content = (self.directory / f"week_{week_number}_checkin.json").read_text()
+            return json.loads(content) if content else None
+        except (OSError, ValueError, TypeError):
+            return None
+
+    def _load(self, week_number: int) -> Optional[Tuple[Dict[str, Any], Dict[str, float]]]:
+        file_path = self.directory / f"week_{week_number}_checkin.json"
+        signature = _file_signature(file_path)
+        cached = self._records.get(week_number)
+        if cached and signature is not None and cached[0] == signature:
+            return cached[1], cached[2]
+
+        record = self._read(week_number)
+        if record is None:
+            return None
+        scores = _record_scores(record)
+        if self._in_window(week_number):
+            self._records[week_number] = (signature, record, scores)
+        return record, scores
+
+    def get(self, week_number: int) -> Optional[Dict[str, Any]]:
+        """
+        Get the check-in record for a week.
+
+        Args:
+            week_number: Week to load
+
+        Returns:
+            Decoded check-in record, or None if there is none for the week
+        """
+        loaded = self._load(week_number)
+        return loaded[0] if loaded else None
+
+    def scores(self, week_number: int) -> Dict[str, float]:
+        """Per-domain scores (overall, career, ...) for a week, empty if missing."""
+        loaded = self._load(week_number)
+        return dict(loaded[1]) if loaded else {}
+
+    def latest(self) -> Optional[Dict[str, Any]]:
+        """The most recent check-in record."""
+        latest = self.latest_week
+        return self.get(latest) if latest is not None else None
+
+    def recent(self, count: int, before: Optional[int] = None) -> List[Dict[str, Any]]:
+        """
+        Records of the most recent indexed weeks, oldest first.
+
+        Args:
+            count: Maximum number of weeks
+            before: Only include weeks before this week number
+
+        Returns:
+            List of check-in records
+        """
+        weeks = self._weeks
+        if before is not None:
+            weeks = weeks[: bisect_left(weeks, before)]
+        if count <= 0:
+            return []
+        records = []
+        for week in weeks[-count:]:
+            record = self.get(week)
+            if record is not None:
+                records.append(record)
+        return records
+
+    def score_series(self, domain: str, count: int) -> List[float]:
+        """Scores for one domain over the most recent weeks, oldest first."""
+        series = []
+        for week in self._weeks[-count:] if count > 0 else []:
+            loaded = self._load(week)
+            if loaded:
+                series.append(loaded[1].get(domain, 0.5))
+        return series
+
+    def since(self, cutoff: Any) -> List[Dict[str, Any]]:
+        """
+        Records from the recent window dated on or after a cutoff.
+
+        Args:
+            cutoff: date, datetime or ISO string compared with each record's
+                timestamp (or date when there is no timestamp)
+
+        Returns:
+            Matching check-in records, oldest week first
+        """
+        cutoff = cutoff if isinstance(cutoff, str) else cutoff.isoformat()
+        return [
+            record
+            for record in self.recent(self.window)
+            if (record.get("timestamp") or record.get("date") or "") >= cutoff
+        ]
+
+    def save(self, record: Dict[str, Any]) -> str:
+        """
+        Write a check-in record and update the index and cache.
+
+        Args:
+            record: Check-in record including week_number
+
+        Returns:
+            Workspace-relative path of the saved check-in
+        """
+        week_number = int(record["week_number"])
+        path = get_checkin_path(self.user_id, week_number)
+        json_content = json.dumps(record, indent=2)
+
+        if hasattr(self.backend, "write_file"):
+            self.backend.write_file(path, json_content)
+        else:
+            file_path = self.directory / f"week_{week_number}_checkin.json"
+            file_path.parent.mkdir(parents=True, exist_ok=True)
+            file_path.write_text(json_content)
+
+        self.refresh()
+        if self._index_position(week_number) is None:
+            # Backend stored the file outside the scanned directory
+            insort(self._weeks, week_number)
+            self._evict()
+        if self._in_window(week_number):
+            file_path = self.directory / f"week_{week_number}_checkin.json"
+            self._records[week_number] = (
+                _file_signature(file_path),
+                record,
+                _record_scores(record),
+            )
+        return path
+
+
+# One history per check-in directory, shared by the check-in, adaptive,
+# mood and dashboard tools
+_history_cache: Dict[Path, CheckinHistory] = {}
+
+
+def load_checkin_history(
+    user_id: str, backend: Any, workspace_path: Optional[Path] = None
+) -> CheckinHistory:
+    """
+    Get a user's check-in history, rescanning the index only if it changed.
+
+    Args:
+        user_id: User identifier
+        backend: FilesystemBackend instance
+        workspace_path: Workspace directory (defaults to backend.root_dir)
+
+    Returns:
+        CheckinHistory for the user (empty if no check-in has been saved)
+    """
+    if workspace_path is None:
+        workspace_path = (
+            Path(backend.root_dir) if hasattr(backend, "root_dir") else Path("workspace")
+        )
+    directory = Path(workspace_path) / "checkins" / user_id
+    history = _history_cache.get(directory)
+    if history is None or history.backend is not backend:
+        history = CheckinHistory(user_id, backend, workspace_path)
+        _history_cache[directory] = history
+    return history.refresh()
+
+
 def load_previous_checkins(user_id: str, backend: Any, current_week: int) -> List[Dict[str, Any]]:
     """
     Load previous check-in data for trend analysis.
@@ -493,19 +802,15 @@ def load_previous_checkins(user_id: str, backend: Any, current_week: int) -> Lis
         List of previous check-in dictionaries, sorted by week
     """
     try:
-        previous_checkins = []
+        history = load_checkin_history(user_id, backend)
 
-        # Load the last 4 weeks of data for trend analysis
+        # The last 4 weeks of data for trend analysis
+        previous_checkins = []
         for week_num in range(max(1, current_week - 4), current_week):
-            path = f"checkins/{user_id}/week_{week_num}_checkin.json"
-
-            if hasattr(backend, "read_file"):
-                try:
-                    content = backend.read_file(path)
-                    checkin_data = json.loads(content)
+            if week_num in history:
+                checkin_data = history.get(week_num)
+                if checkin_data is not None:
                     previous_checkins.append(checkin_data)
-                except Exception:
-                    pass  # Skip missing or invalid files
 
         return previous_checkins
 
@@ -631,17 +936,12 @@ def create_checkin_tools(backend=None):
                 return f"Error: Missing required field '{field}'"
 
         try:
+            history = load_checkin_history(user_id, backend, workspace_path)
+
             # Determine week number
             if week_number is None:
                 # Auto-increment from existing check-ins
-                checkins_dir = workspace_path / "checkins" / user_id
-                if checkins_dir.exists():
-                    existing_weeks = [
-                        int(f.stem.split("_")[1]) for f in checkins_dir.glob("week_*_checkin.json")
-                    ]
-                    week_number = max(existing_weeks, default=0) + 1
-                else:
-                    week_number = 1
+                week_number = history.next_week()
 
             # Validate responses against questionnaire
             all_validations_passed = True
@@ -689,18 +989,8 @@ def create_checkin_tools(backend=None):
                 },
             }
 
-            # Convert to JSON
-            json_content = json.dumps(checkin_record, indent=2)
-
             # Save check-in file
-            path = f"checkins/{user_id}/week_{week_number}_checkin.json"
-
-            if hasattr(backend, "write_file"):
-                backend.write_file(path, json_content)
-            else:
-                file_path = workspace_path / path
-                file_path.parent.mkdir(parents=True, exist_ok=True)
-                file_path.write_text(json_content)
+            path = history.save(checkin_record)
 
             # Format response
             lines = [
@@ -774,35 +1064,18 @@ def create_checkin_tools(backend=None):
 
         try:
             # Load check-in data
-            if week_number:
-                path = f"checkins/{user_id}/week_{week_number}_checkin.json"
-            else:
-                # Find most recent check-in
-                checkins_dir = workspace_path / "checkins" / user_id
-                if not checkins_dir.exists():
+            history = load_checkin_history(user_id, backend, workspace_path)
+            if not week_number:
+                # Most recent check-in
+                if not len(history):
                     return f"No check-ins found for user '{user_id}'. Conduct a check-in first."
+                week_number = history.latest_week
 
-                checkin_files = sorted(
-                    checkins_dir.glob("week_*_checkin.json"),
-                    key=lambda f: int(f.stem.split("_")[1]),
-                )
-                if not checkin_files:
-                    return f"No check-ins found for user '{user_id}'. Conduct a check-in first."
-
-                most_recent = checkin_files[-1]
-                week_number = int(most_recent.stem.split("_")[1])
-                path = f"checkins/{user_id}/week_{week_number}_checkin.json"
-
-            if hasattr(backend, "read_file"):
-                content = backend.read_file(path)
-            else:
-                file_path = workspace_path / path
-                if not file_path.exists():
-                    return f"No check-in found for week {week_number}"
-                content = file_path.read_text()
+            checkin_data = history.get(week_number)
+            if checkin_data is None:
+                return f"No check-in found for week {week_number}"
 
-            checkin_data = json.loads(content)
-            scores = checkin_data.get("scores", {})
+            scores = history.scores(week_number)
             responses = checkin_data.get("responses", {})
 
             # Format response
@@ -895,35 +1168,16 @@ def create_checkin_tools(backend=None):
 
         try:
             # Load recent check-ins
-            checkins_dir = workspace_path / "checkins" / user_id
+            history = load_checkin_history(user_id, backend, workspace_path)
 
-            if not checkins_dir.exists():
+            if not len(history):
                 return f"No check-ins found for user '{user_id}'. Conduct a check-in first."
 
-            checkin_files = sorted(
-                checkins_dir.glob("week_*_checkin.json"),
-                key=lambda f: int(f.stem.split("_")[1]),
-            )
-
-            # Filter to requested number of weeks
-            recent_files = checkin_files[-weeks:] if len(checkin_files) >= weeks else checkin_files
+            # Requested number of weeks
+            checkin_data = history.recent(weeks)
 
-            if len(recent_files) < 2:
-                return f"Need at least 2 check-ins for trend analysis. Found {len(recent_files)}."
-
-            # Load and parse data
-            checkin_data = []
-            for file_path in recent_files:
-                week_num = int(file_path.stem.split("_")[1])
-
-                if hasattr(backend, "read_file"):
-                    rel_path = f"checkins/{user_id}/{file_path.name}"
-                    content = backend.read_file(rel_path)
-                else:
-                    content = file_path.read_text()
-
-                data = json.loads(content)
-                checkin_data.append(data)
+            if len(checkin_data) < 2:
+                return f"Need at least 2 check-ins for trend analysis. Found {len(checkin_data)}."
 
             # Extract scores for trend analysis
             lines = [
@@ -936,7 +1190,7 @@ def create_checkin_tools(backend=None):
             lines.append("\n📊 Domain Progress Trends:")
 
             for domain in ["career", "relationship", "finance", "wellness"]:
-                scores = [d["scores"].get(domain, 0.5) for d in checkin_data]
+                scores = history.score_series(domain, weeks)
                 current = scores[-1]
                 previous_avg = sum(scores[:-1]) / len(scores[:-1])
 
@@ -990,7 +1244,7 @@ def create_checkin_tools(backend=None):
             )
 
             # Overall trajectory
-            overall_scores = [d["scores"].get("overall", 0.5) for d in checkin_data]
+            overall_scores = history.score_series("overall", weeks)
             overall_change = (
                 overall_scores[-1] - sum(overall_scores[:-1]) / len(overall_scores[:-1])
             ) * 100
@@ -1051,46 +1305,21 @@ def create_checkin_tools(backend=None):
 
         try:
             # Load check-in data
-            if week_number:
-                path = f"checkins/{user_id}/week_{week_number}_checkin.json"
-            else:
-                # Find most recent check-in
-                checkins_dir = workspace_path / "checkins" / user_id
-                if not checkins_dir.exists():
+            history = load_checkin_history(user_id, backend, workspace_path)
+            if not week_number:
+                # Most recent check-in
+                if not len(history):
                     return f"No check-ins found for user '{user_id}'. Conduct a check-in first."
-
-                checkin_files = sorted(
-                    checkins_dir.glob("week_*_checkin.json"),
-                    key=lambda f: int(f.stem.split("_")[1]),
-                )
-                if not checkin_files:
-                    return f"No check-ins found for user '{user_id}'. Conduct a check-in first."
-
-                most_recent = checkin_files[-1]
-                week_number = int(most_recent.stem.split("_")[1])
-                path = f"checkins/{user_id}/week_{week_number}_checkin.json"
+                week_number = history.latest_week
 
             # Load current check-in
-            if hasattr(backend, "read_file"):
-                content = backend.read_file(path)
-            else:
-                file_path = workspace_path / path
-                if not file_path.exists():
-                    return f"No check-in found for week {week_number}"
-                content = file_path.read_text()
+            current_checkin = history.get(week_number)
+            if current_checkin is None:
+                return f"No check-in found for week {week_number}"
 
-            current_checkin = json.loads(content)
             responses = current_checkin.get("responses", {})
             scores = current_checkin.get("scores", {})
 
-            # Generate trend analysis for recommendations
-            checkins_dir = workspace_path / "checkins" / user_id
-            if checkins_dir.exists():
-                checkin_files = sorted(
-                    checkins_dir.glob("week_*_checkin.json"),
-                    key=lambda f: int(f.stem.split("_")[1]),
-                )
-
             # Generate adaptations
             adaptations = generate_adaptations(responses, scores, {})
 
@@ -1173,33 +1402,17 @@ def create_checkin_tools(backend=None):
 
         try:
             # Load check-in data
+            history = load_checkin_history(user_id, backend, workspace_path)
             if week_number is None:
-                # Find most recent check-in
-                checkins_dir = workspace_path / "checkins" / user_id
-                if not checkins_dir.exists():
+                # Most recent check-in
+                if not len(history):
                     return f"No check-ins found for user '{user_id}'. Conduct a check-in first."
+                week_number = history.latest_week
 
-                checkin_files = sorted(
-                    checkins_dir.glob("week_*_checkin.json"),
-                    key=lambda f: int(f.stem.split("_")[1]),
-                )
-                if not checkin_files:
-                    return f"No check-ins found for user '{user_id}'. Conduct a check-in first."
-
-                most_recent = checkin_files[-1]
-                week_number = int(most_recent.stem.split("_")[1])
-
-            path = f"checkins/{user_id}/week_{week_number}_checkin.json"
-
-            if hasattr(backend, "read_file"):
-                content = backend.read_file(path)
-            else:
-                file_path = workspace_path / path
-                if not file_path.exists():
-                    return f"No check-in found for week {week_number}"
-                content = file_path.read_text()
+            checkin_data = history.get(week_number)
+            if checkin_data is None:
+                return f"No check-in found for week {week_number}"
 
-            checkin_data = json.loads(content)
             responses = checkin_data.get("responses", {})
             scores = checkin_data.get("scores", {})
 
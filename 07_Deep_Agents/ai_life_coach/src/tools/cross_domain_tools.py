@@ -18,6 +18,7 @@ Based on research in:
 - Life domain interdependence theory (8 dimensions of wellness)
 """
 
+from collections import deque
 from datetime import datetime, date
 from pathlib import Path
 from typing import Any, Dict, List, Optional, Set, Tuple
@@ -114,6 +115,13 @@ class GoalDependencyGraph:
     def __init__(self):
         self.nodes: Dict[str, GoalNode] = {}
         self.edges: List[DependencyEdge] = []
+        # Adjacency indexes: goal ID -> relationship type -> edges, with all
+        # types under None, each in insertion order. Kept in step with
+        # self.edges by add_dependency().
+        self._outgoing: Dict[str, Dict[Optional[str], List[DependencyEdge]]] = {}
+        self._incoming: Dict[str, Dict[Optional[str], List[DependencyEdge]]] = {}
+        self._indexed_list = self.edges  # The list the indexes were built from
+        self._indexed_edges = 0
 
     def add_goal(self, goal: GoalNode) -> None:
         """Add a goal node to the graph."""
@@ -121,25 +129,41 @@ class GoalDependencyGraph:
 
     def add_dependency(self, edge: DependencyEdge) -> None:
         """Add a dependency edge to the graph."""
+        self._ensure_index()
         self.edges.append(edge)
+        self._index_edge(edge)
+
+    def _index_edge(self, edge: DependencyEdge) -> None:
+        for index, goal_id in (
+            (self._outgoing, edge.from_goal_id),
+            (self._incoming, edge.to_goal_id),
+        ):
+            by_type = index.setdefault(goal_id, {})
+            by_type.setdefault(None, []).append(edge)
+            by_type.setdefault(edge.relationship_type, []).append(edge)
+        self._indexed_edges += 1
+
+    def _ensure_index(self) -> None:
+        """Rebuild the indexes if self.edges was appended to or replaced directly."""
+        if self._indexed_list is not self.edges or self._indexed_edges != len(self.edges):
+            self._outgoing, self._incoming, self._indexed_edges = {}, {}, 0
+            self._indexed_list = self.edges
+            for edge in self.edges:
+                self._index_edge(edge)
 
     def get_dependencies(
         self, goal_id: str, relationship_type: Optional[str] = None
     ) -> List[DependencyEdge]:
         """Get all dependencies for a goal, optionally filtered by type."""
-        deps = [e for e in self.edges if e.to_goal_id == goal_id]
-        if relationship_type:
-            deps = [e for e in deps if e.relationship_type == relationship_type]
-        return deps
+        self._ensure_index()
+        return list(self._incoming.get(goal_id, {}).get(relationship_type or None, ()))
 
     def get_dependents(
         self, goal_id: str, relationship_type: Optional[str] = None
     ) -> List[DependencyEdge]:
         """Get all goals that depend on this goal."""
-        deps = [e for e in self.edges if e.from_goal_id == goal_id]
-        if relationship_type:
-            deps = [e for e in deps if e.relationship_type == relationship_type]
-        return deps
+        self._ensure_index()
+        return list(self._outgoing.get(goal_id, {}).get(relationship_type or None, ()))
 
     def detect_cycles(self) -> List[List[str]]:
         """Detect cycles in the dependency graph using DFS."""
@@ -148,28 +172,33 @@ class GoalDependencyGraph:
         cycles: List[List[str]] = []
         path: List[str] = []
 
-        def dfs(node_id: str):
-            color[node_id] = GRAY
-            path.append(node_id)
-
-            # Check all outgoing edges (goals this goal enables/requires)
-            for edge in self.get_dependents(node_id):
-                if edge.relationship_type not in ["enables", "requires"]:
-                    continue  # Only check positive dependencies for cycles
-
-                if color[edge.to_goal_id] == GRAY:
-                    # Found a cycle
-                    cycle_start = path.index(edge.to_goal_id)
-                    cycles.append(path[cycle_start:] + [edge.to_goal_id])
-                elif color[edge.to_goal_id] == WHITE:
-                    dfs(edge.to_goal_id)
-
-            path.pop()
-            color[node_id] = BLACK
-
-        for node_id in self.nodes:
-            if color[node_id] == WHITE:
-                dfs(node_id)
+        # Iterative DFS (goal chains can be deeper than the recursion limit):
+        # one iterator over outgoing edges per goal on the current path
+        for root_id in self.nodes:
+            if color[root_id] != WHITE:
+                continue
+            color[root_id] = GRAY
+            path.append(root_id)
+            stack = [iter(self.get_dependents(root_id))]
+
+            while stack:
+                # Check outgoing edges (goals this goal enables/requires)
+                for edge in stack[-1]:
+                    if edge.relationship_type not in ["enables", "requires"]:
+                        continue  # Only check positive dependencies for cycles
+
+                    if color[edge.to_goal_id] == GRAY:
+                        # Found a cycle
+                        cycle_start = path.index(edge.to_goal_id)
+                        cycles.append(path[cycle_start:] + [edge.to_goal_id])
+                    elif color[edge.to_goal_id] == WHITE:
+                        color[edge.to_goal_id] = GRAY
+                        path.append(edge.to_goal_id)
+                        stack.append(iter(self.get_dependents(edge.to_goal_id)))
+                        break
+                else:
+                    stack.pop()
+                    color[path.pop()] = BLACK
 
         return cycles
 
@@ -192,11 +221,11 @@ class GoalDependencyGraph:
             in_degree[edge.to_goal_id] += 1
 
         # Find nodes with no incoming edges
-        queue = [node_id for node_id, degree in in_degree.items() if degree == 0]
+        queue = deque(node_id for node_id, degree in in_degree.items() if degree == 0)
         result = []
 
         while queue:
-            node_id = queue.pop(0)
+            node_id = queue.popleft()
             result.append(node_id)
 
             for neighbor in adjacency_list[node_id]:
@@ -52,6 +52,8 @@ import sys
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
 from config import get_backend
+from .checkin_tools import load_checkin_history
+from .mood_tools import load_mood_series, mood_series_version
 
 
 # ==============================================================================
@@ -257,6 +259,153 @@ class DashboardRenderer:
             return f"{self.chars['arrow_flat']} ~"
 
 
+# ==============================================================================
+# Dashboard Model
+# ==============================================================================
+
+
+class DashboardModel:
+    """
+    Dashboard metrics for one user at one data version.
+
+    Every metric (domain progress, trends, breakdowns, mood history,
+    achievements, milestones) is computed on first use and memoized, so the
+    dashboard, its exports and view switches only format stored values.
+    Use get_dashboard_model() to get the model for the current data version.
+    """
+
+    def __init__(self, user_id: str, backend: Any, version: Optional[Tuple[Any, ...]] = None):
+        self.user_id = user_id
+        self.backend = backend
+        self.version = version
+        self._memo: Dict[Tuple[Any, ...], Any] = {}
+
+    def _memoize(self, key: Tuple[Any, ...], compute) -> Any:
+        if key not in self._memo:
+            self._memo[key] = compute()
+        return self._memo[key]
+
+    def domain_progress(self, view: str) -> Dict[str, float]:
+        """Progress percentage (0-100) per domain."""
+        return self._memoize(
+            ("progress", view),
+            lambda: {
+                domain: _get_domain_progress(self.user_id, domain, view, self.backend)
+                for domain in DOMAINS
+            },
+        )
+
+    def overall_score(self, view: str) -> float:
+        """Overall life satisfaction score (0-100)."""
+        return self._memoize(("overall", view), lambda: _weighted_score(self.domain_progress(view)))
+
+    def domain_trend(self, view: str) -> Dict[str, float]:
+        """Trend change (+/- percentage points) per domain."""
+        return self._memoize(
+            ("trend", view),
+            lambda: {
+                domain: _get_domain_trend(self.user_id, domain, view, self.backend)
+                for domain in DOMAINS
+            },
+        )
+
+    def domain_breakdown(self, domain: str, view: str) -> Dict[str, float]:
+        """Contributing factors for one domain."""
+        return self._memoize(
+            ("breakdown", domain, view),
+            lambda: _get_domain_breakdown(
+                self.user_id, domain, view, self.backend, self.domain_progress(view)[domain]
+            ),
+        )
+
+    def mood_history(self, points: int) -> List[float]:
+        """Recent mood scores (1-10), oldest first."""
+        return self._memoize(
+            ("mood", points), lambda: _get_mood_history(self.user_id, points, self.backend)
+        )
+
+    def achievements(self, limit: int) -> List[Dict]:
+        """Recent achievements, most recent first."""
+        return self._memoize(
+            ("achievements", limit),
+            lambda: _get_recent_achievements(self.user_id, limit, self.backend),
+        )
+
+    def milestones(self, limit: int) -> List[Dict]:
+        """Upcoming milestones, soonest first."""
+        return self._memoize(
+            ("milestones", limit),
+            lambda: _get_upcoming_milestones(self.user_id, limit, self.backend),
+        )
+
+
+# Latest model per (workspace, user), replaced when the data version changes
+_dashboard_models: Dict[Tuple[str, str], DashboardModel] = {}
+
+
+def _signature(path: Path) -> Optional[Tuple[int, int]]:
+    try:
+        stat = path.stat()
+    except OSError:
+        return None
+    return (stat.st_mtime_ns, stat.st_size)
+
+
+def _dashboard_version(user_id: str, backend) -> Optional[Tuple[Any, ...]]:
+    """
+    Data version of everything a user's dashboard shows.
+
+    Combines the check-in history and mood series versions with the
+    milestone and goal files, plus today's date so that view windows and
+    days-remaining counts roll over daily. None if it cannot be determined.
+    """
+    try:
+        workspace = _workspace_path(backend)
+        history = load_checkin_history(user_id, backend, workspace)
+        legacy = getattr(backend, "workspace", None)
+        files = ()
+        if isinstance(legacy, (str, Path)):
+            files = (
+                _signature(Path(legacy) / f"milestones_{user_id}.json"),
+                _signature(Path(legacy) / f"goals_{user_id}.json"),
+            )
+        return (
+            date.today(),
+            history.version,
+            mood_series_version(user_id, backend, workspace),
+            files,
+        )
+    except Exception:
+        return None
+
+
+def get_dashboard_model(user_id: str, backend) -> DashboardModel:
+    """
+    Get the dashboard model for a user's current data version.
+
+    The model is rebuilt only when check-ins, mood entries, milestones or
+    goals change (or the day changes); otherwise the memoized model is
+    returned and rendering does no data loading.
+
+    Args:
+        user_id: The user's unique identifier
+        backend: Backend the data is stored in
+
+    Returns:
+        DashboardModel for the user
+    """
+    version = _dashboard_version(user_id, backend)
+    if version is None:
+        return DashboardModel(user_id, backend)
+
+    key = (str(_workspace_path(backend)), user_id)
+    model = _dashboard_models.get(key)
+    if model is None or model.backend is not backend or model.version != version:
+        model = DashboardModel(user_id, backend, version)
+        _dashboard_models[key] = model
+    return model
+
+
 # ==============================================================================
 # Dashboard Tool Factory
 # ==============================================================================
@@ -315,6 +464,7 @@ def create_dashboard_tools(backend=None):
             view = "weekly"
 
         view_config = VIEW_CONFIGS[view]
+        model = get_dashboard_model(user_id, backend)
         lines = []
         r = renderer
 
@@ -325,7 +475,7 @@ def create_dashboard_tools(backend=None):
         lines.append(r._separator())
 
         # Calculate overall life satisfaction score
-        life_score = _calculate_overall_score(user_id, view, backend)
+        life_score = model.overall_score(view)
         score_color = _score_color(life_score)
         score_bar = r._progress_bar(life_score, width=40)
 
@@ -343,9 +493,11 @@ def create_dashboard_tools(backend=None):
             lines.append(r._box_line("📈 DOMAIN PROGRESS", align="left"))
             lines.append(r._box_line(""))
 
+            progress_by_domain = model.domain_progress(view)
+            trend_by_domain = model.domain_trend(view)
             for domain_key, domain_info in DOMAINS.items():
-                progress = _get_domain_progress(user_id, domain_key, view, backend)
-                trend = _get_domain_trend(user_id, domain_key, view, backend)
+                progress = progress_by_domain[domain_key]
+                trend = trend_by_domain[domain_key]
                 bar = r._progress_bar(progress, width=25)
                 trend_str = f"{trend:+.1f}" if trend != 0 else "~"
 
@@ -360,7 +512,7 @@ def create_dashboard_tools(backend=None):
             lines.append(r._box_line("😊 MOOD TREND", align="left"))
             lines.append(r._box_line(""))
 
-            mood_data = _get_mood_history(user_id, view_config["mood_points"], backend)
+            mood_data = model.mood_history(view_config["mood_points"])
             if mood_data:
                 sparkline = r._sparkline(mood_data, width=40)
                 current_mood = mood_data[-1] if mood_data else 5.0
@@ -386,7 +538,7 @@ def create_dashboard_tools(backend=None):
             lines.append(r._box_line("🏆 RECENT ACHIEVEMENTS", align="left"))
             lines.append(r._box_line(""))
 
-            achievements = _get_recent_achievements(user_id, 3, backend)
+            achievements = model.achievements(3)
             if achievements:
                 for ach in achievements:
                     icon = "★" if ach.get("significance") == "major" else "✓"
@@ -407,7 +559,7 @@ def create_dashboard_tools(backend=None):
         lines.append(r._box_line("🎯 UPCOMING MILESTONES", align="left"))
         lines.append(r._box_line(""))
 
-        milestones = _get_upcoming_milestones(user_id, 3, backend)
+        milestones = model.milestones(3)
         if milestones:
             for ms in milestones:
                 days_left = ms.get("days_remaining", "?")
@@ -458,11 +610,9 @@ def create_dashboard_tools(backend=None):
         if view not in VIEW_CONFIGS:
             view = "weekly"
 
-        score = _calculate_overall_score(user_id, view, backend)
-        domain_scores = {}
-
-        for domain_key in DOMAINS.keys():
-            domain_scores[domain_key] = _get_domain_progress(user_id, domain_key, view, backend)
+        model = get_dashboard_model(user_id, backend)
+        score = model.overall_score(view)
+        domain_scores = model.domain_progress(view)
 
         # Build detailed report
         lines = []
@@ -561,11 +711,12 @@ def create_dashboard_tools(backend=None):
             view = "weekly"
 
         domain_info = DOMAINS[domain]
-        progress = _get_domain_progress(user_id, domain, view, backend)
-        trend = _get_domain_trend(user_id, domain, view, backend)
+        model = get_dashboard_model(user_id, backend)
+        progress = model.domain_progress(view)[domain]
+        trend = model.domain_trend(view)[domain]
 
         # Get detailed breakdown
-        breakdown = _get_domain_breakdown(user_id, domain, view, backend)
+        breakdown = model.domain_breakdown(domain, view)
 
         lines = []
         lines.append("")
@@ -650,7 +801,7 @@ def create_dashboard_tools(backend=None):
             view = "weekly"
 
         view_config = VIEW_CONFIGS[view]
-        mood_data = _get_mood_history(user_id, view_config["mood_points"], backend)
+        mood_data = get_dashboard_model(user_id, backend).mood_history(view_config["mood_points"])
 
         if not mood_data:
             return "No mood data available. Start logging your mood to see trends!"
@@ -731,7 +882,7 @@ def create_dashboard_tools(backend=None):
             >>> get_recent_achievements("user_123", 3)
             '🏆 RECENT ACHIEVEMENTS\n\n1. ★ Completed Project X (Major)\n   Career - 2 days ago\n   ...'
         """
-        achievements = _get_recent_achievements(user_id, limit, backend)
+        achievements = get_dashboard_model(user_id, backend).achievements(limit)
 
         if not achievements:
             return (
@@ -796,7 +947,7 @@ def create_dashboard_tools(backend=None):
             >>> get_upcoming_milestones("user_123", 3)
             '🎯 UPCOMING MILESTONES\n\n🔥 Complete quarterly review (3 days)\n   Finance domain...'
         """
-        milestones = _get_upcoming_milestones(user_id, limit, backend)
+        milestones = get_dashboard_model(user_id, backend).milestones(limit)
 
         if not milestones:
             return (
@@ -894,6 +1045,7 @@ def create_dashboard_tools(backend=None):
             view = "weekly"
 
         view_config = VIEW_CONFIGS[view]
+        model = get_dashboard_model(user_id, backend)
         timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
         date_display = datetime.now().strftime("%B %d, %Y")
 
@@ -913,7 +1065,7 @@ def create_dashboard_tools(backend=None):
         lines.append("## 📊 Executive Summary")
         lines.append("")
 
-        overall_score = _calculate_overall_score(user_id, view, backend)
+        overall_score = model.overall_score(view)
         lines.append(f"### Overall Life Satisfaction: {overall_score:.1f}/100")
         lines.append("")
         lines.append(f"**Status:** {_score_label(overall_score)}")
@@ -934,9 +1086,11 @@ def create_dashboard_tools(backend=None):
         lines.append("| Domain | Progress | Trend | Status |")
         lines.append("|--------|----------|-------|--------|")
 
+        domain_scores = model.domain_progress(view)
+        domain_trends = model.domain_trend(view)
         for domain_key, domain_info in DOMAINS.items():
-            progress = _get_domain_progress(user_id, domain_key, view, backend)
-            trend = _get_domain_trend(user_id, domain_key, view, backend)
+            progress = domain_scores[domain_key]
+            trend = domain_trends[domain_key]
             trend_str = f"{trend:+.1f}" if trend != 0 else "~"
             status = _score_label(progress)
 
@@ -951,7 +1105,7 @@ def create_dashboard_tools(backend=None):
         lines.append("## 😊 Mood Analysis")
         lines.append("")
 
-        mood_data = _get_mood_history(user_id, view_config["mood_points"], backend)
+        mood_data = model.mood_history(view_config["mood_points"])
         if mood_data:
             current = mood_data[-1]
             avg = sum(mood_data) / len(mood_data)
@@ -971,7 +1125,7 @@ def create_dashboard_tools(backend=None):
         lines.append("## 🏆 Recent Achievements")
         lines.append("")
 
-        achievements = _get_recent_achievements(user_id, 5, backend)
+        achievements = model.achievements(5)
         if achievements:
             for ach in achievements:
                 sig_icon = "⭐" if ach.get("significance") == "major" else "✓"
@@ -989,7 +1143,7 @@ def create_dashboard_tools(backend=None):
         lines.append("## 🎯 Upcoming Milestones")
         lines.append("")
 
-        milestones = _get_upcoming_milestones(user_id, 5, backend)
+        milestones = model.milestones(5)
         if milestones:
             for ms in milestones:
                 days = ms.get("days_remaining", "?")
@@ -1005,7 +1159,6 @@ def create_dashboard_tools(backend=None):
         lines.append("## 💡 Insights & Recommendations")
         lines.append("")
 
-        domain_scores = {k: _get_domain_progress(user_id, k, view, backend) for k in DOMAINS.keys()}
         weakest = min(domain_scores.items(), key=lambda x: x[1])
         strongest = max(domain_scores.items(), key=lambda x: x[1])
 
@@ -1117,14 +1270,28 @@ def create_dashboard_tools(backend=None):
 # ==============================================================================
 
 
+def _workspace_path(backend) -> Path:
+    """Workspace directory of a backend (root_dir, or workspace for older backends)."""
+    root_dir = getattr(backend, "root_dir", None)
+    return Path(root_dir) if isinstance(root_dir, (str, Path)) else Path(backend.workspace)
+
+
 def _calculate_overall_score(user_id: str, view: str, backend) -> float:
     """Calculate overall life satisfaction score (0-100)."""
+    progress = {
+        domain_key: _get_domain_progress(user_id, domain_key, view, backend)
+        for domain_key in DOMAINS
+    }
+    return _weighted_score(progress)
+
+
+def _weighted_score(progress: Dict[str, float]) -> float:
+    """Weighted average of domain progress percentages (0-100)."""
     scores = []
     weights = []
 
     for domain_key, domain_info in DOMAINS.items():
-        progress = _get_domain_progress(user_id, domain_key, view, backend)
-        scores.append(progress)
+        scores.append(progress[domain_key])
         weights.append(domain_info["weight"])
 
     # Weighted average
@@ -1139,28 +1306,25 @@ def _get_domain_progress(user_id: str, domain: str, view: str, backend) -> float
     """Get progress percentage for a specific domain (0-100)."""
     # Try to load from stored check-in data
     try:
-        checkin_file = backend.workspace / f"checkins_{user_id}.json"
-        if checkin_file.exists():
-            with open(checkin_file) as f:
-                checkins = json.load(f)
-
-            # Get most recent check-ins for this view
-            view_days = VIEW_CONFIGS[view]["days"]
-            cutoff = (datetime.now() - timedelta(days=view_days)).isoformat()
-
-            recent_checkins = [c for c in checkins if c.get("timestamp", "") >= cutoff]
-
-            if recent_checkins:
-                # Look for domain-specific progress in check-ins
-                key = f"{domain}_goals_completed"
-                values = [
-                    c.get("responses", {}).get(key, 50)
-                    for c in recent_checkins
-                    if key in c.get("responses", {})
-                ]
-
-                if values:
-                    return sum(values) / len(values)
+        history = load_checkin_history(user_id, backend, _workspace_path(backend))
+
+        # Get most recent check-ins for this view
+        view_days = VIEW_CONFIGS[view]["days"]
+        cutoff = (datetime.now() - timedelta(days=view_days)).isoformat()
+
+        recent_checkins = history.since(cutoff)
+
+        if recent_checkins:
+            # Look for domain-specific progress in check-ins
+            key = f"{domain}_goals_completed"
+            values = [
+                c.get("responses", {}).get(key, 50)
+                for c in recent_checkins
+                if key in c.get("responses", {})
+            ]
+
+            if values:
+                return sum(values) / len(values)
     except Exception:
         pass
 
@@ -1170,10 +1334,7 @@ def _get_domain_progress(user_id: str, domain: str, view: str, backend) -> float
 
 def _get_domain_trend(user_id: str, domain: str, view: str, backend) -> float:
     """Get trend change for a domain (+/- percentage points)."""
-    # Compare current period to previous period
-    current = _get_domain_progress(user_id, domain, view, backend)
-
-    # For trend, we'd ideally compare to previous period
+    # For trend, we'd ideally compare the current period to the previous one
     # For now, simulate a small trend
     import hashlib
 
@@ -1181,8 +1342,10 @@ def _get_domain_trend(user_id: str, domain: str, view: str, backend) -> float:
     return (hash_val % 20) - 10  # -10 to +10
 
 
-def _get_domain_breakdown(user_id: str, domain: str, view: str, backend) -> Dict[str, float]:
-    """Get breakdown of factors contributing to domain score."""
+def _get_domain_breakdown(
+    user_id: str, domain: str, view: str, backend, progress: Optional[float] = None
+) -> Dict[str, float]:
+    """Get breakdown of factors contributing to domain score (around progress if given)."""
     # Domain-specific breakdowns
     breakdowns = {
         "career": {
@@ -1211,7 +1374,9 @@ def _get_domain_breakdown(user_id: str, domain: str, view: str, backend) -> Dict
         },
     }
 
-    base_progress = _get_domain_progress(user_id, domain, view, backend)
+    if progress is None:
+        progress = _get_domain_progress(user_id, domain, view, backend)
+    base_progress = progress
 
     # Generate realistic breakdown around base progress
     import random
@@ -1228,30 +1393,14 @@ def _get_domain_breakdown(user_id: str, domain: str, view: str, backend) -> Dict
 
 
 def _get_mood_history(user_id: str, points: int, backend) -> List[float]:
-    """Get mood history data for sparkline."""
+    """Get mood history data (1-10 scale) for sparkline from the user's mood series."""
     try:
-        mood_file = backend.workspace / f"mood_{user_id}.json"
-        if mood_file.exists():
-            with open(mood_file) as f:
-                entries = json.load(f)
-
-            # Extract mood scores
-            scores = []
-            for entry in entries[-points:]:
-                if "composite_score" in entry:
-                    scores.append(entry["composite_score"])
-                elif "dimensions" in entry:
-                    dims = entry["dimensions"]
-                    score = (
-                        dims.get("happiness", 5)
-                        + (10 - dims.get("stress", 5))  # Invert stress
-                        + dims.get("energy", 5)
-                        + dims.get("motivation", 5)
-                    ) / 4
-                    scores.append(score)
-
-            if len(scores) >= 2:
-                return scores
+        series = load_mood_series(user_id, backend, _workspace_path(backend))
+
+        # Composite scores are stored on a 0-1 scale
+        scores = [1 + 9 * entry["composite_score"] for entry in series.tail(points)]
+        if len(scores) >= 2:
+            return scores
     except Exception:
         pass
 
@@ -48,6 +48,7 @@ import sys
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
 from config import get_backend
+from .keyword_matcher import KeywordMatcher
 
 
 # ==============================================================================
@@ -95,6 +96,7 @@ CRISIS_KEYWORDS = {
             "end it all",
             "jump off",
             "hang myself",
+            "hanging myself",
         ],
         "high": [
             "suicidal thoughts",
@@ -167,6 +169,7 @@ CRISIS_KEYWORDS = {
     CrisisType.SUBSTANCE_CRISIS: {
         "critical": [
             "overdose",
+            "overdosed",
             "od on",
             "drug emergency",
             "alcohol poisoning",
@@ -213,6 +216,32 @@ CRISIS_KEYWORDS = {
 }
 
 
+# Short keywords that are also prefixes of everyday words ("IPv6"); these
+# must match as whole words
+WHOLE_WORD_CRISIS_KEYWORDS = frozenset({"ipv", "od on"})
+
+
+def _build_crisis_matcher() -> KeywordMatcher:
+    """
+    Compile CRISIS_KEYWORDS into a matcher (category: CrisisType).
+
+    Matches must start a word, so "od on" does not fire inside "good one",
+    but may run into a longer word ("self-harming", "boyfriend hits").
+    WHOLE_WORD_CRISIS_KEYWORDS must match whole words, so "ipv" does not
+    fire inside "IPv6".
+    """
+    matcher = KeywordMatcher(boundary="start")
+    for crisis_type, severity_levels in CRISIS_KEYWORDS.items():
+        for severity, keywords in severity_levels.items():
+            for keyword in keywords:
+                boundary = "word" if keyword in WHOLE_WORD_CRISIS_KEYWORDS else None
+                matcher.add(keyword, crisis_type, severity, boundary=boundary)
+    return matcher.compile()
+
+
+CRISIS_MATCHER = _build_crisis_matcher()
+
+
 # Professional crisis resources directory
 CRISIS_RESOURCES = {
     "988_lifeline": {
@@ -442,41 +471,31 @@ def detect_crisis_keywords(text: str) -> CrisisDetectionResult:
     if not text or not isinstance(text, str):
         return CrisisDetectionResult(is_crisis=False)
 
-    text_lower = text.lower()
     matched_keywords = []
     detected_types = []
     max_severity = "none"
     confidence = 0.0
-
-    # Check each crisis type
-    for crisis_type, severity_levels in CRISIS_KEYWORDS.items():
-        type_matched = False
-
-        for severity, keywords in severity_levels.items():
-            for keyword in keywords:
-                # Use word boundary matching for phrases
-                if keyword in text_lower:
-                    matched_keywords.append(keyword)
-                    type_matched = True
-
-                    # Track highest severity
-                    severity_rank = {"critical": 3, "high": 2, "moderate": 1}
-                    current_rank = severity_rank.get(max_severity, 0)
-                    new_rank = severity_rank.get(severity, 0)
-
-                    if new_rank > current_rank:
-                        max_severity = severity
-
-                    # Add to confidence score
-                    if severity == "critical":
-                        confidence += 0.4
-                    elif severity == "high":
-                        confidence += 0.25
-                    elif severity == "moderate":
-                        confidence += 0.15
-
-        if type_matched:
-            detected_types.append(crisis_type)
+    severity_rank = {"critical": 3, "high": 2, "moderate": 1}
+
+    # Each keyword counts once however often it occurs, in CRISIS_KEYWORDS order
+    matches = {m.index: m for m in CRISIS_MATCHER.find_all(text)}
+    for index in sorted(matches):
+        match = matches[index]
+        matched_keywords.append(match.keyword)
+        if match.category not in detected_types:
+            detected_types.append(match.category)
+
+        # Track highest severity
+        if severity_rank.get(match.severity, 0) > severity_rank.get(max_severity, 0):
+            max_severity = match.severity
+
+        # Add to confidence score
+        if match.severity == "critical":
+            confidence += 0.4
+        elif match.severity == "high":
+            confidence += 0.25
+        elif match.severity == "moderate":
+            confidence += 0.15
 
     # Determine crisis level
     if max_severity == "critical":
@@ -535,6 +554,93 @@ def get_appropriate_resources(crisis_types: List[CrisisType]) -> List[Dict[str,
     return resources
 
 
+def build_crisis_response(crisis_level: str, crisis_types: Optional[List[str]] = None) -> str:
+    """
+    Build the empathetic crisis response message for a crisis level.
+
+    Shared by the generate_crisis_response tool and the pre-model crisis
+    screening middleware, so both give users the same wording and resources.
+
+    Args:
+        crisis_level: Severity level ('critical', 'high', 'moderate')
+        crisis_types: Optional list of crisis types
+
+    Returns:
+        Empathetic crisis response with resources
+    """
+    crisis_types = crisis_types or []
+
+    if crisis_level == "critical":
+        response = [
+            "I'm really concerned about what you've shared. It sounds like you're going through",
+            "an incredibly difficult time, and I want you to know that you're not alone.",
+            "",
+            "Please reach out to one of these crisis resources right now:",
+            "",
+            "🆘 988 Suicide & Crisis Lifeline: Call or text 988",
+            "   Available 24/7 with trained crisis counselors",
+            "",
+            "🆘 Crisis Text Line: Text HOME to 741741",
+            "   Free, confidential text-based support",
+            "",
+            "🆘 Emergency Services: Call 911",
+            "   If you're in immediate danger",
+            "",
+            "These resources have trained professionals who can provide the support",
+            "you need right now. You deserve help, and it's available.",
+        ]
+    elif crisis_level == "high":
+        response = [
+            "Thank you for sharing what you're going through. It sounds like you're",
+            "experiencing significant pain, and I want you to know that support is available.",
+            "",
+            "I'd strongly encourage you to reach out to:",
+            "",
+            "📞 988 Suicide & Crisis Lifeline: Call or text 988",
+            "   Free, confidential support available 24/7",
+            "",
+            "💬 Crisis Text Line: Text HOME to 741741",
+            "   Text with a trained crisis counselor",
+            "",
+            "Talking to someone trained in crisis support can make a real difference.",
+            "You don't have to carry this alone.",
+        ]
+    elif crisis_level == "moderate":
+        response = [
+            "I can hear that you're going through a difficult time. It's really important",
+            "to take care of yourself during moments like this.",
+            "",
+            "Here are some resources that might help:",
+            "",
+            "📞 988 Suicide & Crisis Lifeline: Call or text 988",
+            "   Available if you need someone to talk to",
+            "",
+            "💬 Crisis Text Line: Text HOME to 741741",
+            "   Text-based support when you need it",
+            "",
+            "Would you like to create a safety plan together? It can help you",
+            "prepare for difficult moments and know what steps to take.",
+        ]
+    else:
+        response = [
+            "Thank you for sharing with me. If you're ever in crisis or need immediate support,",
+            "please don't hesitate to reach out to professional resources:",
+            "",
+            "📞 988 Suicide & Crisis Lifeline: Call or text 988",
+            "💬 Crisis Text Line: Text HOME to 741741",
+        ]
+
+    response.extend(
+        [
+            "",
+            "⚠️  Important: I'm an AI assistant and cannot provide crisis intervention or",
+            "emergency services. Please contact the professionals above for immediate help.",
+        ]
+    )
+
+    return "\n".join(response)
+
+
 # ==============================================================================
 # Safety Plan Management
 # ==============================================================================
@@ -1476,77 +1582,7 @@ def create_emergency_tools(backend=None):
             >>> generate_crisis_response("critical", ["suicide_ideation"])
             >>> generate_crisis_response("moderate")
         """
-        crisis_types = crisis_types or []
-
-        if crisis_level == "critical":
-            response = [
-                "I'm really concerned about what you've shared. It sounds like you're going through",
-                "an incredibly difficult time, and I want you to know that you're not alone.",
-                "",
-                "Please reach out to one of these crisis resources right now:",
-                "",
-                "🆘 988 Suicide & Crisis Lifeline: Call or text 988",
-                "   Available 24/7 with trained crisis counselors",
-                "",
-                "🆘 Crisis Text Line: Text HOME to 741741",
-                "   Free, confidential text-based support",
-                "",
-                "🆘 Emergency Services: Call 911",
-                "   If you're in immediate danger",
-                "",
-                "These resources have trained professionals who can provide the support",
-                "you need right now. You deserve help, and it's available.",
-            ]
-        elif crisis_level == "high":
-            response = [
-                "Thank you for sharing what you're going through. It sounds like you're",
-                "experiencing significant pain, and I want you to know that support is available.",
-                "",
-                "I'd strongly encourage you to reach out to:",
-                "",
-                "📞 988 Suicide & Crisis Lifeline: Call or text 988",
-                "   Free, confidential support available 24/7",
-                "",
-                "💬 Crisis Text Line: Text HOME to 741741",
-                "   Text with a trained crisis counselor",
-                "",
-                "Talking to someone trained in crisis support can make a real difference.",
-                "You don't have to carry this alone.",
-            ]
-        elif crisis_level == "moderate":
-            response = [
-                "I can hear that you're going through a difficult time. It's really important",
-                "to take care of yourself during moments like this.",
-                "",
-                "Here are some resources that might help:",
-                "",
-                "📞 988 Suicide & Crisis Lifeline: Call or text 988",
-                "   Available if you need someone to talk to",
-                "",
-                "💬 Crisis Text Line: Text HOME to 741741",
-                "   Text-based support when you need it",
-                "",
-                "Would you like to create a safety plan together? It can help you",
-                "prepare for difficult moments and know what steps to take.",
-            ]
-        else:
-            response = [
-                "Thank you for sharing with me. If you're ever in crisis or need immediate support,",
-                "please don't hesitate to reach out to professional resources:",
-                "",
-                "📞 988 Suicide & Crisis Lifeline: Call or text 988",
-                "💬 Crisis Text Line: Text HOME to 741741",
-            ]
-
-        response.extend(
-            [
-                "",
-                "⚠️  Important: I'm an AI assistant and cannot provide crisis intervention or",
-                "emergency services. Please contact the professionals above for immediate help.",
-            ]
-        )
-
-        return "\n".join(response)
+        return build_crisis_response(crisis_level, crisis_types)
 
     return (
         analyze_crisis_risk,
@@ -19,6 +19,7 @@ Based on research in:
 - Conflict resolution strategies
 """
 
+from collections import deque
 from datetime import datetime, date
 from pathlib import Path
 from typing import Any, Dict, List, Optional, Set, Tuple
@@ -121,6 +122,13 @@ class GoalDependencyGraph:
     def __init__(self):
         self.nodes: Dict[str, GoalNode] = {}
         self.edges: List[DependencyEdge] = []
+        # Adjacency indexes: goal ID -> relationship type -> edges, with all
+        # types under None, each in insertion order. Kept in step with
+        # self.edges by add_dependency() and remove_goal().
+        self._outgoing: Dict[str, Dict[Optional[str], List[DependencyEdge]]] = {}
+        self._incoming: Dict[str, Dict[Optional[str], List[DependencyEdge]]] = {}
+        self._indexed_list = self.edges  # The list the indexes were built from
+        self._indexed_edges = 0
 
     def add_goal(self, goal: GoalNode) -> None:
         """Add a goal node to the graph."""
@@ -128,16 +136,69 @@ class GoalDependencyGraph:
 
     def add_dependency(self, edge: DependencyEdge) -> None:
         """Add a dependency edge to the graph."""
+        self._ensure_index()
         self.edges.append(edge)
+        self._index_edge(edge)
 
     def remove_goal(self, goal_id: str) -> None:
         """Remove a goal and all its edges from the graph."""
         if goal_id in self.nodes:
             del self.nodes[goal_id]
+            self._ensure_index()
             # Remove all edges involving this goal
+            outgoing = self._outgoing.pop(goal_id, {}).get(None, [])
+            incoming = self._incoming.pop(goal_id, {}).get(None, [])
+            if not outgoing and not incoming:
+                return
             self.edges = [
                 e for e in self.edges if e.from_goal_id != goal_id and e.to_goal_id != goal_id
             ]
+            for neighbor_id in {e.to_goal_id for e in outgoing}:
+                self._unindex(self._incoming, neighbor_id, goal_id)
+            for neighbor_id in {e.from_goal_id for e in incoming}:
+                self._unindex(self._outgoing, neighbor_id, goal_id)
+            self._indexed_list, self._indexed_edges = self.edges, len(self.edges)
+
+    def _index_edge(self, edge: DependencyEdge) -> None:
+        for index, goal_id in (
+            (self._outgoing, edge.from_goal_id),
+            (self._incoming, edge.to_goal_id),
+        ):
+            by_type = index.setdefault(goal_id, {})
+            by_type.setdefault(None, []).append(edge)
+            by_type.setdefault(edge.relationship_type, []).append(edge)
+        self._indexed_edges += 1
+
+    @staticmethod
+    def _unindex(
+        index: Dict[str, Dict[Optional[str], List[DependencyEdge]]],
+        goal_id: str,
+        removed_id: str,
+    ) -> None:
+        """Drop edges to or from removed_id from goal_id's entry in an index."""
+        by_type = index.get(goal_id)
+        if not by_type:
+            return
+        for rel_type in list(by_type):
+            kept = [
+                e
+                for e in by_type[rel_type]
+                if e.from_goal_id != removed_id and e.to_goal_id != removed_id
+            ]
+            if kept:
+                by_type[rel_type] = kept
+            else:
+                del by_type[rel_type]
+        if not by_type:
+            del index[goal_id]
+
+    def _ensure_index(self) -> None:
+        """Rebuild the indexes if self.edges was appended to or replaced directly."""
+        if self._indexed_list is not self.edges or self._indexed_edges != len(self.edges):
+            self._outgoing, self._incoming, self._indexed_edges = {}, {}, 0
+            self._indexed_list = self.edges
+            for edge in self.edges:
+                self._index_edge(edge)
 
     def update_goal(self, goal_id: str, **kwargs) -> None:
         """Update goal attributes."""
@@ -149,19 +210,15 @@ class GoalDependencyGraph:
         self, goal_id: str, relationship_type: Optional[str] = None
     ) -> List[DependencyEdge]:
         """Get all dependencies for a goal, optionally filtered by type."""
-        deps = [e for e in self.edges if e.to_goal_id == goal_id]
-        if relationship_type:
-            deps = [e for e in deps if e.relationship_type == relationship_type]
-        return deps
+        self._ensure_index()
+        return list(self._incoming.get(goal_id, {}).get(relationship_type or None, ()))
 
     def get_dependents(
         self, goal_id: str, relationship_type: Optional[str] = None
     ) -> List[DependencyEdge]:
         """Get all goals that depend on this goal."""
-        deps = [e for e in self.edges if e.from_goal_id == goal_id]
-        if relationship_type:
-            deps = [e for e in deps if e.relationship_type == relationship_type]
-        return deps
+        self._ensure_index()
+        return list(self._outgoing.get(goal_id, {}).get(relationship_type or None, ()))
 
     def detect_cycles(self) -> List[List[str]]:
         """Detect cycles in the dependency graph using DFS."""
@@ -170,28 +227,33 @@ class GoalDependencyGraph:
         cycles: List[List[str]] = []
         path: List[str] = []
 
-        def dfs(node_id: str):
-            color[node_id] = GRAY
-            path.append(node_id)
-
-            # Check all outgoing edges (goals this goal enables/requires)
-            for edge in self.get_dependents(node_id):
-                if edge.relationship_type not in ["enables", "requires"]:
-                    continue  # Only check positive dependencies for cycles
-
-                if color[edge.to_goal_id] == GRAY:
-                    # Found a cycle
-                    cycle_start = path.index(edge.to_goal_id)
-                    cycles.append(path[cycle_start:] + [edge.to_goal_id])
-                elif color[edge.to_goal_id] == WHITE:
-                    dfs(edge.to_goal_id)
-
-            path.pop()
-            color[node_id] = BLACK
-
-        for node_id in self.nodes:
-            if color[node_id] == WHITE:
-                dfs(node_id)
+        # Iterative DFS (goal chains can be deeper than the recursion limit):
+        # one iterator over outgoing edges per goal on the current path
+        for root_id in self.nodes:
+            if color[root_id] != WHITE:
+                continue
+            color[root_id] = GRAY
+            path.append(root_id)
+            stack = [iter(self.get_dependents(root_id))]
+
+            while stack:
+                # Check outgoing edges (goals this goal enables/requires)
+                for edge in stack[-1]:
+                    if edge.relationship_type not in ["enables", "requires"]:
+                        continue  # Only check positive dependencies for cycles
+
+                    if color[edge.to_goal_id] == GRAY:
+                        # Found a cycle
+                        cycle_start = path.index(edge.to_goal_id)
+                        cycles.append(path[cycle_start:] + [edge.to_goal_id])
+                    elif color[edge.to_goal_id] == WHITE:
+                        color[edge.to_goal_id] = GRAY
+                        path.append(edge.to_goal_id)
+                        stack.append(iter(self.get_dependents(edge.to_goal_id)))
+                        break
+                else:
+                    stack.pop()
+                    color[path.pop()] = BLACK
 
         return cycles
 
@@ -214,11 +276,11 @@ class GoalDependencyGraph:
             in_degree[edge.to_goal_id] += 1
 
         # Find nodes with no incoming edges
-        queue = [node_id for node_id, degree in in_degree.items() if degree == 0]
+        queue = deque(node_id for node_id, degree in in_degree.items() if degree == 0)
         result = []
 
         while queue:
-            node_id = queue.pop(0)
+            node_id = queue.popleft()
             result.append(node_id)
 
             for neighbor in adjacency_list[node_id]:
@@ -271,10 +333,9 @@ class GoalDependencyGraph:
 
         for node_id in self.nodes:
             # Check if it's a source node (no incoming positive dependencies)
-            has_incoming = any(
-                e.to_goal_id == node_id
-                for e in self.edges
-                if e.relationship_type in ["enables", "requires"]
+            has_incoming = bool(
+                self.get_dependencies(node_id, "enables")
+                or self.get_dependencies(node_id, "requires")
             )
             if not has_incoming:
                 path, effort = dfs(node_id, set())
@@ -302,11 +363,11 @@ class GoalDependencyGraph:
         }
 
         # BFS to propagate impact
-        queue = [(goal_id, 1.0)]  # (node_id, impact_strength)
+        queue = deque([(goal_id, 1.0)])  # (node_id, impact_strength)
         visited = {goal_id}
 
         while queue:
-            current_id, current_impact = queue.pop(0)
+            current_id, current_impact = queue.popleft()
 
             # Get all goals that depend on this one
             for edge in self.get_dependents(current_id):
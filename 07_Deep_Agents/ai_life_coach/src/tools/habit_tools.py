@@ -40,6 +40,12 @@ except ImportError:
         return func
 
 
+# Optional NumPy for vectorized analytics (pure Python fallback otherwise)
+try:
+    import numpy as np
+except ImportError:
+    np = None  # type: ignore
+
 # Import backend configuration
 import sys
 
@@ -47,7 +53,6 @@ sys.path.insert(0, str(Path(__file__).parent.parent))
 
 from config import get_backend
 
-
 # ==============================================================================
 # Habit Constants and Configuration
 # ==============================================================================
@@ -279,6 +284,137 @@ class HabitEntry:
         )
 
 
+class HabitLog:
+    """
+    Columnar completion log for one habit.
+
+    Completions are appended as rows to per-field columns, with an index from
+    completion date to row. Streak aggregates are updated on every append, so
+    stats never need to re-read the history. Appending a date earlier than the
+    latest completion (a backfill) recomputes the aggregates from the sorted
+    dates.
+    """
+
+    COLUMNS = ("entry_id", "completion_date", "completed_at", "notes", "mood", "difficulty")
+
+    def __init__(
+        self,
+        habit_id: str,
+        user_id: str,
+        target_days: Optional[List[int]] = None,
+        columns: Optional[Dict[str, List[Any]]] = None,
+    ):
+        self.habit_id = habit_id
+        self.user_id = user_id
+        self.target_days = list(target_days or [])
+        self.columns: Dict[str, List[Any]] = {name: [] for name in self.COLUMNS}
+        self.date_index: Dict[str, int] = {}
+        # Streak aggregates (see calculate_streak for the rules they mirror)
+        self.last_date: Optional[date] = None
+        self.run = 0  # Forward streak ending at last_date
+        self.longest_streak = 0
+        self.tail_run = 0  # Backward-linked completions ending at last_date
+
+        for name, values in (columns or {}).items():
+            if name in self.columns:
+                self.columns[name] = list(values)
+        for row, completion_date in enumerate(self.columns["completion_date"]):
+            self.date_index.setdefault(completion_date, row)
+        self.recompute()
+
+    def __len__(self) -> int:
+        return len(self.columns["completion_date"])
+
+    def __contains__(self, completion_date: str) -> bool:
+        return completion_date in self.date_index
+
+    def append(self, entry: HabitEntry) -> bool:
+        """
+        Append a completion and update the aggregates.
+
+        Returns:
+            False if the date was already logged, True otherwise
+        """
+        if entry.completion_date in self.date_index:
+            return False
+
+        row = entry.to_dict()
+        for name in self.COLUMNS:
+            self.columns[name].append(row[name])
+        self.date_index[entry.completion_date] = len(self) - 1
+
+        completed = parse_date(entry.completion_date)
+        if self.last_date is None:
+            self.last_date, self.run, self.longest_streak, self.tail_run = completed, 1, 1, 1
+        elif completed > self.last_date:
+            self._step(completed)
+        else:
+            self.recompute()
+        return True
+
+    def _step(self, completed: date) -> None:
+        """Extend the aggregates with a completion after last_date."""
+        forward, linked = _streak_step(self.last_date, completed, self.target_days)
+        if forward > 0:
+            self.run += 1
+            self.longest_streak = max(self.longest_streak, self.run)
+        elif forward < 0:
+            self.run = 1
+        self.tail_run = self.tail_run + 1 if linked else 1
+        self.last_date = completed
+
+    def recompute(self, target_days: Optional[List[int]] = None) -> None:
+        """Rebuild the aggregates from all logged dates (O(n log n))."""
+        if target_days is not None:
+            self.target_days = list(target_days)
+        dates = self.completion_dates()
+        self.last_date, self.run, self.longest_streak, self.tail_run = None, 0, 0, 0
+        if dates:
+            self.last_date, self.run, self.longest_streak, self.tail_run = dates[0], 1, 1, 1
+            for completed in dates[1:]:
+                self._step(completed)
+
+    def completion_dates(self) -> List[date]:
+        """Logged completion dates, sorted."""
+        return sorted(parse_date(d) for d in self.columns["completion_date"])
+
+    def current_streak(self, today: Optional[date] = None) -> int:
+        """Current streak as calculate_streak() would report it."""
+        if self.last_date is None:
+            return 0
+        max_gap = _get_max_gap(self.target_days) if self.target_days else 1
+        days_since_last = ((today or date.today()) - self.last_date).days
+        return self.tail_run if days_since_last <= max_gap else 0
+
+    def entries(self) -> List[HabitEntry]:
+        """Logged completions as HabitEntry objects, in log order."""
+        return [
+            HabitEntry.from_dict(
+                {"habit_id": self.habit_id, "user_id": self.user_id, **dict(zip(self.COLUMNS, row))}
+            )
+            for row in zip(*(self.columns[name] for name in self.COLUMNS))
+        ]
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert log to dictionary."""
+        return {
+            "habit_id": self.habit_id,
+            "user_id": self.user_id,
+            "target_days": self.target_days,
+            "columns": self.columns,
+        }
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "HabitLog":
+        """Create log from dictionary."""
+        return cls(
+            habit_id=data.get("habit_id", ""),
+            user_id=data.get("user_id", ""),
+            target_days=data.get("target_days"),
+            columns=data.get("columns"),
+        )
+
+
 class HabitStats:
     """Statistics for a habit."""
 
@@ -352,8 +488,22 @@ def get_target_dates(
     return dates
 
 
+def count_target_dates(target_days: List[int], start_date: date, end_date: date) -> int:
+    """Count target dates in a date range without enumerating it (see get_target_dates)."""
+    total_days = (end_date - start_date).days + 1
+    if total_days <= 0:
+        return 0
+    weekdays = set(target_days)
+    full_weeks, remainder = divmod(total_days, 7)
+    start_weekday = start_date.weekday()
+    extra = sum(1 for i in range(remainder) if (start_weekday + i) % 7 in weekdays)
+    return full_weeks * len(weekdays) + extra
+
+
 def calculate_streak(
-    completion_dates: List[date], target_days: Optional[List[int]] = None
+    completion_dates: List[date],
+    target_days: Optional[List[int]] = None,
+    today: Optional[date] = None,
 ) -> Tuple[int, int]:
     """
     Calculate current and longest streak.
@@ -361,6 +511,7 @@ def calculate_streak(
     Args:
         completion_dates: List of dates when habit was completed
         target_days: Optional list of target weekdays (0=Monday, 6=Sunday)
+        today: Reference date for the current streak (defaults to today)
 
     Returns:
         Tuple of (current_streak, longest_streak)
@@ -400,7 +551,7 @@ def calculate_streak(
 
     # Calculate current streak (from most recent completion)
     current_streak = 0
-    today = date.today()
+    today = today or date.today()
 
     if sorted_dates:
         most_recent = sorted_dates[-1]
@@ -449,6 +600,24 @@ def _get_prev_target_date(from_date: date, target_days: List[int]) -> date:
     return prev_date
 
 
+def _streak_step(prev_date: date, curr_date: date, target_days: List[int]) -> Tuple[int, bool]:
+    """
+    Relation between two consecutive (sorted) completion dates.
+
+    Returns:
+        (forward, linked): forward is 1 if curr_date extends the streak, -1 if
+        it breaks it and 0 if neither; linked is True if prev_date is the
+        target date right before curr_date (used for the current streak).
+    """
+    if target_days:
+        expected_next = _get_next_target_date(prev_date, target_days)
+        forward = 1 if curr_date == expected_next else -1 if curr_date > expected_next else 0
+        return forward, prev_date == _get_prev_target_date(curr_date, target_days)
+
+    gap = (curr_date - prev_date).days
+    return (1 if gap == 1 else -1 if gap > 1 else 0), gap == 1
+
+
 def _get_max_gap(target_days: List[int]) -> int:
     """Get maximum allowed gap between completions based on frequency."""
     if len(target_days) >= 6:
@@ -693,6 +862,487 @@ def suggest_habit_stack(
     return suggestions[:5]  # Return top 5
 
 
+# ==============================================================================
+# Vectorized Habit Analytics
+# ==============================================================================
+#
+# Dates are handled as day ordinals (date.toordinal()); ordinal 1 is a Monday,
+# so weekday == (ordinal - 1) % 7. Target days become a 7-entry weekday mask,
+# from which per-weekday offsets to the next/previous target day are derived.
+# These functions mirror calculate_streak, get_target_dates and
+# calculate_habit_strength exactly.
+
+
+def _weekday_mask(target_days: Optional[List[int]]) -> "np.ndarray":
+    """Boolean mask over weekdays (0=Monday); all days if target_days is empty."""
+    mask = np.zeros(7, dtype=bool)
+    if target_days:
+        mask[list(target_days)] = True
+    else:
+        mask[:] = True
+    return mask
+
+
+def _target_offsets(mask: "np.ndarray") -> Tuple["np.ndarray", "np.ndarray"]:
+    """Per-weekday distance to the next and previous target day (1-7), for (..., 7) masks."""
+    steps = np.arange(1, 8)
+    weekdays = np.arange(7)[:, None]
+    next_hits = mask[..., (weekdays + steps) % 7]
+    prev_hits = mask[..., (weekdays - steps) % 7]
+    return next_hits.argmax(axis=-1) + 1, prev_hits.argmax(axis=-1) + 1
+
+
+def _segment_runs(extend: "np.ndarray", restart: "np.ndarray") -> "np.ndarray":
+    """
+    Run length at each position: +1 where extend, back to 1 where restart.
+
+    Positions where neither is set keep the previous run length.
+    """
+    counts = np.cumsum(extend)
+    base = np.maximum.accumulate(np.where(restart, counts, 0))
+    return 1 + counts - base
+
+
+def _max_gap_days(target_days: Optional[List[int]]) -> int:
+    """Days allowed since the last completion for the current streak to count."""
+    return _get_max_gap(target_days) if target_days else 1
+
+
+def calculate_streaks_vectorized(
+    completion_dates: List[date],
+    target_days: Optional[List[int]] = None,
+    today: Optional[date] = None,
+) -> Tuple[int, int]:
+    """
+    NumPy version of calculate_streak.
+
+    Args:
+        completion_dates: List of dates when habit was completed
+        target_days: Optional list of target weekdays (0=Monday, 6=Sunday)
+        today: Reference date for the current streak (defaults to today)
+
+    Returns:
+        Tuple of (current_streak, longest_streak)
+    """
+    if np is None:
+        raise ImportError("NumPy is required for vectorized streaks: pip install numpy")
+    if not completion_dates:
+        return 0, 0
+
+    ordinals = np.sort(np.fromiter((d.toordinal() for d in completion_dates), dtype=np.int64))
+    next_offset, prev_offset = _target_offsets(_weekday_mask(target_days))
+    prev, curr = ordinals[:-1], ordinals[1:]
+
+    expected_next = prev + next_offset[(prev - 1) % 7]
+    extend = np.concatenate(([False], curr == expected_next))
+    restart = np.concatenate(([True], curr > expected_next))
+    longest_streak = int(_segment_runs(extend, restart).max())
+
+    linked = prev == curr - prev_offset[(curr - 1) % 7]
+    unlinked = np.flatnonzero(~linked)
+    tail_run = len(ordinals) - 1 - unlinked[-1] if len(unlinked) else len(ordinals)
+
+    days_since_last = (today or date.today()).toordinal() - int(ordinals[-1])
+    current_streak = int(tail_run) if days_since_last <= _max_gap_days(target_days) else 0
+    return current_streak, longest_streak
+
+
+def count_target_dates_vectorized(
+    target_days: List[List[int]], start_dates: List[date], end_dates: List[date]
+) -> "np.ndarray":
+    """
+    Count target dates in many date ranges at once (see count_target_dates).
+
+    Args:
+        target_days: Target weekdays for each range
+        start_dates: First date of each range
+        end_dates: Last date of each range (inclusive)
+
+    Returns:
+        Array with the number of target dates in each range
+    """
+    if np is None:
+        raise ImportError("NumPy is required for vectorized counts: pip install numpy")
+    masks = np.array([_weekday_mask(days) if days else np.zeros(7, bool) for days in target_days])
+    masks = masks.reshape(len(target_days), 7)
+    starts = np.array([d.toordinal() for d in start_dates], dtype=np.int64)
+    ends = np.array([d.toordinal() for d in end_dates], dtype=np.int64)
+
+    total_days = np.maximum(ends - starts + 1, 0)
+    full_weeks, remainder = np.divmod(total_days, 7)
+    # Prefix sums over two weeks so a partial week starting on any weekday is a slice
+    prefix = np.concatenate(
+        (np.zeros((len(masks), 1), dtype=np.int64), np.cumsum(np.tile(masks, 2), axis=1)), axis=1
+    )
+    rows = np.arange(len(masks))
+    start_weekday = (starts - 1) % 7
+    extra = prefix[rows, start_weekday + remainder] - prefix[rows, start_weekday]
+    return full_weeks * masks.sum(axis=1) + extra
+
+
+def _strength_scores_vectorized(
+    total_completions: "np.ndarray",
+    current_streak: "np.ndarray",
+    longest_streak: "np.ndarray",
+    days_active: "np.ndarray",
+    completion_rate: "np.ndarray",
+    target_counts: "np.ndarray",
+) -> List[float]:
+    """NumPy version of calculate_habit_strength over arrays of habits."""
+    consistency_score = completion_rate * 100
+
+    streak_score = np.select(
+        [current_streak >= 100, current_streak >= 66, current_streak >= 30, current_streak >= 7],
+        [
+            np.full(len(current_streak), 95.0),
+            85 + (current_streak - 66) * 0.3,
+            60 + (current_streak - 30) * 0.8,
+            25 + (current_streak - 7) * 1.4,
+        ],
+        current_streak * 3.5,
+    )
+    duration_score = np.select(
+        [days_active >= 254, days_active >= 66, days_active >= 21],
+        [
+            np.full(len(days_active), 100.0),
+            70 + (days_active - 66) * 0.16,
+            35 + (days_active - 21) * 0.8,
+        ],
+        days_active * 1.67,
+    )
+
+    freq_factor = np.where(target_counts > 0, 7 / np.maximum(target_counts, 1), 1)
+    frequency_score = np.minimum(100, completion_rate * 100 * freq_factor)
+    recovery_score = np.where(
+        longest_streak > 0,
+        np.minimum(100, current_streak / np.maximum(longest_streak, 1) * 100),
+        100,
+    )
+
+    strength = (
+        consistency_score * STRENGTH_WEIGHTS["consistency"]
+        + streak_score * STRENGTH_WEIGHTS["streak"]
+        + duration_score * STRENGTH_WEIGHTS["duration"]
+        + frequency_score * STRENGTH_WEIGHTS["frequency_adherence"]
+        + recovery_score * STRENGTH_WEIGHTS["recovery"]
+    )
+    # Python's round() keeps results identical to calculate_habit_strength
+    return [round(float(value), 1) for value in np.clip(strength, 0, 100)]
+
+
+def _score_habit(habit: Habit, completion_dates: List[date], today: date) -> HabitStats:
+    """Pure Python stats for one habit (fallback for score_habits)."""
+    current_streak, longest_streak = calculate_streak(
+        completion_dates, habit.target_days, today=today
+    )
+    created_date = parse_date(habit.created_at)
+    days_active = (today - created_date).days + 1
+    expected = count_target_dates(habit.target_days, created_date, today)
+    completion_rate = len(completion_dates) / expected if expected > 0 else 0
+    return HabitStats(
+        habit_id=habit.habit_id,
+        total_completions=len(completion_dates),
+        current_streak=current_streak,
+        longest_streak=longest_streak,
+        strength_score=calculate_habit_strength(
+            total_completions=len(completion_dates),
+            current_streak=current_streak,
+            longest_streak=longest_streak,
+            days_active=days_active,
+            completion_rate=completion_rate,
+            target_days=habit.target_days,
+        ),
+        completion_rate=completion_rate,
+        last_completed=max(completion_dates).isoformat() if completion_dates else None,
+        days_active=days_active,
+    )
+
+
+def score_habits(
+    habits: List[Habit],
+    completion_dates: Dict[str, List[date]],
+    today: Optional[date] = None,
+) -> Dict[str, HabitStats]:
+    """
+    Compute stats for many habits at once.
+
+    With NumPy installed all habits are scored in a handful of array
+    operations over the concatenated completion history; otherwise each habit
+    is scored with the scalar functions.
+
+    Args:
+        habits: Habits to score (typically all of a user's habits)
+        completion_dates: Completion dates keyed by habit_id
+        today: Reference date (defaults to today)
+
+    Returns:
+        HabitStats keyed by habit_id
+    """
+    today = today or date.today()
+    if not habits:
+        return {}
+    if np is None:
+        return {
+            h.habit_id: _score_habit(h, completion_dates.get(h.habit_id, []), today) for h in habits
+        }
+
+    count = len(habits)
+    lengths = np.array([len(completion_dates.get(h.habit_id, [])) for h in habits])
+    group = np.repeat(np.arange(count), lengths)
+    ordinals = np.fromiter(
+        (d.toordinal() for h in habits for d in completion_dates.get(h.habit_id, [])),
+        dtype=np.int64,
+        count=int(lengths.sum()),
+    )
+    order = np.lexsort((ordinals, group))
+    ordinals, group = ordinals[order], group[order]
+
+    next_offset, prev_offset = _target_offsets(
+        np.array([_weekday_mask(h.target_days) for h in habits])
+    )
+
+    # Pairwise relations between consecutive completions of the same habit
+    starts = np.concatenate(([True], group[1:] != group[:-1])) if len(group) else group
+    prev, curr = np.roll(ordinals, 1), ordinals
+    expected_next = prev + next_offset[group, (prev - 1) % 7]
+    extend = ~starts & (curr == expected_next)
+    restart = starts | (curr > expected_next)
+    linked = ~starts & (prev == curr - prev_offset[group, (curr - 1) % 7])
+
+    runs = _segment_runs(extend, restart)
+    tails = _segment_runs(linked, ~linked)
+    has_dates = lengths > 0
+    first = np.concatenate(([0], np.cumsum(lengths)[:-1]))
+    last = first + lengths - 1
+
+    longest = np.zeros(count, dtype=np.int64)
+    current = np.zeros(count, dtype=np.int64)
+    last_ordinal = np.zeros(count, dtype=np.int64)
+    if len(ordinals):
+        longest[has_dates] = np.maximum.reduceat(runs, first[has_dates])
+        last_ordinal[has_dates] = ordinals[last[has_dates]]
+        max_gaps = np.array([_max_gap_days(h.target_days) for h in habits])
+        recent = has_dates & (today.toordinal() - last_ordinal <= max_gaps)
+        current[recent] = tails[last[recent]]
+
+    created = [parse_date(h.created_at) for h in habits]
+    days_active = np.array([(today - c).days + 1 for c in created])
+    expected = count_target_dates_vectorized(
+        [h.target_days for h in habits], created, [today] * count
+    )
+    completion_rate = np.where(expected > 0, lengths / np.maximum(expected, 1), 0)
+    target_counts = np.array([len(h.target_days) if h.target_days else 0 for h in habits])
+    strength = _strength_scores_vectorized(
+        lengths, current, longest, days_active, completion_rate, target_counts
+    )
+
+    return {
+        habit.habit_id: HabitStats(
+            habit_id=habit.habit_id,
+            total_completions=int(lengths[i]),
+            current_streak=int(current[i]),
+            longest_streak=int(longest[i]),
+            strength_score=strength[i],
+            completion_rate=(float(lengths[i]) / float(expected[i]) if expected[i] > 0 else 0),
+            last_completed=(
+                date.fromordinal(int(last_ordinal[i])).isoformat() if has_dates[i] else None
+            ),
+            days_active=int(days_active[i]),
+        )
+        for i, habit in enumerate(habits)
+    }
+
+
+# ==============================================================================
+# Habit Log Repository
+# ==============================================================================
+
+# Loaded logs per log file -> (file mtime_ns, HabitLog), shared by every habit
+# tool set and the session prefetcher
+_log_cache: Dict[Path, Tuple[Optional[int], HabitLog]] = {}
+
+
+def _resolve_workspace(backend: Any, workspace_path: Optional[Path]) -> Path:
+    if workspace_path is not None:
+        return Path(workspace_path)
+    return Path(backend.root_dir) if hasattr(backend, "root_dir") else Path("workspace")
+
+
+def get_habit_log_path(user_id: str, habit_id: str) -> str:
+    """Workspace-relative path of a habit's completion log."""
+    return f"habits/{user_id}/entries/{habit_id}/log.json"
+
+
+def _log_mtime(file_path: Path) -> Optional[int]:
+    try:
+        return file_path.stat().st_mtime_ns
+    except OSError:
+        return None
+
+
+def load_user_habits(
+    user_id: str, backend: Any, workspace_path: Optional[Path] = None
+) -> List[Habit]:
+    """
+    Load all habits for a user.
+
+    Args:
+        user_id: User identifier
+        backend: FilesystemBackend instance
+        workspace_path: Workspace directory (defaults to backend.root_dir)
+
+    Returns:
+        List of the user's habits
+    """
+    workspace_path = _resolve_workspace(backend, workspace_path)
+    habits = []
+    habits_dir = workspace_path / "habits" / user_id
+
+    if not habits_dir.exists():
+        return habits
+
+    for habit_file in habits_dir.glob("habit_*.json"):
+        try:
+            if hasattr(backend, "read_file"):
+                content = backend.read_file(f"habits/{user_id}/{habit_file.name}")
+            else:
+                content = habit_file.read_text()
+
+            habit = Habit.from_dict(json.loads(content))
+            if habit.user_id == user_id:
+                habits.append(habit)
+        except Exception:
+            continue
+
+    return habits
+
+
+def save_habit_log(log: HabitLog, backend: Any, workspace_path: Optional[Path] = None) -> None:
+    """
+    Save a habit's completion log and keep it cached.
+
+    Args:
+        log: Completion log to save
+        backend: FilesystemBackend instance
+        workspace_path: Workspace directory (defaults to backend.root_dir)
+    """
+    workspace_path = _resolve_workspace(backend, workspace_path)
+    json_content = json.dumps(log.to_dict())
+    path = get_habit_log_path(log.user_id, log.habit_id)
+    file_path = workspace_path / path
+
+    if hasattr(backend, "write_file"):
+        backend.write_file(path, json_content)
+    else:
+        file_path.parent.mkdir(parents=True, exist_ok=True)
+        file_path.write_text(json_content)
+    _log_cache[file_path] = (_log_mtime(file_path), log)
+
+
+def _load_entries(
+    user_id: str, habit_id: str, backend: Any, workspace_path: Path
+) -> List[HabitEntry]:
+    """Load legacy one-file-per-completion entries for a habit."""
+    entries = []
+    entries_dir = workspace_path / "habits" / user_id / "entries" / habit_id
+
+    if not entries_dir.exists():
+        return entries
+
+    for entry_file in entries_dir.glob("entry_*.json"):
+        try:
+            if hasattr(backend, "read_file"):
+                content = backend.read_file(
+                    f"habits/{user_id}/entries/{habit_id}/{entry_file.name}"
+                )
+            else:
+                content = entry_file.read_text()
+
+            entry = HabitEntry.from_dict(json.loads(content))
+            entries.append(entry)
+        except Exception:
+            continue
+
+    return entries
+
+
+def load_habit_log(habit: Habit, backend: Any, workspace_path: Optional[Path] = None) -> HabitLog:
+    """
+    Load a habit's completion log (cached until the file changes).
+
+    When the habit has no log yet, completions stored as one file per entry
+    are imported into a new log.
+
+    Args:
+        habit: Habit whose log to load
+        backend: FilesystemBackend instance
+        workspace_path: Workspace directory (defaults to backend.root_dir)
+
+    Returns:
+        HabitLog for the habit (empty if nothing has been logged)
+    """
+    workspace_path = _resolve_workspace(backend, workspace_path)
+    path = get_habit_log_path(habit.user_id, habit.habit_id)
+    file_path = workspace_path / path
+    mtime = _log_mtime(file_path)
+    cached = _log_cache.get(file_path)
+    if cached and cached[0] == mtime:
+        log = cached[1]
+    else:
+        log = None
+        try:
+            if hasattr(backend, "read_file"):
+                content = backend.read_file(path)
+            else:
+                content = file_path.read_text() if file_path.exists() else None
+            if content:
+                log = HabitLog.from_dict(json.loads(content))
+        except Exception:
+            log = None
+
+        if log is None:
+            # No log yet: import completions stored as one file per entry
+            log = HabitLog(habit.habit_id, habit.user_id, habit.target_days)
+            entries = _load_entries(habit.user_id, habit.habit_id, backend, workspace_path)
+            for entry in sorted(entries, key=lambda e: e.completion_date):
+                log.append(entry)
+            if entries:
+                save_habit_log(log, backend, workspace_path)
+        _log_cache[file_path] = (_log_mtime(file_path), log)
+
+    if log.target_days != list(habit.target_days):
+        log.recompute(habit.target_days)
+    return log
+
+
+def load_habit_logs(
+    user_id: str, backend: Any, workspace_path: Optional[Path] = None
+) -> List[HabitLog]:
+    """
+    Load (and cache) the completion logs of all of a user's habits.
+
+    Args:
+        user_id: User identifier
+        backend: FilesystemBackend instance
+        workspace_path: Workspace directory (defaults to backend.root_dir)
+
+    Returns:
+        One HabitLog per habit
+    """
+    return [
+        load_habit_log(habit, backend, workspace_path)
+        for habit in load_user_habits(user_id, backend, workspace_path)
+    ]
+
+
+def forget_habit_log(
+    user_id: str, habit_id: str, backend: Any, workspace_path: Optional[Path] = None
+) -> None:
+    """Drop a deleted habit's log from the cache."""
+    workspace_path = _resolve_workspace(backend, workspace_path)
+    _log_cache.pop(workspace_path / get_habit_log_path(user_id, habit_id), None)
+
+
 # ==============================================================================
 # Habit Tools Factory
 # ==============================================================================
@@ -755,82 +1405,32 @@ def create_habit_tools(backend=None):
 
     def _load_all_habits(user_id: str) -> List[Habit]:
         """Load all habits for a user."""
-        habits = []
-        habits_dir = workspace_path / "habits" / user_id
+        return load_user_habits(user_id, backend, workspace_path)
 
-        if not habits_dir.exists():
-            return habits
+    def _save_log(log: HabitLog) -> None:
+        """Save a habit's completion log to file."""
+        save_habit_log(log, backend, workspace_path)
 
-        for habit_file in habits_dir.glob("habit_*.json"):
-            try:
-                if hasattr(backend, "read_file"):
-                    content = backend.read_file(f"habits/{user_id}/{habit_file.name}")
-                else:
-                    content = habit_file.read_text()
-
-                habit = Habit.from_dict(json.loads(content))
-                if habit.user_id == user_id:
-                    habits.append(habit)
-            except Exception:
-                continue
-
-        return habits
-
-    def _save_entry(entry: HabitEntry) -> None:
-        """Save habit entry to file."""
-        json_content = json.dumps(entry.to_dict(), indent=2)
-        path = f"habits/{entry.user_id}/entries/{entry.habit_id}/{entry.entry_id}.json"
-
-        if hasattr(backend, "write_file"):
-            backend.write_file(path, json_content)
-        else:
-            file_path = workspace_path / path
-            file_path.parent.mkdir(parents=True, exist_ok=True)
-            file_path.write_text(json_content)
-
-    def _load_entries(user_id: str, habit_id: str) -> List[HabitEntry]:
-        """Load all entries for a habit."""
-        entries = []
-        entries_dir = workspace_path / "habits" / user_id / "entries" / habit_id
-
-        if not entries_dir.exists():
-            return entries
-
-        for entry_file in entries_dir.glob("entry_*.json"):
-            try:
-                if hasattr(backend, "read_file"):
-                    content = backend.read_file(
-                        f"habits/{user_id}/entries/{habit_id}/{entry_file.name}"
-                    )
-                else:
-                    content = entry_file.read_text()
-
-                entry = HabitEntry.from_dict(json.loads(content))
-                entries.append(entry)
-            except Exception:
-                continue
-
-        return entries
+    def _load_log(habit: Habit) -> HabitLog:
+        """Load a habit's completion log (cached until the file changes)."""
+        return load_habit_log(habit, backend, workspace_path)
 
     def _calculate_habit_stats(habit: Habit) -> HabitStats:
-        """Calculate statistics for a habit."""
-        entries = _load_entries(habit.user_id, habit.habit_id)
+        """Calculate statistics for a habit from its log's aggregates."""
+        log = _load_log(habit)
 
-        total_completions = len(entries)
-        completion_dates = [parse_date(e.completion_date) for e in entries]
+        total_completions = len(log)
 
-        # Calculate streaks
-        current_streak, longest_streak = calculate_streak(completion_dates, habit.target_days)
+        # Streaks are maintained incrementally by the log
+        current_streak = log.current_streak()
+        longest_streak = log.longest_streak
 
         # Calculate days active
         created_date = parse_date(habit.created_at)
         days_active = (date.today() - created_date).days + 1
 
         # Calculate completion rate
-        target_dates = get_target_dates(
-            habit.frequency, habit.target_days, created_date, date.today()
-        )
-        expected_completions = len(target_dates)
+        expected_completions = count_target_dates(habit.target_days, created_date, date.today())
         completion_rate = (
             total_completions / expected_completions if expected_completions > 0 else 0
         )
@@ -845,7 +1445,7 @@ def create_habit_tools(backend=None):
             target_days=habit.target_days,
         )
 
-        last_completed = entries[-1].completion_date if entries else None
+        last_completed = log.last_date.isoformat() if log.last_date else None
 
         return HabitStats(
             habit_id=habit.habit_id,
@@ -1031,7 +1631,7 @@ def create_habit_tools(backend=None):
 
         Returns:
             Confirmation with streak info and milestone celebrations.
-            Saved to habits/{user_id}/entries/{habit_id}/{entry_id}.json
+            Appended to habits/{user_id}/entries/{habit_id}/log.json
 
         Example:
             >>> log_habit_completion(
@@ -1070,10 +1670,9 @@ def create_habit_tools(backend=None):
                 comp_date = date.today()
 
             # Check if already completed for this date
-            existing_entries = _load_entries(user_id, habit_id)
-            for entry in existing_entries:
-                if parse_date(entry.completion_date) == comp_date:
-                    return f"Habit '{habit.name}' already logged for {comp_date}. Use a different date or update existing entry."
+            log = _load_log(habit)
+            if comp_date.isoformat() in log:
+                return f"Habit '{habit.name}' already logged for {comp_date}. Use a different date or update existing entry."
 
             # Create entry
             entry = HabitEntry(
@@ -1086,8 +1685,9 @@ def create_habit_tools(backend=None):
                 difficulty=difficulty,
             )
 
-            # Save entry
-            _save_entry(entry)
+            # Append entry (updates streak aggregates)
+            log.append(entry)
+            _save_log(log)
 
             # Calculate updated stats
             stats = _calculate_habit_stats(habit)
@@ -1140,7 +1740,7 @@ def create_habit_tools(backend=None):
                 lines.append("   Outstanding! This habit is now part of who you are.")
 
             lines.append(
-                f"\n💾 Entry saved to: habits/{user_id}/entries/{habit_id}/{entry.entry_id}.json"
+                f"\n💾 Entry {entry.entry_id} saved to: {get_habit_log_path(user_id, habit_id)}"
             )
 
             return "\n".join(lines)
@@ -1662,10 +2262,11 @@ Alternative: You can still use time-based cues:
                 return f"Error: Habit '{habit_id}' not found for user '{user_id}'"
 
             stats = _calculate_habit_stats(habit)
-            entries = _load_entries(user_id, habit_id)
+            log = _load_log(habit)
+            entries = log.entries()
 
             # Get completion dates
-            completion_dates = [parse_date(e.completion_date) for e in entries]
+            completion_dates = log.completion_dates()
 
             # Format response
             domain_emoji = DOMAIN_COLORS.get(HabitDomain(habit.domain), "⚪")
@@ -1972,6 +2573,7 @@ Alternative: Use update_habit() to archive instead:
                 for entry_file in entries_dir.glob("*.json"):
                     entry_file.unlink()
                 entries_dir.rmdir()
+            forget_habit_log(user_id, habit_id, backend, workspace_path)
 
             return f"✅ Habit '{habit.name}' (ID: {habit_id}) has been permanently deleted."
 
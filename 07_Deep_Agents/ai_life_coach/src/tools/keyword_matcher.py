@@ -0,0 +1,186 @@
+"""
+Multi-pattern keyword matching for AI Life Coach text analysis.
+
+Sentiment analysis (mood and reflection tools) and crisis detection
+(emergency tools) look for dozens of keywords and phrases in user text.
+Checking every keyword with a separate substring search costs
+O(keywords x text). KeywordMatcher compiles all keywords into an
+Aho-Corasick automaton once, then reports every occurrence, with its
+category and severity, in a single pass over the text. The cost of that
+pass does not depend on the number of keywords.
+
+Each keyword has a word-boundary mode:
+- "word": the match must be a whole word or phrase (like regex \\b...\\b)
+- "start": the match must begin a word but may run into a longer one,
+  so "struggle" also matches "struggled"
+- "none": plain substring match
+
+Matching is case-insensitive: keywords and text are lowercased.
+
+Example:
+    >>> matcher = KeywordMatcher.from_keywords({"negative": ["tired", "burned out"]})
+    >>> [m.keyword for m in matcher.find_all("Tired and burned out.")]
+    ['tired', 'burned out']
+"""
+
+from collections import deque
+from typing import Any, Dict, Iterable, List, NamedTuple, Optional, Tuple
+
+BOUNDARY_MODES = ("word", "start", "none")
+
+
+class KeywordMatch(NamedTuple):
+    """One keyword occurrence found by KeywordMatcher."""
+
+    keyword: str
+    category: Any
+    severity: Optional[str]
+    start: int  # Offsets into the lowercased text
+    end: int
+    index: int  # Order in which the keyword was added to the matcher
+
+
+def _is_word_char(ch: str) -> bool:
+    return ch.isalnum() or ch == "_"
+
+
+class KeywordMatcher:
+    """
+    Aho-Corasick automaton over a set of keywords.
+
+    Add keywords with add() (or build with from_keywords()), then call
+    compile() once; find_all() compiles on first use if needed. A compiled
+    matcher is read-only and safe to share between threads.
+    """
+
+    def __init__(self, boundary: str = "word"):
+        if boundary not in BOUNDARY_MODES:
+            raise ValueError(f"boundary must be one of {BOUNDARY_MODES}, got {boundary!r}")
+        self.boundary = boundary
+        # (keyword, lowercased keyword, category, severity, boundary)
+        self._patterns: List[Tuple[str, str, Any, Optional[str], str]] = []
+        # Full transition table: a missing character leads back to the root
+        self._delta: List[Dict[str, int]] = []
+        # Pattern indexes recognised on entering each state (via failure links too)
+        self._output: List[Tuple[int, ...]] = []
+
+    def __len__(self) -> int:
+        return len(self._patterns)
+
+    @property
+    def compiled(self) -> bool:
+        return bool(self._delta)
+
+    def add(
+        self,
+        keyword: str,
+        category: Any,
+        severity: Optional[str] = None,
+        boundary: Optional[str] = None,
+    ) -> None:
+        """
+        Add a keyword.
+
+        The same keyword may be added under several categories; each is
+        reported as its own match.
+
+        Args:
+            keyword: Word or phrase to find
+            category: Category reported with matches (any hashable value)
+            severity: Optional severity reported with matches
+            boundary: Boundary mode, defaults to the matcher's
+        """
+        boundary = boundary or self.boundary
+        if boundary not in BOUNDARY_MODES:
+            raise ValueError(f"boundary must be one of {BOUNDARY_MODES}, got {boundary!r}")
+        if not keyword:
+            raise ValueError("keyword must be a non-empty string")
+        self._patterns.append((keyword, keyword.lower(), category, severity, boundary))
+        self._delta, self._output = [], []
+
+    @classmethod
+    def from_keywords(
+        cls, keywords: Dict[Any, Iterable[str]], boundary: str = "word"
+    ) -> "KeywordMatcher":
+        """Build and compile a matcher from a category -> keywords mapping."""
+        matcher = cls(boundary)
+        for category, words in keywords.items():
+            for word in words:
+                matcher.add(word, category)
+        return matcher.compile()
+
+    def compile(self) -> "KeywordMatcher":
+        """Build the automaton (O(total keyword length x alphabet))."""
+        goto: List[Dict[str, int]] = [{}]
+        output: List[List[int]] = [[]]
+        for index, (_, pattern, _, _, _) in enumerate(self._patterns):
+            state = 0
+            for ch in pattern:
+                nxt = goto[state].get(ch)
+                if nxt is None:
+                    goto.append({})
+                    output.append([])
+                    nxt = len(goto) - 1
+                    goto[state][ch] = nxt
+                state = nxt
+            output[state].append(index)
+
+        # Breadth-first over the trie: failure links, merged outputs and the
+        # full transition table (delta[s][c] = goto or delta[fail[s]][c])
+        fail = [0] * len(goto)
+        delta: List[Dict[str, int]] = [dict(g) for g in goto]
+        queue = deque(goto[0].values())
+        while queue:
+            state = queue.popleft()
+            for ch, target in delta[fail[state]].items():
+                delta[state].setdefault(ch, target)
+            for ch, child in goto[state].items():
+                fail[child] = delta[fail[state]].get(ch, 0) if state else 0
+                output[child] = output[child] + output[fail[child]]
+                queue.append(child)
+
+        self._delta = delta
+        self._output = [tuple(out) for out in output]
+        return self
+
+    def find_all(self, text: str) -> List[KeywordMatch]:
+        """
+        Find every keyword occurrence in text in one pass.
+
+        Overlapping occurrences of different keywords are all reported.
+
+        Args:
+            text: Text to search
+
+        Returns:
+            Matches in the order they end in the text (longer keywords
+            first when several end at the same position)
+        """
+        if not self._delta:
+            self.compile()
+        if not text:
+            return []
+
+        text = text.lower()
+        length = len(text)
+        delta = self._delta
+        output = self._output
+        patterns = self._patterns
+        matches: List[KeywordMatch] = []
+
+        state = 0
+        for position, ch in enumerate(text):
+            state = delta[state].get(ch, 0)
+            if not output[state]:
+                continue
+            end = position + 1
+            for index in output[state]:
+                keyword, pattern, category, severity, boundary = patterns[index]
+                start = end - len(pattern)
+                if boundary != "none":
+                    if start > 0 and _is_word_char(text[start - 1]):
+                        continue
+                    if boundary == "word" and end < length and _is_word_char(text[end]):
+                        continue
+                matches.append(KeywordMatch(keyword, category, severity, start, end, index))
+        return matches
@@ -31,11 +31,11 @@ Tools:
 - get_mood_history: Retrieve historical mood entries
 """
 
-from datetime import datetime, date
+from datetime import datetime, date, timedelta
 from pathlib import Path
 from typing import Any, Dict, List, Optional, Tuple
+import bisect
 import json
-import re
 
 # Import LangChain components
 try:
@@ -48,12 +48,20 @@ except ImportError:
         return func
 
 
+# Optional NumPy for vectorized analytics (pure Python fallback otherwise)
+try:
+    import numpy as np
+except ImportError:
+    np = None  # type: ignore
+
 # Import backend configuration
 import sys
 
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
 from config import get_backend
+from .checkin_tools import load_checkin_history
+from .keyword_matcher import KeywordMatcher
 
 
 # ==============================================================================
@@ -182,6 +190,9 @@ SENTIMENT_KEYWORDS = {
     ],
 }
 
+# Whole-word matcher over SENTIMENT_KEYWORDS, compiled once at import
+SENTIMENT_MATCHER = KeywordMatcher.from_keywords(SENTIMENT_KEYWORDS, boundary="word")
+
 # Mood trigger thresholds
 MOOD_TRIGGERS = {
     "low_mood_threshold": 3,  # Below 3/10 on happiness indicates low mood
@@ -230,24 +241,10 @@ def analyze_sentiment_keywords(text: str) -> Dict[str, Any]:
             "negative_words": [],
         }
 
-    # Convert to lowercase for matching
-    text_lower = text.lower()
-
-    # Find positive matches
-    positive_words = []
-    for word in SENTIMENT_KEYWORDS["positive"]:
-        if word.lower() in text_lower:
-            # Count occurrences
-            count = len(re.findall(r"\b" + re.escape(word.lower()) + r"\b", text_lower))
-            positive_words.extend([word] * count)
-
-    # Find negative matches
-    negative_words = []
-    for word in SENTIMENT_KEYWORDS["negative"]:
-        if word.lower() in text_lower:
-            # Count occurrences
-            count = len(re.findall(r"\b" + re.escape(word.lower()) + r"\b", text_lower))
-            negative_words.extend([word] * count)
+    # Find all keyword occurrences in one pass, listed in keyword order
+    matches = sorted(SENTIMENT_MATCHER.find_all(text), key=lambda m: m.index)
+    positive_words = [m.keyword for m in matches if m.category == "positive"]
+    negative_words = [m.keyword for m in matches if m.category == "negative"]
 
     # Calculate sentiment
     positive_score = len(positive_words)
@@ -419,77 +416,27 @@ def calculate_correlation(
             "interpretation": "Need at least 2 data points for correlation analysis",
         }
 
-    n = len(mood_scores)
-
-    # Calculate means
-    mood_mean = sum(mood_scores) / n
-    progress_mean = sum(progress_scores) / n
-
     # Calculate Pearson correlation coefficient
-    numerator = 0.0
-    for m, p in zip(mood_scores, progress_scores):
-        numerator += (m - mood_mean) * (p - progress_mean)
-
-    mood_variance = 0.0
-    for m in mood_scores:
-        mood_variance += (m - mood_mean) ** 2
-
-    progress_variance = 0.0
-    for p in progress_scores:
-        progress_variance += (p - progress_mean) ** 2
-
-    denominator = (mood_variance * progress_variance) ** 0.5
-
-    if denominator == 0:
-        correlation = 0.0
+    if np is not None:
+        r = _pairwise_pearson(
+            np.asarray(mood_scores, dtype=float)[:, None],
+            np.asarray(progress_scores, dtype=float)[:, None],
+            min_periods=2,
+        )[0, 0]
+        correlation = 0.0 if np.isnan(r) else float(r)
     else:
-        correlation = numerator / denominator
-
-    # Interpret correlation strength
-    abs_corr = abs(correlation)
-    if abs_corr >= 0.7:
-        strength = "strong"
-    elif abs_corr >= 0.4:
-        strength = "moderate"
-    else:
-        strength = "weak"
-
-    # Interpret direction
-    if correlation > 0.3:
-        interpretation = (
-            f"Positive {strength} correlation: Better mood tends to accompany better progress"
-        )
-    elif correlation < -0.3:
-        interpretation = f"Negative {strength} correlation: Higher mood tends to accompany lower progress (may indicate burnout/rushing)"
-    else:
-        interpretation = f"Weak/no correlation: Mood and progress appear independent"
-
-    return {
-        "correlation": round(correlation, 3),
-        "strength": strength,
-        "interpretation": interpretation,
-    }
-
-    n = len(mood_scores)
-
-    # Calculate means
-    mood_mean = sum(mood_scores) / n
-    progress_mean = sum(progress_scores) / n
-
-    # Calculate Pearson correlation coefficient
-    numerator = sum(
-        (m - mood_mean) * (p - progress_mean) for m, p in zip(mood_scores, progress_scores)
-    )
-
-    mood_variance = sum((m - mood_mean) ** 2 for m in mood_scores)
-    progress_variance = sum((p - progress_mean) ** 2 for p in progress_scores)
+        n = len(mood_scores)
+        mood_mean = sum(mood_scores) / n
+        progress_mean = sum(progress_scores) / n
 
-    denominator = (mood_variance * progress_variance) ** 0.5
+        numerator = mood_variance = progress_variance = 0.0
+        for m, p in zip(mood_scores, progress_scores):
+            numerator += (m - mood_mean) * (p - progress_mean)
+            mood_variance += (m - mood_mean) ** 2
+            progress_variance += (p - progress_mean) ** 2
 
-    if denominator == 0:
-        correlation = 0.0
-    else:
-        correlation = numerator / denominator
+        denominator = (mood_variance * progress_variance) ** 0.5
+        correlation = numerator / denominator if denominator else 0.0
 
     # Interpret correlation strength
     abs_corr = abs(correlation)
@@ -624,6 +571,585 @@ def detect_mood_triggers(
     return triggers
 
 
+# The detect_mood_triggers tool in create_mood_tools() shadows this name
+_detect_triggers = detect_mood_triggers
+
+
+# ==============================================================================
+# Mood Time-Series Store
+# ==============================================================================
+
+# Rolling windows (days) maintained on every append
+MOOD_WINDOWS = (7, 30, 90)
+
+# Smoothing factor for the exponentially weighted moving average
+MOOD_EWMA_ALPHA = 0.3
+
+
+class MoodSeries:
+    """
+    Per-user mood time series with rolling aggregates.
+
+    Entries are kept in timestamp order as per-field columns. For each window
+    in MOOD_WINDOWS the series maintains the count, sum and sum of squares of
+    the composite scores dated inside the window, plus an EWMA over all
+    entries, so trend queries are answered without touching the history.
+    Appending an entry older than the latest one (or dated before the current
+    window end) recomputes the aggregates.
+    """
+
+    COLUMNS = ("timestamp", "date", "dimensions", "composite_score", "notes", "sentiment_analysis")
+
+    def __init__(
+        self,
+        user_id: str,
+        columns: Optional[Dict[str, List[Any]]] = None,
+        ewma_alpha: float = MOOD_EWMA_ALPHA,
+    ):
+        self.user_id = user_id
+        self.ewma_alpha = ewma_alpha
+        self.columns: Dict[str, List[Any]] = {name: [] for name in self.COLUMNS}
+        self.ewma: Optional[float] = None
+        self.window_end: Optional[date] = None
+        # days -> [first row inside window, count, sum, sum of squares]
+        self._windows: Dict[int, List[Any]] = {}
+
+        for name, values in (columns or {}).items():
+            if name in self.columns:
+                self.columns[name] = list(values)
+        self.recompute()
+
+    def __len__(self) -> int:
+        return len(self.columns["timestamp"])
+
+    def append(self, entry: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Append a mood entry (as written by log_mood_entry) and update the aggregates.
+
+        Returns:
+            The entry as stored, with derivable fields filled in
+        """
+        row = self._normalize(entry)
+        timestamps = self.columns["timestamp"]
+        in_order = not timestamps or row["timestamp"] >= timestamps[-1]
+
+        if in_order:
+            for name in self.COLUMNS:
+                self.columns[name].append(row[name])
+        else:
+            position = bisect.bisect_right(timestamps, row["timestamp"])
+            for name in self.COLUMNS:
+                self.columns[name].insert(position, row[name])
+
+        if in_order and (self.window_end is None or row["date"] >= self.window_end.isoformat()):
+            self._add(len(self) - 1)
+        else:
+            self.recompute()
+        return {**row, "user_id": self.user_id}
+
+    def _normalize(self, entry: Dict[str, Any]) -> Dict[str, Any]:
+        """Fill in derivable fields of an entry."""
+        row = {name: entry.get(name) for name in self.COLUMNS}
+        row["timestamp"] = row["timestamp"] or datetime.now().isoformat()
+        row["date"] = row["date"] or row["timestamp"][:10]
+        row["dimensions"] = row["dimensions"] or {}
+        if row["composite_score"] is None:
+            row["composite_score"] = calculate_composite_mood_score(row["dimensions"])
+        row["notes"] = row["notes"] or ""
+        row["sentiment_analysis"] = row["sentiment_analysis"] or {}
+        return row
+
+    def _add(self, row: int) -> None:
+        """Fold row (the latest entry) into the aggregates."""
+        score = self.columns["composite_score"][row]
+        if self.ewma is None:
+            self.ewma = score
+        else:
+            self.ewma = self.ewma_alpha * score + (1 - self.ewma_alpha) * self.ewma
+
+        for aggregate in self._windows.values():
+            aggregate[1] += 1
+            aggregate[2] += score
+            aggregate[3] += score * score
+        self._advance(date.fromisoformat(self.columns["date"][row]))
+
+    def _advance(self, window_end: date) -> None:
+        """Slide the windows forward so they end on window_end (never backwards)."""
+        if self.window_end is not None and window_end <= self.window_end:
+            return
+        self.window_end = window_end
+
+        dates = self.columns["date"]
+        scores = self.columns["composite_score"]
+        for days, aggregate in self._windows.items():
+            cutoff = (window_end - timedelta(days=days - 1)).isoformat()
+            start = aggregate[0]
+            while start < len(dates) and dates[start] < cutoff:
+                score = scores[start]
+                aggregate[1] -= 1
+                aggregate[2] -= score
+                aggregate[3] -= score * score
+                start += 1
+            aggregate[0] = start
+
+    def recompute(self) -> None:
+        """Rebuild all aggregates from the stored entries (O(n))."""
+        self.ewma = None
+        self.window_end = None
+        self._windows = {days: [0, 0, 0.0, 0.0] for days in MOOD_WINDOWS}
+        for row in range(len(self)):
+            self._add(row)
+
+    def window(self, days: int, today: Optional[date] = None) -> Dict[str, Any]:
+        """
+        Composite score statistics over the last `days` days.
+
+        Windows in MOOD_WINDOWS are answered from the maintained aggregates;
+        other lengths fall back to a scan of the entries inside the window.
+
+        Args:
+            days: Window length in days (ending today)
+            today: Reference date (defaults to date.today())
+
+        Returns:
+            Dictionary with count, mean and (population) variance; mean and
+            variance are None when the window is empty
+        """
+        today = today or date.today()
+        if days in self._windows and (self.window_end is None or today >= self.window_end):
+            self._advance(today)
+            _, count, total, total_sq = self._windows[days]
+        else:
+            scores = [
+                row["composite_score"] for row in self.since(today - timedelta(days=days - 1))
+            ]
+            count, total, total_sq = len(scores), sum(scores), sum(s * s for s in scores)
+
+        if count <= 0:
+            return {"count": 0, "mean": None, "variance": None}
+        mean = total / count
+        return {"count": count, "mean": mean, "variance": max(total_sq / count - mean * mean, 0.0)}
+
+    def rolling_summary(self, today: Optional[date] = None) -> Dict[str, Any]:
+        """EWMA plus statistics for every window in MOOD_WINDOWS."""
+        return {
+            "ewma": self.ewma,
+            "windows": {days: self.window(days, today) for days in MOOD_WINDOWS},
+        }
+
+    def _row(self, row: int) -> Dict[str, Any]:
+        entry = {name: self.columns[name][row] for name in self.COLUMNS}
+        entry["user_id"] = self.user_id
+        return entry
+
+    def tail(self, n: int) -> List[Dict[str, Any]]:
+        """The n most recent entries, oldest first."""
+        return [self._row(row) for row in range(max(len(self) - n, 0), len(self))]
+
+    def since(self, start: date) -> List[Dict[str, Any]]:
+        """Entries dated on or after start, oldest first."""
+        first = bisect.bisect_left(self.columns["date"], start.isoformat())
+        return [self._row(row) for row in range(first, len(self))]
+
+    def entries(self) -> List[Dict[str, Any]]:
+        """All entries, oldest first."""
+        return [self._row(row) for row in range(len(self))]
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert series to dictionary."""
+        return {"user_id": self.user_id, "columns": self.columns}
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "MoodSeries":
+        """Create series from dictionary."""
+        return cls(user_id=data.get("user_id", ""), columns=data.get("columns"))
+
+
+# Parsed series per file, validated by (mtime_ns, size) of the series file
+_series_cache: Dict[Path, Tuple[Optional[Tuple[int, int]], MoodSeries]] = {}
+
+
+def get_mood_series_path(user_id: str) -> str:
+    """Workspace-relative path of a user's mood series file."""
+    return f"moods/{user_id}/series.jsonl"
+
+
+def _series_signature(file_path: Path) -> Optional[Tuple[int, int]]:
+    try:
+        stat = file_path.stat()
+    except OSError:
+        return None
+    return (stat.st_mtime_ns, stat.st_size)
+
+
+def _resolve_workspace(backend: Any, workspace_path: Optional[Path]) -> Path:
+    if workspace_path is not None:
+        return Path(workspace_path)
+    return Path(backend.root_dir) if hasattr(backend, "root_dir") else Path("workspace")
+
+
+def load_mood_series(
+    user_id: str, backend: Any, workspace_path: Optional[Path] = None
+) -> MoodSeries:
+    """
+    Load a user's mood series (cached until the series file changes).
+
+    The series file holds one JSON entry per line. When it does not exist yet,
+    mood entries stored as individual mood_*.json files are imported into it.
+
+    Args:
+        user_id: User identifier
+        backend: FilesystemBackend instance
+        workspace_path: Workspace directory (defaults to backend.root_dir)
+
+    Returns:
+        MoodSeries for the user (empty if no mood has been logged)
+    """
+    workspace_path = _resolve_workspace(backend, workspace_path)
+    path = get_mood_series_path(user_id)
+    file_path = workspace_path / path
+    signature = _series_signature(file_path)
+
+    cached = _series_cache.get(file_path)
+    if cached and signature is not None and cached[0] == signature:
+        return cached[1]
+
+    series = MoodSeries(user_id)
+    if signature is not None:
+        if hasattr(backend, "read_file"):
+            content = backend.read_file(path)
+        else:
+            content = file_path.read_text()
+        for line in (content or "").splitlines():
+            if line.strip():
+                try:
+                    series.append(json.loads(line))
+                except (ValueError, TypeError):
+                    continue  # Skip a torn or corrupt line
+    else:
+        # No series yet: import entries stored as one file per mood entry
+        legacy = []
+        for legacy_file in (workspace_path / "moods" / user_id).glob("mood_*.json"):
+            try:
+                if hasattr(backend, "read_file"):
+                    content = backend.read_file(f"moods/{user_id}/{legacy_file.name}")
+                else:
+                    content = legacy_file.read_text()
+                legacy.append(json.loads(content))
+            except Exception:
+                continue
+        for entry in sorted(legacy, key=lambda e: e.get("timestamp") or ""):
+            series.append(entry)
+        if legacy:
+            _write_series(series, backend, workspace_path)
+            signature = _series_signature(file_path)
+
+    _series_cache[file_path] = (signature, series)
+    return series
+
+
+def mood_series_version(
+    user_id: str, backend: Any, workspace_path: Optional[Path] = None
+) -> Tuple[Optional[Tuple[int, int]], ...]:
+    """
+    Cheap data version of a user's mood entries.
+
+    Changes when the series file is written or appended to, or when files are
+    added to the user's mood directory (e.g. legacy entries awaiting import).
+
+    Args:
+        user_id: User identifier
+        backend: FilesystemBackend instance
+        workspace_path: Workspace directory (defaults to backend.root_dir)
+
+    Returns:
+        Tuple of (mtime_ns, size) signatures, None for missing paths
+    """
+    workspace_path = _resolve_workspace(backend, workspace_path)
+    return (
+        _series_signature(workspace_path / get_mood_series_path(user_id)),
+        _series_signature(workspace_path / "moods" / user_id),
+    )
+
+
+def _write_series(series: MoodSeries, backend: Any, workspace_path: Path) -> None:
+    """Write a whole series file."""
+    path = get_mood_series_path(series.user_id)
+    content = "".join(json.dumps(entry) + "\n" for entry in series.entries())
+
+    if hasattr(backend, "write_file"):
+        backend.write_file(path, content)
+    else:
+        file_path = workspace_path / path
+        file_path.parent.mkdir(parents=True, exist_ok=True)
+        file_path.write_text(content)
+
+
+def append_mood_entry(
+    entry: Dict[str, Any], backend: Any, workspace_path: Optional[Path] = None
+) -> MoodSeries:
+    """
+    Append a mood entry to the user's series file and cached series.
+
+    On the filesystem the entry is appended as a single line; backends that
+    only expose write_file get the whole series rewritten.
+
+    Args:
+        entry: Mood entry including user_id
+        backend: FilesystemBackend instance
+        workspace_path: Workspace directory (defaults to backend.root_dir)
+
+    Returns:
+        The updated MoodSeries
+    """
+    workspace_path = _resolve_workspace(backend, workspace_path)
+    series = load_mood_series(entry["user_id"], backend, workspace_path)
+    row = series.append(entry)
+
+    file_path = workspace_path / get_mood_series_path(series.user_id)
+    if hasattr(backend, "write_file"):
+        _write_series(series, backend, workspace_path)
+    else:
+        file_path.parent.mkdir(parents=True, exist_ok=True)
+        with open(file_path, "a") as f:
+            f.write(json.dumps(row) + "\n")
+
+    _series_cache[file_path] = (_series_signature(file_path), series)
+    return series
+
+
+# ==============================================================================
+# Vectorized Mood Analytics
+# ==============================================================================
+
+# Check-in score domains included in the daily analytics frame
+PROGRESS_DOMAINS = ("career", "relationship", "finance", "wellness")
+
+
+def _pairwise_pearson(x: "np.ndarray", y: "np.ndarray", min_periods: int = 3) -> "np.ndarray":
+    """
+    Pearson correlation of every column of x with every column of y.
+
+    Missing values (NaN) are excluded pairwise, as in pandas' DataFrame.corr().
+    All pairs are computed together from masked matrix products, so the cost
+    is a handful of (n x k) @ (n x m) products regardless of how many pairs.
+
+    Args:
+        x: Array of shape (n, k)
+        y: Array of shape (n, m), rows aligned with x
+        min_periods: Minimum number of complete pairs for a result
+
+    Returns:
+        Array of shape (k, m); NaN where a pair has too few observations or
+        no variance
+    """
+    x = np.asarray(x, dtype=float)
+    y = np.asarray(y, dtype=float)
+    mask_x = np.isfinite(x)
+    mask_y = np.isfinite(y)
+
+    # Centre each column first to keep the sum-of-squares formulas stable
+    x0 = np.where(mask_x, x, 0.0)
+    y0 = np.where(mask_y, y, 0.0)
+    x0 = np.where(mask_x, x0 - x0.sum(axis=0) / np.maximum(mask_x.sum(axis=0), 1), 0.0)
+    y0 = np.where(mask_y, y0 - y0.sum(axis=0) / np.maximum(mask_y.sum(axis=0), 1), 0.0)
+    fx = mask_x.astype(float)
+    fy = mask_y.astype(float)
+
+    n = fx.T @ fy
+    sum_x = x0.T @ fy
+    sum_y = fx.T @ y0
+    with np.errstate(divide="ignore", invalid="ignore"):
+        cov = x0.T @ y0 - sum_x * sum_y / n
+        var_x = (x0 * x0).T @ fy - sum_x * sum_x / n
+        var_y = fx.T @ (y0 * y0) - sum_y * sum_y / n
+        r = cov / np.sqrt(var_x * var_y)
+
+    degenerate = (n < min_periods) | (var_x <= 1e-12 * n) | (var_y <= 1e-12 * n)
+    r[degenerate] = np.nan
+    return np.clip(r, -1.0, 1.0)
+
+
+def _as_optional(value: float) -> Optional[float]:
+    return None if np.isnan(value) else round(float(value), 3)
+
+
+def correlation_matrix(
+    columns: Dict[str, List[Optional[float]]],
+    min_periods: int = 3,
+) -> Dict[str, Dict[str, Optional[float]]]:
+    """
+    Pairwise Pearson correlations between aligned series.
+
+    Args:
+        columns: Series name -> values (equal lengths; None/NaN for missing)
+        min_periods: Minimum number of complete pairs for a result
+
+    Returns:
+        Nested dictionary matrix[a][b] with correlations rounded to 3
+        decimals (None where undefined)
+    """
+    if np is None:
+        raise ImportError("NumPy is required for correlation matrices: pip install numpy")
+    names = list(columns)
+    if not names:
+        return {}
+    data = np.array([columns[name] for name in names], dtype=float).T
+    r = _pairwise_pearson(data, data, min_periods)
+    return {a: {b: _as_optional(r[i, j]) for j, b in enumerate(names)} for i, a in enumerate(names)}
+
+
+def lagged_correlations(
+    leading: List[Optional[float]],
+    lagging: List[Optional[float]],
+    max_lag: int = 7,
+    min_periods: int = 3,
+) -> Dict[int, Optional[float]]:
+    """
+    Correlation of leading[t] with lagging[t + lag] for lag = 0..max_lag.
+
+    With daily series, a strong correlation at lag 3 means the leading series
+    tends to move three days before the lagging one. All lags are computed
+    together from a matrix of shifted copies of the lagging series.
+
+    Args:
+        leading: Daily values of the series expected to lead (e.g. mood)
+        lagging: Daily values of the series expected to follow (e.g. progress)
+        max_lag: Largest lag in steps
+        min_periods: Minimum number of complete pairs per lag
+
+    Returns:
+        Dictionary lag -> correlation rounded to 3 decimals (None where undefined)
+    """
+    if np is None:
+        raise ImportError("NumPy is required for lagged correlations: pip install numpy")
+    x = np.asarray(leading, dtype=float)
+    y = np.asarray(lagging, dtype=float)
+    if x.shape != y.shape:
+        raise ValueError("leading and lagging series must have the same length")
+
+    lags = np.arange(max_lag + 1)
+    padded = np.concatenate([y, np.full(max_lag, np.nan)])
+    shifted = padded[np.arange(len(y))[:, None] + lags[None, :]]
+    r = _pairwise_pearson(x[:, None], shifted, min_periods)[0]
+    return {int(lag): _as_optional(r[lag]) for lag in lags}
+
+
+def rolling_correlation(
+    x: List[Optional[float]],
+    y: List[Optional[float]],
+    window: int,
+    min_periods: Optional[int] = None,
+) -> List[Optional[float]]:
+    """
+    Pearson correlation of x and y over a sliding window.
+
+    Window sums come from cumulative sums, so the whole series is computed in
+    O(n) regardless of the window length.
+
+    Args:
+        x: First series
+        y: Second series (same length; None/NaN for missing)
+        window: Window length in steps
+        min_periods: Minimum complete pairs per window (defaults to window)
+
+    Returns:
+        Correlation for the window ending at each position (None while the
+        window is incomplete or the correlation is undefined)
+    """
+    if np is None:
+        raise ImportError("NumPy is required for rolling correlations: pip install numpy")
+    x = np.asarray(x, dtype=float)
+    y = np.asarray(y, dtype=float)
+    if x.shape != y.shape:
+        raise ValueError("x and y must have the same length")
+    if window < 2:
+        raise ValueError("window must be at least 2")
+    min_periods = max(min_periods or window, 2)
+    if len(x) < window:
+        return [None] * len(x)
+
+    mask = np.isfinite(x) & np.isfinite(y)
+    if mask.any():
+        x = x - x[mask].mean()
+        y = y - y[mask].mean()
+    x0 = np.where(mask, x, 0.0)
+    y0 = np.where(mask, y, 0.0)
+
+    stacked = np.stack([mask.astype(float), x0, y0, x0 * x0, y0 * y0, x0 * y0])
+    sums = np.cumsum(np.pad(stacked, ((0, 0), (1, 0))), axis=1)
+    n, sx, sy, sxx, syy, sxy = sums[:, window:] - sums[:, :-window]
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        var_x = sxx - sx * sx / n
+        var_y = syy - sy * sy / n
+        r = (sxy - sx * sy / n) / np.sqrt(var_x * var_y)
+    r[(n < min_periods) | (var_x <= 1e-12 * n) | (var_y <= 1e-12 * n)] = np.nan
+    r = np.clip(r, -1.0, 1.0)
+
+    return [None] * (window - 1) + [_as_optional(value) for value in r]
+
+
+def build_daily_mood_frame(
+    mood_entries: List[Dict[str, Any]],
+    checkins: List[Dict[str, Any]],
+) -> Tuple[List[date], Dict[str, List[Optional[float]]]]:
+    """
+    Align mood entries and check-in progress on a daily grid.
+
+    Several mood entries on one day are averaged. Days without data are None,
+    so the columns can be passed straight to the correlation functions.
+
+    Args:
+        mood_entries: Mood entries (as stored by log_mood_entry)
+        checkins: Check-in records with "date" and "scores"
+
+    Returns:
+        Tuple of (days, columns). Columns are "composite", the four mood
+        dimensions, "progress" (overall check-in score) and
+        "progress_<domain>" for each domain in PROGRESS_DOMAINS.
+    """
+    if np is None:
+        raise ImportError("NumPy is required for the daily mood frame: pip install numpy")
+    mood_days = np.array(
+        [date.fromisoformat(m["date"]).toordinal() for m in mood_entries], dtype=np.int64
+    )
+    checkin_days = np.array(
+        [date.fromisoformat(c["date"][:10]).toordinal() for c in checkins], dtype=np.int64
+    )
+    all_days = np.concatenate([mood_days, checkin_days])
+    if not all_days.size:
+        return [], {}
+
+    first = int(all_days.min())
+    length = int(all_days.max()) - first + 1
+
+    def daily_mean(days: "np.ndarray", values: List[float]) -> List[Optional[float]]:
+        counts = np.bincount(days - first, minlength=length)
+        totals = np.bincount(days - first, weights=np.asarray(values, float), minlength=length)
+        with np.errstate(invalid="ignore"):
+            means = totals / counts
+        return [None if np.isnan(v) else float(v) for v in means]
+
+    columns: Dict[str, List[Optional[float]]] = {
+        "composite": daily_mean(mood_days, [m.get("composite_score", 0.5) for m in mood_entries])
+    }
+    for dim in MOOD_DIMENSIONS:
+        columns[dim] = daily_mean(
+            mood_days, [m.get("dimensions", {}).get(dim, 5) for m in mood_entries]
+        )
+    columns["progress"] = daily_mean(
+        checkin_days, [c.get("scores", {}).get("overall", 0.5) for c in checkins]
+    )
+    for domain in PROGRESS_DOMAINS:
+        columns[f"progress_{domain}"] = daily_mean(
+            checkin_days, [c.get("scores", {}).get(domain, 0.5) for c in checkins]
+        )
+
+    days = [date.fromordinal(first + offset) for offset in range(length)]
+    return days, columns
+
+
 # ==============================================================================
 # Mood Tracking Tools Factory
 # ==============================================================================
@@ -698,7 +1224,7 @@ def create_mood_tools(backend=None):
 
         Returns:
             Confirmation message with mood summary and sentiment analysis.
-            Mood saved to moods/{user_id}/mood_{timestamp}.json
+            Mood appended to moods/{user_id}/series.jsonl
 
         Example:
             >>> log_mood_entry("user_123", {
@@ -747,18 +1273,9 @@ def create_mood_tools(backend=None):
                 "sentiment_analysis": sentiment_analysis,
             }
 
-            # Convert to JSON
-            json_content = json.dumps(mood_entry, indent=2)
-
-            # Save mood entry file
-            path = f"moods/{user_id}/mood_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json"
-
-            if hasattr(backend, "write_file"):
-                backend.write_file(path, json_content)
-            else:
-                file_path = workspace_path / path
-                file_path.parent.mkdir(parents=True, exist_ok=True)
-                file_path.write_text(json_content)
+            # Append to the user's mood series
+            append_mood_entry(mood_entry, backend, workspace_path)
+            path = get_mood_series_path(user_id)
 
             # Format response
             lines = [
@@ -926,26 +1443,12 @@ def create_mood_tools(backend=None):
         try:
             # Load mood dimensions if not provided
             if mood_dimensions is None:
-                # Find most recent mood entry
-                moods_dir = workspace_path / "moods" / user_id
-                if not moods_dir.exists():
-                    return f"No mood entries found for user '{user_id}'. Log a mood entry first."
-
-                mood_files = sorted(
-                    moods_dir.glob("mood_*.json"), key=lambda f: f.stat().st_mtime, reverse=True
-                )
-
-                if not mood_files:
+                # Use the most recent mood entry
+                series = load_mood_series(user_id, backend, workspace_path)
+                if not series:
                     return f"No mood entries found for user '{user_id}'. Log a mood entry first."
 
-                if hasattr(backend, "read_file"):
-                    rel_path = f"moods/{user_id}/{mood_files[0].name}"
-                    content = backend.read_file(rel_path)
-                else:
-                    content = mood_files[0].read_text()
-
-                mood_data = json.loads(content)
-                mood_dimensions = mood_data.get("dimensions", {})
+                mood_dimensions = series.tail(1)[0]["dimensions"]
 
             # Validate dimensions
             if not mood_dimensions:
@@ -1030,47 +1533,19 @@ def create_mood_tools(backend=None):
 
         try:
             # Load mood entries
-            moods_dir = workspace_path / "moods" / user_id
+            series = load_mood_series(user_id, backend, workspace_path)
 
-            if not moods_dir.exists():
+            if not series:
                 return f"No mood entries found for user '{user_id}'. Log a mood entry first."
 
-            # Get recent mood files
-            mood_files = sorted(
-                moods_dir.glob("mood_*.json"),
-                key=lambda f: f.stat().st_mtime,
-            )
-
             # Filter to requested days
-            from datetime import timedelta
-
             cutoff_date = date.today() - timedelta(days=days)
-            recent_files = [
-                f
-                for f in mood_files
-                if datetime.fromtimestamp(f.stat().st_mtime).date() >= cutoff_date
-            ]
+            moods = series.since(cutoff_date)[:days]  # Limit to requested number
 
-            if not recent_files:
+            if not moods:
                 return f"No mood entries found in the last {days} days."
 
-            # Load and parse data
-            moods = []
-            dates = []
-
-            for file_path in recent_files[:days]:  # Limit to requested number
-                if hasattr(backend, "read_file"):
-                    rel_path = f"moods/{user_id}/{file_path.name}"
-                    content = backend.read_file(rel_path)
-                else:
-                    content = file_path.read_text()
-
-                mood_data = json.loads(content)
-                moods.append(mood_data)
-
-                # Extract date for label
-                file_date = datetime.fromtimestamp(file_path.stat().st_mtime).date()
-                dates.append(file_day if (file_day := file_date.strftime("%m/%d")) else "")
+            dates = [date.fromisoformat(m["date"]).strftime("%m/%d") for m in moods]
 
             # Format response
             lines = [
@@ -1094,6 +1569,17 @@ def create_mood_tools(backend=None):
                 lines.append(f"\n{MOOD_DIMENSIONS[dim]['name']}:")
                 lines.append(generate_ascii_chart(dimension_scores, labels))
 
+            # Rolling averages from the maintained window aggregates
+            summary = series.rolling_summary()
+            lines.append("\n📐 Rolling Averages (composite):")
+            for window_days, stats in summary["windows"].items():
+                if stats["count"]:
+                    lines.append(
+                        f"   {window_days}-day: {stats['mean'] * 100:.0f}% "
+                        f"(±{stats['variance'] ** 0.5 * 100:.0f}, {stats['count']} entries)"
+                    )
+            lines.append(f"   EWMA: {summary['ewma'] * 100:.0f}%")
+
             return "\n".join(lines)
 
         except Exception as e:
@@ -1129,67 +1615,39 @@ def create_mood_tools(backend=None):
 
         try:
             # Load mood entries
-            moods_dir = workspace_path / "moods" / user_id
+            series = load_mood_series(user_id, backend, workspace_path)
 
-            if not moods_dir.exists():
+            if not series:
                 return f"No mood entries found for user '{user_id}'. Log a mood entry first."
 
             # Load check-in data
-            checkins_dir = workspace_path / "checkins" / user_id
+            history = load_checkin_history(user_id, backend, workspace_path)
 
-            if not checkins_dir.exists():
+            if not len(history):
                 return f"No check-in entries found for user '{user_id}'. Need both mood and check-in data."
 
             # Get recent entries
-            from datetime import timedelta
-
             cutoff_date = date.today() - timedelta(days=days)
 
-            # Load moods
-            mood_files = sorted(
-                (
-                    f
-                    for f in moods_dir.glob("mood_*.json")
-                    if datetime.fromtimestamp(f.stat().st_mtime).date() >= cutoff_date
-                ),
-                key=lambda f: f.stat().st_mtime,
-            )
-
             # Load check-ins (they're weekly, so fewer)
-            checkin_files = sorted(
-                (
-                    f
-                    for f in checkins_dir.glob("week_*_checkin.json")
-                    if datetime.fromisoformat(f.stem.split("_")[0]).date() >= cutoff_date
-                    if f.stem != "week"
-                ),  # Skip invalid names
-                key=lambda f: int(f.stem.split("_")[1]),
-            )
+            checkins = []
+            for c in history.recent(len(history)):
+                c = dict(c)
+                c.setdefault("date", date.today().isoformat())
+                if date.fromisoformat(c["date"][:10]) >= cutoff_date:
+                    checkins.append(c)
+            checkins.sort(key=lambda c: c["date"])
 
             # Parse data
+            mood_entries = series.since(cutoff_date)
             mood_data = {}
-            for file_path in mood_files:
-                if hasattr(backend, "read_file"):
-                    rel_path = f"moods/{user_id}/{file_path.name}"
-                    content = backend.read_file(rel_path)
-                else:
-                    content = file_path.read_text()
-
-                m = json.loads(content)
+            for m in mood_entries:
                 entry_date = datetime.fromisoformat(m["timestamp"]).date()
                 mood_data[entry_date] = m.get("composite_score", 0.5)
 
             checkin_data = {}
-            for file_path in checkin_files:
-                if hasattr(backend, "read_file"):
-                    content = backend.read_file(f"checkins/{user_id}/{file_path.name}")
-                else:
-                    content = file_path.read_text()
-
-                c = json.loads(content)
-                entry_date = (
-                    datetime.fromisoformat(c["date"]).date() if "date" in c else date.today()
-                )
+            for c in checkins:
+                entry_date = date.fromisoformat(c["date"][:10])
                 checkin_data[entry_date] = c.get("scores", {}).get("overall", 0.5)
 
             # Align data by date
@@ -1228,6 +1686,36 @@ def create_mood_tools(backend=None):
                 progress_pct = aligned_progress[i] * 100
                 lines.append(f"   Day {i + 1}: Mood {mood_pct:.0f}%, Progress {progress_pct:.0f}%")
 
+            # Per-dimension, per-domain and lagged correlations on the daily grid
+            if np is not None:
+                _, frame = build_daily_mood_frame(mood_entries, checkins)
+                matrix = correlation_matrix(frame)
+                mood_columns = ["composite", *MOOD_DIMENSIONS]
+                progress_columns = ["progress"] + [f"progress_{d}" for d in PROGRESS_DOMAINS]
+
+                lines.append("\n🧭 Mood Dimensions vs Progress:")
+                lines.append(
+                    "   "
+                    + " " * 12
+                    + "".join(f"{c.replace('progress_', '')[:8]:>9}" for c in progress_columns)
+                )
+                for mood_column in mood_columns:
+                    cells = "".join(
+                        f"{'n/a' if r is None else f'{r:+.2f}':>9}"
+                        for r in (matrix[mood_column][c] for c in progress_columns)
+                    )
+                    lines.append(f"   {mood_column[:12]:<12}{cells}")
+
+                lagged = lagged_correlations(frame["composite"], frame["progress"], max_lag=7)
+                defined = {lag: r for lag, r in lagged.items() if r is not None}
+                if defined:
+                    best_lag = max(defined, key=lambda lag: abs(defined[lag]))
+                    lines.append("\n⏱️  Lagged Correlation (mood leading progress):")
+                    lines.append(
+                        f"   Strongest at {best_lag} day(s): {defined[best_lag]:+.2f}"
+                        f" (same day: {'n/a' if lagged[0] is None else f'{lagged[0]:+.2f}'})"
+                    )
+
             # Provide recommendations based on correlation
             lines.append(f"\n🎯 Recommendations:")
 
@@ -1284,45 +1772,20 @@ def create_mood_tools(backend=None):
             return "Error: user_id must be a non-empty string"
 
         try:
-            # Load mood entries
-            moods_dir = workspace_path / "moods" / user_id
-
-            if not moods_dir.exists():
-                return f"No mood entries found for user '{user_id}'. Log a mood entry first."
-
-            # Get recent mood files
-            mood_files = sorted(
-                moods_dir.glob("mood_*.json"),
-                key=lambda f: f.stat().st_mtime,
-            )
-
-            if not mood_files:
-                return f"No mood entries found for user '{user_id}'. Log a mood entry first."
-
             # Load recent moods (last 10 entries)
-            recent_files = mood_files[-min(10, len(mood_files)) :]
+            series = load_mood_series(user_id, backend, workspace_path)
 
-            # Parse data
-            moods = []
-            for file_path in recent_files:
-                if hasattr(backend, "read_file"):
-                    rel_path = f"moods/{user_id}/{file_path.name}"
-                    content = backend.read_file(rel_path)
-                else:
-                    content = file_path.read_text()
+            if not series:
+                return f"No mood entries found for user '{user_id}'. Log a mood entry first."
 
-                mood_data = json.loads(content)
-                moods.append(mood_data)
+            moods = series.tail(10)
 
             # Get current and historical mood
-            if not moods:
-                return "No mood data available"
-
             current_mood = moods[-1].get("dimensions", {})
-            historical_moods = moods[:-1]
+            historical_moods = [m.get("dimensions", {}) for m in moods[:-1]]
 
             # Detect triggers
-            triggers = detect_mood_triggers(current_mood, historical_moods)
+            triggers = _detect_triggers(current_mood, historical_moods)
 
             # Format response
             lines = [
@@ -1413,45 +1876,26 @@ def create_mood_tools(backend=None):
 
         try:
             # Load mood entries
-            moods_dir = workspace_path / "moods" / user_id
+            series = load_mood_series(user_id, backend, workspace_path)
 
-            if not moods_dir.exists():
+            if not series:
                 return f"No mood entries found for user '{user_id}'. Log a mood entry first."
 
-            # Get recent mood files
-            from datetime import timedelta
-
             cutoff_date = date.today() - timedelta(days=days)
+            moods = series.since(cutoff_date)
 
-            mood_files = sorted(
-                (
-                    f
-                    for f in moods_dir.glob("mood_*.json")
-                    if datetime.fromtimestamp(f.stat().st_mtime).date() >= cutoff_date
-                ),
-                key=lambda f: f.stat().st_mtime,
-            )
-
-            if not mood_files:
+            if not moods:
                 return f"No mood entries found in the last {days} days."
 
             # Format response
             lines = [
                 f"Mood History for {user_id}",
                 "=" * 60,
-                f"\nShowing {len(mood_files)} entries over the last {days} days",
+                f"\nShowing {len(moods)} entries over the last {days} days",
             ]
 
-            # Load and display each entry
-            for file_path in mood_files:
-                if hasattr(backend, "read_file"):
-                    rel_path = f"moods/{user_id}/{file_path.name}"
-                    content = backend.read_file(rel_path)
-                else:
-                    content = file_path.read_text()
-
-                mood_data = json.loads(content)
-
+            # Display each entry
+            for mood_data in moods:
                 lines.append(
                     f"\n📅 {mood_data.get('date', 'N/A')} ({datetime.fromisoformat(mood_data['timestamp']).strftime('%H:%M')})"
                 )
@@ -1484,19 +1928,8 @@ def create_mood_tools(backend=None):
                     lines.append(f'   Notes: "{snippet}"')
 
             # Calculate averages
-            all_composites = []
-            for file_path in mood_files:
-                if hasattr(backend, "read_file"):
-                    content = backend.read_file(f"moods/{user_id}/{file_path.name}")
-                else:
-                    content = file_path.read_text()
-
-                mood_data = json.loads(content)
-                all_composites.append(mood_data.get("composite_score", 0.5))
-
-            if all_composites:
-                avg_composite = sum(all_composites) / len(all_composites)
-                lines.append(f"\n📊 Average Composite Score: {avg_composite * 100:.0f}%")
+            avg_composite = series.window(days + 1)["mean"]
+            lines.append(f"\n📊 Average Composite Score: {avg_composite * 100:.0f}%")
 
             return "\n".join(lines)
 
@@ -50,6 +50,7 @@ import sys
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
 from config import get_backend
+from .keyword_matcher import KeywordMatcher
 
 
 # ==============================================================================
@@ -536,26 +537,10 @@ def trigger_setback_prompts(
     return customized
 
 
-def analyze_reflection_sentiment(reflection_text: str) -> Dict[str, Any]:
-    """
-    Analyze sentiment and emotional content of a reflection response.
-
-    Uses keyword-based analysis similar to mood_tools.py but adapted
-    for reflection content (growth-oriented, introspective language).
-
-    Args:
-        reflection_text: Text of the reflection response
-
-    Returns:
-        Dictionary with sentiment analysis results
-    """
-    if not reflection_text or not isinstance(reflection_text, str):
-        return {"sentiment": "neutral", "confidence": 0.0, "key_emotions": []}
-
-    text_lower = reflection_text.lower()
-
+# Reflection sentiment indicators by category
+REFLECTION_SENTIMENT_KEYWORDS = {
     # Growth and learning indicators
-    growth_keywords = [
+    "growth": [
         "learned",
         "grew",
         "growth",
@@ -569,10 +554,9 @@ def analyze_reflection_sentiment(reflection_text: str) -> Dict[str, Any]:
         "shifted",
         "changed",
         "transformed",
-    ]
-
+    ],
     # Positive achievement indicators
-    positive_keywords = [
+    "positive": [
         "proud",
         "accomplished",
         "succeeded",
@@ -583,10 +567,9 @@ def analyze_reflection_sentiment(reflection_text: str) -> Dict[str, Any]:
         "confident",
         "grateful",
         "joy",
-    ]
-
+    ],
     # Challenge and difficulty indicators
-    challenge_keywords = [
+    "challenge": [
         "difficult",
         "hard",
         "challenging",
@@ -597,12 +580,34 @@ def analyze_reflection_sentiment(reflection_text: str) -> Dict[str, Any]:
         "mistake",
         "overwhelmed",
         "discouraged",
-    ]
+    ],
+}
+
+# Matches must start a word so inflections count ("struggled" for "struggle")
+REFLECTION_MATCHER = KeywordMatcher.from_keywords(REFLECTION_SENTIMENT_KEYWORDS, boundary="start")
+
+
+def analyze_reflection_sentiment(reflection_text: str) -> Dict[str, Any]:
+    """
+    Analyze sentiment and emotional content of a reflection response.
+
+    Uses keyword-based analysis similar to mood_tools.py but adapted
+    for reflection content (growth-oriented, introspective language).
+
+    Args:
+        reflection_text: Text of the reflection response
+
+    Returns:
+        Dictionary with sentiment analysis results
+    """
+    if not reflection_text or not isinstance(reflection_text, str):
+        return {"sentiment": "neutral", "confidence": 0.0, "key_emotions": []}
 
-    # Growth-oriented indicators
-    growth_count = sum(1 for kw in growth_keywords if kw in text_lower)
-    positive_count = sum(1 for kw in positive_keywords if kw in text_lower)
-    challenge_count = sum(1 for kw in challenge_keywords if kw in text_lower)
+    # Count distinct indicators of each category in one pass over the text
+    found = {(m.category, m.keyword) for m in REFLECTION_MATCHER.find_all(reflection_text)}
+    growth_count = sum(1 for category, _ in found if category == "growth")
+    positive_count = sum(1 for category, _ in found if category == "positive")
+    challenge_count = sum(1 for category, _ in found if category == "challenge")
 
     # Determine overall sentiment
     total_indicators = growth_count + positive_count + challenge_count
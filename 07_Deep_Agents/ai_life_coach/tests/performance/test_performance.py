@@ -7,8 +7,17 @@ This module provides comprehensive performance tests to:
 3. Ensure performance targets are met
 """
 
+import asyncio
+import concurrent.futures
+import contextvars
+import json
+import random
+import tempfile
+import threading
 import time
 import unittest
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
 from typing import Any, Dict, List
 import sys
 import os
@@ -27,6 +36,28 @@ from performance import (
     OptimizedMemoryManager,
     create_optimized_memory_manager,
     ToolInvocationOptimizer,
+    BatchToolInvoker,
+    PerformanceProfiler,
+    StreamingHistogram,
+    ParallelExecutor,
+    LatencyTracker,
+    AsyncTaskExecutor,
+    AsyncToolExecutor,
+    get_parallel_executor,
+    fan_out_specialists,
+    ToolPerformanceTracker,
+    InMemorySpanExporter,
+    OTLPJsonFileExporter,
+    get_tracer,
+    reset_tracer,
+    ScriptedChatModel,
+    run_hotspot_profile,
+    AdaptiveCacheTuner,
+    PrefetchManager,
+    TimedCache,
+    benchmark_memory_models,
+    benchmark_keyword_matching,
+    benchmark_goal_graph,
 )
 
 
@@ -194,6 +225,276 @@ class TestProfiler(unittest.TestCase):
         self.assertIn("test_op", report)
 
 
+class TestHistogramProfiler(unittest.TestCase):
+    """Test the constant-memory, sampled profiling mode."""
+
+    def test_histogram_percentiles_are_accurate(self):
+        """Test that histogram percentiles stay within bucket precision."""
+        histogram = StreamingHistogram()
+        values = [i / 10000 for i in range(1, 10001)]  # 0.1ms .. 1s
+        for value in values:
+            histogram.record(value)
+
+        for pct, exact in [(50, 0.5), (95, 0.95), (99, 0.99)]:
+            self.assertAlmostEqual(histogram.percentile(pct), exact, delta=exact * 0.04)
+        self.assertEqual(histogram.count, 10000)
+        self.assertAlmostEqual(histogram.max, 1.0)
+
+    def test_histogram_memory_is_fixed(self):
+        """Test that recording does not grow the bucket array."""
+        histogram = StreamingHistogram()
+        size = len(histogram._counts)
+        for i in range(50000):
+            histogram.record(i * 1e-5)
+        histogram.record(10_000.0)  # Beyond max tracked value: clamped
+
+        self.assertEqual(len(histogram._counts), size)
+        self.assertEqual(histogram.count, 50001)
+
+    def test_histogram_mode_summary(self):
+        """Test that histogram mode reports counts and percentiles without lists."""
+        profiler = PerformanceProfiler(use_histograms=True)
+        for _ in range(20):
+            profiler.record_timing("tool.fast", 0.001)
+        profiler.record_timing("tool.fast", 0.1)
+
+        summary = profiler.get_summary()["tool.fast"]
+        self.assertEqual(summary["count"], 21)
+        self.assertAlmostEqual(summary["p50_time"], 0.001, delta=0.0001)
+        self.assertAlmostEqual(summary["p99_time"], 0.1, delta=0.004)
+        self.assertEqual(profiler.metrics, {})
+        self.assertIn("tool.fast", profiler.generate_report())
+
+    def test_sampling_keeps_exact_counts(self):
+        """Test that sampling times a fraction of calls but counts all of them."""
+        random.seed(1234)
+        profiler = PerformanceProfiler(use_histograms=True, sample_rate=0.2)
+        for _ in range(1000):
+            with profiler.profile_section("tool.sampled"):
+                pass
+
+        timed = profiler.histograms["tool.sampled"].count
+        self.assertEqual(profiler.get_summary()["tool.sampled"]["count"], 1000)
+        self.assertGreater(timed, 100)
+        self.assertLess(timed, 300)
+
+    def test_configure_switches_backend(self):
+        """Test that configure() switches to histograms in place."""
+        profiler = PerformanceProfiler()
+        profiler.record_timing("section", 0.01)
+        profiler.configure(use_histograms=True, sample_rate=0.5)
+
+        self.assertTrue(profiler.use_histograms)
+        self.assertEqual(profiler.sample_rate, 0.5)
+        self.assertEqual(profiler.get_summary(), {})
+
+
+class TestSpanTracing(unittest.TestCase):
+    """Test nested span export from profiled sections."""
+
+    def setUp(self):
+        reset_profiler()
+        reset_tracer()
+        self.exporter = InMemorySpanExporter()
+        get_tracer().add_exporter(self.exporter)
+
+    def tearDown(self):
+        reset_tracer()
+
+    def test_nested_sections_link_parent_and_child(self):
+        """Test coordinator -> specialist -> tool -> memory nesting."""
+        tracker = ToolPerformanceTracker()
+
+        def load_profile():
+            with profile("memory.get_profile"):
+                return {"name": "Alex"}
+
+        tool = tracker.wrap_tool(load_profile, "load_profile")
+
+        with profile("coordinator.turn", {"user.id": "user_1"}):
+            with profile("specialist.career"):
+                tool()
+
+        spans = {span.name: span for span in self.exporter.get_finished_spans()}
+        self.assertEqual(
+            set(spans),
+            {"coordinator.turn", "specialist.career", "tool.load_profile", "memory.get_profile"},
+        )
+        root = spans["coordinator.turn"]
+        self.assertIsNone(root.parent_span_id)
+        self.assertEqual(spans["specialist.career"].parent_span_id, root.span_id)
+        self.assertEqual(
+            spans["tool.load_profile"].parent_span_id, spans["specialist.career"].span_id
+        )
+        self.assertEqual(
+            spans["memory.get_profile"].parent_span_id, spans["tool.load_profile"].span_id
+        )
+        self.assertEqual(len({span.trace_id for span in spans.values()}), 1)
+        self.assertEqual(root.attributes["user.id"], "user_1")
+        self.assertEqual(spans["tool.load_profile"].attributes["tool.name"], "load_profile")
+        self.assertEqual(spans["memory.get_profile"].attributes["component"], "memory")
+
+    def test_errors_mark_span_status(self):
+        """Test that an exception sets the error status and still exports."""
+        with self.assertRaises(ValueError):
+            with profile("tool.broken"):
+                raise ValueError("bad input")
+
+        (span,) = self.exporter.get_finished_spans()
+        self.assertEqual(span.status_code, 2)
+        self.assertEqual(span.attributes["exception.type"], "ValueError")
+
+    def test_parallel_specialists_inherit_parent(self):
+        """Test that spans started on worker threads nest under the caller."""
+
+        def specialist(**context):
+            with profile("tool.lookup"):
+                return context["user_id"]
+
+        with profile("coordinator.turn"):
+            results = fan_out_specialists(
+                {"career": specialist, "wellness": specialist}, {"user_id": "u1"}, budget=5.0
+            )
+
+        self.assertTrue(all(r.success for r in results.values()))
+        spans = self.exporter.get_finished_spans()
+        root = next(span for span in spans if span.name == "coordinator.turn")
+        specialists = [span for span in spans if span.name.startswith("specialist.")]
+        self.assertEqual(len(specialists), 2)
+        for span in specialists:
+            self.assertEqual(span.parent_span_id, root.span_id)
+        specialist_ids = {span.span_id for span in specialists}
+        for span in spans:
+            if span.name == "tool.lookup":
+                self.assertIn(span.parent_span_id, specialist_ids)
+
+    def test_otlp_json_file_export(self):
+        """Test that a trace is written as one OTLP/JSON line."""
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, "spans.jsonl")
+            get_tracer().add_exporter(OTLPJsonFileExporter(path))
+
+            with profile("coordinator.turn", {"specialists.count": 2}):
+                with profile("tool.summarize"):
+                    pass
+
+            with open(path) as f:
+                lines = f.readlines()
+
+        self.assertEqual(len(lines), 1)
+        payload = json.loads(lines[0])
+        scope_spans = payload["resourceSpans"][0]["scopeSpans"][0]
+        spans = {span["name"]: span for span in scope_spans["spans"]}
+        self.assertEqual(len(spans["coordinator.turn"]["traceId"]), 32)
+        self.assertEqual(len(spans["tool.summarize"]["spanId"]), 16)
+        self.assertEqual(
+            spans["tool.summarize"]["parentSpanId"], spans["coordinator.turn"]["spanId"]
+        )
+        self.assertIn(
+            {"key": "specialists.count", "value": {"intValue": "2"}},
+            spans["coordinator.turn"]["attributes"],
+        )
+
+    def test_disabled_tracer_records_nothing(self):
+        """Test that profiling works unchanged without exporters."""
+        reset_tracer()
+        with profile("tool.untraced"):
+            pass
+
+        self.assertEqual(self.exporter.get_finished_spans(), [])
+        self.assertEqual(get_profiler().call_counts["tool.untraced"], 1)
+
+
+class TestHotspotProfiler(unittest.TestCase):
+    """Test the scripted-session hotspot profiler."""
+
+    def setUp(self):
+        def slow_tool(user_id: str) -> str:
+            deadline = time.perf_counter() + 0.05
+            while time.perf_counter() < deadline:
+                pass
+            return f"done for {user_id}"
+
+        def allocating_tool(size: int) -> str:
+            data = [str(i) for i in range(size)]
+            return f"{len(data)} items"
+
+        def broken_tool() -> str:
+            raise RuntimeError("boom")
+
+        self.tools = {
+            "slow_tool": slow_tool,
+            "allocating_tool": allocating_tool,
+            "broken_tool": broken_tool,
+        }
+        self.scenario = [
+            {
+                "user": "hello",
+                "tool_calls": [
+                    ("slow_tool", {"user_id": "u1"}),
+                    ("allocating_tool", {"size": 5000}),
+                ],
+                "response": "hi",
+            },
+            {
+                "user": "again",
+                "tool_calls": [("broken_tool", {}), ("not_a_tool", {})],
+                "response": "sorry",
+            },
+        ]
+
+    def test_scripted_model_replays_turns(self):
+        """Test that the scripted model emits tool calls then the reply."""
+        model = ScriptedChatModel(self.scenario)
+        first = model.invoke([])
+        self.assertEqual([c["name"] for c in first["tool_calls"]], ["slow_tool", "allocating_tool"])
+        self.assertEqual(model.invoke([])["content"], "hi")
+        self.assertEqual(len(model.invoke([])["tool_calls"]), 2)
+        self.assertEqual(model.invoke([])["content"], "sorry")
+
+    def test_ranks_tools_by_time_and_allocations(self):
+        """Test per-tool time/allocation ranking and error accounting."""
+        report = run_hotspot_profile(self.scenario, tools=self.tools, iterations=2)
+
+        self.assertEqual(report.ranked_tools()[0].name, "slow_tool")
+        self.assertEqual(report.ranked_tools(by="total_alloc_bytes")[0].name, "allocating_tool")
+        self.assertEqual(report.tool_stats["slow_tool"].calls, 2)
+        self.assertEqual(report.tool_stats["broken_tool"].errors, 2)
+        self.assertEqual(report.missing_tools, ["not_a_tool"])
+        self.assertIn("slow_tool", report.format_table())
+
+    def test_default_scenario_writes_only_to_its_workspace(self):
+        """Test that the offline tools resolve files inside the scratch workspace."""
+        with tempfile.TemporaryDirectory() as cwd, tempfile.TemporaryDirectory() as workspace:
+            previous = os.getcwd()
+            os.chdir(cwd)
+            try:
+                report = run_hotspot_profile(workspace=workspace, trace_allocations=False)
+            finally:
+                os.chdir(previous)
+
+            self.assertEqual(os.listdir(cwd), [])
+            self.assertTrue(os.path.isdir(os.path.join(workspace, "habits", "hotspot_user")))
+        self.assertGreater(len(report.tool_stats), 0)
+
+    def test_collapsed_stacks_for_flame_graphs(self):
+        """Test that sampled stacks are written in collapsed format."""
+        report = run_hotspot_profile(
+            self.scenario, tools=self.tools, iterations=3, trace_allocations=False
+        )
+        self.assertGreater(sum(report.stack_counts.values()), 0)
+        self.assertTrue(any("slow_tool" in stack for stack in report.stack_counts))
+
+        with tempfile.TemporaryDirectory() as tmp:
+            paths = report.save(tmp)
+            with open(paths["collapsed"]) as f:
+                lines = f.read().splitlines()
+        for line in lines:
+            stack, count = line.rsplit(" ", 1)
+            self.assertIn(":", stack)
+            self.assertGreater(int(count), 0)
+
+
 class TestParallelExecution(unittest.TestCase):
     """Test parallel execution utilities."""
 
@@ -234,6 +535,310 @@ class TestParallelExecution(unittest.TestCase):
         self.assertEqual(results["finance"]["domain"], "finance")
 
 
+class TestPersistentExecutor(unittest.TestCase):
+    """Test the long-lived worker pool behind ParallelExecutor."""
+
+    def setUp(self):
+        self.executor = ParallelExecutor(max_workers=2)
+
+    def tearDown(self):
+        self.executor.shutdown()
+
+    def test_pool_is_reused_across_calls(self):
+        """Test that the pool is created lazily and shared by later calls."""
+        self.assertIsNone(self.executor._pool)
+
+        self.executor.execute_map(abs, [-1, -2])
+        pool = self.executor._pool
+        self.executor.execute_map(abs, [-3, -4])
+
+        self.assertIsNotNone(pool)
+        self.assertIs(self.executor._pool, pool)
+
+    def test_shutdown_allows_restart(self):
+        """Test that a shut down executor creates a fresh pool on next use."""
+        self.executor.execute_map(abs, [-1])
+        self.executor.shutdown()
+        self.assertIsNone(self.executor._pool)
+
+        results = self.executor.execute_map(abs, [-5])
+        self.assertEqual(results[0].result, 5)
+
+    def test_results_match_task_order(self):
+        """Test that results are ordered like tasks, not by completion."""
+
+        def delayed(x):
+            time.sleep(0.02 * (4 - x))
+            return x
+
+        results = self.executor.execute_map(delayed, [0, 1, 2, 3])
+        self.assertEqual([r.result for r in results], [0, 1, 2, 3])
+
+    def test_queue_and_run_time_are_separated(self):
+        """Test that waiting for a worker is reported separately from run time."""
+
+        def sleeper(_):
+            time.sleep(0.05)
+
+        # Four tasks on two workers: the last two must queue for ~50ms
+        results = self.executor.execute_map(sleeper, range(4))
+
+        for result in results:
+            self.assertGreaterEqual(result.run_time, 0.04)
+            self.assertAlmostEqual(
+                result.execution_time, result.queue_time + result.run_time, places=6
+            )
+        self.assertGreaterEqual(max(r.queue_time for r in results), 0.04)
+
+    def test_nested_call_runs_inline(self):
+        """Test that a task fanning out on its own executor does not deadlock."""
+        executor = self.executor
+
+        def outer(x):
+            return [r.result for r in executor.execute_map(abs, [-x, -x])]
+
+        results = executor.execute_map(outer, [1, 2], timeout=5)
+        self.assertEqual([r.result for r in results], [[1, 1], [2, 2]])
+
+    def test_shared_executor_per_configuration(self):
+        """Test that convenience helpers share one executor per configuration."""
+        self.assertIs(get_parallel_executor(3), get_parallel_executor(3))
+        self.assertIsNot(get_parallel_executor(3), get_parallel_executor(5))
+
+
+class TestDeadlineFanOut(unittest.TestCase):
+    """Test budgeted, hedged specialist fan-out."""
+
+    def setUp(self):
+        self.executor = ParallelExecutor(max_workers=4)
+        self.tracker = LatencyTracker(min_samples=3)
+
+    def tearDown(self):
+        self.executor.shutdown(wait=False)
+
+    def test_returns_finished_specialists_and_marks_timeouts(self):
+        """Test that a budget overrun keeps finished results instead of raising."""
+
+        def fast(**ctx):
+            return "fast"
+
+        def slow(**ctx):
+            time.sleep(0.5)
+            return "slow"
+
+        start = time.perf_counter()
+        results = self.executor.execute_with_budget(
+            {"career": (fast, (), {}), "finance": (slow, (), {})},
+            budget=0.1,
+            latency_tracker=self.tracker,
+        )
+        elapsed = time.perf_counter() - start
+
+        self.assertLess(elapsed, 0.3)
+        self.assertEqual(list(results), ["career", "finance"])
+        self.assertEqual(results["career"].result, "fast")
+        self.assertTrue(results["finance"].timed_out)
+        self.assertEqual(results["finance"].name, "finance")
+        self.assertFalse(results["finance"].success)
+
+    def test_hedged_retry_beats_slow_attempt(self):
+        """Test that a specialist slower than its p95 is retried and the retry wins."""
+        attempts = [0]
+        lock = threading.Lock()
+
+        def flaky(**ctx):
+            with lock:
+                attempts[0] += 1
+                attempt = attempts[0]
+            time.sleep(1.0 if attempt == 1 else 0.01)
+            return attempt
+
+        for _ in range(3):
+            self.tracker.record("wellness", 0.02)
+
+        results = self.executor.execute_with_budget(
+            {"wellness": (flaky, (), {})}, budget=0.5, latency_tracker=self.tracker
+        )
+
+        self.assertTrue(results["wellness"].success)
+        self.assertTrue(results["wellness"].hedged)
+        self.assertEqual(results["wellness"].result, 2)
+
+    def test_hedge_does_not_queue_behind_straggler(self):
+        """Test that a hedge runs on its own capacity when the shared pool is full."""
+        executor = ParallelExecutor(max_workers=1)
+        self.addCleanup(executor.shutdown, wait=False)
+        attempts = [0]
+        lock = threading.Lock()
+
+        def flaky(**ctx):
+            with lock:
+                attempts[0] += 1
+                attempt = attempts[0]
+            time.sleep(1.0 if attempt == 1 else 0.01)
+            return attempt
+
+        for _ in range(3):
+            self.tracker.record("wellness", 0.02)
+
+        results = executor.execute_with_budget(
+            {"wellness": (flaky, (), {})}, budget=0.5, latency_tracker=self.tracker
+        )
+
+        self.assertTrue(results["wellness"].hedged)
+        self.assertEqual(results["wellness"].result, 2)
+
+    def test_timed_out_attempts_are_accounted_for(self):
+        """Test that abandoned attempts are counted until done and still tracked."""
+        tracker = LatencyTracker(min_samples=1)
+
+        def slow(**ctx):
+            time.sleep(0.3)
+            return "late"
+
+        results = self.executor.execute_with_budget(
+            {"finance": (slow, (), {})}, budget=0.05, latency_tracker=tracker
+        )
+
+        self.assertTrue(results["finance"].timed_out)
+        self.assertEqual(self.executor.straggler_count, 1)
+        self.assertIsNone(tracker.percentile("finance"))
+        deadline = time.perf_counter() + 2.0
+        while self.executor.straggler_count and time.perf_counter() < deadline:
+            time.sleep(0.01)
+        self.assertEqual(self.executor.straggler_count, 0)
+        self.assertGreaterEqual(tracker.percentile("finance"), 0.25)
+
+    def test_no_hedge_without_history(self):
+        """Test that hedging waits for enough latency samples."""
+        results = self.executor.execute_with_budget(
+            {"career": (lambda: "ok", (), {})}, budget=1.0, latency_tracker=self.tracker
+        )
+        self.assertFalse(results["career"].hedged)
+        self.assertIsNone(self.tracker.percentile("career"))
+
+    def test_parallel_specialists_returns_partial_results(self):
+        """Test that the convenience API reports timeouts per specialist."""
+
+        def quick(**ctx):
+            return ctx["user_id"]
+
+        def stuck(**ctx):
+            time.sleep(0.5)
+
+        results = parallel_specialists(
+            {"career": quick, "finance": stuck}, {"user_id": "u1"}, timeout=0.1
+        )
+
+        self.assertEqual(results["career"], "u1")
+        self.assertIsInstance(results["finance"], concurrent.futures.TimeoutError)
+
+    def test_latency_percentile(self):
+        """Test percentile calculation over the sample window."""
+        for value in [0.1, 0.2, 0.3, 0.4, 1.0]:
+            self.tracker.record("career", value)
+
+        self.assertEqual(self.tracker.percentile("career", 50), 0.3)
+        self.assertEqual(self.tracker.percentile("career", 95), 1.0)
+
+
+class TestAsyncTaskExecutor(unittest.TestCase):
+    """Test the asyncio-native executor."""
+
+    def setUp(self):
+        self.executor = AsyncTaskExecutor(max_concurrency=2)
+
+    def test_semaphore_limits_concurrency(self):
+        """Test that no more than max_concurrency tasks run at once."""
+        running = [0]
+        peak = [0]
+
+        async def tracked(x):
+            running[0] += 1
+            peak[0] = max(peak[0], running[0])
+            await asyncio.sleep(0.02)
+            running[0] -= 1
+            return x
+
+        tasks = [(tracked, (i,), {}) for i in range(6)]
+        results = asyncio.run(self.executor.run_many(tasks))
+
+        self.assertEqual([r.result for r in results], list(range(6)))
+        self.assertEqual(peak[0], 2)
+        self.assertGreater(max(r.queue_time for r in results), 0.01)
+
+    def test_blocking_tools_are_offloaded(self):
+        """Test that sync tools run in threads and do not serialize the loop."""
+
+        def blocking(x):
+            time.sleep(0.1)
+            return x
+
+        start = time.perf_counter()
+        results = self.executor.run_many_sync([(blocking, (i,), {}) for i in range(2)])
+        elapsed = time.perf_counter() - start
+
+        self.assertEqual([r.result for r in results], [0, 1])
+        self.assertLess(elapsed, 0.18)
+
+    def test_timeout_cancels_outstanding_tasks(self):
+        """Test that a timeout cancels unfinished tasks and keeps finished ones."""
+        cancelled = []
+
+        async def quick():
+            return "done"
+
+        async def slow():
+            try:
+                await asyncio.sleep(1)
+            except asyncio.CancelledError:
+                cancelled.append(True)
+                raise
+
+        results = asyncio.run(
+            self.executor.run_many([(quick, (), {}), (slow, (), {})], timeout=0.05)
+        )
+
+        self.assertEqual(results[0].result, "done")
+        self.assertTrue(results[1].timed_out)
+        self.assertEqual(cancelled, [True])
+
+    def test_errors_are_isolated(self):
+        """Test that one failing task does not cancel its siblings."""
+
+        async def fail():
+            raise ValueError("bad")
+
+        async def ok():
+            await asyncio.sleep(0.01)
+            return 1
+
+        results = self.executor.run_many_sync([(fail, (), {}), (ok, (), {})])
+
+        self.assertIsInstance(results[0].error, ValueError)
+        self.assertEqual(results[1].result, 1)
+
+    def test_sync_api_inside_running_loop(self):
+        """Test that the sync bridge works when called from within a loop."""
+
+        async def add(a, b):
+            return a + b
+
+        async def caller():
+            # Sync tool code running on the loop thread
+            return self.executor.run_sync(add, 2, 3)
+
+        self.assertEqual(asyncio.run(caller()), 5)
+
+    def test_async_tool_executor_compat(self):
+        """Test that AsyncToolExecutor keeps its sync interface."""
+        executor = AsyncToolExecutor()
+
+        self.assertEqual(executor.execute(abs, -4), 4)
+        results = executor.run_multiple([(abs, (-1,), {}), (abs, (-2,), {})])
+        self.assertEqual([r.result for r in results], [1, 2])
+
+
 class TestToolOptimization(unittest.TestCase):
     """Test tool invocation optimization."""
 
@@ -259,6 +864,494 @@ class TestToolOptimization(unittest.TestCase):
         self.assertEqual(result2, 10)
         self.assertEqual(call_count[0], 1)  # No additional call
 
+    def test_concurrent_calls_are_deduplicated(self):
+        """Test that identical in-flight calls execute once and share the result."""
+        call_count = [0]
+        started = threading.Event()
+        release = threading.Event()
+
+        def slow_tool(x):
+            call_count[0] += 1
+            started.set()
+            release.wait(timeout=5)
+            return x * 2
+
+        results = []
+
+        def caller():
+            results.append(self.optimizer.invoke_with_dedup(slow_tool, 21))
+
+        leader = threading.Thread(target=caller)
+        leader.start()
+        started.wait(timeout=5)
+
+        followers = [threading.Thread(target=caller) for _ in range(3)]
+        for thread in followers:
+            thread.start()
+        # Give followers time to attach to the in-flight call
+        time.sleep(0.05)
+        release.set()
+        for thread in [leader] + followers:
+            thread.join(timeout=5)
+
+        self.assertEqual(results, [42, 42, 42, 42])
+        self.assertEqual(call_count[0], 1)
+
+        stats = self.optimizer.get_dedup_stats()
+        self.assertEqual(stats["executed"], 1)
+        self.assertEqual(stats["coalesced"], 3)
+        self.assertEqual(stats["by_tool"]["slow_tool"]["coalesced"], 3)
+
+    def test_dedup_propagates_errors(self):
+        """Test that errors reach the caller and the call is not left pending."""
+
+        def failing_tool():
+            raise ValueError("boom")
+
+        with self.assertRaises(ValueError):
+            self.optimizer.invoke_with_dedup(failing_tool)
+        self.assertEqual(self.optimizer._pending_calls, {})
+
+    def test_async_concurrent_calls_are_deduplicated(self):
+        """Test that concurrent coroutines share a single in-flight call."""
+        call_count = [0]
+
+        async def async_tool(x):
+            call_count[0] += 1
+            await asyncio.sleep(0.05)
+            return x + 1
+
+        async def run():
+            return await asyncio.gather(
+                *[self.optimizer.ainvoke_with_dedup(async_tool, 1) for _ in range(5)]
+            )
+
+        results = asyncio.run(run())
+
+        self.assertEqual(results, [2] * 5)
+        self.assertEqual(call_count[0], 1)
+        self.assertEqual(self.optimizer.get_dedup_stats()["coalesced"], 4)
+
+
+class TestBatchToolInvoker(unittest.TestCase):
+    """Test batched tool execution."""
+
+    def test_flush_preserves_submission_order(self):
+        """Test that results come back in the order calls were added."""
+
+        def double(x):
+            time.sleep(0.01 * (5 - x))  # Later calls finish first
+            return x * 2
+
+        def negate(x):
+            return -x
+
+        invoker = BatchToolInvoker(max_batch_size=100)
+        for x in range(5):
+            invoker.add(double, x)
+            invoker.add(negate, x)
+
+        results = invoker.flush()
+        expected = []
+        for x in range(5):
+            expected.extend([x * 2, -x])
+        self.assertEqual(results, expected)
+
+    def test_flush_runs_calls_concurrently(self):
+        """Test that independent calls share the pool instead of running serially."""
+
+        def slow_tool(x):
+            time.sleep(0.1)
+            return x
+
+        invoker = BatchToolInvoker(max_batch_size=100, executor=ThreadPoolExecutor(4))
+        for x in range(4):
+            invoker.add(slow_tool, x)
+
+        start = time.perf_counter()
+        results = invoker.flush()
+        elapsed = time.perf_counter() - start
+
+        self.assertEqual(results, [0, 1, 2, 3])
+        self.assertLess(elapsed, 0.3)
+
+    def test_batch_fn_called_once_per_group(self):
+        """Test that a registered batch_fn handles the whole group in one call."""
+        batch_calls = []
+
+        def score(habit):
+            raise AssertionError("per-call path should not be used")
+
+        def score_many(calls):
+            batch_calls.append(len(calls))
+            return [len(args[0]) for args, _ in calls]
+
+        invoker = BatchToolInvoker(max_batch_size=100)
+        invoker.register_batch_fn(score, score_many)
+        for habit in ["run", "read", "meditate"]:
+            invoker.add(score, habit)
+
+        self.assertEqual(invoker.flush(), [3, 4, 8])
+        self.assertEqual(batch_calls, [3])
+
+    def test_errors_are_isolated_per_call(self):
+        """Test that one failing call does not affect the others."""
+
+        def fragile(x):
+            if x == 2:
+                raise ValueError("bad input")
+            return x
+
+        invoker = BatchToolInvoker(max_batch_size=100)
+        for x in range(4):
+            invoker.add(fragile, x)
+
+        results = invoker.flush()
+        self.assertEqual(results[:2], [0, 1])
+        self.assertIsInstance(results[2], ValueError)
+        self.assertEqual(results[3], 3)
+
+    def test_failing_batch_fn_falls_back_to_single_calls(self):
+        """Test that a broken batch_fn falls back to individual calls."""
+
+        def tool(x):
+            return x + 1
+
+        def broken_batch(calls):
+            raise RuntimeError("vectorized path failed")
+
+        tool.batch_fn = broken_batch
+        invoker = BatchToolInvoker(max_batch_size=100)
+        invoker.add(tool, 1)
+        invoker.add(tool, 2)
+
+        self.assertEqual(invoker.flush(), [2, 3])
+
+    def test_flush_from_executor_worker_runs_inline(self):
+        """Test that a flush inside a pool worker does not wait on its own full pool."""
+        executor = ParallelExecutor(max_workers=1)
+        self.addCleanup(executor.shutdown, wait=False)
+        invoker = BatchToolInvoker(max_batch_size=100, executor=executor)
+
+        def outer_tool():
+            for x in range(3):
+                invoker.add(abs, -x)
+            return invoker.flush()
+
+        results = executor.execute_parallel([(outer_tool, (), {})], timeout=2.0)
+
+        self.assertEqual(results[0].result, [0, 1, 2])
+
+    def test_flush_carries_caller_context(self):
+        """Test that calls see the caller's context variables (e.g. the active span)."""
+        request_id = contextvars.ContextVar("request_id", default=None)
+
+        def tool(x):
+            return (x, request_id.get())
+
+        request_id.set("req-1")
+        for executor in (None, ThreadPoolExecutor(2)):
+            invoker = BatchToolInvoker(max_batch_size=100, executor=executor)
+            invoker.add(tool, 1)
+            invoker.add(tool, 2)
+            self.assertEqual(invoker.flush(), [(1, "req-1"), (2, "req-1")])
+            if executor is not None:
+                executor.shutdown()
+
+
+class TestAdaptiveCaching(unittest.TestCase):
+    """Test feedback from access patterns into cache configuration."""
+
+    class _FakeManager:
+        def __init__(self):
+            self.loads = 0
+
+        def get_profile(self, user_id):
+            self.loads += 1
+            time.sleep(0.001)
+            return {"user_id": user_id}
+
+        def get_goals(self, user_id):
+            return [user_id]
+
+    def setUp(self):
+        reset_cache_manager()
+        self.cache = get_cache_manager()
+
+    def _pattern(self, count, span, miss_time=0.01):
+        now = time.time()
+        return {
+            "count": count,
+            "first_access": now - span,
+            "last_access": now,
+            "total_time": miss_time * count,
+            "misses": count,
+            "miss_time": miss_time * count,
+        }
+
+    def test_per_entry_ttl_and_resize(self):
+        """Test that TimedCache honours per-entry TTLs and resizes with LRU eviction."""
+        cache = TimedCache(default_ttl=60.0, max_size=10)
+        cache.set("short", 1, ttl=0.01)
+        cache.set("long", 2)
+        time.sleep(0.02)
+        self.assertIsNone(cache.get("short"))
+        self.assertEqual(cache.get("long"), 2)
+
+        for i in range(8):
+            cache.set(f"k{i}", i)
+        cache.resize(3)
+        self.assertEqual(len(cache.get_keys()), 3)
+        self.assertEqual(cache.get_stats()["evictions"], 6)
+
+    def test_ttl_raised_when_reaccess_follows_expiry(self):
+        """Test that expensive re-accesses slower than the TTL lengthen it, within a step."""
+        tuner = AdaptiveCacheTuner(cache_manager=self.cache, min_samples=5)
+        tuner.access_optimizer.access_patterns["profile:u1"] = self._pattern(5, 4000)
+
+        changes = tuner.tune()
+
+        ttl_changes = [c for c in changes if c["cache"] == "profile" and c["setting"] == "ttl"]
+        self.assertEqual(len(ttl_changes), 1)
+        self.assertEqual(ttl_changes[0]["old"], 600.0)
+        self.assertEqual(self.cache.profile_cache.default_ttl, 1200.0)  # Capped at 2x
+
+    def test_ttl_lowered_and_bounded_without_reuse(self):
+        """Test that TTLs drop when nothing is re-read, but not below the bound."""
+        tuner = AdaptiveCacheTuner(
+            cache_manager=self.cache, min_samples=5, bounds={"goals": {"min_ttl": 200.0}}
+        )
+        for i in range(10):
+            tuner.access_optimizer.access_patterns[f"goals:u{i}"] = self._pattern(1, 0)
+
+        tuner.tune()
+        self.assertEqual(self.cache.goals_cache.default_ttl, 300.0)  # First round: no verdict
+
+        for i in range(10, 20):
+            tuner.access_optimizer.access_patterns[f"goals:u{i}"] = self._pattern(1, 0)
+        tuner.tune()
+        self.assertEqual(self.cache.goals_cache.default_ttl, 200.0)
+
+    def test_reaccess_interval_spans_rounds(self):
+        """Test that keys read less than once per round still lengthen an expiring TTL."""
+        tuner = AdaptiveCacheTuner(cache_manager=self.cache, min_samples=5)
+        optimizer = tuner.access_optimizer
+        for i in range(5):
+            optimizer.track_access("profile", f"u{i}", 0.01, hit=False)
+        tuner.tune()
+        self.assertEqual(self.cache.profile_cache.default_ttl, 600.0)
+
+        # Next round: the same keys come back once each, 900s after their last read
+        for key in list(optimizer._last_seen):
+            optimizer._last_seen[key] -= 900
+        for i in range(5):
+            optimizer.track_access("profile", f"u{i}", 0.01, hit=False)
+
+        stats = optimizer.get_namespace_stats()["profile"]
+        self.assertEqual(stats["reused_keys"], 5)
+        self.assertGreater(stats["median_reaccess_interval"], 899)
+
+        tuner.tune()
+        self.assertEqual(self.cache.profile_cache.default_ttl, 1200.0)
+
+    def test_caches_without_observations_untouched(self):
+        """Test that caches with no tracked accesses keep their TTL and size."""
+        tuner = AdaptiveCacheTuner(cache_manager=self.cache, min_samples=1)
+        before = {
+            name: (cache.default_ttl, cache.max_size)
+            for name, cache in self.cache.get_caches().items()
+        }
+        tuner.access_optimizer.track_access("profile", "u1", 0.01, hit=False)
+
+        for _ in range(3):
+            tuner.tune()
+
+        for name, cache in self.cache.get_caches().items():
+            if name != "profile":
+                self.assertEqual((cache.default_ttl, cache.max_size), before[name], name)
+
+    def test_size_follows_evictions_and_occupancy(self):
+        """Test growing an evicting cache and shrinking an idle one."""
+        tuner = AdaptiveCacheTuner(cache_manager=self.cache)
+        self.cache.goals_cache.resize(100)
+        for i in range(150):
+            self.cache.set_goals(f"user_{i}", [])
+        tuner.access_optimizer.track_access("goals", "user_0", 0.001, hit=False)
+        tuner.access_optimizer.track_access("profile", "user_0", 0.001, hit=False)
+
+        changes = {(c["cache"], c["setting"]): c for c in tuner.tune()}
+
+        self.assertEqual(changes[("goals", "max_size")]["new"], 150)
+        self.assertEqual(self.cache.goals_cache.max_size, 150)
+        self.assertEqual(changes[("profile", "max_size")]["new"], 250)  # Empty: halved
+        self.assertIn("max_size", tuner.format_report())
+
+    def test_memory_manager_feeds_tuner_and_prefetch(self):
+        """Test end-to-end tracking from OptimizedMemoryManager into prefetch queues."""
+        manager = OptimizedMemoryManager(self._FakeManager())
+        prefetch = PrefetchManager(manager)
+        tuner = manager.enable_adaptive_caching(prefetch_manager=prefetch, interval=3600)
+
+        for _ in range(3):
+            manager.get_profile("hot_user")
+            self.cache.invalidate_profile("hot_user")
+
+        stats = tuner.access_optimizer.get_namespace_stats()["profile"]
+        self.assertEqual(stats["misses"], 3)
+        self.assertGreater(stats["avg_miss_time"], 0.0005)
+
+        changes = tuner.tune()
+        self.assertIn(("profile", "hot_user"), prefetch._prefetch_queue)
+        self.assertTrue(any(c["setting"] == "prefetch" for c in changes))
+        self.assertEqual(tuner.access_optimizer.access_patterns, {})  # New window
+
+
+class TestBackgroundPrefetch(unittest.TestCase):
+    """Test session-scoped background prefetching."""
+
+    class _SlowManager:
+        def __init__(self, delay=0.0):
+            self.delay = delay
+            self.calls = []
+
+        def get_profile(self, user_id):
+            self.calls.append(("profile", user_id))
+            time.sleep(self.delay)
+            return {"user_id": user_id}
+
+        def get_goals(self, user_id):
+            self.calls.append(("goals", user_id))
+            time.sleep(self.delay)
+            return [f"goal for {user_id}"]
+
+    def setUp(self):
+        reset_cache_manager()
+        self.cache = get_cache_manager()
+        self.tmp = tempfile.TemporaryDirectory()
+        workspace = self.tmp.name
+        for week in (1, 2, 3):
+            path = os.path.join(workspace, "checkins", "u1", f"week_{week}_checkin.json")
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            with open(path, "w") as f:
+                json.dump({"week_number": week}, f)
+            os.utime(path, (week, week))  # Older weeks have older mtimes
+        today = datetime.now()
+        for name in ("mood_a.json", "mood_b.json"):
+            # Legacy one-file-per-entry moods, imported into the mood series
+            path = os.path.join(workspace, "moods", "u1", name)
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            with open(path, "w") as f:
+                json.dump(
+                    {
+                        "timestamp": today.isoformat(),
+                        "date": today.date().isoformat(),
+                        "composite_score": 7,
+                    },
+                    f,
+                )
+        self.workspace = workspace
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def test_session_start_preloads_user_data(self):
+        """Test that a session preloads profile, goals and workspace data."""
+        base = self._SlowManager()
+        prefetch = PrefetchManager(
+            OptimizedMemoryManager(base), workspace_dir=self.workspace, recent_checkins=2
+        )
+
+        summary = prefetch.start_session("u1").result(timeout=5)
+
+        self.assertEqual(summary["loaded"][:2], ["profile", "goals"])
+        self.assertFalse(summary["cancelled"])
+        self.assertEqual(self.cache.get_profile("u1"), {"user_id": "u1"})
+        self.assertEqual(self.cache.get_goals("u1"), ["goal for u1"])
+        checkins = prefetch.get_prefetched("checkins", "u1")
+        self.assertEqual([c["week_number"] for c in checkins], [2, 3])  # Oldest first
+        self.assertEqual(len(prefetch.get_prefetched("moods", "u1")), 2)
+        self.assertEqual(prefetch.get_prefetched("habits", "u1"), [])
+
+    def test_tool_calls_after_session_start_hit_warm_data(self):
+        """Test that prefetching warms the caches the check-in, mood and habit tools read."""
+        from tools import checkin_tools, habit_tools, mood_tools
+
+        class CountingBackend:
+            def __init__(self, root_dir):
+                self.root_dir = root_dir
+                self.reads = []
+
+            def read_file(self, path):
+                self.reads.append(path)
+                with open(os.path.join(self.root_dir, path)) as f:
+                    return f.read()
+
+            def write_file(self, path, content):
+                full_path = os.path.join(self.root_dir, path)
+                os.makedirs(os.path.dirname(full_path), exist_ok=True)
+                with open(full_path, "w") as f:
+                    f.write(content)
+
+        backend = CountingBackend(self.workspace)
+        tools = {t.name: t for t in habit_tools.create_habit_tools(backend=backend)}
+        tools["create_habit"].invoke({"user_id": "u1", "name": "Read"})
+        habit_file = os.listdir(os.path.join(self.workspace, "habits", "u1"))[0]
+        habit_id = os.path.splitext(habit_file)[0]
+        tools["log_habit_completion"].invoke({"user_id": "u1", "habit_id": habit_id})
+        # Start from cold tool caches, as a new process would
+        checkin_tools._history_cache.clear()
+        habit_tools._log_cache.clear()
+        mood_tools._series_cache.clear()
+
+        prefetch = PrefetchManager(OptimizedMemoryManager(self._SlowManager()), backend=backend)
+        prefetch.start_session("u1").result(timeout=5)
+        self.assertEqual(len(prefetch.get_prefetched("habits", "u1")[0].entries()), 1)
+        self.assertEqual(len(prefetch.get_prefetched("moods", "u1")), 2)
+        backend.reads.clear()
+
+        trends = checkin_tools.create_checkin_tools(backend=backend)
+        trends = next(t for t in trends if t.name == "analyze_weekly_trends")
+        trends.invoke({"user_id": "u1", "weeks": 3})
+        tools["get_habit_streaks"].invoke({"user_id": "u1", "habit_id": habit_id})
+        history = mood_tools.create_mood_tools(backend=backend)
+        history = next(t for t in history if t.name == "get_mood_history")
+        self.assertIn("Showing 2 entries", history.invoke({"user_id": "u1"}))
+
+        self.assertFalse([path for path in backend.reads if path.startswith("checkins/")])
+        self.assertFalse([path for path in backend.reads if path.startswith("moods/")])
+        self.assertFalse([path for path in backend.reads if path.endswith("log.json")])
+
+    def test_user_switch_cancels_previous_session(self):
+        """Test that switching users stops the old prefetch between loads."""
+        base = self._SlowManager(delay=0.05)
+        prefetch = PrefetchManager(OptimizedMemoryManager(base), max_workers=4)
+
+        first = prefetch.start_session("old_user")
+        time.sleep(0.01)
+        second = prefetch.switch_user("new_user")
+
+        old_summary = first.result(timeout=5)
+        new_summary = second.result(timeout=5)
+        self.assertTrue(old_summary["cancelled"])
+        self.assertNotIn(("goals", "old_user"), base.calls)
+        self.assertEqual(new_summary["loaded"], ["profile", "goals"])
+
+    def test_end_session_and_prediction(self):
+        """Test cancellation on session end and usage-based ordering."""
+        prefetch = PrefetchManager(
+            OptimizedMemoryManager(self._SlowManager()), workspace_dir=self.workspace
+        )
+        prefetch.start_session("u1").result(timeout=5)
+        for _ in range(3):
+            prefetch.get_prefetched("moods", "u1")
+
+        self.assertEqual(prefetch.predict("u1")[0], "moods")
+
+        prefetch.queue_profile_prefetch("other_user")
+        prefetch.end_session(wait=True)
+        self.assertEqual(prefetch._session_user, None)
+        self.assertEqual(prefetch._prefetch_queue, [("profile", "other_user")])
+
 
 class TestMemoryOptimization(unittest.TestCase):
     """Test memory access optimizations."""
@@ -288,6 +1381,89 @@ class TestMemoryOptimization(unittest.TestCase):
         self.assertEqual(call_count[0], 1)
         self.assertEqual(list(lazy), [1, 2, 3, 4, 5])
 
+    def test_multiple_profiles_batch_cache_misses(self):
+        """Test that cache misses for many users are loaded in one store round trip."""
+        from memory import MemoryManager, UserProfile, create_memory_store
+
+        batch_calls = []
+
+        class CountingStore:
+            def __init__(self, store):
+                self._store = store
+
+            def batch(self, ops):
+                batch_calls.append(len(ops))
+                return self._store.batch(ops)
+
+            def __getattr__(self, name):
+                return getattr(self._store, name)
+
+        base = MemoryManager(CountingStore(create_memory_store("in_memory")))
+        user_ids = [f"user_{i}" for i in range(10)]
+        for user_id in user_ids:
+            base.save_profile(UserProfile(user_id=user_id, name=user_id))
+
+        reset_cache_manager()
+        manager = OptimizedMemoryManager(base)
+        manager.get_profile("user_0")  # Warm one entry
+        batch_calls.clear()
+
+        profiles = manager.get_multiple_profiles(user_ids)
+        self.assertEqual(batch_calls, [9])
+        self.assertEqual([profiles[u].name for u in user_ids], user_ids)
+
+        # Everything is cached now
+        manager.get_multiple_profiles(user_ids)
+        self.assertEqual(batch_calls, [9])
+
+    def test_memory_model_benchmark(self):
+        """Test that slotted records allocate less than plain classes."""
+        results = benchmark_memory_models(count=5000)
+
+        print(f"\nSlotted: {results['slotted_bytes']} bytes, plain: {results['plain_bytes']} bytes")
+        self.assertLess(results["slotted_bytes"], results["plain_bytes"])
+        self.assertLess(results["datetime_cached_s"], results["datetime_first_s"])
+
+
+class TestKeywordMatching(unittest.TestCase):
+    """Test the compiled keyword matchers against per-keyword scanning."""
+
+    def test_keyword_matching_benchmark(self):
+        """Test that the matchers agree with the baseline and scale with keyword count."""
+        results = benchmark_keyword_matching(count=10, words=2000)
+
+        # Whole-word sentiment matching finds exactly the regex baseline's matches
+        self.assertEqual(results["sentiment_matcher_matches"], results["sentiment_naive_matches"])
+        self.assertLess(results["sentiment_matcher_s"], results["sentiment_naive_s"])
+
+        small, large = results["scaling"]
+        print(
+            f"\n1000 keywords: matcher {large['matcher_s'] * 1000:.1f} ms, "
+            f"per keyword {large['naive_s'] * 1000:.1f} ms"
+        )
+        self.assertLess(large["matcher_s"], large["naive_s"])
+        self.assertGreater(large["naive_s"], small["naive_s"] * 3)
+
+
+class TestGoalGraphIndex(unittest.TestCase):
+    """Test indexed edge lookups in the goal dependency graph."""
+
+    def test_goal_graph_benchmark(self):
+        """Test that traversals stay linear on a 5,000-goal, 50,000-edge graph."""
+        results = benchmark_goal_graph(count=5000, edges_per_goal=10)
+
+        self.assertEqual(results["edges"], 50_000)
+        self.assertEqual(results["detect_cycles_result"], 0)  # Edges only point forward
+        self.assertEqual(results["detect_cycles_lookups"], 5000)
+
+        print(
+            f"\ndetect_cycles: indexed {results['detect_cycles_indexed_s'] * 1000:.1f} ms, "
+            f"scanning ~{results['detect_cycles_scan_s']:.1f} s"
+        )
+        self.assertLess(results["detect_cycles_indexed_s"], 1.0)
+        self.assertLess(results["detect_cycles_indexed_s"] * 10, results["detect_cycles_scan_s"])
+        self.assertLess(results["impact_failure_indexed_s"] * 10, results["impact_failure_scan_s"])
+
 
 def run_performance_benchmark():
     """
@@ -443,9 +1619,20 @@ def run_all_tests():
     suite.addTests(loader.loadTestsFromTestCase(TestPerformanceTargets))
     suite.addTests(loader.loadTestsFromTestCase(TestCachingEffectiveness))
     suite.addTests(loader.loadTestsFromTestCase(TestProfiler))
+    suite.addTests(loader.loadTestsFromTestCase(TestHistogramProfiler))
+    suite.addTests(loader.loadTestsFromTestCase(TestSpanTracing))
+    suite.addTests(loader.loadTestsFromTestCase(TestHotspotProfiler))
     suite.addTests(loader.loadTestsFromTestCase(TestParallelExecution))
+    suite.addTests(loader.loadTestsFromTestCase(TestPersistentExecutor))
+    suite.addTests(loader.loadTestsFromTestCase(TestDeadlineFanOut))
+    suite.addTests(loader.loadTestsFromTestCase(TestAsyncTaskExecutor))
     suite.addTests(loader.loadTestsFromTestCase(TestToolOptimization))
+    suite.addTests(loader.loadTestsFromTestCase(TestBatchToolInvoker))
     suite.addTests(loader.loadTestsFromTestCase(TestMemoryOptimization))
+    suite.addTests(loader.loadTestsFromTestCase(TestAdaptiveCaching))
+    suite.addTests(loader.loadTestsFromTestCase(TestBackgroundPrefetch))
+    suite.addTests(loader.loadTestsFromTestCase(TestKeywordMatching))
+    suite.addTests(loader.loadTestsFromTestCase(TestGoalGraphIndex))
 
     runner = unittest.TextTestRunner(verbosity=2)
     result = runner.run(suite)
@@ -9,8 +9,10 @@ including:
 - Adaptation recommendation generation
 """
 
+import json
 import pytest
 from pathlib import Path
+from types import SimpleNamespace
 
 # Import check-in tools and helper functions
 import sys
@@ -25,6 +27,9 @@ from src.tools.checkin_tools import (
     analyze_trend,
     generate_adaptations,
     HABIT_SCORING_FACTORS,
+    RECENT_CHECKIN_WINDOW,
+    load_checkin_history,
+    load_previous_checkins,
 )
 
 
@@ -583,6 +588,116 @@ class TestCheckInTools:
         assert "Domain Progress" in result
 
 
+# ==============================================================================
+# Check-In History Tests
+# ==============================================================================
+
+
+def _checkin_record(user_id, week, completed=50, day=None):
+    return {
+        "user_id": user_id,
+        "week_number": week,
+        "date": day or f"2026-01-{week:02d}",
+        "timestamp": f"{day or f'2026-01-{week:02d}'}T09:00:00",
+        "responses": {"career_goals_completed": completed, "average_energy": 6},
+        "scores": {"overall": completed / 100, "career": completed / 100},
+    }
+
+
+class TestCheckinHistory:
+    """Test the indexed check-in history shared by trend tools and the dashboard."""
+
+    @pytest.fixture
+    def fs_backend(self, tmp_path):
+        return SimpleNamespace(root_dir=tmp_path)
+
+    def test_index_and_next_week(self, fs_backend):
+        history = load_checkin_history("alice", fs_backend)
+        assert len(history) == 0
+        assert history.next_week() == 1
+
+        for week in (1, 2, 10):
+            history.save(_checkin_record("alice", week))
+
+        assert history.weeks == [1, 2, 10]
+        assert history.latest_week == 10
+        assert history.next_week() == 11
+        assert load_checkin_history("alice", fs_backend) is history
+
+    def test_index_picks_up_external_files(self, fs_backend, tmp_path):
+        history = load_checkin_history("bob", fs_backend)
+        history.save(_checkin_record("bob", 1))
+
+        external = tmp_path / "checkins" / "bob" / "week_2_checkin.json"
+        external.write_text(json.dumps(_checkin_record("bob", 2, completed=80)))
+
+        history = load_checkin_history("bob", fs_backend)
+        assert history.weeks == [1, 2]
+        assert history.get(2)["responses"]["career_goals_completed"] == 80
+
+    def test_rewritten_checkin_revalidated(self, fs_backend, tmp_path):
+        history = load_checkin_history("carol", fs_backend)
+        history.save(_checkin_record("carol", 1, completed=40))
+        assert history.scores(1)["career"] == 0.4
+
+        path = tmp_path / "checkins" / "carol" / "week_1_checkin.json"
+        path.write_text(json.dumps(_checkin_record("carol", 1, completed=90)) + "\n")
+
+        assert history.scores(1)["career"] == 0.9
+
+    def test_precomputed_scores_fill_missing_domains(self, fs_backend):
+        history = load_checkin_history("dave", fs_backend)
+        record = _checkin_record("dave", 1, completed=70)
+        history.save(record)
+
+        scores = history.scores(1)
+        assert scores["overall"] == 0.7
+        assert scores["career"] == 0.7
+        assert scores["finance"] == calculate_domain_score(record["responses"], "finance")
+        assert history.scores(99) == {}
+
+    def test_recent_and_score_series(self, fs_backend):
+        history = load_checkin_history("erin", fs_backend)
+        for week in range(1, 7):
+            history.save(_checkin_record("erin", week, completed=week * 10))
+
+        assert [r["week_number"] for r in history.recent(3)] == [4, 5, 6]
+        assert [r["week_number"] for r in history.recent(2, before=4)] == [2, 3]
+        assert history.score_series("career", 3) == [0.4, 0.5, 0.6]
+
+    def test_recent_window_cached(self, fs_backend):
+        history = load_checkin_history("frank", fs_backend)
+        last = RECENT_CHECKIN_WINDOW + 5
+        for week in range(1, last + 1):
+            history.save(_checkin_record("frank", week, day="2026-03-01"))
+
+        assert history.get(1)["week_number"] == 1
+        assert 1 not in history._records  # Outside the window: read, not kept
+        assert history.get(last) is history.get(last)
+        assert len(history.since("2026-01-01")) == RECENT_CHECKIN_WINDOW
+
+    def test_load_previous_checkins(self, fs_backend):
+        history = load_checkin_history("gina", fs_backend)
+        for week in (1, 3, 4, 5):
+            history.save(_checkin_record("gina", week))
+
+        previous = load_previous_checkins("gina", fs_backend, 6)
+        assert [c["week_number"] for c in previous] == [3, 4, 5]
+
+    def test_trend_tool_uses_history(self, fs_backend, sample_responses):
+        from src.tools.checkin_tools import create_checkin_tools
+
+        conduct_weekly_checkin, _, analyze_weekly_trends, _, _ = create_checkin_tools(fs_backend)
+        for completed in (40, 60, 80):
+            responses = dict(sample_responses, career_goals_completed=completed)
+            conduct_weekly_checkin.invoke({"user_id": "hana", "responses": responses})
+
+        result = analyze_weekly_trends.invoke({"user_id": "hana", "weeks": 3})
+
+        assert "Analyzing 3 weeks of data" in result
+        assert "Career: 80% - ⬆️ Improving" in result
+
+
 # ==============================================================================
 # Run Tests
 # ==============================================================================
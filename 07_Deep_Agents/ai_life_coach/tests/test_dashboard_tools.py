@@ -915,6 +915,107 @@ class TestHelperFunctions:
             assert len(tips) > 0
             assert all(isinstance(tip, str) for tip in tips)
 
+    def test_domain_progress_from_checkin_history(self, tmp_path):
+        """Domain progress averages goal completion from recent check-ins."""
+        from types import SimpleNamespace
+        from tools.checkin_tools import load_checkin_history
+        from tools.dashboard_tools import _get_domain_progress
+
+        backend = SimpleNamespace(root_dir=tmp_path)
+        history = load_checkin_history("dash_user", backend)
+        now = datetime.now()
+        for week, (completed, age) in enumerate([(20, 40), (60, 3), (80, 0)], 1):
+            history.save(
+                {
+                    "user_id": "dash_user",
+                    "week_number": week,
+                    "date": (now - timedelta(days=age)).date().isoformat(),
+                    "timestamp": (now - timedelta(days=age)).isoformat(),
+                    "responses": {"career_goals_completed": completed},
+                    "scores": {},
+                }
+            )
+
+        assert _get_domain_progress("dash_user", "career", "weekly", backend) == 70
+        assert _get_domain_progress("dash_user", "career", "daily", backend) == 80
+
+
+# ==============================================================================
+# Dashboard Model Tests
+# ==============================================================================
+
+
+class TestDashboardModel:
+    """Test the memoized per-user dashboard model."""
+
+    @pytest.fixture
+    def fs_backend(self, tmp_path):
+        from types import SimpleNamespace
+
+        return SimpleNamespace(root_dir=tmp_path, workspace=tmp_path)
+
+    def _save_checkin(self, backend, week, completed):
+        from tools.checkin_tools import load_checkin_history
+
+        load_checkin_history("model_user", backend).save(
+            {
+                "user_id": "model_user",
+                "week_number": week,
+                "date": datetime.now().date().isoformat(),
+                "timestamp": datetime.now().isoformat(),
+                "responses": {f"{d}_goals_completed": completed for d in DOMAINS},
+                "scores": {},
+            }
+        )
+
+    def test_model_reused_until_data_changes(self, fs_backend):
+        from tools.dashboard_tools import get_dashboard_model
+
+        self._save_checkin(fs_backend, 1, 40)
+        model = get_dashboard_model("model_user", fs_backend)
+        assert model.domain_progress("weekly")["career"] == 40
+        assert get_dashboard_model("model_user", fs_backend) is model
+
+        self._save_checkin(fs_backend, 2, 80)
+        updated = get_dashboard_model("model_user", fs_backend)
+        assert updated is not model
+        assert updated.domain_progress("weekly")["career"] == 60
+        assert updated.overall_score("weekly") == 60
+
+    def test_model_rebuilt_when_milestones_change(self, fs_backend, tmp_path):
+        from tools.dashboard_tools import get_dashboard_model
+
+        model = get_dashboard_model("model_user", fs_backend)
+        (tmp_path / "milestones_model_user.json").write_text(
+            json.dumps({"milestones": [{"title": "Ran a 10k", "domain": "wellness"}]})
+        )
+
+        updated = get_dashboard_model("model_user", fs_backend)
+        assert updated is not model
+        assert updated.achievements(3)[0]["title"] == "Ran a 10k"
+
+    def test_views_render_from_memoized_metrics(self, fs_backend):
+        import tools.dashboard_tools as dashboard_tools
+
+        self._save_checkin(fs_backend, 1, 70)
+        tools = dashboard_tools.create_dashboard_tools(backend=fs_backend)
+        render, life_score, domain_bar = tools[0], tools[1], tools[2]
+        export = tools[6]
+
+        with patch.object(
+            dashboard_tools,
+            "_get_domain_progress",
+            wraps=dashboard_tools._get_domain_progress,
+        ) as progress:
+            render.invoke({"user_id": "model_user", "view": "weekly"})
+            life_score.invoke({"user_id": "model_user", "view": "weekly"})
+            domain_bar.invoke({"user_id": "model_user", "domain": "career", "view": "weekly"})
+            report = export.invoke({"user_id": "model_user", "view": "weekly"})
+
+        # One computation per domain, shared by every view and the export
+        assert progress.call_count == len(DOMAINS)
+        assert "70.0%" in report
+
 
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
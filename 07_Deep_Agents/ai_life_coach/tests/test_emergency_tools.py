@@ -33,7 +33,9 @@ from src.tools.emergency_tools import (
     get_appropriate_resources,
     CRISIS_RESOURCES,
     SAFETY_PLAN_TEMPLATE,
+    build_crisis_response,
 )
+from src.middleware import CrisisScreeningMiddleware
 
 
 class MockBackend:
@@ -137,6 +139,38 @@ class TestCrisisDetection(unittest.TestCase):
         result = detect_crisis_keywords(None)
         self.assertFalse(result.is_crisis)
 
+    def test_keywords_must_start_a_word(self):
+        """Test that keywords inside other words do not trigger detection."""
+        result = detect_crisis_keywords("That was a good one, and the period on my calendar is set")
+        self.assertFalse(result.is_crisis)
+
+        result = detect_crisis_keywords("We are migrating the office network to IPv6")
+        self.assertFalse(result.is_crisis)
+
+        result = detect_crisis_keywords("I think I overdosed last night")
+        self.assertEqual(result.crisis_level, CrisisLevel.CRITICAL)
+        self.assertIn(CrisisType.SUBSTANCE_CRISIS, result.crisis_types)
+
+    def test_inflected_disclosures_detected(self):
+        """Test that keywords still match inflected forms of the disclosure."""
+        cases = {
+            "I was self harming again": CrisisLevel.CRITICAL,
+            "I've been self-harming": CrisisLevel.CRITICAL,
+            "my boyfriend hits me": CrisisLevel.HIGH,
+            "I think about hanging myself": CrisisLevel.CRITICAL,
+        }
+        for text, level in cases.items():
+            with self.subTest(text=text):
+                self.assertEqual(detect_crisis_keywords(text).crisis_level, level)
+
+    def test_keyword_in_several_types(self):
+        """Test that a keyword listed under two crisis types counts for both."""
+        result = detect_crisis_keywords("Sometimes I hurt myself. I want to hurt myself again.")
+
+        self.assertEqual(result.matched_keywords, ["hurt myself", "hurt myself"])
+        self.assertEqual(result.crisis_types, [CrisisType.SUICIDE_IDEATION, CrisisType.SELF_HARM])
+        self.assertEqual(result.confidence_score, 0.65)
+
 
 class TestResourceProvision(unittest.TestCase):
     """Test crisis resource provision."""
@@ -335,6 +369,13 @@ class TestEmergencyToolsIntegration(unittest.TestCase):
         self.assertIn("CRITICAL", result)
         self.assertIn("IMMEDIATE ACTION REQUIRED", result)
 
+    def test_analyze_crisis_risk_inflected_disclosure(self):
+        """Test that the tool flags inflected disclosures ("self-harming")."""
+        result = self.analyze_crisis_risk.invoke({"user_message": "I've been self-harming"})
+
+        self.assertIn("CRISIS DETECTED", result)
+        self.assertIn("CRITICAL", result)
+
     def test_analyze_crisis_risk_no_crisis(self):
         """Test analyzing message with no crisis indicators."""
         result = self.analyze_crisis_risk.invoke({"user_message": "I'm having a good day!"})
@@ -582,5 +623,199 @@ class TestCrisisResources(unittest.TestCase):
         self.assertEqual(resource["available"], "24/7")
 
 
+class TestCrisisScreeningMiddleware(unittest.TestCase):
+    """Test pre-model crisis screening of incoming user messages."""
+
+    def setUp(self):
+        from langchain.agents import create_agent
+        from langchain_core.language_models.fake_chat_models import GenericFakeChatModel
+        from langchain_core.messages import AIMessage
+
+        self.middleware = CrisisScreeningMiddleware()
+        self._agent = lambda: create_agent(
+            model=GenericFakeChatModel(messages=iter([AIMessage(content="Coach reply")])),
+            tools=[],
+            middleware=[self.middleware],
+        )
+        self.agent = self._agent()
+
+    def _reply(self, text):
+        result = self.agent.invoke({"messages": [{"role": "user", "content": text}]})
+        return result["messages"][-1]
+
+    def test_critical_message_short_circuits_model(self):
+        """Critical messages are answered with crisis resources, not by the model."""
+        reply = self._reply("I want to kill myself")
+
+        self.assertEqual(reply.type, "ai")
+        self.assertIn("988", reply.content)
+        self.assertNotIn("Coach reply", reply.content)
+        self.assertEqual(
+            reply.content.split("\n\n")[0], build_crisis_response("critical").split("\n\n")[0]
+        )
+        self.assertEqual(reply.response_metadata["crisis_screening"]["crisis_level"], "critical")
+
+    def test_type_specific_resources_added(self):
+        """Resources beyond the general hotlines are listed for the detected crisis type."""
+        reply = self._reply("My partner hit me again and I am being abused at home")
+
+        self.assertIn("National Domestic Violence Hotline", reply.content)
+
+    def test_ordinary_message_reaches_model(self):
+        """Messages without high or critical indicators go to the model."""
+        reply = self._reply("Can you help me plan my career change?")
+
+        self.assertEqual(reply.content, "Coach reply")
+        self.assertEqual(self.middleware.last_result.crisis_level, CrisisLevel.NONE)
+        self.assertIsNone(
+            self.middleware.screen("Can you help me plan my career change?")["crisis_screening"]
+        )
+
+    def test_moderate_message_reaches_model(self):
+        """Moderate results are left to the coordinator by default."""
+        result = detect_crisis_keywords("I feel so overwhelmed at work")
+        self.assertEqual(result.crisis_level, CrisisLevel.MODERATE)
+
+        update = self.middleware.screen("I feel so overwhelmed at work")
+        self.assertNotIn("jump_to", update)
+        self.assertEqual(update["crisis_screening"]["crisis_level"], "moderate")
+
+    def test_ambiguous_keywords_reach_model(self):
+        """Single non-explicit keyword hits are recorded on the state, not short-circuited."""
+        messages = [
+            "How do I enable IPv6 on my router?",
+            "I'm planning a digital detox weekend",
+            "I was forced to work overtime again",
+            "I have physical pain in my knee after running",
+            "That was a good jump off point for the project",
+            "We might get beaten by competitors this quarter",
+            "I volunteer for suicide prevention training",
+            "I relapsed on my diet this week",
+        ]
+        for text in messages:
+            with self.subTest(text=text):
+                update = self.middleware.screen(text)
+                self.assertNotIn("jump_to", update)
+
+        agent = self._agent()
+        result = agent.invoke(
+            {
+                "messages": [
+                    {"role": "user", "content": "I volunteer for suicide prevention training"}
+                ]
+            }
+        )
+        self.assertEqual(result["messages"][-1].content, "Coach reply")
+        self.assertEqual(result["crisis_screening"]["crisis_level"], "critical")
+
+    def test_explicit_disclosures_short_circuit(self):
+        """A single first-person crisis statement skips the coordinator."""
+        messages = [
+            "I want to end it all",
+            "I keep cutting myself",
+            "I overdosed last night",
+            "I am having suicidal thoughts",
+            "My partner hit me last night",
+            "I cannot go on, I want to hurt myself",
+        ]
+        for text in messages:
+            with self.subTest(text=text):
+                self.assertEqual(self.middleware.screen(text)["jump_to"], "end")
+
+    def test_keyword_in_several_types_corroborates(self):
+        """A keyword matching two crisis types counts as two signals."""
+        self.assertEqual(len(detect_crisis_keywords("I might hurt myself").matched_keywords), 2)
+
+        # A non-explicit keyword listed under two types
+        result = CrisisDetectionResult(
+            is_crisis=True,
+            crisis_level=CrisisLevel.HIGH,
+            crisis_types=[CrisisType.SELF_HARM, CrisisType.ABUSE],
+            matched_keywords=["punish myself", "punish myself"],
+        )
+        self.assertTrue(self.middleware.should_short_circuit(result))
+        result.matched_keywords = ["punish myself"]
+        self.assertFalse(self.middleware.should_short_circuit(result))
+
+    def test_screening_result_added_to_system_prompt(self):
+        """Results left to the model reach it as a system prompt note."""
+        from langchain.agents import create_agent
+        from langchain.agents.middleware import wrap_model_call
+        from langchain_core.language_models.fake_chat_models import GenericFakeChatModel
+        from langchain_core.messages import AIMessage
+
+        prompts = []
+
+        @wrap_model_call
+        def record_prompt(request, handler):
+            prompts.append(request.system_prompt)
+            return handler(request)
+
+        def run(text):
+            agent = create_agent(
+                model=GenericFakeChatModel(messages=iter([AIMessage(content="Coach reply")])),
+                tools=[],
+                system_prompt="You are a life coach.",
+                middleware=[self.middleware, record_prompt],
+            )
+            return agent.invoke({"messages": [{"role": "user", "content": text}]})
+
+        result = run("I volunteer for suicide prevention training")
+        self.assertEqual(result["messages"][-1].content, "Coach reply")
+        self.assertTrue(prompts[-1].startswith("You are a life coach."))
+        self.assertIn("Crisis screening", prompts[-1])
+        self.assertIn('"suicide"', prompts[-1])
+        self.assertIn("analyze_crisis_risk", prompts[-1])
+
+        run("Can you help me plan my career change?")
+        self.assertEqual(prompts[-1], "You are a life coach.")
+
+    def test_corroborated_high_result_short_circuits(self):
+        """Several distinct keywords together short-circuit without an explicit statement."""
+        update = self.middleware.screen("I relapsed and I'm using again, I need rehab")
+
+        self.assertEqual(update["jump_to"], "end")
+
+    def test_only_latest_user_message_screened(self):
+        """Model calls after tool results are not screened again."""
+        state = {
+            "messages": [
+                {"role": "user", "content": "I want to kill myself"},
+                {"role": "assistant", "content": "I'm here for you."},
+            ]
+        }
+        self.assertIsNone(self.middleware.before_model(state, None))
+
+    def test_content_blocks_screened(self):
+        """Multi-part message content is screened as text."""
+        state = {
+            "messages": [
+                {
+                    "role": "user",
+                    "content": [{"type": "text", "text": "I want to end my life"}],
+                }
+            ]
+        }
+        update = self.middleware.before_model(state, None)
+
+        self.assertEqual(update["jump_to"], "end")
+
+    def test_screening_latency(self):
+        """Screening a typical message takes well under a millisecond."""
+        text = (
+            "Work has been really stressful this week and I haven't been sleeping well, "
+            "but I went for a run this morning and talked to a friend about my goals. "
+        ) * 3
+        self.middleware.screen(text)  # Warm up
+
+        timings = []
+        for _ in range(50):
+            self.middleware.screen(text)
+            timings.append(self.middleware.last_latency_ms)
+        timings.sort()
+
+        self.assertLess(timings[len(timings) // 2], 1.0)
+
+
 if __name__ == "__main__":
     unittest.main()
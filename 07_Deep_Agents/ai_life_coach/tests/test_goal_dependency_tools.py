@@ -180,6 +180,38 @@ def test_remove_goal():
     assert "g2" in graph.nodes
 
 
+def test_remove_goal_updates_neighbor_lookups():
+    """Test that removing a goal drops its edges from its neighbours' lookups."""
+    graph = GoalDependencyGraph()
+    for goal_id in ("g1", "g2", "g3"):
+        graph.add_goal(GoalNode(id=goal_id, domain="career", title=goal_id))
+
+    graph.add_dependency(DependencyEdge("g1", "g2", "enables"))
+    graph.add_dependency(DependencyEdge("g2", "g3", "requires"))
+    graph.add_dependency(DependencyEdge("g1", "g3", "supports"))
+
+    graph.remove_goal("g2")
+
+    assert [e.to_goal_id for e in graph.get_dependents("g1")] == ["g3"]
+    assert graph.get_dependents("g1", "enables") == []
+    assert [e.from_goal_id for e in graph.get_dependencies("g3")] == ["g1"]
+    assert graph.get_dependencies("g3", "requires") == []
+
+
+def test_lookups_follow_direct_edge_changes():
+    """Test that lookups stay correct when the edges list is replaced directly."""
+    graph = GoalDependencyGraph()
+    graph.add_goal(GoalNode(id="g1", domain="career", title="Get promotion"))
+    graph.add_goal(GoalNode(id="g2", domain="finance", title="Save $50k"))
+    graph.add_dependency(DependencyEdge("g1", "g2", "enables"))
+    assert len(graph.get_dependents("g1")) == 1
+
+    graph.edges = [DependencyEdge("g2", "g1", "supports")]
+
+    assert graph.get_dependents("g1") == []
+    assert [e.to_goal_id for e in graph.get_dependents("g2", "supports")] == ["g1"]
+
+
 def test_update_goal():
     """Test updating goal attributes."""
     graph = GoalDependencyGraph()
@@ -282,6 +314,24 @@ def test_detect_cycles_with_conflicts_ignored():
     assert len(cycles) == 0
 
 
+def test_detect_cycles_deep_chain():
+    """Test cycle detection on a chain deeper than the recursion limit."""
+    graph = GoalDependencyGraph()
+    length = sys.getrecursionlimit() + 500
+    for i in range(length):
+        graph.add_goal(GoalNode(id=f"g{i}", domain="career", title=f"Goal {i}"))
+    for i in range(length - 1):
+        graph.add_dependency(DependencyEdge(f"g{i}", f"g{i + 1}", "requires"))
+    assert graph.detect_cycles() == []
+
+    graph.add_dependency(DependencyEdge(f"g{length - 1}", "g0", "enables"))
+    cycles = graph.detect_cycles()
+
+    assert len(cycles) == 1
+    assert cycles[0][0] == cycles[0][-1] == "g0"
+    assert len(cycles[0]) == length + 1
+
+
 # ==============================================================================
 # Test Topological Sort
 # ==============================================================================
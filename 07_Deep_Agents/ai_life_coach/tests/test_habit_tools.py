@@ -13,6 +13,7 @@ Tests all habit tracking functionality including:
 
 import pytest
 import json
+import random
 import sys
 from datetime import datetime, date, timedelta
 from pathlib import Path
@@ -24,18 +25,23 @@ from src.tools.habit_tools import (
     create_habit_tools,
     Habit,
     HabitEntry,
+    HabitLog,
     HabitStats,
     HabitFrequency,
     HabitDomain,
     HabitStatus,
     calculate_streak,
     calculate_habit_strength,
+    calculate_streaks_vectorized,
+    count_target_dates,
+    count_target_dates_vectorized,
     get_target_dates,
     generate_habit_id,
     parse_date,
     get_streak_visual,
     get_strength_level,
     suggest_habit_stack,
+    score_habits,
     HABIT_FORMATION_RESEARCH,
 )
 
@@ -627,6 +633,211 @@ class TestListHabits:
         assert "No habits found" in result
 
 
+# ==============================================================================
+# Habit Log Tests
+# ==============================================================================
+
+
+def _entry(habit_id, completion_date):
+    return HabitEntry(
+        entry_id=f"entry_{completion_date.isoformat()}",
+        habit_id=habit_id,
+        user_id="user_test",
+        completion_date=completion_date.isoformat(),
+    )
+
+
+class TestHabitLog:
+    """Test the columnar completion log and its incremental aggregates."""
+
+    @pytest.mark.parametrize("target_days", [[0, 1, 2, 3, 4, 5, 6], [0, 1, 2, 3, 4], [0, 3], [0]])
+    def test_aggregates_match_calculate_streak(self, target_days):
+        """Test that incremental streaks equal a full recalculation after each append."""
+        rng = random.Random(42)
+        today = date.today()
+        candidates = [today - timedelta(days=i) for i in range(60)]
+        # Mostly chronological with a few backfilled dates
+        dates = sorted(d for d in candidates if rng.random() < 0.7)
+        for _ in range(5):
+            dates.insert(rng.randrange(len(dates)), dates.pop())
+
+        log = HabitLog("habit_log", "user_test", target_days)
+        logged = []
+        for completion_date in dates:
+            log.append(_entry("habit_log", completion_date))
+            logged.append(completion_date)
+            assert (log.current_streak(), log.longest_streak) == calculate_streak(
+                logged, target_days
+            )
+
+    def test_append_rejects_duplicate_date(self):
+        """Test that a date can only be logged once."""
+        log = HabitLog("habit_log", "user_test", [0, 1, 2, 3, 4, 5, 6])
+        assert log.append(_entry("habit_log", date.today())) is True
+        assert log.append(_entry("habit_log", date.today())) is False
+        assert len(log) == 1
+
+    def test_round_trip(self):
+        """Test serialization keeps rows and aggregates."""
+        log = HabitLog("habit_log", "user_test", [0, 1, 2, 3, 4, 5, 6])
+        for i in range(5):
+            log.append(_entry("habit_log", date.today() - timedelta(days=4 - i)))
+
+        restored = HabitLog.from_dict(json.loads(json.dumps(log.to_dict())))
+        assert len(restored) == 5
+        assert restored.current_streak() == log.current_streak() == 5
+        assert [e.entry_id for e in restored.entries()] == [e.entry_id for e in log.entries()]
+
+    def test_count_target_dates_matches_enumeration(self):
+        """Test arithmetic target-date counting against get_target_dates."""
+        start = date(2024, 1, 3)
+        for target_days in ([0, 1, 2, 3, 4, 5, 6], [0, 1, 2, 3, 4], [5, 6], [2]):
+            for length in range(0, 40):
+                end = start + timedelta(days=length)
+                expected = len(get_target_dates("custom", target_days, start, end))
+                assert count_target_dates(target_days, start, end) == expected
+
+
+class TestHabitLogStorage:
+    """Test that the tools store completions in the per-habit log."""
+
+    @pytest.fixture
+    def workspace(self, tmp_path):
+        habit = Habit(habit_id="habit_log_001", user_id="user_log", name="Stretch")
+        habit_dir = tmp_path / "habits" / "user_log"
+        habit_dir.mkdir(parents=True)
+        (habit_dir / "habit_log_001.json").write_text(json.dumps(habit.to_dict()))
+        return tmp_path
+
+    def test_log_completion_appends_to_log(self, workspace):
+        """Test logging writes one log file and updates streaks."""
+        from types import SimpleNamespace
+
+        tools = create_habit_tools(SimpleNamespace(root_dir=str(workspace)))
+        log_completion = tools[1]
+
+        for days_ago in (2, 1, 0):
+            result = log_completion.invoke(
+                {
+                    "user_id": "user_log",
+                    "habit_id": "habit_log_001",
+                    "completion_date": (date.today() - timedelta(days=days_ago)).isoformat(),
+                }
+            )
+            assert "Habit Completed" in result
+        assert "Current Streak: 3 days" in result
+
+        duplicate = log_completion.invoke({"user_id": "user_log", "habit_id": "habit_log_001"})
+        assert "already logged" in duplicate
+
+        entries_dir = workspace / "habits" / "user_log" / "entries" / "habit_log_001"
+        assert [p.name for p in entries_dir.iterdir()] == ["log.json"]
+
+        # A fresh tool set reads the same log
+        streaks = create_habit_tools(SimpleNamespace(root_dir=str(workspace)))[2]
+        assert "Total: 3 completions" in streaks.invoke({"user_id": "user_log"})
+
+    def test_legacy_entry_files_imported(self, workspace):
+        """Test that one-file-per-entry history is migrated into the log."""
+        from types import SimpleNamespace
+
+        entries_dir = workspace / "habits" / "user_log" / "entries" / "habit_log_001"
+        entries_dir.mkdir(parents=True)
+        for i in range(4):
+            entry = _entry("habit_log_001", date.today() - timedelta(days=i))
+            entry.user_id = "user_log"
+            (entries_dir / f"entry_{i}.json").write_text(json.dumps(entry.to_dict()))
+
+        tools = create_habit_tools(SimpleNamespace(root_dir=str(workspace)))
+        result = tools[2].invoke({"user_id": "user_log", "habit_id": "habit_log_001"})
+        assert "Current: 4 days" in result
+        assert "Total: 4 completions" in result
+        assert (entries_dir / "log.json").exists()
+
+
+# ==============================================================================
+# Vectorized Analytics Tests
+# ==============================================================================
+
+TARGET_DAY_SETS = [[0, 1, 2, 3, 4, 5, 6], [0, 1, 2, 3, 4], [5, 6], [0, 3], [2], [1, 2, 4, 6]]
+
+
+def _random_dates(rng, today, count, span=90):
+    return [today - timedelta(days=rng.randrange(span)) for _ in range(count)]
+
+
+class TestVectorizedAnalytics:
+    """Parity tests for the NumPy implementations."""
+
+    def test_streaks_match_calculate_streak(self):
+        """Test vectorized streaks against calculate_streak on random histories."""
+        pytest.importorskip("numpy")
+        rng = random.Random(7)
+        today = date.today()
+        for _ in range(500):
+            target_days = rng.choice(TARGET_DAY_SETS)
+            dates = _random_dates(rng, today, rng.randrange(40))
+            dates += dates[:2]  # Duplicates are tolerated by both
+            reference = today - timedelta(days=rng.randrange(5))
+            assert calculate_streaks_vectorized(
+                dates, target_days, today=reference
+            ) == calculate_streak(dates, target_days, today=reference)
+
+    def test_target_date_counts_match_enumeration(self):
+        """Test vectorized target-date counts against get_target_dates."""
+        pytest.importorskip("numpy")
+        rng = random.Random(11)
+        start_dates = [date(2024, 1, 1) + timedelta(days=rng.randrange(400)) for _ in range(50)]
+        end_dates = [d + timedelta(days=rng.randrange(-3, 60)) for d in start_dates]
+        target_days = [rng.choice(TARGET_DAY_SETS) for _ in start_dates]
+
+        counts = count_target_dates_vectorized(target_days, start_dates, end_dates)
+        expected = [
+            len(get_target_dates("custom", days, start, end))
+            for days, start, end in zip(target_days, start_dates, end_dates)
+        ]
+        assert counts.tolist() == expected
+
+    def test_score_habits_matches_scalar_functions(self):
+        """Test batch scoring against calculate_streak and calculate_habit_strength."""
+        rng = random.Random(3)
+        today = date.today()
+        habits, history = [], {}
+        for i in range(40):
+            habit = Habit(
+                habit_id=f"habit_batch_{i}",
+                user_id="user_test",
+                name=f"Habit {i}",
+                target_days=rng.choice(TARGET_DAY_SETS),
+                created_at=(today - timedelta(days=rng.randrange(1, 300))).isoformat(),
+            )
+            habits.append(habit)
+            history[habit.habit_id] = sorted(set(_random_dates(rng, today, rng.randrange(60))))
+        history[habits[0].habit_id] = []
+
+        stats = score_habits(habits, history)
+        assert set(stats) == {h.habit_id for h in habits}
+        for habit in habits:
+            dates = history[habit.habit_id]
+            created = parse_date(habit.created_at)
+            current, longest = calculate_streak(dates, habit.target_days)
+            expected = len(get_target_dates(habit.frequency, habit.target_days, created, today))
+            rate = len(dates) / expected if expected else 0
+            result = stats[habit.habit_id]
+
+            assert (result.current_streak, result.longest_streak) == (current, longest)
+            assert result.total_completions == len(dates)
+            assert result.completion_rate == rate
+            assert result.strength_score == calculate_habit_strength(
+                len(dates), current, longest, (today - created).days + 1, rate, habit.target_days
+            )
+            assert result.last_completed == (dates[-1].isoformat() if dates else None)
+
+    def test_score_habits_empty(self):
+        """Test batch scoring with no habits."""
+        assert score_habits([], {}) == {}
+
+
 # ==============================================================================
 # Research Constants Tests
 # ==============================================================================
@@ -0,0 +1,124 @@
+"""
+Tests for the shared Aho-Corasick keyword matcher.
+
+Covers:
+- Word-boundary modes ("word", "start", "none")
+- Overlapping matches and keywords in several categories
+- Parity with per-keyword regex searches
+"""
+
+import random
+import re
+import sys
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.tools.keyword_matcher import KeywordMatch, KeywordMatcher
+
+
+def _regex_matches(text, keywords, boundary):
+    """Per-keyword regex baseline (overlapping occurrences included)."""
+    before = r"\b" if boundary != "none" else ""
+    after = r"\b" if boundary == "word" else ""
+    found = []
+    for keyword in keywords:
+        pattern = "(?=" + before + re.escape(keyword) + after + ")"
+        found.extend((keyword, m.start()) for m in re.finditer(pattern, text.lower()))
+    return sorted(found)
+
+
+class TestKeywordMatcher:
+    """Test KeywordMatcher."""
+
+    def test_whole_word_matching(self):
+        """Whole-word keywords skip occurrences inside other words."""
+        matcher = KeywordMatcher.from_keywords({"positive": ["joy", "calm"]})
+        matches = matcher.find_all("I enjoy the calm; joy, calmly.")
+
+        assert [(m.keyword, m.start) for m in matches] == [("calm", 12), ("joy", 18)]
+        assert all(isinstance(m, KeywordMatch) for m in matches)
+
+    def test_start_boundary_allows_inflections(self):
+        """'start' keywords match word prefixes but not word middles."""
+        matcher = KeywordMatcher.from_keywords({"challenge": ["struggle", "hard"]}, "start")
+        keywords = [m.keyword for m in matcher.find_all("I struggled. Hardly. Not orchard.")]
+
+        assert keywords == ["struggle", "hard"]
+
+    def test_substring_mode(self):
+        """'none' keywords match anywhere."""
+        matcher = KeywordMatcher.from_keywords({"x": ["od on"]}, boundary="none")
+        assert len(matcher.find_all("a good one")) == 1
+
+    def test_case_insensitive_phrases(self):
+        """Phrases match across case and report offsets into the text."""
+        matcher = KeywordMatcher.from_keywords({"negative": ["burned out"]})
+        (match,) = matcher.find_all("Totally BURNED OUT today")
+
+        assert match.keyword == "burned out"
+        assert (match.start, match.end) == (8, 18)
+
+    def test_overlapping_and_multi_category(self):
+        """Overlapping keywords and repeated keywords are all reported."""
+        matcher = KeywordMatcher(boundary="none")
+        matcher.add("he", "a")
+        matcher.add("she", "b", severity="high")
+        matcher.add("hers", "c")
+        matcher.add("she", "d")
+
+        found = {(m.keyword, m.category, m.severity, m.start) for m in matcher.find_all("ushers")}
+
+        assert found == {
+            ("she", "b", "high", 1),
+            ("she", "d", None, 1),
+            ("he", "a", None, 2),
+            ("hers", "c", None, 2),
+        }
+
+    def test_index_follows_insertion_order(self):
+        """Match index is the order in which keywords were added."""
+        matcher = KeywordMatcher.from_keywords({"a": ["first", "second"], "b": ["third"]})
+        matches = matcher.find_all("third second first")
+
+        assert sorted((m.index, m.keyword) for m in matches) == [
+            (0, "first"),
+            (1, "second"),
+            (2, "third"),
+        ]
+
+    def test_add_after_compile_recompiles(self):
+        """Keywords added after compiling are picked up by the next search."""
+        matcher = KeywordMatcher.from_keywords({"a": ["alpha"]})
+        matcher.add("beta", "b")
+
+        assert not matcher.compiled
+        assert [m.keyword for m in matcher.find_all("alpha beta")] == ["alpha", "beta"]
+        assert len(matcher) == 2
+
+    def test_invalid_arguments(self):
+        """Unknown boundary modes and empty keywords are rejected."""
+        with pytest.raises(ValueError):
+            KeywordMatcher(boundary="edge")
+        with pytest.raises(ValueError):
+            KeywordMatcher().add("", "a")
+
+    def test_empty_text(self):
+        """Searching empty text finds nothing."""
+        assert KeywordMatcher.from_keywords({"a": ["x"]}).find_all("") == []
+
+    @pytest.mark.parametrize("boundary", ["word", "start", "none"])
+    def test_parity_with_regex(self, boundary):
+        """Matches equal per-keyword regex searches on random text."""
+        rng = random.Random(boundary)
+        for _ in range(300):
+            keywords = sorted(
+                {"".join(rng.choice("abc") for _ in range(rng.randint(1, 4))) for _ in range(6)}
+            )
+            text = "".join(rng.choice("abC -") for _ in range(40))
+            matcher = KeywordMatcher.from_keywords({"k": keywords}, boundary)
+
+            found = sorted((m.keyword, m.start) for m in matcher.find_all(text))
+            assert found == _regex_matches(text, keywords, boundary)
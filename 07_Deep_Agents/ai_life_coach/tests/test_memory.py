@@ -5,6 +5,10 @@ Tests all namespace operations, data models, and CRUD functionality.
 """
 
 import pytest
+import threading
+import time
+from datetime import datetime
+from typing import Optional
 from uuid import uuid4
 
 # Import the memory module components
@@ -21,6 +25,8 @@ from memory import (
     get_progress_namespace,
     get_preferences_namespace,
     get_coaching_patterns_namespace,
+    get_pattern_vectors_namespace,
+    get_journal_namespace,
     # Data models
     UserProfile,
     Goal,
@@ -33,6 +39,12 @@ from memory import (
     create_memory_manager,
     # Memory manager
     MemoryManager,
+    # Pattern retrieval
+    PatternVectorIndex,
+    hashed_embedding,
+    # Record base
+    _Record,
+    _record,
 )
 
 
@@ -254,6 +266,88 @@ def test_create_invalid_store_type():
         create_memory_store("invalid_type")
 
 
+def test_records_are_slotted():
+    """Test that records have no per-instance __dict__."""
+    for record in (
+        UserProfile(user_id="u"),
+        Goal(),
+        Milestone(),
+        Setback(),
+        UserPreferences(),
+        CoachingPattern(),
+    ):
+        assert not hasattr(record, "__dict__")
+        with pytest.raises(AttributeError):
+            record.unexpected_attribute = 1
+
+
+def test_from_dict_ignores_unknown_keys():
+    """Test that stored dictionaries with extra keys still load."""
+    goal = Goal(title="Run", domain="wellness")
+    data = goal.to_dict()
+    data["legacy_field"] = "ignored"
+
+    loaded = Goal.from_dict(data)
+    assert loaded.goal_id == goal.goal_id
+    assert loaded.title == "Run"
+    assert UserProfile.from_dict({"name": "No ID"}).user_id == ""
+
+
+def test_json_round_trip():
+    """Test JSON serialization of records."""
+    profile = UserProfile(user_id="user_json", name="Jay", values=["growth"], age=33)
+    loaded = UserProfile.from_json(profile.to_json())
+    assert loaded.to_dict() == profile.to_dict()
+
+    pattern = CoachingPattern(title="Small wins", related_domains=["career"])
+    assert CoachingPattern.from_json(pattern.to_json().decode()).to_dict() == pattern.to_dict()
+
+
+def test_base_to_dict_covers_record_fields():
+    """Test that the shared to_dict serializes every init field (not the parse cache)."""
+
+    @_record
+    class Note(_Record):
+        text: str = ""
+        created_at: Optional[str] = None
+
+    note = Note(text="hi", created_at="2025-01-01T00:00:00")
+    note._timestamp("created_at")  # Fills the parse cache, which is not stored
+    assert note.to_dict() == {"text": "hi", "created_at": "2025-01-01T00:00:00"}
+    assert Note.from_json(note.to_json()).text == "hi"
+
+    # Records rely on the shared to_dict; the stored keys are the dataclass fields
+    assert list(Goal().to_dict()) == [
+        "goal_id",
+        "title",
+        "description",
+        "domain",
+        "priority",
+        "status",
+        "timeframe",
+        "deadline",
+        "dependencies",
+        "created_at",
+    ]
+    milestone = Milestone(title="First week", significance="major")
+    assert Milestone.from_dict(milestone.to_dict()).to_dict() == milestone.to_dict()
+
+
+def test_parsed_datetimes_are_cached():
+    """Test that parsed timestamps are cached and refreshed when the field changes."""
+    goal = Goal(deadline="2025-06-30", created_at="2025-01-15T09:30:00")
+    assert goal.deadline_dt == datetime(2025, 6, 30)
+    assert goal.created_at_dt == datetime(2025, 1, 15, 9, 30)
+    assert goal.deadline_dt is goal.deadline_dt
+
+    goal.deadline = "2025-07-31"
+    assert goal.deadline_dt == datetime(2025, 7, 31)
+
+    goal.deadline = None
+    assert goal.deadline_dt is None
+    assert Milestone(achieved_at="not a date").achieved_at_dt is None
+
+
 # ==============================================================================
 # Memory Manager Tests
 # ==============================================================================
@@ -424,6 +518,96 @@ def test_get_goals_by_domain():
         pytest.skip("LangGraph not available")
 
 
+def test_get_goals_with_indexed_filters():
+    """Test filtering goals by domain, status and deadline through the goal index."""
+    try:
+        store = create_memory_store("in_memory")
+        manager = MemoryManager(store)
+
+        user_id = "test_user_goal_index"
+        specs = [
+            ("Run 5k", "wellness", "in_progress", "2025-03-01"),
+            ("Promotion", "career", "pending", "2025-12-31"),
+            ("Emergency fund", "finance", "in_progress", "2025-06-30"),
+            ("Meditate", "wellness", "completed", None),
+            ("Learn Rust", "career", "in_progress", "2025-02-01"),
+        ]
+        goals = {}
+        for title, domain, status, deadline in specs:
+            goal = Goal(title=title, domain=domain, status=status, deadline=deadline)
+            manager.save_goal(user_id, goal)
+            goals[title] = goal
+
+        def titles(**filters):
+            return [g.title for g in manager.get_goals(user_id, **filters)]
+
+        assert titles(domain="wellness") == ["Run 5k", "Meditate"]
+        assert titles(status="in_progress") == ["Run 5k", "Emergency fund", "Learn Rust"]
+        assert titles(domain="career", status="in_progress") == ["Learn Rust"]
+        assert titles(due_before="2025-06-30") == ["Run 5k", "Learn Rust"]
+        assert titles(status="in_progress", due_before="2025-07-01") == [
+            "Run 5k",
+            "Emergency fund",
+            "Learn Rust",
+        ]
+        assert titles(domain="relationship") == []
+        assert manager.count_goals(user_id, status="in_progress") == 3
+
+        # Updating a goal moves it between index buckets but keeps its position
+        goals["Run 5k"].status = "completed"
+        goals["Run 5k"].deadline = None
+        manager.save_goal(user_id, goals["Run 5k"])
+        assert titles(status="completed") == ["Run 5k", "Meditate"]
+        assert titles(due_before="2025-06-30") == ["Learn Rust"]
+
+        manager.delete_goal(user_id, goals["Learn Rust"].goal_id)
+        assert titles(domain="career") == ["Promotion"]
+        assert manager.count_goals(user_id) == 4
+
+    except ValueError:
+        pytest.skip("LangGraph not available")
+
+
+def test_get_goals_paging():
+    """Test paging through a long goal history."""
+    try:
+        store = create_memory_store("in_memory")
+        manager = MemoryManager(store)
+
+        user_id = "test_user_goal_paging"
+        for i in range(30):
+            manager.save_goal(user_id, Goal(title=f"Goal {i:02d}", domain="career"))
+
+        pages = [
+            [g.title for g in manager.get_goals(user_id, domain="career", limit=12, offset=o)]
+            for o in (0, 12, 24)
+        ]
+        assert [len(page) for page in pages] == [12, 12, 6]
+        assert pages[0][0] == "Goal 00" and pages[2][-1] == "Goal 29"
+        assert manager.get_goals(user_id, limit=5)[4].title == "Goal 04"
+
+    except ValueError:
+        pytest.skip("LangGraph not available")
+
+
+def test_goal_index_rebuilt_for_unindexed_goals():
+    """Test that goals written without an index are indexed on first query."""
+    try:
+        store = create_memory_store("in_memory")
+        manager = MemoryManager(store)
+
+        user_id = "test_user_legacy_goals"
+        for domain in ("career", "finance", "career"):
+            goal = Goal(title=f"{domain} goal", domain=domain)
+            store.put(get_goals_namespace(user_id), goal.goal_id, goal.to_dict())
+
+        assert len(manager.get_goals(user_id, domain="career")) == 2
+        assert manager.count_goals(user_id) == 3
+
+    except ValueError:
+        pytest.skip("LangGraph not available")
+
+
 def test_delete_goal():
     """Test deleting a goal."""
     try:
@@ -650,6 +834,319 @@ def test_increment_pattern_usage():
         pytest.skip("LangGraph not available")
 
 
+class CountingEmbedder:
+    """Offline embedding stub that counts how often it is called."""
+
+    __name__ = "counting"
+
+    def __init__(self):
+        self.calls = 0
+
+    def __call__(self, text):
+        self.calls += 1
+        return hashed_embedding(text, dims=64)
+
+
+def test_find_relevant_patterns():
+    """Test that retrieval ranks patterns by relevance to the query."""
+    try:
+        store = create_memory_store("in_memory")
+        manager = MemoryManager(store)
+
+        manager.save_pattern(
+            CoachingPattern(
+                title="Budget envelopes",
+                description="Split monthly spending into envelopes to control debt",
+                related_domains=["finance"],
+            )
+        )
+        manager.save_pattern(
+            CoachingPattern(
+                title="Sleep wind-down routine",
+                description="Screens off an hour before bed to improve sleep quality",
+                related_domains=["wellness"],
+            )
+        )
+
+        results = manager.find_relevant_patterns("I can't sleep and feel tired before bed", k=1)
+        assert len(results) == 1
+        assert results[0][0].title == "Sleep wind-down routine"
+
+        finance = manager.find_relevant_patterns("sleep", domain="finance")
+        assert finance == []
+        assert manager.find_relevant_patterns("") == []
+
+    except ValueError:
+        pytest.skip("LangGraph not available")
+
+
+def test_patterns_embedded_once():
+    """Test that vectors are persisted and reused instead of re-embedding."""
+    try:
+        store = create_memory_store("in_memory")
+        embedder = CountingEmbedder()
+        manager = MemoryManager(store, embed_fn=embedder)
+
+        patterns = [
+            CoachingPattern(title=f"Pattern {i}", description=f"strategy number {i}")
+            for i in range(5)
+        ]
+        for pattern in patterns:
+            manager.save_pattern(pattern)
+        assert embedder.calls == 5
+        assert len(store.search(get_pattern_vectors_namespace())) == 5
+
+        # Building the index, usage updates and unchanged saves reuse stored vectors
+        manager.find_relevant_patterns("strategy")
+        manager.increment_pattern_usage(patterns[0].pattern_id)
+        manager.save_pattern(patterns[1])
+        assert embedder.calls == 5 + 1  # only the query
+
+        # A fresh manager loads persisted vectors
+        other = MemoryManager(store, embed_fn=embedder)
+        other.find_relevant_patterns("strategy")
+        assert embedder.calls == 5 + 2
+
+        # Changing the text re-embeds that pattern only
+        patterns[2].description = "completely different text"
+        other.save_pattern(patterns[2])
+        assert embedder.calls == 5 + 3
+
+    except ValueError:
+        pytest.skip("LangGraph not available")
+
+
+def test_pattern_usage_breaks_ties():
+    """Test that usage counts act as a ranking prior."""
+    try:
+        store = create_memory_store("in_memory")
+        manager = MemoryManager(store)
+
+        quiet = CoachingPattern(title="Morning journaling", description="write three pages")
+        popular = CoachingPattern(title="Morning journaling", description="write three pages")
+        manager.save_pattern(quiet)
+        manager.save_pattern(popular)
+        manager.find_relevant_patterns("journaling")
+
+        for _ in range(3):
+            manager.increment_pattern_usage(popular.pattern_id)
+
+        results = manager.find_relevant_patterns("morning journaling", k=2)
+        assert [p.pattern_id for p, _ in results] == [popular.pattern_id, quiet.pattern_id]
+        assert results[0][1] > results[1][1]
+
+    except ValueError:
+        pytest.skip("LangGraph not available")
+
+
+def test_pattern_vector_index_query_speed():
+    """Test that top-k retrieval over 1000 patterns stays under 1ms."""
+    index = PatternVectorIndex()
+    domains = ["career", "finance", "wellness", "relationship"]
+    topics = ["sleep", "budget", "promotion", "conflict", "exercise", "savings", "focus"]
+    for i in range(1000):
+        index.add(
+            CoachingPattern(
+                title=f"{topics[i % 7]} pattern {i}",
+                description=f"Use {topics[(i * 3) % 7]} check-ins to sustain progress",
+                related_domains=[domains[i % 4]],
+                usage_count=i % 10,
+            )
+        )
+
+    index.search("struggling with my budget and savings")  # Warm up
+    start = time.perf_counter()
+    for _ in range(100):
+        results = index.search("struggling with my budget and savings", k=5)
+    avg_ms = (time.perf_counter() - start) / 100 * 1000
+
+    assert len(results) == 5
+    assert avg_ms < 1.0, f"search took {avg_ms:.3f}ms"
+
+
+# ==============================================================================
+# Journal Tests
+# ==============================================================================
+
+
+def test_journaled_mutations_visible_before_compaction():
+    """Test that journaled writes are applied on read and folded by compaction."""
+    try:
+        store = create_memory_store("in_memory")
+        manager = MemoryManager(store, journaled=True, compact_every=1000)
+        user_id = "journal_user"
+
+        pattern = CoachingPattern(title="Habit stacking", usage_count=2)
+        manager.save_pattern(pattern)
+        for _ in range(3):
+            manager.increment_pattern_usage(pattern.pattern_id)
+        manager.update_preference_key(user_id, "communication_style", "concise")
+        manager.update_preference_key(user_id, "favorite_time", "morning")
+        manager.add_milestone(user_id, Milestone(title="First week done"))
+
+        # Snapshots are untouched; reads apply the pending entries
+        stored = store.get(get_coaching_patterns_namespace(), pattern.pattern_id)
+        assert stored.value["usage_count"] == 2
+        assert manager.get_pattern(pattern.pattern_id).usage_count == 5
+        assert manager.get_patterns()[0].usage_count == 5
+        preferences = manager.get_preferences(user_id)
+        assert preferences.communication_style == "concise"
+        assert preferences.custom_preferences == {"favorite_time": "morning"}
+        assert [m.title for m in manager.get_milestones(user_id)] == ["First week done"]
+        summary = manager.get_user_summary(user_id)
+        assert summary["preferences"].communication_style == "concise"
+        assert len(summary["milestones"]) == 1
+
+        assert manager.compact_journal() == 6
+        assert store.search(("journal",)) == []
+        stored = store.get(get_coaching_patterns_namespace(), pattern.pattern_id)
+        assert stored.value["usage_count"] == 5
+        assert manager.get_preferences(user_id).custom_preferences == {"favorite_time": "morning"}
+        assert len(manager.get_milestones(user_id)) == 1
+
+    except ValueError:
+        pytest.skip("LangGraph not available")
+
+
+def test_milestones_for_users_include_journaled_entries():
+    """Test that the multi-user milestone read applies pending journal entries."""
+    try:
+        store = create_memory_store("in_memory")
+        manager = MemoryManager(store, journaled=True, compact_every=1000)
+        manager.add_milestone("u1", Milestone(title="a"))
+        manager.add_milestone("u2", Milestone(title="b"))
+        manager.compact_journal()
+        manager.add_milestone("u2", Milestone(title="c"))
+
+        milestones = manager.get_milestones_for_users(["u1", "u2", "u3"])
+        assert [m.title for m in milestones["u1"]] == ["a"]
+        assert sorted(m.title for m in milestones["u2"]) == ["b", "c"]
+        assert milestones["u3"] == []
+
+    except ValueError:
+        pytest.skip("LangGraph not available")
+
+
+def test_journal_compacts_automatically():
+    """Test that compaction runs after compact_every appends."""
+    try:
+        store = create_memory_store("in_memory")
+        manager = MemoryManager(store, journaled=True, compact_every=5)
+        pattern = CoachingPattern(title="Two-minute rule")
+        manager.save_pattern(pattern)
+
+        for _ in range(7):
+            manager.increment_pattern_usage(pattern.pattern_id)
+
+        journal = store.search(get_journal_namespace(get_coaching_patterns_namespace()))
+        assert len(journal) == 2
+        stored = store.get(get_coaching_patterns_namespace(), pattern.pattern_id)
+        assert stored.value["usage_count"] == 5
+        assert manager.get_pattern(pattern.pattern_id).usage_count == 7
+
+    except ValueError:
+        pytest.skip("LangGraph not available")
+
+
+def test_journal_concurrent_increments_not_lost():
+    """Test that concurrent journaled increments are all counted."""
+    try:
+        store = create_memory_store("in_memory")
+        manager = MemoryManager(store, journaled=True, compact_every=50)
+        pattern = CoachingPattern(title="Implementation intentions")
+        manager.save_pattern(pattern)
+
+        def worker():
+            for _ in range(100):
+                manager.increment_pattern_usage(pattern.pattern_id)
+
+        threads = [threading.Thread(target=worker) for _ in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert manager.get_pattern(pattern.pattern_id).usage_count == 400
+        manager.compact_journal()
+        assert manager.get_pattern(pattern.pattern_id).usage_count == 400
+
+    except ValueError:
+        pytest.skip("LangGraph not available")
+
+
+def test_full_put_supersedes_pending_journal_entries():
+    """Test that saving a whole record drops its pending journal entries."""
+    try:
+        store = create_memory_store("in_memory")
+        manager = MemoryManager(store, journaled=True, compact_every=1000)
+        user_id = "journal_user"
+
+        pattern = CoachingPattern(title="Habit stacking", usage_count=3)
+        manager.save_pattern(pattern)
+        manager.increment_pattern_usage(pattern.pattern_id)
+        edited = manager.get_pattern(pattern.pattern_id)
+        assert edited.usage_count == 4
+        edited.description = "Attach a new habit to an existing one"
+        manager.save_pattern(edited)
+
+        assert manager.get_pattern(pattern.pattern_id).usage_count == 4
+        manager.compact_journal()
+        assert manager.get_pattern(pattern.pattern_id).usage_count == 4
+
+        manager.update_preference_key(user_id, "communication_style", "concise")
+        manager.save_preferences(UserPreferences(user_id=user_id, communication_style="detailed"))
+
+        assert manager.get_preferences(user_id).communication_style == "detailed"
+        assert store.search(get_journal_namespace(get_preferences_namespace(user_id))) == []
+
+    except ValueError:
+        pytest.skip("LangGraph not available")
+
+
+def test_concurrent_compaction_folds_entries_once():
+    """Test that managers sharing a store never fold the same entries twice."""
+    try:
+        store = create_memory_store("in_memory")
+        managers = [MemoryManager(store, journaled=True, compact_every=10_000) for _ in range(4)]
+        pattern = CoachingPattern(title="Implementation intentions")
+        managers[0].save_pattern(pattern)
+
+        def worker(manager):
+            for _ in range(50):
+                manager.increment_pattern_usage(pattern.pattern_id)
+                manager.compact_journal()
+
+        threads = [threading.Thread(target=worker, args=(m,)) for m in managers]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert managers[0].get_pattern(pattern.pattern_id).usage_count == 200
+        managers[0].compact_journal()
+        stored = store.get(get_coaching_patterns_namespace(), pattern.pattern_id)
+        assert stored.value["usage_count"] == 200
+
+    except ValueError:
+        pytest.skip("LangGraph not available")
+
+
+def test_delete_user_data_clears_journal():
+    """Test that user deletion also removes pending journal entries."""
+    try:
+        store = create_memory_store("in_memory")
+        manager = MemoryManager(store, journaled=True)
+        manager.update_preference_key("gone_user", "communication_style", "detailed")
+        manager.add_milestone("gone_user", Milestone(title="Pending"))
+
+        assert manager.delete_user_data("gone_user") is True
+        assert manager.get_preferences("gone_user") is None
+        assert manager.get_milestones("gone_user") == []
+
+    except ValueError:
+        pytest.skip("LangGraph not available")
+
+
 # ==============================================================================
 # Integration Tests
 # ==============================================================================
@@ -720,6 +1217,152 @@ def test_delete_user_data():
         pytest.skip("LangGraph not available")
 
 
+# ==============================================================================
+# Batch Operation Tests
+# ==============================================================================
+
+
+class CountingStore:
+    """Store wrapper counting batch() round trips."""
+
+    def __init__(self, store):
+        self._store = store
+        self.batch_calls = 0
+
+    def batch(self, ops):
+        self.batch_calls += 1
+        return self._store.batch(ops)
+
+    def __getattr__(self, name):
+        return getattr(self._store, name)
+
+
+def test_get_goals_returns_more_than_default_search_limit():
+    """Test that listing goals is not truncated at the store's default page size."""
+    try:
+        store = create_memory_store("in_memory")
+        manager = MemoryManager(store)
+
+        user_id = "test_user_many_goals"
+        for i in range(25):
+            manager.save_goal(user_id, Goal(title=f"Goal {i}", domain="career"))
+
+        assert len(manager.get_goals(user_id)) == 25
+
+    except ValueError:
+        pytest.skip("LangGraph not available")
+
+
+def test_put_get_delete_many():
+    """Test bulk put, get and delete across namespaces."""
+    try:
+        store = create_memory_store("in_memory")
+        manager = MemoryManager(store)
+
+        items = [
+            (get_profile_namespace("user_a"), "profile_data", {"user_id": "user_a"}),
+            (get_preferences_namespace("user_b"), "preferences_data", {"user_id": "user_b"}),
+        ]
+        manager.put_many(items)
+
+        keys = [(namespace, key) for namespace, key, _ in items]
+        values = manager.get_many(keys + [(get_profile_namespace("missing"), "profile_data")])
+        assert values == [{"user_id": "user_a"}, {"user_id": "user_b"}, None]
+
+        manager.delete_many(keys)
+        assert manager.get_many(keys) == [None, None]
+
+    except ValueError:
+        pytest.skip("LangGraph not available")
+
+
+def test_async_bulk_operations():
+    """Test async bulk variants."""
+    import asyncio
+
+    try:
+        store = create_memory_store("in_memory")
+        manager = MemoryManager(store)
+        keys = [(get_profile_namespace(f"user_{i}"), "profile_data") for i in range(3)]
+
+        async def run():
+            await manager.aput_many([(ns, key, {"n": i}) for i, (ns, key) in enumerate(keys)])
+            values = await manager.aget_many(keys)
+            await manager.adelete_many(keys)
+            return values, await manager.aget_many(keys)
+
+        values, after_delete = asyncio.run(run())
+        assert values == [{"n": 0}, {"n": 1}, {"n": 2}]
+        assert after_delete == [None, None, None]
+
+    except ValueError:
+        pytest.skip("LangGraph not available")
+
+
+def test_bulk_reads_for_many_users_use_one_round_trip():
+    """Test that bulk profile, goal and milestone reads batch across users."""
+    try:
+        store = CountingStore(create_memory_store("in_memory"))
+        manager = MemoryManager(store)
+
+        user_ids = [f"bulk_user_{i}" for i in range(20)]
+        for i, user_id in enumerate(user_ids):
+            manager.save_profile(UserProfile(user_id=user_id, name=f"User {i}"))
+            for j in range(i % 3):
+                manager.save_goal(user_id, Goal(title=f"Goal {j}", domain="health"))
+            manager.add_milestone(user_id, Milestone(title="Started", domain="health"))
+            manager.add_setback(user_id, Setback(description="Missed a day", domain="health"))
+
+        store.batch_calls = 0
+        profiles = manager.get_profiles_for_users(user_ids + ["unknown"])
+        goals = manager.get_goals_for_users(user_ids)
+        milestones = manager.get_milestones_for_users(user_ids)
+        assert store.batch_calls == 3
+
+        assert profiles["bulk_user_4"].name == "User 4"
+        assert profiles["unknown"] is None
+        assert [len(goals[user_id]) for user_id in user_ids] == [i % 3 for i in range(20)]
+        assert all(len(milestones[user_id]) == 1 for user_id in user_ids)
+
+    except ValueError:
+        pytest.skip("LangGraph not available")
+
+
+def test_user_summary_and_delete_are_batched():
+    """Test that summary reads take one round trip and deletion takes two."""
+    try:
+        store = CountingStore(create_memory_store("in_memory"))
+        manager = MemoryManager(store)
+
+        user_id = "test_user_batched"
+        manager.save_profile(UserProfile(user_id=user_id, name="Batched"))
+        for i in range(3):
+            manager.save_goal(user_id, Goal(title=f"Goal {i}", domain="career"))
+        manager.add_milestone(user_id, Milestone(title="Milestone", domain="career"))
+        manager.add_setback(user_id, Setback(description="Setback", domain="career"))
+        manager.save_preferences(UserPreferences(user_id=user_id))
+
+        store.batch_calls = 0
+        summary = manager.get_user_summary(user_id)
+        assert store.batch_calls == 1
+        assert summary["profile"].name == "Batched"
+        assert len(summary["goals"]) == 3
+        assert len(summary["milestones"]) == 1
+        assert len(summary["setbacks"]) == 1
+        assert summary["preferences"].user_id == user_id
+
+        store.batch_calls = 0
+        assert manager.delete_user_data(user_id) is True
+        assert store.batch_calls == 2
+        summary = manager.get_user_summary(user_id)
+        assert summary["profile"] is None
+        assert summary["goals"] == []
+        assert summary["preferences"] is None
+
+    except ValueError:
+        pytest.skip("LangGraph not available")
+
+
 # ==============================================================================
 # Main Test Runner
 # ==============================================================================
@@ -11,8 +11,11 @@ including:
 - Mood trigger detection system
 """
 
+import json
 import pytest
+from datetime import date, datetime, timedelta
 from pathlib import Path
+from types import SimpleNamespace
 
 # Import mood tools and helper functions
 import sys
@@ -20,6 +23,7 @@ import sys
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
 from src.tools.mood_tools import (
+    create_mood_tools,
     analyze_sentiment_keywords,
     calculate_composite_mood_score,
     generate_ascii_chart,
@@ -28,6 +32,16 @@ from src.tools.mood_tools import (
     MOOD_DIMENSIONS,
     SENTIMENT_KEYWORDS,
     MOOD_TRIGGERS,
+    MOOD_WINDOWS,
+    MOOD_EWMA_ALPHA,
+    MoodSeries,
+    append_mood_entry,
+    get_mood_series_path,
+    load_mood_series,
+    build_daily_mood_frame,
+    correlation_matrix,
+    lagged_correlations,
+    rolling_correlation,
 )
 
 
@@ -630,6 +644,24 @@ class TestAnalyzeMoodProgressCorrelation:
 
         assert "No mood entries found" in result or "No check-in entries found" in result
 
+    def test_analyze_correlation_with_checkins(self, tmp_path):
+        """Test correlation analysis over mood entries and weekly check-ins."""
+        backend = SimpleNamespace(root_dir=tmp_path)
+        analyze_corr = create_mood_tools(backend)[4]
+        today = date.today()
+        checkins_dir = tmp_path / "checkins" / "series_user"
+        checkins_dir.mkdir(parents=True)
+        for week in range(4):
+            day = today - timedelta(days=7 * (3 - week))
+            append_mood_entry(_series_entry(day, 3 + 2 * week), backend)
+            checkin = {"date": day.isoformat(), "scores": {"overall": 0.2 + 0.2 * week}}
+            (checkins_dir / f"week_{week + 1}_checkin.json").write_text(json.dumps(checkin))
+
+        result = analyze_corr.invoke({"user_id": "series_user", "days": 30})
+
+        assert "Analyzing 4 data points" in result
+        assert "Positive strong correlation" in result
+
 
 class TestDetectMoodTriggers:
     """Test detect_mood_triggers tool."""
@@ -704,6 +736,231 @@ class TestGetMoodHistory:
         assert "Day 1 entry" in result or "Composite:" in result
 
 
+# ==============================================================================
+# Mood Series Tests
+# ==============================================================================
+
+
+def _series_entry(day: date, happiness: int, hour: int = 9) -> dict:
+    dims = {"happiness": happiness, "stress": 11 - happiness, "energy": 5, "motivation": 5}
+    return {
+        "user_id": "series_user",
+        "timestamp": datetime.combine(day, datetime.min.time()).replace(hour=hour).isoformat(),
+        "date": day.isoformat(),
+        "dimensions": dims,
+        "composite_score": calculate_composite_mood_score(dims),
+    }
+
+
+class TestMoodSeries:
+    """Test the MoodSeries rolling aggregates."""
+
+    def _brute_window(self, entries, days, today):
+        cutoff = (today - timedelta(days=days - 1)).isoformat()
+        scores = [e["composite_score"] for e in entries if e["date"] >= cutoff]
+        if not scores:
+            return 0, None, None
+        mean = sum(scores) / len(scores)
+        return len(scores), mean, sum((s - mean) ** 2 for s in scores) / len(scores)
+
+    def test_windows_match_brute_force(self):
+        """Maintained window statistics match a recomputation from the entries."""
+        start = date(2026, 1, 1)
+        entries = [
+            _series_entry(start + timedelta(days=i * 2), 1 + (i * 7) % 10) for i in range(80)
+        ]
+        series = MoodSeries("series_user")
+        for entry in entries:
+            series.append(entry)
+
+        for today in (start + timedelta(days=158), start + timedelta(days=170)):
+            for days in MOOD_WINDOWS + (14,):
+                stats = series.window(days, today)
+                count, mean, variance = self._brute_window(entries, days, today)
+                assert stats["count"] == count
+                assert stats["mean"] == pytest.approx(mean)
+                assert stats["variance"] == pytest.approx(variance, abs=1e-9)
+
+    def test_ewma(self):
+        """EWMA follows the configured smoothing factor."""
+        series = MoodSeries("series_user")
+        scores = []
+        for i, happiness in enumerate([8, 2, 6, 9]):
+            entry = _series_entry(date(2026, 3, 1) + timedelta(days=i), happiness)
+            series.append(entry)
+            scores.append(entry["composite_score"])
+
+        expected = scores[0]
+        for score in scores[1:]:
+            expected = MOOD_EWMA_ALPHA * score + (1 - MOOD_EWMA_ALPHA) * expected
+        assert series.ewma == pytest.approx(expected)
+
+    def test_out_of_order_append(self):
+        """Entries appended out of order are stored sorted with correct aggregates."""
+        days = [date(2026, 5, 10), date(2026, 5, 1), date(2026, 5, 12), date(2026, 5, 5)]
+        series = MoodSeries("series_user")
+        for i, day in enumerate(days):
+            series.append(_series_entry(day, 3 + i))
+
+        assert [e["date"] for e in series.entries()] == sorted(d.isoformat() for d in days)
+        rebuilt = MoodSeries.from_dict(series.to_dict())
+        assert series.window(7, date(2026, 5, 12)) == rebuilt.window(7, date(2026, 5, 12))
+        assert series.ewma == pytest.approx(rebuilt.ewma)
+
+    def test_tail_and_since(self):
+        """tail() and since() return the most recent entries oldest first."""
+        series = MoodSeries("series_user")
+        for i in range(10):
+            series.append(_series_entry(date(2026, 6, 1) + timedelta(days=i), 5))
+
+        assert [e["date"] for e in series.tail(2)] == ["2026-06-09", "2026-06-10"]
+        assert len(series.since(date(2026, 6, 8))) == 3
+        assert series.tail(50)[0]["date"] == "2026-06-01"
+
+
+class TestMoodAnalytics:
+    """Test the vectorized correlation analytics."""
+
+    @pytest.fixture(autouse=True)
+    def _numpy(self):
+        self.np = pytest.importorskip("numpy")
+
+    def test_correlation_matrix_matches_corrcoef(self):
+        """Pairwise correlations skip missing values like a complete-case corrcoef."""
+        rng = self.np.random.default_rng(7)
+        a = rng.random(60)
+        b = 0.6 * a + 0.4 * rng.random(60)
+        c = rng.random(60)
+        a_missing = [None if i % 9 == 0 else float(v) for i, v in enumerate(a)]
+
+        matrix = correlation_matrix({"a": a_missing, "b": list(b), "c": list(c)})
+
+        keep = [i for i in range(60) if i % 9]
+        expected_ab = self.np.corrcoef(a[keep], b[keep])[0, 1]
+        assert matrix["a"]["b"] == pytest.approx(expected_ab, abs=1e-3)
+        assert matrix["b"]["a"] == matrix["a"]["b"]
+        assert matrix["b"]["c"] == pytest.approx(self.np.corrcoef(b, c)[0, 1], abs=1e-3)
+        assert matrix["a"]["a"] == 1.0
+
+    def test_constant_series_has_no_correlation(self):
+        """Series without variance yield None rather than a spurious value."""
+        matrix = correlation_matrix({"flat": [0.5] * 10, "x": [i / 10 for i in range(10)]})
+        assert matrix["flat"]["x"] is None
+
+    def test_lagged_correlation_finds_shift(self):
+        """A series that repeats another three steps later peaks at lag 3."""
+        rng = self.np.random.default_rng(3)
+        mood = rng.random(120)
+        progress = self.np.concatenate([rng.random(3), mood[:-3]])
+
+        lagged = lagged_correlations(list(mood), list(progress), max_lag=7)
+
+        assert set(lagged) == set(range(8))
+        assert lagged[3] == pytest.approx(1.0)
+        assert max(lagged, key=lambda lag: abs(lagged[lag] or 0)) == 3
+
+    def test_rolling_correlation_matches_windows(self):
+        """Rolling correlation equals corrcoef over each window."""
+        rng = self.np.random.default_rng(11)
+        x = rng.random(50)
+        y = x + rng.random(50)
+
+        rolling = rolling_correlation(list(x), list(y), window=10)
+
+        assert len(rolling) == 50
+        assert rolling[:9] == [None] * 9
+        for end in (9, 25, 49):
+            expected = self.np.corrcoef(x[end - 9 : end + 1], y[end - 9 : end + 1])[0, 1]
+            assert rolling[end] == pytest.approx(expected, abs=1e-3)
+
+    def test_calculate_correlation_fallback_parity(self, monkeypatch):
+        """The pure Python fallback reports the same coefficient."""
+        import src.tools.mood_tools as mood_module
+
+        mood = [0.2, 0.5, 0.4, 0.9, 0.7, 0.3]
+        progress = [0.1, 0.6, 0.5, 0.8, 0.9, 0.2]
+        vectorized = calculate_correlation(mood, progress)
+        monkeypatch.setattr(mood_module, "np", None)
+        assert mood_module.calculate_correlation(mood, progress) == vectorized
+        assert mood_module.calculate_correlation([1, 1, 1], [1, 2, 3])["correlation"] == 0.0
+
+    def test_daily_frame_aligns_mood_and_checkins(self):
+        """Mood entries are averaged per day and check-ins land on their date."""
+        moods = [
+            _series_entry(date(2026, 4, 1), 4),
+            _series_entry(date(2026, 4, 1), 8, hour=20),
+            _series_entry(date(2026, 4, 3), 6),
+        ]
+        checkins = [{"date": "2026-04-03", "scores": {"overall": 0.7, "career": 0.4}}]
+
+        days, frame = build_daily_mood_frame(moods, checkins)
+
+        assert days == [date(2026, 4, 1), date(2026, 4, 2), date(2026, 4, 3)]
+        assert frame["happiness"] == [6.0, None, 6.0]
+        assert frame["progress"] == [None, None, 0.7]
+        assert frame["progress_career"][2] == 0.4
+
+    def test_years_of_daily_entries(self):
+        """Correlating five years of daily data across all columns stays fast."""
+        import time
+
+        rng = self.np.random.default_rng(5)
+        columns = {f"c{i}": list(rng.random(5 * 365)) for i in range(10)}
+
+        start = time.perf_counter()
+        correlation_matrix(columns)
+        lagged_correlations(columns["c0"], columns["c1"], max_lag=30)
+        rolling_correlation(columns["c0"], columns["c1"], window=30)
+        assert time.perf_counter() - start < 0.5
+
+
+class TestMoodSeriesStorage:
+    """Test mood series persistence on the filesystem."""
+
+    def test_append_writes_one_line_per_entry(self, tmp_path):
+        """Entries are appended to the series file and reloaded after a change."""
+        backend = SimpleNamespace(root_dir=tmp_path)
+        for i in range(3):
+            append_mood_entry(_series_entry(date(2026, 7, 1) + timedelta(days=i), 6), backend)
+
+        lines = (tmp_path / get_mood_series_path("series_user")).read_text().splitlines()
+        assert len(lines) == 3
+        assert load_mood_series("series_user", backend) is load_mood_series("series_user", backend)
+
+        # An external append invalidates the cached series
+        with open(tmp_path / get_mood_series_path("series_user"), "a") as f:
+            f.write(json.dumps(_series_entry(date(2026, 7, 9), 9)) + "\n")
+        assert len(load_mood_series("series_user", backend)) == 4
+
+    def test_legacy_mood_files_imported(self, tmp_path):
+        """Individual mood_*.json files are imported into the series on first load."""
+        backend = SimpleNamespace(root_dir=tmp_path)
+        moods_dir = tmp_path / "moods" / "series_user"
+        moods_dir.mkdir(parents=True)
+        for i in range(4):
+            entry = _series_entry(date(2026, 8, 1) + timedelta(days=i), 4 + i)
+            (moods_dir / f"mood_2026080{i + 1}_090000.json").write_text(json.dumps(entry))
+
+        series = load_mood_series("series_user", backend)
+        assert len(series) == 4
+        assert (tmp_path / get_mood_series_path("series_user")).exists()
+
+    def test_dashboard_sparkline_reads_series(self, tmp_path):
+        """The dashboard's mood sparkline data comes from the mood series."""
+        from src.tools.dashboard_tools import _get_mood_history
+
+        backend = SimpleNamespace(root_dir=tmp_path)
+        for i, happiness in enumerate([2, 5, 9]):
+            append_mood_entry(
+                _series_entry(date(2026, 9, 1) + timedelta(days=i), happiness), backend
+            )
+
+        scores = _get_mood_history("series_user", 7, backend)
+        assert len(scores) == 3
+        assert scores[-1] > scores[0]
+        assert all(1 <= s <= 10 for s in scores)
+
+
 # ==============================================================================
 # Integration Tests
 # ==============================================================================
@@ -0,0 +1,283 @@
+"""
+Test suite for the SQLite-backed memory store.
+
+Tests BaseStore operations, persistence, filtering, migration and lookup speed.
+"""
+
+import asyncio
+import threading
+import time
+
+import pytest
+
+# Import the memory module components
+import sys
+from pathlib import Path
+
+# Add parent directory to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+pytest.importorskip("langgraph")
+
+from memory import CoachingPattern, Goal, MemoryManager, UserProfile, create_memory_store
+from sqlite_store import SQLiteStore, dump_store
+
+
+@pytest.fixture
+def db_path(tmp_path):
+    """Path for a fresh database file."""
+    return str(tmp_path / "store.db")
+
+
+@pytest.fixture
+def store(db_path):
+    """SQLite store backed by a temporary file."""
+    sqlite_store = SQLiteStore(db_path)
+    yield sqlite_store
+    sqlite_store.close()
+
+
+# ==============================================================================
+# BaseStore Interface Tests
+# ==============================================================================
+
+
+def test_create_memory_store_sqlite(db_path):
+    """Test creating the sqlite store through the factory."""
+    store = create_memory_store("sqlite", f"sqlite:///{db_path}")
+    assert isinstance(store, SQLiteStore)
+    assert store.path == db_path
+    store.close()
+
+
+def test_wal_mode_enabled(store):
+    """Test that the database uses write-ahead logging."""
+    assert store._conn.execute("PRAGMA journal_mode").fetchone()[0] == "wal"
+
+
+def test_put_get_delete(store):
+    """Test basic item lifecycle."""
+    store.put(("user_1", "profile"), "profile_data", {"name": "Alex"})
+
+    item = store.get(("user_1", "profile"), "profile_data")
+    assert item.value == {"name": "Alex"}
+    assert item.namespace == ("user_1", "profile")
+    created_at = item.created_at
+
+    store.put(("user_1", "profile"), "profile_data", {"name": "Alex B"})
+    item = store.get(("user_1", "profile"), "profile_data")
+    assert item.value == {"name": "Alex B"}
+    assert item.created_at == created_at
+    assert item.updated_at >= created_at
+
+    store.delete(("user_1", "profile"), "profile_data")
+    assert store.get(("user_1", "profile"), "profile_data") is None
+
+
+def test_search_namespace_prefix(store):
+    """Test that prefix search matches whole labels only."""
+    store.put(("user_1", "goals"), "g1", {"title": "a"})
+    store.put(("user_1", "goals", "archived"), "g2", {"title": "b"})
+    store.put(("user_1", "goalsX"), "g3", {"title": "c"})
+    store.put(("user_10", "goals"), "g4", {"title": "d"})
+
+    keys = [item.key for item in store.search(("user_1", "goals"))]
+    assert sorted(keys) == ["g1", "g2"]
+    assert len(store.search(("user_1",))) == 3
+    assert len(store.search(())) == 4
+
+
+def test_search_filters_and_paging(store):
+    """Test JSON filters, operators and limit/offset."""
+    for i in range(15):
+        store.put(
+            ("user_1", "goals"),
+            f"g{i:02d}",
+            {"domain": "career" if i % 2 else "health", "priority": i, "tags": ["x"]},
+        )
+
+    career = store.search(("user_1", "goals"), filter={"domain": "career"}, limit=100)
+    assert len(career) == 7
+
+    high = store.search(("user_1", "goals"), filter={"priority": {"$gte": 10}}, limit=100)
+    assert sorted(item.value["priority"] for item in high) == [10, 11, 12, 13, 14]
+
+    not_health = store.search(("user_1", "goals"), filter={"domain": {"$ne": "health"}})
+    assert all(item.value["domain"] == "career" for item in not_health)
+
+    # List filters are evaluated in Python with the same semantics
+    tagged = store.search(("user_1", "goals"), filter={"tags": ["x"]}, limit=100)
+    assert len(tagged) == 15
+
+    first = store.search(("user_1", "goals"), limit=10)
+    rest = store.search(("user_1", "goals"), limit=10, offset=10)
+    assert len(first) == 10 and len(rest) == 5
+    assert {i.key for i in first}.isdisjoint({i.key for i in rest})
+
+
+def test_list_namespaces(store):
+    """Test namespace listing with conditions and depth."""
+    store.put(("user_1", "goals"), "g", {"x": 1})
+    store.put(("user_1", "profile"), "p", {"x": 1})
+    store.put(("user_2", "goals"), "g", {"x": 1})
+
+    assert store.list_namespaces(prefix=("user_1",)) == [
+        ("user_1", "goals"),
+        ("user_1", "profile"),
+    ]
+    assert store.list_namespaces(suffix=("goals",)) == [("user_1", "goals"), ("user_2", "goals")]
+    assert store.list_namespaces(max_depth=1) == [("user_1",), ("user_2",)]
+
+
+def test_async_operations(store):
+    """Test the async BaseStore methods."""
+
+    async def run():
+        await store.aput(("user_1", "goals"), "g1", {"title": "async"})
+        return await store.aget(("user_1", "goals"), "g1")
+
+    assert asyncio.run(run()).value == {"title": "async"}
+
+
+# ==============================================================================
+# Persistence and Migration Tests
+# ==============================================================================
+
+
+def test_data_survives_restart(db_path):
+    """Test that data written by one store is visible after reopening."""
+    manager = MemoryManager(SQLiteStore(db_path))
+    manager.save_profile(UserProfile(user_id="user_1", name="Persistent"))
+    manager.save_goal("user_1", Goal(title="Survive restart", domain="career"))
+    manager.store.close()
+
+    reopened = MemoryManager(SQLiteStore(db_path))
+    assert reopened.get_profile("user_1").name == "Persistent"
+    assert [g.title for g in reopened.get_goals("user_1")] == ["Survive restart"]
+    reopened.store.close()
+
+
+def test_journal_recovered_after_restart(db_path):
+    """Test that journal entries written before a crash are applied after reopening."""
+    manager = MemoryManager(SQLiteStore(db_path), journaled=True, compact_every=1000)
+    pattern = CoachingPattern(title="Habit tracking")
+    manager.save_pattern(pattern)
+    for _ in range(4):
+        manager.increment_pattern_usage(pattern.pattern_id)
+    manager.update_preference_key("user_1", "coaching_approach", "direct")
+    manager.store.close()  # No compaction before "crashing"
+
+    reopened = MemoryManager(SQLiteStore(db_path), journaled=True)
+    assert reopened.get_pattern(pattern.pattern_id).usage_count == 4
+    assert reopened.compact_journal() == 5
+    assert reopened.store.search(("journal",)) == []
+    assert reopened.get_pattern(pattern.pattern_id).usage_count == 4
+    assert reopened.get_preferences("user_1").coaching_approach == "direct"
+    reopened.store.close()
+
+
+def test_transaction_commits_or_rolls_back(db_path):
+    """Test that a transaction's batches commit together and roll back on error."""
+    store = SQLiteStore(db_path)
+    other = SQLiteStore(db_path)
+    namespace = ("user_1", "counters")
+
+    with store.transaction():
+        store.put(namespace, "a", {"n": 1})
+        assert store.get(namespace, "a").value == {"n": 1}
+        assert other.get(namespace, "a") is None  # Not committed yet
+        store.put(namespace, "b", {"n": 2})
+    assert other.get(namespace, "b").value == {"n": 2}
+
+    with pytest.raises(RuntimeError):
+        with store.transaction():
+            store.put(namespace, "a", {"n": 10})
+            raise RuntimeError("abort")
+    assert other.get(namespace, "a").value == {"n": 1}
+    store.close()
+    other.close()
+
+
+def test_compaction_across_connections_folds_entries_once(db_path):
+    """Test that managers on separate connections never fold the same entries twice."""
+    managers = [
+        MemoryManager(SQLiteStore(db_path), journaled=True, compact_every=10_000) for _ in range(4)
+    ]
+    pattern = CoachingPattern(title="Habit tracking")
+    managers[0].save_pattern(pattern)
+
+    def worker(manager):
+        for _ in range(25):
+            manager.increment_pattern_usage(pattern.pattern_id)
+            manager.compact_journal()
+
+    threads = [threading.Thread(target=worker, args=(m,)) for m in managers]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert managers[0].get_pattern(pattern.pattern_id).usage_count == 100
+    managers[0].compact_journal()
+    stored = managers[0].store.get(("coaching", "patterns"), pattern.pattern_id)
+    assert stored.value["usage_count"] == 100
+    for manager in managers:
+        manager.store.close()
+
+
+def test_goal_saves_across_connections_keep_index_complete(db_path):
+    """Test that concurrent goal saves on separate connections all reach the index."""
+    managers = [MemoryManager(SQLiteStore(db_path)) for _ in range(4)]
+    managers[0].rebuild_goal_index("user_1")
+
+    def worker(manager):
+        for i in range(10):
+            manager.save_goal("user_1", Goal(title=f"Goal {i}", domain="health"))
+
+    threads = [threading.Thread(target=worker, args=(m,)) for m in managers]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert managers[0].count_goals("user_1") == 40
+    assert len(managers[0].get_goals("user_1", domain="health")) == 40
+    for manager in managers:
+        manager.store.close()
+
+
+def test_migrate_from_in_memory_store(store):
+    """Test copying all data out of an InMemoryStore."""
+    source = create_memory_store("in_memory")
+    source_manager = MemoryManager(source)
+    source_manager.save_profile(UserProfile(user_id="user_1", name="Migrated"))
+    for i in range(12):
+        source_manager.save_goal("user_1", Goal(title=f"Goal {i}", domain="health"))
+
+    records = dump_store(source)
+    assert len(records) == 14  # profile, 12 goals and the goal index
+    assert store.migrate_from(source) == 14
+
+    manager = MemoryManager(store)
+    assert manager.get_profile("user_1").name == "Migrated"
+    assert len(manager.get_goals("user_1")) == 12
+    original = source.get(("user_1", "profile"), "profile_data")
+    migrated = store.get(("user_1", "profile"), "profile_data")
+    assert migrated.created_at == original.created_at
+
+
+def test_get_goals_under_one_millisecond(store):
+    """Test that listing a typical user's goals stays under 1ms."""
+    manager = MemoryManager(store)
+    for user in range(50):
+        for i in range(20):
+            manager.save_goal(f"user_{user}", Goal(title=f"Goal {i}", domain="career"))
+
+    manager.get_goals("user_25")  # Warm up
+    start = time.perf_counter()
+    for _ in range(100):
+        goals = manager.get_goals("user_25")
+    avg_ms = (time.perf_counter() - start) / 100 * 1000
+
+    assert len(goals) == 20
+    assert avg_ms < 1.0, f"get_goals took {avg_ms:.3f}ms"